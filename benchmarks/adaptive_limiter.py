@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Adaptive limiter benchmark
+--------------------------
+Sends a burst of concurrent requests to a local server that accepts a fixed number of simultaneous requests and
+rejects the others with 503, comparing an unlimited session with a session using the adaptive limiter.
+
+    python benchmarks/adaptive_limiter.py --requests 1000 --capacity 16 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge import logger
+from knowledge.services.asyncio.base import AsyncServiceAPIClient, AsyncSession, ConnectorConfig
+from knowledge.services.concurrency import AsyncAdaptiveLimiter
+
+
+async def burst(url: str, requests: int, limiter: Optional[AsyncAdaptiveLimiter], rejected: List[int], label: str):
+    """Send the requests concurrently and report the duration and the rejected attempts."""
+    config: ConnectorConfig = ConnectorConfig(limit=requests, limit_per_host=requests)
+    client: AsyncServiceAPIClient = AsyncServiceAPIClient(url, connector_config=config)
+    session: AsyncSession = AsyncSession(
+        client, max_retries=10, backoff_factor=0.05, connector_config=config, limiter=limiter
+    )
+    rejected[0] = 0
+    start: float = time.perf_counter()
+    responses = await asyncio.gather(*[session.get(f"{url}/entity", ignore_auth=True) for _ in range(requests)])
+    duration: float = time.perf_counter() - start
+    await session.close()
+    failed: int = sum(1 for r in responses if not r.ok)
+    line: str = f"{label:<18} {duration:,.2f} s, {rejected[0]} rejected attempts, {failed} failed requests"
+    if limiter is not None:
+        line += f", final limit {limiter.limit}"
+    print(line)
+
+
+async def main(requests: int, capacity: int, latency: float) -> None:
+    """Run the benchmark against a local server."""
+    active: List[int] = [0]
+    rejected: List[int] = [0]
+
+    async def handle(_: web.Request) -> web.Response:
+        if active[0] >= capacity:
+            rejected[0] += 1
+            return web.json_response({}, status=503)
+        active[0] += 1
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            active[0] -= 1
+        return web.json_response({})
+
+    app: web.Application = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    server: TestServer = TestServer(app)
+    await server.start_server()
+    url: str = str(server.make_url("")).rstrip("/")
+    try:
+        print(f"Requests / capacity:   {requests} / {capacity}")
+        await burst(url, requests, None, rejected, "unlimited")
+        await burst(url, requests, AsyncAdaptiveLimiter(initial_limit=capacity * 4), rejected, "adaptive limiter")
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--requests", type=int, default=1000, help="Number of concurrent requests.")
+    parser.add_argument("-c", "--capacity", type=int, default=16, help="Simultaneous requests accepted by the server.")
+    parser.add_argument("-l", "--latency", type=float, default=0.05, help="Latency of the endpoint in seconds.")
+    args = parser.parse_args()
+    logging.getLogger("aiohttp.access").disabled = True
+    logger.disable("knowledge")
+    asyncio.run(main(args.requests, args.capacity, args.latency))
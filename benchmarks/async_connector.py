@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Async connector benchmark
+-------------------------
+Times the creation of asynchronous sessions with a fresh certifi SSL context against the cached context, and a fan-out
+of concurrent requests against a local server with a slow endpoint, comparing the default connector limits with a
+configured connector, and with a configured connector shared by several clients.
+
+    python benchmarks/async_connector.py --clients 10 --requests 500 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import logging
+import ssl
+import time
+from typing import List, Set
+
+import aiohttp
+import certifi
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.services.asyncio.base import AsyncServiceAPIClient, AsyncSession, ConnectorConfig, default_ssl_context
+
+
+async def session_creation(sessions: int) -> None:
+    """Time the creation of sessions with a fresh and with the cached SSL context."""
+    start: float = time.perf_counter()
+    for _ in range(sessions):
+        ssl.create_default_context(cafile=certifi.where())
+    fresh: float = time.perf_counter() - start
+    default_ssl_context()
+    start = time.perf_counter()
+    for _ in range(sessions):
+        default_ssl_context()
+    cached: float = time.perf_counter() - start
+    print(f"SSL context (fresh)     {fresh * 1e3 / sessions:,.3f} ms per session")
+    print(f"SSL context (cached)    {cached * 1e3 / sessions:,.6f} ms per session")
+
+
+async def fan_out(url: str, clients: List[AsyncServiceAPIClient], requests: int, peers: Set[int], label: str) -> None:
+    """Send the requests concurrently, round-robin over the clients."""
+    sessions: List[AsyncSession] = [await client.asyncio_session() for client in clients]
+    peers.clear()
+    start: float = time.perf_counter()
+    responses = await asyncio.gather(*[sessions[i % len(sessions)].get(url, ignore_auth=True) for i in range(requests)])
+    duration: float = time.perf_counter() - start
+    if not all(r.ok for r in responses):
+        raise RuntimeError("Requests failed.")
+    for client in clients:
+        await client.close()
+    print(f"{label:<23} {duration:,.2f} s, {len(peers)} connections")
+
+
+async def main(client_count: int, requests: int, latency: float) -> None:
+    """Run the benchmark against a local server."""
+    peers: Set[int] = set()
+
+    async def handle(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername")[1])
+        await asyncio.sleep(latency)
+        return web.json_response({})
+
+    app: web.Application = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    server: TestServer = TestServer(app)
+    await server.start_server()
+    service_url: str = str(server.make_url("")).rstrip("/")
+    url: str = f"{service_url}/entity"
+    try:
+        await session_creation(100)
+        print(f"Clients / requests:     {client_count} / {requests}")
+        await fan_out(url, [AsyncServiceAPIClient(service_url)], requests, peers, "default limits")
+        config: ConnectorConfig = ConnectorConfig(limit=requests, limit_per_host=requests)
+        configured: AsyncServiceAPIClient = AsyncServiceAPIClient(service_url, connector_config=config)
+        await fan_out(url, [configured], requests, peers, "configured limits")
+        connector: aiohttp.TCPConnector = config.create_connector()
+        shared_clients: List[AsyncServiceAPIClient] = [
+            AsyncServiceAPIClient(service_url, connector=connector) for _ in range(client_count)
+        ]
+        await fan_out(url, shared_clients, requests, peers, "shared connector")
+        await connector.close()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--clients", type=int, default=10, help="Number of clients.")
+    parser.add_argument("-n", "--requests", type=int, default=500, help="Number of concurrent requests.")
+    parser.add_argument("-l", "--latency", type=float, default=0.5, help="Latency of the endpoint in seconds.")
+    args = parser.parse_args()
+    logging.getLogger("aiohttp.access").disabled = True
+    asyncio.run(main(args.clients, args.requests, args.latency))
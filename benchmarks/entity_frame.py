@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Entity frame benchmark
+----------------------
+Compares the memory held by an EntityFrame with a list of ThingObject instances, both built from listing responses,
+and times a filter on the frame. Memory is reported per 100k entities.
+
+    python benchmarks/entity_frame.py --entities 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from knowledge.base.frame import EntityFrame
+from knowledge.base.ontology import ThingObject
+from synthetic import synthetic_entities, CLASSES
+
+PER_ENTITIES: int = 100_000
+
+
+def measure(build: Callable[[], Any]) -> int:
+    """
+    Build a collection and return the number of bytes it keeps alive.
+
+    Parameters
+    ----------
+    build: Callable[[], Any]
+        Builds the collection
+
+    Returns
+    -------
+    size: int
+        Allocated bytes held by the collection.
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    collection: Any = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del collection
+    return current - baseline
+
+
+def things(count: int) -> List[ThingObject]:
+    """Parse the entities into ThingObjects."""
+    return [ThingObject.from_dict(e) for e in synthetic_entities(count)]
+
+
+def frame(count: int) -> EntityFrame:
+    """Parse the entities into a frame."""
+    return EntityFrame.from_listing(synthetic_entities(count))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--entities", type=int, default=PER_ENTITIES, help="Number of entities.")
+    args = parser.parse_args()
+    scale: float = PER_ENTITIES / args.entities / 2**20
+    things_size: int = measure(lambda: things(args.entities))
+    frame_size: int = measure(lambda: frame(args.entities))
+    entity_frame: EntityFrame = frame(args.entities)
+    start: float = time.perf_counter()
+    selected: EntityFrame = entity_frame.where(concept_type=CLASSES[0], locale="en_US", use_for_nel=True)
+    duration: float = time.perf_counter() - start
+    print(f"Entities:                        {args.entities}")
+    print(f"List[ThingObject] MiB per 100k:  {things_size * scale:,.1f}")
+    print(f"EntityFrame MiB per 100k:        {frame_size * scale:,.1f}")
+    print(f"Reduction:                       {things_size / frame_size:,.1f}x")
+    print(f"Filter ({len(selected)} matches):       {duration * 1000:,.1f} ms")
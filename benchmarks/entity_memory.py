@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Entity memory benchmark
+-----------------------
+Measures the memory held by ThingObject instances parsed from listing responses (with relations), reported per
+100k entities.
+
+    python benchmarks/entity_memory.py --entities 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import List
+
+from knowledge.base.ontology import ThingObject
+from synthetic import synthetic_entities
+
+PER_ENTITIES: int = 100_000
+
+
+def measure(count: int, include_relations: bool) -> int:
+    """
+    Parse `count` synthetic entities and return the number of bytes they keep alive.
+
+    Parameters
+    ----------
+    count: int
+        Number of entities
+    include_relations: bool
+        Include relations in the payload
+
+    Returns
+    -------
+    size: int
+        Allocated bytes held by the parsed entities.
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    things: List[ThingObject] = [ThingObject.from_dict(e) for e in synthetic_entities(count, include_relations)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if len(things) != count:
+        raise RuntimeError("Unexpected number of entities.")
+    return current - baseline
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--entities", type=int, default=PER_ENTITIES, help="Number of entities.")
+    parser.add_argument("--no-relations", action="store_true", help="Parse entities without relations.")
+    args = parser.parse_args()
+    size: int = measure(args.entities, not args.no_relations)
+    print(f"Entities:                  {args.entities}")
+    print(f"Bytes per entity:          {size / args.entities:,.0f}")
+    print(f"MiB per {PER_ENTITIES:,} entities:   {size / args.entities * PER_ENTITIES / 2**20:,.1f}")
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Ontology index benchmark
+------------------------
+Times `Ontology.data_properties_for` and `Ontology.object_properties_for` on a synthetic ontology with several hundred
+classes, comparing the indexed lookup with walking the class hierarchy for every property domain.
+
+    python benchmarks/ontology_index.py --classes 600 --lookups 10000
+"""
+
+import argparse
+import random
+import time
+from typing import List, Optional
+
+from knowledge.base.ontology import (
+    Ontology,
+    OntologyClass,
+    OntologyClassReference,
+    OntologyProperty,
+    OntologyPropertyReference,
+    PropertyType,
+)
+
+
+def build_ontology(classes: int, properties: int, seed: int = 42) -> Ontology:
+    """
+    Build an ontology with a class tree and properties whose domains are random classes.
+
+    Parameters
+    ----------
+    classes: int
+        Number of classes
+    properties: int
+        Number of data properties and of object properties
+    seed: int (default:= 42)
+        Seed of the random generator
+
+    Returns
+    -------
+    ontology: Ontology
+        Synthetic ontology
+    """
+    rnd: random.Random = random.Random(seed)
+    ontology: Ontology = Ontology()
+    references: List[OntologyClassReference] = []
+    for idx in range(classes):
+        reference: OntologyClassReference = OntologyClassReference("wacom", "bench", f"Class{idx}")
+        # Every class extends one of the previous classes, which results in a tree of depth ~log(classes)
+        parent: Optional[OntologyClassReference] = references[rnd.randrange(idx)] if idx else None
+        ontology.add_class(OntologyClass("tenant", "bench", reference, parent))
+        references.append(reference)
+    for kind in (PropertyType.DATA_PROPERTY, PropertyType.OBJECT_PROPERTY):
+        for idx in range(properties):
+            ontology.add_properties(
+                OntologyProperty(
+                    kind,
+                    "tenant",
+                    "bench",
+                    OntologyPropertyReference("wacom", "bench", f"{kind.name.lower()}{idx}"),
+                    property_domain=rnd.sample(references, rnd.randint(1, 3)),
+                )
+            )
+    return ontology
+
+
+def hierarchy_walk(ontology: Ontology, cls_reference: OntologyClassReference) -> List[OntologyPropertyReference]:
+    """Lookup of the data and object properties by walking the class hierarchy for every domain."""
+    result: List[OntologyPropertyReference] = []
+    for prop in ontology.data_properties + ontology.object_properties:
+        for domain in prop.domains:
+            current: Optional[OntologyClass] = ontology.get_class(cls_reference)
+            while current is not None:
+                if current.reference == domain:
+                    result.append(prop.reference)
+                    break
+                current = ontology.get_class(current.subclass_of) if current.subclass_of else None
+    return result
+
+
+def indexed(ontology: Ontology, cls_reference: OntologyClassReference) -> List[OntologyPropertyReference]:
+    """Lookup of the data and object properties with the ontology indexes."""
+    return ontology.data_properties_for(cls_reference) + ontology.object_properties_for(cls_reference)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--classes", type=int, default=600, help="Number of classes.")
+    parser.add_argument("-p", "--properties", type=int, default=400, help="Number of data and object properties.")
+    parser.add_argument("-n", "--lookups", type=int, default=10_000, help="Number of lookups (entities).")
+    args = parser.parse_args()
+    onto: Ontology = build_ontology(args.classes, args.properties)
+    # Entities of all classes, the indexes are built during the first pass over the classes
+    lookups: List[OntologyClassReference] = [onto.classes[i % args.classes].reference for i in range(args.lookups)]
+    timings = {}
+    for name, function in (("hierarchy walk", hierarchy_walk), ("indexed", indexed)):
+        start: float = time.perf_counter()
+        for lookup in lookups:
+            function(onto, lookup)
+        timings[name] = time.perf_counter() - start
+    for lookup in lookups[: args.classes]:
+        if sorted(r.iri for r in hierarchy_walk(onto, lookup)) != sorted(r.iri for r in indexed(onto, lookup)):
+            raise RuntimeError(f"Mismatch for {lookup.iri}.")
+    print(f"Classes / properties:  {args.classes} / {2 * args.properties}")
+    print(f"Lookups:               {args.lookups}")
+    for name, duration in timings.items():
+        print(f"{name:<22} {duration * 1e6 / args.lookups:,.1f} µs per lookup")
+    print(f"Speedup:               {timings['hierarchy walk'] / timings['indexed']:,.0f}x")
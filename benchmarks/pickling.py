@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Entity pickling benchmark
+-------------------------
+Measures pickle round-trips (dumps + loads) per second of ThingObject instances, shipped in chunks as done by
+`multiprocessing.Pool.map`. The previous state format (`as_dict`) is measured through the legacy dict path of
+`__setstate__`.
+
+    python benchmarks/pickling.py --entities 100000 --chunk-size 100
+"""
+
+import argparse
+import gc
+import pickle
+import time
+from typing import Any, Callable, List, Tuple
+
+from knowledge.base.ontology import ThingObject
+from synthetic import synthetic_entities
+
+PER_ENTITIES: int = 100_000
+
+
+def restore_dict_state(state: Any) -> ThingObject:
+    """Restores an entity from the previous dict state."""
+    thing: ThingObject = ThingObject.__new__(ThingObject)
+    thing.__setstate__(state)
+    return thing
+
+
+def dict_roundtrip(chunk: List[ThingObject]) -> Tuple[List[ThingObject], int]:
+    """Previous path: state created by `as_dict` and parsed again when unpickling."""
+    content: bytes = pickle.dumps([thing.as_dict() for thing in chunk], protocol=pickle.HIGHEST_PROTOCOL)
+    return [restore_dict_state(state) for state in pickle.loads(content)], len(content)
+
+
+def tuple_roundtrip(chunk: List[ThingObject]) -> Tuple[List[ThingObject], int]:
+    """Current path: compact tuple state."""
+    content: bytes = pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL)
+    return pickle.loads(content), len(content)
+
+
+def measure(
+    things: List[ThingObject], roundtrip: Callable[[List[ThingObject]], Tuple[List[ThingObject], int]], chunk_size: int
+) -> Tuple[float, int]:
+    """
+    Measure the pickle round-trips of the entities.
+
+    Parameters
+    ----------
+    things: List[ThingObject]
+        Entities
+    roundtrip: Callable[[List[ThingObject]], Tuple[List[ThingObject], int]]
+        Round-trip of a chunk, returns the restored entities and the size of the pickle
+    chunk_size: int
+        Number of entities per pickle
+
+    Returns
+    -------
+    result: Tuple[float, int]
+        Elapsed time in seconds and total size of the pickles in bytes.
+    """
+    size: int = 0
+    restored: int = 0
+    start: float = time.perf_counter()
+    for idx in range(0, len(things), chunk_size):
+        chunk, chunk_bytes = roundtrip(things[idx : idx + chunk_size])
+        restored += len(chunk)
+        size += chunk_bytes
+    elapsed: float = time.perf_counter() - start
+    if restored != len(things):
+        raise RuntimeError("Unexpected number of entities.")
+    return elapsed, size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--entities", type=int, default=PER_ENTITIES, help="Number of entities.")
+    parser.add_argument("-c", "--chunk-size", type=int, default=100, help="Number of entities per pickle.")
+    args = parser.parse_args()
+    entities: List[ThingObject] = [ThingObject.from_dict(e) for e in synthetic_entities(args.entities)]
+    # The input entities are long-lived, exclude them from the garbage collection like a worker process would
+    gc.freeze()
+    before, before_size = measure(entities, dict_roundtrip, args.chunk_size)
+    after, after_size = measure(entities, tuple_roundtrip, args.chunk_size)
+    print(f"Entities:            {args.entities}")
+    print(
+        f"dict state:  {args.entities / before:10,.0f} round-trips/s  "
+        f"{before_size / args.entities:6,.0f} bytes/entity"
+    )
+    print(
+        f"tuple state: {args.entities / after:10,.0f} round-trips/s  "
+        f"{after_size / args.entities:6,.0f} bytes/entity"
+    )
+    print(f"Speedup:     {before / after:10.2f}x")
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Entity serialization benchmark
+------------------------------
+Compares the throughput of the json module path with the orjson serializers for the API payload (bulk creation) and
+the import format (import endpoint and import files).
+
+    python benchmarks/serialization.py --entities 100000
+"""
+
+import argparse
+import gzip
+import json
+import time
+from typing import Callable, List
+
+from knowledge.base.ontology import ThingObject
+from knowledge.services.helper import entity_payload, entities_payload_bytes, import_format_ndjson
+from synthetic import synthetic_entities
+
+PER_ENTITIES: int = 100_000
+
+
+def json_payload(things: List[ThingObject]) -> bytes:
+    """Previous path: bulk payload encoded with the json module (requests `json=`)."""
+    return json.dumps([entity_payload(t) for t in things]).encode("utf-8")
+
+
+def json_import_format(things: List[ThingObject]) -> bytes:
+    """Previous path: import format lines encoded with the json module."""
+    return "\n".join(json.dumps(t.__import_format_dict__()) for t in things).encode("utf-8")
+
+
+def measure(things: List[ThingObject], encoder: Callable[[List[ThingObject]], bytes], compress: bool) -> float:
+    """
+    Measure the time to encode the entities.
+
+    Parameters
+    ----------
+    things: List[ThingObject]
+        Entities to encode
+    encoder: Callable[[List[ThingObject]], bytes]
+        Encoder
+    compress: bool
+        Compress the encoded bytes with gzip, like the import endpoint
+
+    Returns
+    -------
+    seconds: float
+        Elapsed time in seconds.
+    """
+    start: float = time.perf_counter()
+    content: bytes = encoder(things)
+    if compress:
+        gzip.compress(content)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--entities", type=int, default=PER_ENTITIES, help="Number of entities.")
+    parser.add_argument("--gzip", action="store_true", help="Include gzip compression of the import format.")
+    args = parser.parse_args()
+    entities: List[ThingObject] = [ThingObject.from_dict(e) for e in synthetic_entities(args.entities)]
+    cases = [
+        ("API payload", json_payload, entities_payload_bytes, False),
+        ("Import format", json_import_format, import_format_ndjson, args.gzip),
+    ]
+    for name, baseline, optimized, use_gzip in cases:
+        before: float = measure(entities, baseline, use_gzip)
+        after: float = measure(entities, optimized, use_gzip)
+        print(f"{name}:")
+        print(f"  json:    {before:6.2f} s  ({args.entities / before:,.0f} entities/s)")
+        print(f"  orjson:  {after:6.2f} s  ({args.entities / after:,.0f} entities/s)")
+        print(f"  speedup: {before / after:6.2f}x")
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Synthetic entity payloads
+-------------------------
+Generates entity dictionaries in the shape returned by the knowledge graph listing endpoint, so that the benchmarks
+can run without access to a tenant.
+"""
+
+from typing import Any, Dict, Iterator, List
+
+from knowledge.base.entity import (
+    URI_TAG,
+    IMAGE_TAG,
+    LABELS_TAG,
+    DESCRIPTIONS_TAG,
+    TYPE_TAG,
+    DATA_PROPERTIES_TAG,
+    OBJECT_PROPERTIES_TAG,
+    TARGETS_TAG,
+    CONTENT_TAG,
+    LOCALE_TAG,
+    IS_MAIN_TAG,
+    DESCRIPTION_TAG,
+    DATA_PROPERTY_TAG,
+    DATA_TYPE_TAG,
+    RELATION_TAG,
+    INCOMING_TAG,
+    OUTGOING_TAG,
+    OWNER_TAG,
+    OWNER_ID_TAG,
+    GROUP_IDS,
+    VISIBILITY_TAG,
+    INDEXING_NEL_TARGET,
+    INDEXING_FULLTEXT_TARGET,
+)
+
+LOCALES: List[str] = ["en_US", "de_DE", "ja_JP"]
+CLASSES: List[str] = ["wacom:core#Person", "wacom:core#Organization", "wacom:core#Topic", "wacom:core#Event"]
+LITERALS: List[str] = [
+    "wacom:core#sourceReferenceId",
+    "wacom:core#sourceSystem",
+    "wacom:core#lastUpdate",
+    "wacom:personal#birthPlace",
+]
+RELATIONS: List[str] = ["wacom:core#relatedTo", "wacom:personal#worksFor", "wacom:personal#hasTopic"]
+
+
+def synthetic_entity(idx: int, include_relations: bool = True) -> Dict[str, Any]:
+    """
+    Create a synthetic entity dictionary.
+
+    Parameters
+    ----------
+    idx: int
+        Index of the entity, used to derive URI, labels and literals.
+    include_relations: bool (default:= True)
+        Include relations to neighbouring entities.
+
+    Returns
+    -------
+    entity: Dict[str, Any]
+        Entity in the listing format.
+    """
+    labels: List[Dict[str, Any]] = []
+    for locale in LOCALES:
+        labels.append({CONTENT_TAG: f"Entity {idx} ({locale})", LOCALE_TAG: locale, IS_MAIN_TAG: True})
+        labels.append({CONTENT_TAG: f"Alias {idx} ({locale})", LOCALE_TAG: locale, IS_MAIN_TAG: False})
+    literals: List[Dict[str, Any]] = [
+        {
+            CONTENT_TAG: f"{prop.rsplit('#', 1)[-1]}-{idx}",
+            LOCALE_TAG: "en_US",
+            DATA_PROPERTY_TAG: prop,
+            DATA_TYPE_TAG: "http://www.w3.org/2001/XMLSchema#string",
+        }
+        for prop in LITERALS
+    ]
+    relations: List[Dict[str, Any]] = []
+    if include_relations:
+        relations = [
+            {
+                RELATION_TAG: rel,
+                INCOMING_TAG: [f"wacom:entity:{(idx + r + 7) % 100003:08d}"],
+                OUTGOING_TAG: [f"wacom:entity:{(idx + r + 1) % 100003:08d}", f"wacom:entity:{(idx + r + 2):08d}"],
+            }
+            for r, rel in enumerate(RELATIONS)
+        ]
+    return {
+        URI_TAG: f"wacom:entity:{idx:08d}",
+        IMAGE_TAG: f"https://example.com/images/{idx}.png",
+        LABELS_TAG: labels,
+        DESCRIPTIONS_TAG: [
+            {DESCRIPTION_TAG: f"Description of entity {idx} ({locale})", LOCALE_TAG: locale} for locale in LOCALES
+        ],
+        TYPE_TAG: CLASSES[idx % len(CLASSES)],
+        DATA_PROPERTIES_TAG: literals,
+        OBJECT_PROPERTIES_TAG: relations,
+        TARGETS_TAG: [INDEXING_NEL_TARGET, INDEXING_FULLTEXT_TARGET],
+        OWNER_TAG: True,
+        OWNER_ID_TAG: "00000000-0000-0000-0000-000000000000",
+        GROUP_IDS: [],
+        VISIBILITY_TAG: "Private",
+    }
+
+
+def synthetic_entities(count: int, include_relations: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over synthetic entity dictionaries.
+
+    Parameters
+    ----------
+    count: int
+        Number of entities.
+    include_relations: bool (default:= True)
+        Include relations to neighbouring entities.
+
+    Yields
+    ------
+    entity: Dict[str, Any]
+        Entity in the listing format.
+    """
+    for idx in range(count):
+        yield synthetic_entity(idx, include_relations)
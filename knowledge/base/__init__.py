@@ -16,10 +16,11 @@ The access is used to access the knowledge graph, there are different types of a
     - Group access: the user can access the entities that are in the same group.
 """
 
-__all__ = ["access", "entity", "language", "ontology", "response", "search", "tenant"]
+__all__ = ["access", "entity", "frame", "language", "ontology", "response", "search", "tenant"]
 
 from knowledge.base import access
 from knowledge.base import entity
+from knowledge.base import frame
 from knowledge.base import language
 from knowledge.base import ontology
 from knowledge.base import response
@@ -175,6 +175,8 @@ class LocalizedContent(abc.ABC):
         ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., 'en_US'.
     """
 
+    __slots__ = ("__content", "__language_code")
+
     def __init__(self, content: str, language_code: Union[LocaleCode, LanguageCode]) -> None:
         self.__content: str = content
         self.__language_code: Union[LocaleCode, LanguageCode] = language_code
@@ -213,6 +215,8 @@ class Label(LocalizedContent):
         Main content
     """
 
+    __slots__ = ("__main",)
+
     def __init__(
         self,
         content: str,
@@ -309,6 +313,8 @@ class Description(LocalizedContent):
         Language code of content
     """
 
+    __slots__ = ()
+
     def __init__(self, description: str, language_code: LocaleCode = EN_US) -> None:
         super().__init__(description, language_code)
 
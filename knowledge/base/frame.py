@@ -0,0 +1,1016 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Entity frame
+------------
+Columnar container for large collections of entities.
+
+Instead of one `ThingObject` per entity, an `EntityFrame` stores the entities in parallel arrays: URIs and images as
+packed UTF-8 strings, concept types, owners, visibilities, locales and property IRIs as codes into shared string
+tables, and index targets, ownership and tenant rights as bit flags. Labels, aliases, descriptions, data properties,
+relations and group ids are stored in child tables that are addressed by per-entity offsets.
+
+Filtering and projection operate on the columns; `ThingObject` instances are only created on demand.
+
+>>> frame: EntityFrame = EntityFrame.from_listing(listing_response)
+>>> persons: EntityFrame = frame.where(concept_type=PERSON_CLASS, locale=EN_US, use_for_nel=True)
+>>> for thing in persons.select(FRAME_LABELS):
+...     print(thing.uri, thing.label_lang(EN_US))
+"""
+
+from array import array
+from itertools import repeat
+from operator import add
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+import orjson
+
+from knowledge.base.access import TenantAccessRight
+from knowledge.base.entity import (
+    EntityStatus,
+    Label,
+    Description,
+    URI_TAG,
+    IMAGE_TAG,
+    LABELS_TAG,
+    DESCRIPTIONS_TAG,
+    TYPE_TAG,
+    DATA_PROPERTIES_TAG,
+    OBJECT_PROPERTIES_TAG,
+    GROUP_IDS,
+    OWNER_TAG,
+    OWNER_ID_TAG,
+    VISIBILITY_TAG,
+    TENANT_RIGHTS_TAG,
+    LOCALE_TAG,
+    IS_MAIN_TAG,
+    CONTENT_TAG,
+    VALUE_TAG,
+    DESCRIPTION_TAG,
+    DATA_PROPERTY_TAG,
+    RELATION_TAG,
+    INCOMING_TAG,
+    OUTGOING_TAG,
+)
+from knowledge.base.language import LocaleCode, SUPPORTED_LOCALES
+from knowledge.base.ontology import (
+    ThingObject,
+    DataProperty,
+    ObjectProperty,
+    OntologyClassReference,
+    OntologyPropertyReference,
+)
+
+__all__ = [
+    "StringColumn",
+    "StringTable",
+    "EntityFrame",
+    "FRAME_LABELS",
+    "FRAME_DESCRIPTIONS",
+    "FRAME_DATA_PROPERTIES",
+    "FRAME_OBJECT_PROPERTIES",
+    "FRAME_GROUPS",
+    "FRAME_TABLES",
+]
+
+# ------------------------------------------------- Child tables -------------------------------------------------------
+FRAME_LABELS: str = "labels"
+"""Labels and aliases of the entities."""
+FRAME_DESCRIPTIONS: str = "descriptions"
+"""Descriptions of the entities."""
+FRAME_DATA_PROPERTIES: str = "data_properties"
+"""Data properties of the entities."""
+FRAME_OBJECT_PROPERTIES: str = "object_properties"
+"""Relations of the entities."""
+FRAME_GROUPS: str = "groups"
+"""Group ids of the entities."""
+FRAME_TABLES: Tuple[str, ...] = (
+    FRAME_LABELS,
+    FRAME_DESCRIPTIONS,
+    FRAME_DATA_PROPERTIES,
+    FRAME_OBJECT_PROPERTIES,
+    FRAME_GROUPS,
+)
+"""All child tables of a frame."""
+
+# ----------------------------------------------------- Flags ----------------------------------------------------------
+OWNER_FLAG: int = 1
+USE_NEL_FLAG: int = 2
+USE_VECTOR_INDEX_FLAG: int = 4
+USE_VECTOR_INDEX_DOCUMENT_FLAG: int = 8
+USE_FULL_TEXT_INDEX_FLAG: int = 16
+READ_FLAG: int = 32
+WRITE_FLAG: int = 64
+DELETE_FLAG: int = 128
+NO_CODE: int = -1
+INCOMING: int = 0
+OUTGOING: int = 1
+
+
+def __ranges__(indices: Sequence[int]) -> List[Tuple[int, int]]:
+    """Coalesces ascending indices into ranges (start, stop)."""
+    ranges: List[Tuple[int, int]] = []
+    start: int = -1
+    stop: int = -1
+    for idx in indices:
+        if idx != stop:
+            if start >= 0:
+                ranges.append((start, stop))
+            start = idx
+        stop = idx + 1
+    if start >= 0:
+        ranges.append((start, stop))
+    return ranges
+
+
+def __child_ranges__(offsets: array, ranges: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Row ranges of a child table for ranges of entities."""
+    return [(offsets[start], offsets[stop]) for start, stop in ranges]
+
+
+def __take__(values: array, ranges: Sequence[Tuple[int, int]]) -> array:
+    """Creates an array with the values of the given ranges."""
+    result: array = array(values.typecode)
+    for start, stop in ranges:
+        result.extend(values[start:stop])
+    return result
+
+
+def __take_offsets__(offsets: array, ranges: Sequence[Tuple[int, int]]) -> array:
+    """Creates the offsets for the given ranges, rebased to the new buffer."""
+    result: array = array(offsets.typecode, [0])
+    for start, stop in ranges:
+        result.extend(map(add, offsets[start + 1 : stop + 1], repeat(result[-1] - offsets[start])))
+    return result
+
+
+class StringColumn:
+    """
+    StringColumn
+    ------------
+    Column of optional strings, packed as UTF-8 into one buffer with offsets.
+
+    Parameters
+    ----------
+    values: Optional[Iterable[Optional[str]]] (default:= None)
+        Initial values
+    """
+
+    __slots__ = ("__data", "__offsets", "__nulls")
+
+    def __init__(self, values: Optional[Iterable[Optional[str]]] = None) -> None:
+        self.__data: bytearray = bytearray()
+        self.__offsets: array = array("Q", [0])
+        self.__nulls: bytearray = bytearray()
+        if values is not None:
+            for value in values:
+                self.append(value)
+
+    def append(self, value: Optional[str]) -> None:
+        """
+        Appends a value.
+
+        Parameters
+        ----------
+        value: Optional[str]
+            Value to append
+        """
+        if value is not None:
+            self.__data += value.encode("utf-8")
+        self.__offsets.append(len(self.__data))
+        self.__nulls.append(value is None)
+
+    def take(self, ranges: Sequence[Tuple[int, int]]) -> "StringColumn":
+        """
+        Creates a column with the values of the given row ranges.
+
+        Parameters
+        ----------
+        ranges: Sequence[Tuple[int, int]]
+            Row ranges (start, stop) to take
+
+        Returns
+        -------
+        column: StringColumn
+            New column
+        """
+        offsets: array = self.__offsets
+        column: StringColumn = StringColumn()
+        column.__data = bytearray(b"".join([self.__data[offsets[start] : offsets[stop]] for start, stop in ranges]))
+        column.__offsets = __take_offsets__(offsets, ranges)
+        column.__nulls = bytearray(b"".join([self.__nulls[start:stop] for start, stop in ranges]))
+        return column
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the buffers of the column."""
+        return len(self.__data) + self.__offsets.itemsize * len(self.__offsets) + len(self.__nulls)
+
+    def __len__(self) -> int:
+        return len(self.__nulls)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        if self.__nulls[row]:
+            return None
+        if row < 0:
+            row += len(self.__nulls)
+        return self.__data[self.__offsets[row] : self.__offsets[row + 1]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        for row in range(len(self.__nulls)):
+            yield self[row]
+
+
+class StringTable:
+    """
+    StringTable
+    -----------
+    Dictionary encoding for strings that repeat across entities, e.g., concept types, locales or property IRIs.
+    """
+
+    __slots__ = ("__values", "__codes")
+
+    def __init__(self) -> None:
+        self.__values: List[str] = []
+        self.__codes: Dict[str, int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        """
+        Returns the code of a value, the value is added to the table if needed.
+
+        Parameters
+        ----------
+        value: Optional[str]
+            Value
+
+        Returns
+        -------
+        code: int
+            Code of the value, `NO_CODE` for None
+        """
+        if value is None:
+            return NO_CODE
+        code: Optional[int] = self.__codes.get(value)
+        if code is None:
+            code = len(self.__values)
+            self.__codes[value] = code
+            self.__values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int:
+        """
+        Returns the code of a value without adding it.
+
+        Parameters
+        ----------
+        value: str
+            Value
+
+        Returns
+        -------
+        code: int
+            Code of the value, `NO_CODE` if the value is not in the table
+        """
+        return self.__codes.get(value, NO_CODE)
+
+    def __getitem__(self, code: int) -> Optional[str]:
+        return None if code == NO_CODE else self.__values[code]
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+
+class EntityFrame:
+    """
+    EntityFrame
+    -----------
+    Columnar batch of entities.
+
+    Entity-level columns:
+    - **uri**, **image**: packed strings
+    - **concept type**, **owner id**, **visibility**: codes into string tables
+    - **flags**: ownership, index targets and tenant rights as bits
+    - **status**: synchronization status
+
+    Child tables, addressed by per-entity offsets:
+    - **labels**: content, locale code and main flag of labels and aliases
+    - **descriptions**: content and locale code
+    - **data properties**: property code, JSON encoded value and locale code
+    - **object properties**: property code, direction and target URI
+    - **groups**: group id codes
+
+    Entities materialized from a frame count as unmodified (see `ThingObject.modified_fields`). Relation targets are
+    stored by their URI.
+    """
+
+    __slots__ = (
+        "__types",
+        "__locales",
+        "__properties",
+        "__owners",
+        "__visibilities",
+        "__groups",
+        "__uri",
+        "__image",
+        "__type",
+        "__flags",
+        "__owner_id",
+        "__visibility",
+        "__status",
+        "__tables",
+        "__label_offsets",
+        "__label_content",
+        "__label_locale",
+        "__label_main",
+        "__description_offsets",
+        "__description_content",
+        "__description_locale",
+        "__literal_offsets",
+        "__literal_property",
+        "__literal_value",
+        "__literal_locale",
+        "__relation_offsets",
+        "__relation_property",
+        "__relation_direction",
+        "__relation_target",
+        "__group_offsets",
+        "__group_id",
+    )
+
+    def __init__(self, tables: Iterable[str] = FRAME_TABLES) -> None:
+        # Shared string tables
+        self.__types: StringTable = StringTable()
+        self.__locales: StringTable = StringTable()
+        self.__properties: StringTable = StringTable()
+        self.__owners: StringTable = StringTable()
+        self.__visibilities: StringTable = StringTable()
+        self.__groups: StringTable = StringTable()
+        # Entity columns
+        self.__uri: StringColumn = StringColumn()
+        self.__image: StringColumn = StringColumn()
+        self.__type: array = array("l")
+        self.__flags: array = array("B")
+        self.__owner_id: array = array("l")
+        self.__visibility: array = array("h")
+        self.__status: array = array("B")
+        # Child tables
+        unknown: set = set(tables) - set(FRAME_TABLES)
+        if unknown:
+            raise ValueError(f"Unknown tables {sorted(unknown)}. Supported tables: {FRAME_TABLES}.")
+        self.__tables: Tuple[str, ...] = tuple(t for t in FRAME_TABLES if t in tables)
+        self.__label_offsets: array = array("Q", [0])
+        self.__label_content: StringColumn = StringColumn()
+        self.__label_locale: array = array("h")
+        self.__label_main: array = array("B")
+        self.__description_offsets: array = array("Q", [0])
+        self.__description_content: StringColumn = StringColumn()
+        self.__description_locale: array = array("h")
+        self.__literal_offsets: array = array("Q", [0])
+        self.__literal_property: array = array("l")
+        self.__literal_value: StringColumn = StringColumn()
+        self.__literal_locale: array = array("h")
+        self.__relation_offsets: array = array("Q", [0])
+        self.__relation_property: array = array("l")
+        self.__relation_direction: array = array("B")
+        self.__relation_target: StringColumn = StringColumn()
+        self.__group_offsets: array = array("Q", [0])
+        self.__group_id: array = array("l")
+
+    # ------------------------------------------------ Building ----------------------------------------------------
+    @staticmethod
+    def from_listing(
+        entities: Union[Dict[str, Any], Iterable[Dict[str, Any]]], status: EntityStatus = EntityStatus.SYNCED
+    ) -> "EntityFrame":
+        """
+        Creates a frame from the entities of a listing response, without creating ThingObjects.
+
+        Parameters
+        ----------
+        entities: Union[Dict[str, Any], Iterable[Dict[str, Any]]]
+            Listing response (with the `listing` key) or the entity dicts of the response
+        status: EntityStatus (default:= EntityStatus.SYNCED)
+            Status of the entities
+
+        Returns
+        -------
+        frame: EntityFrame
+            Frame with the entities
+        """
+        frame: EntityFrame = EntityFrame()
+        frame.extend_listing(entities, status)
+        return frame
+
+    @staticmethod
+    def from_things(things: Iterable[ThingObject]) -> "EntityFrame":
+        """
+        Creates a frame from entities.
+
+        Parameters
+        ----------
+        things: Iterable[ThingObject]
+            Entities, e.g., the entities of an import format file
+
+        Returns
+        -------
+        frame: EntityFrame
+            Frame with the entities
+        """
+        frame: EntityFrame = EntityFrame()
+        for thing in things:
+            frame.append(thing)
+        return frame
+
+    def extend_listing(
+        self, entities: Union[Dict[str, Any], Iterable[Dict[str, Any]]], status: EntityStatus = EntityStatus.SYNCED
+    ) -> None:
+        """
+        Appends the entities of a listing response, e.g., the next page.
+
+        Parameters
+        ----------
+        entities: Union[Dict[str, Any], Iterable[Dict[str, Any]]]
+            Listing response (with the `listing` key) or the entity dicts of the response
+        status: EntityStatus (default:= EntityStatus.SYNCED)
+            Status of the entities
+        """
+        if isinstance(entities, dict):
+            entities = entities.get("listing", [])
+        for entity in entities:
+            self.append_dict(entity, status)
+
+    def append_dict(self, entity: Dict[str, Any], status: EntityStatus = EntityStatus.UNKNOWN) -> None:
+        """
+        Appends an entity in the format of the knowledge graph service (see `ThingObject.from_dict`).
+
+        Parameters
+        ----------
+        entity: Dict[str, Any]
+            Dictionary that contains the data of the entity
+        status: EntityStatus (default:= EntityStatus.UNKNOWN)
+            Status of the entity
+        """
+        use_nel, use_vector_index, use_vector_index_document, use_fulltext_index = (
+            ThingObject.__index_targets_from_dict__(entity)
+        )
+        rights: List[str] = entity.get(TENANT_RIGHTS_TAG) or []
+        flags: int = (
+            (OWNER_FLAG if entity.get(OWNER_TAG, True) else 0)
+            | (USE_NEL_FLAG if use_nel else 0)
+            | (USE_VECTOR_INDEX_FLAG if use_vector_index else 0)
+            | (USE_VECTOR_INDEX_DOCUMENT_FLAG if use_vector_index_document else 0)
+            | (USE_FULL_TEXT_INDEX_FLAG if use_fulltext_index else 0)
+            | (READ_FLAG if TenantAccessRight.READ in rights else 0)
+            | (WRITE_FLAG if TenantAccessRight.WRITE in rights else 0)
+            | (DELETE_FLAG if TenantAccessRight.DELETE in rights else 0)
+        )
+        self.__append_entity__(
+            entity.get(URI_TAG),
+            entity[IMAGE_TAG],
+            entity[TYPE_TAG],
+            flags,
+            entity.get(OWNER_ID_TAG),
+            entity.get(VISIBILITY_TAG),
+            status,
+        )
+        if FRAME_LABELS in self.__tables:
+            for label in entity[LABELS_TAG]:
+                if label[LOCALE_TAG] in SUPPORTED_LOCALES:
+                    self.__label_content.append(label[CONTENT_TAG])
+                    self.__label_locale.append(self.__locales.code(label[LOCALE_TAG]))
+                    self.__label_main.append(bool(label[IS_MAIN_TAG]))
+            self.__label_offsets.append(len(self.__label_main))
+        if FRAME_DESCRIPTIONS in self.__tables:
+            for desc in entity[DESCRIPTIONS_TAG]:
+                self.__description_content.append(desc[DESCRIPTION_TAG])
+                self.__description_locale.append(self.__locales.code(desc[LOCALE_TAG]))
+            self.__description_offsets.append(len(self.__description_locale))
+        if FRAME_DATA_PROPERTIES in self.__tables:
+            literals: Any = entity.get(DATA_PROPERTIES_TAG, [])
+            if isinstance(literals, dict):
+                for iri, items in literals.items():
+                    for item in items:
+                        self.__append_literal__(iri, item[VALUE_TAG], item[LOCALE_TAG])
+            else:
+                for item in literals:
+                    self.__append_literal__(item[DATA_PROPERTY_TAG], item[VALUE_TAG], item[LOCALE_TAG])
+            self.__literal_offsets.append(len(self.__literal_locale))
+        if FRAME_OBJECT_PROPERTIES in self.__tables:
+            relations: Any = entity.get(OBJECT_PROPERTIES_TAG, [])
+            if isinstance(relations, list):
+                for relation in relations:
+                    code: int = self.__properties.code(relation[RELATION_TAG])
+                    for direction, tag in ((INCOMING, INCOMING_TAG), (OUTGOING, OUTGOING_TAG)):
+                        for target in relation[tag]:
+                            if isinstance(target, dict):
+                                target = target.get(URI_TAG)
+                            if isinstance(target, str):
+                                self.__append_relation__(code, direction, target)
+            self.__relation_offsets.append(len(self.__relation_direction))
+        if FRAME_GROUPS in self.__tables:
+            for group_id in entity.get(GROUP_IDS) or []:
+                self.__group_id.append(self.__groups.code(group_id))
+            self.__group_offsets.append(len(self.__group_id))
+
+    def append(self, thing: ThingObject) -> None:
+        """
+        Appends an entity.
+
+        Parameters
+        ----------
+        thing: ThingObject
+            Entity to append
+        """
+        rights: TenantAccessRight = thing.tenant_access_right
+        flags: int = (
+            (OWNER_FLAG if thing.owner else 0)
+            | (USE_NEL_FLAG if thing.use_for_nel else 0)
+            | (USE_VECTOR_INDEX_FLAG if thing.use_vector_index else 0)
+            | (USE_VECTOR_INDEX_DOCUMENT_FLAG if thing.use_vector_index_document else 0)
+            | (USE_FULL_TEXT_INDEX_FLAG if thing.use_full_text_index else 0)
+            | (READ_FLAG if rights.read else 0)
+            | (WRITE_FLAG if rights.write else 0)
+            | (DELETE_FLAG if rights.delete else 0)
+        )
+        self.__append_entity__(
+            thing.uri,
+            thing.image,
+            thing.concept_type.iri,
+            flags,
+            thing.owner_id,
+            thing.visibility,
+            thing.status_flag,
+        )
+        if FRAME_LABELS in self.__tables:
+            for labels, main in ((thing.label, True), (thing.alias, False)):
+                for label in labels:
+                    self.__label_content.append(label.content)
+                    self.__label_locale.append(self.__locales.code(label.language_code))
+                    self.__label_main.append(main)
+            self.__label_offsets.append(len(self.__label_main))
+        if FRAME_DESCRIPTIONS in self.__tables:
+            for desc in thing.description:
+                self.__description_content.append(desc.content)
+                self.__description_locale.append(self.__locales.code(desc.language_code))
+            self.__description_offsets.append(len(self.__description_locale))
+        if FRAME_DATA_PROPERTIES in self.__tables:
+            for prop, items in thing.data_properties.items():
+                for item in items:
+                    self.__append_literal__(prop.iri, item.value, item.language_code)
+            self.__literal_offsets.append(len(self.__literal_locale))
+        if FRAME_OBJECT_PROPERTIES in self.__tables:
+            for prop, relation in thing.object_properties.items():
+                code: int = self.__properties.code(prop.iri)
+                for direction, targets in (
+                    (INCOMING, relation.incoming_relations),
+                    (OUTGOING, relation.outgoing_relations),
+                ):
+                    for target in targets:
+                        target_uri: Optional[str] = ThingObject.__relation_id__(target)
+                        if target_uri is not None:
+                            self.__append_relation__(code, direction, target_uri)
+            self.__relation_offsets.append(len(self.__relation_direction))
+        if FRAME_GROUPS in self.__tables:
+            for group_id in thing.group_ids:
+                self.__group_id.append(self.__groups.code(group_id))
+            self.__group_offsets.append(len(self.__group_id))
+
+    def __append_entity__(
+        self,
+        uri: Optional[str],
+        image: Optional[str],
+        concept_type: str,
+        flags: int,
+        owner_id: Optional[str],
+        visibility: Optional[str],
+        status: EntityStatus,
+    ) -> None:
+        self.__uri.append(uri)
+        self.__image.append(image)
+        self.__type.append(self.__types.code(concept_type))
+        self.__flags.append(flags)
+        self.__owner_id.append(self.__owners.code(owner_id))
+        self.__visibility.append(self.__visibilities.code(visibility))
+        self.__status.append(status.value)
+
+    def __append_literal__(self, iri: str, value: Any, locale: str) -> None:
+        self.__literal_property.append(self.__properties.code(iri))
+        self.__literal_value.append(orjson.dumps(value).decode("utf-8"))
+        self.__literal_locale.append(self.__locales.code(locale))
+
+    def __append_relation__(self, code: int, direction: int, target: str) -> None:
+        self.__relation_property.append(code)
+        self.__relation_direction.append(direction)
+        self.__relation_target.append(target)
+
+    # ------------------------------------------------ Columns -----------------------------------------------------
+    @property
+    def tables(self) -> Tuple[str, ...]:
+        """Child tables of the frame (see `FRAME_TABLES`)."""
+        return self.__tables
+
+    @property
+    def uris(self) -> StringColumn:
+        """URIs of the entities."""
+        return self.__uri
+
+    @property
+    def images(self) -> StringColumn:
+        """Images of the entities."""
+        return self.__image
+
+    @property
+    def concept_types(self) -> List[OntologyClassReference]:
+        """Concept types of the entities."""
+        types: List[OntologyClassReference] = [OntologyClassReference.parse(t) for t in self.__type_values__()]
+        return [types[code] for code in self.__type]
+
+    def __type_values__(self) -> List[str]:
+        return [self.__types[code] for code in range(len(self.__types))]
+
+    def uri(self, idx: int) -> Optional[str]:
+        """
+        URI of an entity.
+
+        Parameters
+        ----------
+        idx: int
+            Index of the entity
+
+        Returns
+        -------
+        uri: Optional[str]
+            URI of the entity
+        """
+        return self.__uri[idx]
+
+    def concept_type(self, idx: int) -> OntologyClassReference:
+        """
+        Concept type of an entity.
+
+        Parameters
+        ----------
+        idx: int
+            Index of the entity
+
+        Returns
+        -------
+        concept_type: OntologyClassReference
+            Concept type of the entity
+        """
+        return OntologyClassReference.parse(self.__types[self.__type[idx]])
+
+    def labels(self, idx: int, locale: Optional[LocaleCode] = None, main: Optional[bool] = True) -> List[str]:
+        """
+        Labels of an entity.
+
+        Parameters
+        ----------
+        idx: int
+            Index of the entity
+        locale: Optional[LocaleCode] (default:= None)
+            Only labels of the locale
+        main: Optional[bool] (default:= True)
+            True for the main labels, False for the aliases, None for both
+
+        Returns
+        -------
+        labels: List[str]
+            Content of the labels
+        """
+        self.__check_table__(FRAME_LABELS)
+        locale_code: int = NO_CODE if locale is None else self.__locales.lookup(locale)
+        if locale is not None and locale_code == NO_CODE:
+            return []
+        return [
+            self.__label_content[row]
+            for row in range(self.__label_offsets[idx], self.__label_offsets[idx + 1])
+            if (locale is None or self.__label_locale[row] == locale_code)
+            and (main is None or bool(self.__label_main[row]) == main)
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the column buffers (without the shared string tables)."""
+        size: int = 0
+        for value in (
+            self.__uri,
+            self.__image,
+            self.__type,
+            self.__flags,
+            self.__owner_id,
+            self.__visibility,
+            self.__status,
+            self.__label_offsets,
+            self.__label_content,
+            self.__label_locale,
+            self.__label_main,
+            self.__description_offsets,
+            self.__description_content,
+            self.__description_locale,
+            self.__literal_offsets,
+            self.__literal_property,
+            self.__literal_value,
+            self.__literal_locale,
+            self.__relation_offsets,
+            self.__relation_property,
+            self.__relation_direction,
+            self.__relation_target,
+            self.__group_offsets,
+            self.__group_id,
+        ):
+            size += value.nbytes if isinstance(value, StringColumn) else value.itemsize * len(value)
+        return size
+
+    def __check_table__(self, table: str) -> None:
+        if table not in self.__tables:
+            raise ValueError(f"Table {table} is not part of the frame. Tables: {self.__tables}.")
+
+    # ---------------------------------------------- Filtering -----------------------------------------------------
+    def indices(
+        self,
+        concept_type: Optional[Union[OntologyClassReference, str]] = None,
+        locale: Optional[LocaleCode] = None,
+        owner: Optional[bool] = None,
+        owner_id: Optional[str] = None,
+        use_for_nel: Optional[bool] = None,
+        use_vector_index: Optional[bool] = None,
+        use_vector_index_document: Optional[bool] = None,
+        use_full_text_index: Optional[bool] = None,
+    ) -> array:
+        """
+        Indices of the entities matching all given conditions, conditions that are None are ignored.
+
+        Parameters
+        ----------
+        concept_type: Optional[Union[OntologyClassReference, str]] (default:= None)
+            Concept type of the entity (exact match)
+        locale: Optional[LocaleCode] (default:= None)
+            Entity has a main label in the locale
+        owner: Optional[bool] (default:= None)
+            The user is the owner of the entity
+        owner_id: Optional[str] (default:= None)
+            Id of the owner
+        use_for_nel: Optional[bool] (default:= None)
+            Entity is used for named entity linking
+        use_vector_index: Optional[bool] (default:= None)
+            Entity is used for the vector index
+        use_vector_index_document: Optional[bool] (default:= None)
+            Entity is used for the vector index of documents
+        use_full_text_index: Optional[bool] (default:= None)
+            Entity is used for the full text index
+
+        Returns
+        -------
+        indices: array
+            Indices of the matching entities
+        """
+        candidates: Iterable[int] = range(len(self))
+        if concept_type is not None:
+            iri: str = concept_type.iri if isinstance(concept_type, OntologyClassReference) else concept_type
+            type_code: int = self.__types.lookup(iri)
+            types: array = self.__type
+            candidates = [idx for idx in candidates if types[idx] == type_code] if type_code != NO_CODE else []
+        if owner_id is not None:
+            owner_code: int = self.__owners.lookup(owner_id)
+            owners: array = self.__owner_id
+            candidates = [idx for idx in candidates if owners[idx] == owner_code] if owner_code != NO_CODE else []
+        mask: int = 0
+        expected: int = 0
+        for flag, condition in (
+            (OWNER_FLAG, owner),
+            (USE_NEL_FLAG, use_for_nel),
+            (USE_VECTOR_INDEX_FLAG, use_vector_index),
+            (USE_VECTOR_INDEX_DOCUMENT_FLAG, use_vector_index_document),
+            (USE_FULL_TEXT_INDEX_FLAG, use_full_text_index),
+        ):
+            if condition is not None:
+                mask |= flag
+                expected |= flag if condition else 0
+        if mask:
+            flags: array = self.__flags
+            candidates = [idx for idx in candidates if flags[idx] & mask == expected]
+        if locale is not None:
+            self.__check_table__(FRAME_LABELS)
+            locale_code: int = self.__locales.lookup(locale)
+            offsets: array = self.__label_offsets
+            locales: array = self.__label_locale
+            mains: array = self.__label_main
+            candidates = [
+                idx
+                for idx in candidates
+                if any(locales[row] == locale_code and mains[row] for row in range(offsets[idx], offsets[idx + 1]))
+            ]
+        return array("Q", candidates)
+
+    def where(self, **conditions: Any) -> "EntityFrame":
+        """
+        Frame with the entities matching all given conditions (see `indices` for the conditions).
+
+        Parameters
+        ----------
+        conditions: Any
+            Conditions
+
+        Returns
+        -------
+        frame: EntityFrame
+            Filtered frame
+        """
+        return self.take(self.indices(**conditions))
+
+    def take(self, indices: Sequence[int]) -> "EntityFrame":
+        """
+        Frame with the entities at the given indices.
+
+        Parameters
+        ----------
+        indices: Sequence[int]
+            Indices of the entities
+
+        Returns
+        -------
+        frame: EntityFrame
+            New frame, sharing the string tables with this frame
+        """
+        return self.__subset__(indices, self.__tables)
+
+    def select(self, *tables: str) -> "EntityFrame":
+        """
+        Projection of the frame on the given child tables (see `FRAME_TABLES`). The entity columns are always kept.
+
+        Parameters
+        ----------
+        tables: str
+            Child tables to keep
+
+        Returns
+        -------
+        frame: EntityFrame
+            New frame, sharing the string tables with this frame
+
+        Raises
+        ------
+        ValueError
+            If a table is not part of the frame.
+        """
+        for table in tables:
+            self.__check_table__(table)
+        return self.__subset__(range(len(self)), tables)
+
+    def __subset__(self, indices: Sequence[int], tables: Iterable[str]) -> "EntityFrame":
+        frame: EntityFrame = EntityFrame(tables)
+        # Share the string tables, the codes stay valid
+        frame.__types = self.__types
+        frame.__locales = self.__locales
+        frame.__properties = self.__properties
+        frame.__owners = self.__owners
+        frame.__visibilities = self.__visibilities
+        frame.__groups = self.__groups
+        ranges: List[Tuple[int, int]] = __ranges__(indices)
+        frame.__uri = self.__uri.take(ranges)
+        frame.__image = self.__image.take(ranges)
+        frame.__type = __take__(self.__type, ranges)
+        frame.__flags = __take__(self.__flags, ranges)
+        frame.__owner_id = __take__(self.__owner_id, ranges)
+        frame.__visibility = __take__(self.__visibility, ranges)
+        frame.__status = __take__(self.__status, ranges)
+        if FRAME_LABELS in frame.__tables:
+            rows: List[Tuple[int, int]] = __child_ranges__(self.__label_offsets, ranges)
+            frame.__label_offsets = __take_offsets__(self.__label_offsets, ranges)
+            frame.__label_content = self.__label_content.take(rows)
+            frame.__label_locale = __take__(self.__label_locale, rows)
+            frame.__label_main = __take__(self.__label_main, rows)
+        if FRAME_DESCRIPTIONS in frame.__tables:
+            rows = __child_ranges__(self.__description_offsets, ranges)
+            frame.__description_offsets = __take_offsets__(self.__description_offsets, ranges)
+            frame.__description_content = self.__description_content.take(rows)
+            frame.__description_locale = __take__(self.__description_locale, rows)
+        if FRAME_DATA_PROPERTIES in frame.__tables:
+            rows = __child_ranges__(self.__literal_offsets, ranges)
+            frame.__literal_offsets = __take_offsets__(self.__literal_offsets, ranges)
+            frame.__literal_property = __take__(self.__literal_property, rows)
+            frame.__literal_value = self.__literal_value.take(rows)
+            frame.__literal_locale = __take__(self.__literal_locale, rows)
+        if FRAME_OBJECT_PROPERTIES in frame.__tables:
+            rows = __child_ranges__(self.__relation_offsets, ranges)
+            frame.__relation_offsets = __take_offsets__(self.__relation_offsets, ranges)
+            frame.__relation_property = __take__(self.__relation_property, rows)
+            frame.__relation_direction = __take__(self.__relation_direction, rows)
+            frame.__relation_target = self.__relation_target.take(rows)
+        if FRAME_GROUPS in frame.__tables:
+            rows = __child_ranges__(self.__group_offsets, ranges)
+            frame.__group_offsets = __take_offsets__(self.__group_offsets, ranges)
+            frame.__group_id = __take__(self.__group_id, rows)
+        return frame
+
+    # --------------------------------------------- Materializing --------------------------------------------------
+    def to_thing(self, idx: int) -> ThingObject:
+        """
+        Creates the ThingObject of an entity. Child tables that are not part of the frame are left empty.
+
+        Parameters
+        ----------
+        idx: int
+            Index of the entity
+
+        Returns
+        -------
+        thing: ThingObject
+            Entity
+        """
+        if idx < 0:
+            idx += len(self)
+        flags: int = self.__flags[idx]
+        thing: ThingObject = ThingObject(
+            icon=self.__image[idx],
+            uri=self.__uri[idx],
+            concept_type=OntologyClassReference.parse(self.__types[self.__type[idx]]),
+            owner=bool(flags & OWNER_FLAG),
+            use_for_nel=bool(flags & USE_NEL_FLAG),
+            use_vector_index=bool(flags & USE_VECTOR_INDEX_FLAG),
+            use_vector_index_document=bool(flags & USE_VECTOR_INDEX_DOCUMENT_FLAG),
+            use_full_text_index=bool(flags & USE_FULL_TEXT_INDEX_FLAG),
+            tenant_rights=TenantAccessRight(
+                read=bool(flags & READ_FLAG), write=bool(flags & WRITE_FLAG), delete=bool(flags & DELETE_FLAG)
+            ),
+        )
+        thing.owner_id = self.__owners[self.__owner_id[idx]]
+        thing.visibility = self.__visibilities[self.__visibility[idx]]
+        thing.status_flag = EntityStatus(self.__status[idx])
+        if FRAME_LABELS in self.__tables:
+            labels: List[Label] = []
+            alias: List[Label] = []
+            for row in range(self.__label_offsets[idx], self.__label_offsets[idx + 1]):
+                main: bool = bool(self.__label_main[row])
+                label: Label = Label(self.__label_content[row], self.__locales[self.__label_locale[row]], main)
+                (labels if main else alias).append(label)
+            thing.label = labels
+            thing.alias = alias
+        if FRAME_DESCRIPTIONS in self.__tables:
+            thing.description = [
+                Description(self.__description_content[row], self.__locales[self.__description_locale[row]])
+                for row in range(self.__description_offsets[idx], self.__description_offsets[idx + 1])
+            ]
+        if FRAME_DATA_PROPERTIES in self.__tables:
+            for row in range(self.__literal_offsets[idx], self.__literal_offsets[idx + 1]):
+                thing.add_data_property(
+                    DataProperty(
+                        orjson.loads(self.__literal_value[row]),
+                        OntologyPropertyReference.parse(self.__properties[self.__literal_property[row]]),
+                        LocaleCode(self.__locales[self.__literal_locale[row]]),
+                    )
+                )
+        if FRAME_OBJECT_PROPERTIES in self.__tables:
+            relations: Dict[OntologyPropertyReference, ObjectProperty] = {}
+            for row in range(self.__relation_offsets[idx], self.__relation_offsets[idx + 1]):
+                prop: OntologyPropertyReference = OntologyPropertyReference.parse(
+                    self.__properties[self.__relation_property[row]]
+                )
+                relation: Optional[ObjectProperty] = relations.get(prop)
+                if relation is None:
+                    relation = ObjectProperty(prop)
+                    relations[prop] = relation
+                if self.__relation_direction[row] == INCOMING:
+                    relation.incoming_relations.append(self.__relation_target[row])
+                else:
+                    relation.outgoing_relations.append(self.__relation_target[row])
+            thing.object_properties = relations
+        if FRAME_GROUPS in self.__tables:
+            thing.group_ids = [
+                self.__groups[self.__group_id[row]]
+                for row in range(self.__group_offsets[idx], self.__group_offsets[idx + 1])
+            ]
+        thing.reset_modified()
+        return thing
+
+    def to_things(self) -> List[ThingObject]:
+        """
+        Creates the ThingObjects of all entities.
+
+        Returns
+        -------
+        things: List[ThingObject]
+            Entities
+        """
+        return [self.to_thing(idx) for idx in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self.__flags)
+
+    def __iter__(self) -> Iterator[ThingObject]:
+        for idx in range(len(self)):
+            yield self.to_thing(idx)
+
+    @overload
+    def __getitem__(self, item: int) -> ThingObject: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> "EntityFrame": ...
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[ThingObject, "EntityFrame"]:
+        if isinstance(item, slice):
+            return self.take(range(*item.indices(len(self))))
+        return self.to_thing(item)
+
+    def __repr__(self) -> str:
+        return f"<EntityFrame: [entities:={len(self)}, tables:={self.__tables}]>"
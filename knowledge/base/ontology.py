@@ -2,9 +2,13 @@
 # Copyright © 2021-present Wacom. All rights reserved.
 import abc
 import enum
+import copyreg
+import hashlib
+import json
 from datetime import datetime
+from functools import lru_cache, wraps
 from json import JSONEncoder
-from typing import Union, Optional, Any, List, Dict, Tuple, Set
+from typing import Union, Optional, Any, List, Dict, Tuple, Set, FrozenSet, Callable, Sized
 
 import loguru
 from rdflib import Literal, RDFS, OWL, URIRef, RDF, Graph
@@ -77,6 +81,9 @@ NAME_TAG: str = "name"
 SEND_TO_NEL: str = "sendToNEL"
 # ---------------------------------------------------- RDFLib ----------------------------------------------------------
 PREFERRED_LABEL: URIRef = URIRef("wacom:core#prefLabel")
+# ---------------------------------------------------- Interning -------------------------------------------------------
+REFERENCE_CACHE_SIZE: int = 16384
+"""Maximum number of interned class and property references per reference type."""
 logger = loguru.logger
 
 
@@ -207,6 +214,8 @@ class OntologyLabel(LocalizedContent):
         Main content
     """
 
+    __slots__ = ("__main",)
+
     def __init__(self, content: str, language_code: LanguageCode = EN, main: bool = False) -> None:
         self.__main: bool = main
         super().__init__(content, language_code)
@@ -309,10 +318,13 @@ class OntologyObjectReference(abc.ABC):
         Ontology object reference name
     """
 
+    __slots__ = ("__scheme", "__context", "__name", "__iri")
+
     def __init__(self, scheme: str, context: str, name: str) -> None:
         self.__scheme: str = scheme
         self.__context: str = context
         self.__name: str = name
+        self.__iri: str = f"{scheme}:{context}#{name}"
 
     @property
     def scheme(self) -> str:
@@ -332,7 +344,7 @@ class OntologyObjectReference(abc.ABC):
     @property
     def iri(self) -> str:
         """Internationalized Resource Identifier (IRI) encoded ontology class name."""
-        return f"{self.scheme}:{self.context}#{self.name}"
+        return self.__iri
 
     def __repr__(self) -> str:
         return self.iri
@@ -379,6 +391,8 @@ class OntologyClassReference(OntologyObjectReference):
         Class name
     """
 
+    __slots__ = ()
+
     def __init__(self, scheme: str, context: str, class_name: str) -> None:
         super().__init__(scheme, context, class_name)
 
@@ -390,6 +404,7 @@ class OntologyClassReference(OntologyObjectReference):
     @classmethod
     def parse(cls, iri: str) -> "OntologyClassReference":
         """Parse IRI to create an ontology class reference.
+        References are interned, thus parsing the same IRI returns the same shared instance.
 
         Parameters
         ----------
@@ -401,10 +416,22 @@ class OntologyClassReference(OntologyObjectReference):
         instance: OntologyClassReference
             Instance of ontology class reference
         """
+        if iri is None:
+            raise ValueError("IRI cannot be None")
+        return OntologyClassReference.__intern__(iri)
+
+    @staticmethod
+    @lru_cache(maxsize=REFERENCE_CACHE_SIZE)
+    def __intern__(iri: str) -> "OntologyClassReference":
         scheme, context, name = OntologyObjectReference.parse_iri(iri)
         return OntologyClassReference(scheme, context, name)
 
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        return OntologyClassReference.parse, (self.iri,)
+
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, OntologyClassReference):
             return False
         return self.iri == other.iri
@@ -429,6 +456,8 @@ class OntologyPropertyReference(OntologyObjectReference):
         Property name
     """
 
+    __slots__ = ()
+
     def __init__(self, scheme: str, context: str, property_name: str) -> None:
         super().__init__(scheme, context, property_name)
 
@@ -440,6 +469,7 @@ class OntologyPropertyReference(OntologyObjectReference):
     @classmethod
     def parse(cls, iri: str) -> "OntologyPropertyReference":
         """Parses an IRI into an OntologyPropertyReference.
+        References are interned, thus parsing the same IRI returns the same shared instance.
 
         Parameters
         ----------
@@ -451,10 +481,22 @@ class OntologyPropertyReference(OntologyObjectReference):
         instance: OntologyPropertyReference
             Instance of OntologyPropertyReference
         """
+        if iri is None:
+            raise ValueError("IRI cannot be None")
+        return OntologyPropertyReference.__intern__(iri)
+
+    @staticmethod
+    @lru_cache(maxsize=REFERENCE_CACHE_SIZE)
+    def __intern__(iri: str) -> "OntologyPropertyReference":
         scheme, context, name = OntologyObjectReference.parse_iri(iri)
         return OntologyPropertyReference(scheme, context, name)
 
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        return OntologyPropertyReference.parse, (self.iri,)
+
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, OntologyPropertyReference):
             return False
         return self.iri == other.iri
@@ -464,10 +506,10 @@ class OntologyPropertyReference(OntologyObjectReference):
 
 
 # ---------------------------------------------------- Classes Constants -----------------------------------------------
-THING_CLASS: OntologyClassReference = OntologyClassReference("wacom", "core", "Thing")
+THING_CLASS: OntologyClassReference = OntologyClassReference.parse("wacom:core#Thing")
 # ---------------------------------------------------- Property Constants ----------------------------------------------
-SYSTEM_SOURCE_SYSTEM: OntologyPropertyReference = OntologyPropertyReference("wacom", "core", "sourceSystem")
-SYSTEM_SOURCE_REFERENCE_ID: OntologyPropertyReference = OntologyPropertyReference("wacom", "core", "sourceReferenceId")
+SYSTEM_SOURCE_SYSTEM: OntologyPropertyReference = OntologyPropertyReference.parse("wacom:core#sourceSystem")
+SYSTEM_SOURCE_REFERENCE_ID: OntologyPropertyReference = OntologyPropertyReference.parse("wacom:core#sourceReferenceId")
 CREATION_DATE: OntologyPropertyReference = OntologyPropertyReference.parse("wacom:core#creationDate")
 LAST_UPDATE_DATE: OntologyPropertyReference = OntologyPropertyReference.parse("wacom:core#lastUpdate")
 
@@ -486,6 +528,8 @@ class Comment(LocalizedContent):
         Language code of content
     """
 
+    __slots__ = ()
+
     def __init__(self, text: str, language_code: LanguageCode = LanguageCode("en")) -> None:
         super().__init__(text, language_code)
 
@@ -1145,6 +1189,8 @@ class EntityProperty(abc.ABC):
     Abstract class for the different types of properties.
     """
 
+    __slots__ = ()
+
 
 class DataProperty(EntityProperty):
     """
@@ -1164,6 +1210,8 @@ class DataProperty(EntityProperty):
         Data type
     """
 
+    __slots__ = ("__content", "__language_code", "__type", "__data_type")
+
     def __init__(
         self,
         content: Any,
@@ -1290,6 +1338,8 @@ class ObjectProperty(EntityProperty):
         Outgoing relations
     """
 
+    __slots__ = ("__relation", "__incoming", "__outgoing")
+
     def __init__(
         self,
         relation: OntologyPropertyReference,
@@ -1420,6 +1470,10 @@ class Ontology:
         self.__classes: Dict[OntologyClassReference, OntologyClass] = {}
         self.__data_properties: Dict[str, OntologyProperty] = {}
         self.__object_properties: Dict[str, OntologyProperty] = {}
+        # Indexes, computed on first use and invalidated when classes or properties are added
+        self.__ancestors: Dict[OntologyClassReference, FrozenSet[OntologyClassReference]] = {}
+        self.__data_properties_index: Dict[OntologyClassReference, List[OntologyPropertyReference]] = {}
+        self.__object_properties_index: Dict[OntologyClassReference, List[OntologyPropertyReference]] = {}
 
     def add_class(self, class_obj: OntologyClass) -> None:
         """
@@ -1431,6 +1485,7 @@ class Ontology:
             Class object
         """
         self.__classes[class_obj.reference] = class_obj
+        self.invalidate()
 
     def add_properties(self, prop_obj: OntologyProperty) -> None:
         """
@@ -1442,8 +1497,54 @@ class Ontology:
         """
         if prop_obj.is_data_property:
             self.__data_properties[prop_obj.reference.iri] = prop_obj
+            self.__data_properties_index.clear()
         else:
             self.__object_properties[prop_obj.reference.iri] = prop_obj
+            self.__object_properties_index.clear()
+
+    def invalidate(self) -> None:
+        """
+        Invalidates the ancestor sets and the property indexes of the classes.
+
+        The indexes are invalidated when classes or properties are added. Call this method after modifying the domains
+        of a property that is already part of the ontology.
+        """
+        self.__ancestors.clear()
+        self.__data_properties_index.clear()
+        self.__object_properties_index.clear()
+
+    def ancestors(self, cls_reference: OntologyClassReference) -> FrozenSet[OntologyClassReference]:
+        """
+        The class and all its super classes.
+
+        Parameters
+        ----------
+        cls_reference: OntologyClassReference
+            Class reference
+
+        Returns
+        -------
+        ancestors: FrozenSet[OntologyClassReference]
+            References of the class and its super classes, empty if the class is not part of the ontology.
+        """
+        ancestors: Optional[FrozenSet[OntologyClassReference]] = self.__ancestors.get(cls_reference)
+        if ancestors is not None:
+            return ancestors
+        chain: Set[OntologyClassReference] = set()
+        inherited: FrozenSet[OntologyClassReference] = frozenset()
+        current_clz: Optional[OntologyClass] = self.get_class(cls_reference)
+        while current_clz is not None and current_clz.reference not in chain:
+            known: Optional[FrozenSet[OntologyClassReference]] = self.__ancestors.get(current_clz.reference)
+            if known is not None:
+                inherited = known
+                break
+            chain.add(current_clz.reference)
+            if current_clz.subclass_of is None:
+                break
+            current_clz = self.get_class(current_clz.subclass_of)
+        ancestors = inherited.union(chain)
+        self.__ancestors[cls_reference] = ancestors
+        return ancestors
 
     @property
     def data_properties(self) -> List[OntologyProperty]:
@@ -1475,14 +1576,22 @@ class Ontology:
         result: bool
             True if the class is in domain.
         """
-        current_clz: Optional[OntologyClass] = self.get_class(clz)
-        while current_clz is not None:
-            if current_clz.reference == domain:
-                return True
-            if current_clz.subclass_of is None:
-                break
-            current_clz = self.get_class(current_clz.subclass_of)
-        return False
+        return domain in self.ancestors(clz)
+
+    def __properties_for__(
+        self,
+        cls_reference: OntologyClassReference,
+        properties: Dict[str, OntologyProperty],
+        index: Dict[OntologyClassReference, List[OntologyPropertyReference]],
+    ) -> List[OntologyPropertyReference]:
+        references: Optional[List[OntologyPropertyReference]] = index.get(cls_reference)
+        if references is None:
+            ancestors: FrozenSet[OntologyClassReference] = self.ancestors(cls_reference)
+            references = [
+                prop.reference for prop in properties.values() for domain in prop.domains if domain in ancestors
+            ]
+            index[cls_reference] = references
+        return list(references)
 
     def get_class(self, class_reference: OntologyClassReference) -> Optional[OntologyClass]:
         """
@@ -1546,14 +1655,7 @@ class Ontology:
         data_properties: List[OntologyPropertyReference]
             List of data properties, where domain fit for the class of one of its super classes.
         """
-        data_properties: List[OntologyPropertyReference] = []
-        clz: Optional[OntologyClass] = self.get_class(cls_reference)
-        if clz is not None:
-            for dp in self.data_properties:
-                for domain in dp.domains:
-                    if self.__check_hierarchy__(clz.reference, domain):
-                        data_properties.append(dp.reference)
-        return data_properties
+        return self.__properties_for__(cls_reference, self.__data_properties, self.__data_properties_index)
 
     def object_properties_for(self, cls_reference: OntologyClassReference) -> List[OntologyPropertyReference]:
         """
@@ -1569,19 +1671,38 @@ class Ontology:
         object_properties: List[OntologyPropertyReference]
             List of object properties, where domain fit for the class of one of its super classes.
         """
-        object_properties: List[OntologyPropertyReference] = []
-        clz: Optional[OntologyClass] = self.get_class(cls_reference)
-        if clz is not None:
-            for dp in self.object_properties:
-                for domain in dp.domains:
-                    if self.__check_hierarchy__(clz.reference, domain):
-                        object_properties.append(dp.reference)
-        return object_properties
+        return self.__properties_for__(cls_reference, self.__object_properties, self.__object_properties_index)
 
     def __repr__(self) -> str:
         return f"<Ontology> : classes:= {self.classes}"
 
 
+# ---------------------------------------------- Modification tracking -------------------------------------------------
+TRACKED_FIELDS: FrozenSet[str] = frozenset(
+    {
+        TYPE_TAG,
+        IMAGE_TAG,
+        LABELS_TAG,
+        DESCRIPTIONS_TAG,
+        DATA_PROPERTIES_TAG,
+        OBJECT_PROPERTIES_TAG,
+        TARGETS_TAG,
+        TENANT_RIGHTS_TAG,
+    }
+)
+"""Fields of an entity whose modifications are tracked, named after the tags of the entity payload."""
+NO_FIELDS: FrozenSet[str] = frozenset()
+
+# ---------------------------------------------------- Pickling --------------------------------------------------------
+PICKLE_STATE_VERSION: int = 1
+"""
+Version of the compact tuple state of ThingObject. Increase it when the layout of the state changes, states of
+unknown versions are rejected when unpickling.
+"""
+__ENTITY_STATUS_BY_VALUE__: Dict[int, EntityStatus] = {status.value: status for status in EntityStatus}
+__DATA_TYPE_BY_VALUE__: Dict[str, DataPropertyType] = {data_type.value: data_type for data_type in DataPropertyType}
+
+
 class ThingObject:
     """
     ThingObject
@@ -1624,6 +1745,35 @@ class ThingObject:
         Use full text index for entity
     """
 
+    __slots__ = (
+        "__uri",
+        "__icon",
+        "__label",
+        "__description",
+        "__alias",
+        "__concept_type",
+        "__data_properties",
+        "__object_properties",
+        "__tenants_rights",
+        "__status_flag",
+        "__ontology_types",
+        "__owner",
+        "__owner_id",
+        "__owner_external_user_id",
+        "__group_ids",
+        "__use_for_nel",
+        "__use_vector_index",
+        "__use_vector_index_document",
+        "__use_full_text_index",
+        "__visibility",
+        "__fingerprint",
+        "__modified",
+        "__label_index",
+        "__alias_index",
+        "__description_index",
+        "__data_property_index",
+    )
+
     def __init__(
         self,
         label: Optional[List[Label]] = None,
@@ -1658,6 +1808,119 @@ class ThingObject:
         self.__use_vector_index_document: bool = use_vector_index_document
         self.__use_full_text_index: bool = use_full_text_index
         self.__visibility: Optional[str] = None
+        # Cached fingerprint, stored with the containers of the content and their sizes (see `__content_stamp__`)
+        self.__fingerprint: Optional[Tuple[str, Tuple[Sized, ...], Tuple[int, ...]]] = None
+        # A new entity has not been synchronized yet, thus all fields count as modified. The frozen sets are shared
+        # between the entities and only replaced on modification.
+        self.__modified: FrozenSet[str] = TRACKED_FIELDS
+        # Locale-keyed lookup indexes, built on first access and maintained by the mutators. Each index is stored with
+        # the container it has been built from and its size, so that in-place changes of the lists are detected.
+        self.__label_index: Optional[Tuple[List[Label], int, Dict[str, Label]]] = None
+        self.__alias_index: Optional[Tuple[List[Label], int, Dict[str, List[Label]]]] = None
+        self.__description_index: Optional[Tuple[List[Description], int, Dict[str, Description]]] = None
+        self.__data_property_index: Optional[
+            Dict[OntologyPropertyReference, Tuple[List[DataProperty], int, Dict[str, List[DataProperty]]]]
+        ] = None
+
+    def __touch__(self, *fields: str) -> None:
+        """Marks the fields of the entity as modified, which invalidates the cached fingerprint."""
+        self.__fingerprint = None
+        if not self.__modified.issuperset(fields):
+            self.__modified = self.__modified.union(fields)
+
+    @property
+    def modified_fields(self) -> FrozenSet[str]:
+        """
+        Fields modified since the entity has been loaded from the service or since the last `reset_modified`
+        (see `TRACKED_FIELDS`). Aliases are tracked as labels, and the source reference id and source system as data
+        properties. In-place changes of the returned lists and dicts are not tracked, use `mark_modified` for them.
+        """
+        return self.__modified
+
+    @property
+    def is_modified(self) -> bool:
+        """Flag if any field has been modified."""
+        return len(self.__modified) > 0
+
+    def mark_modified(self, *fields: str) -> None:
+        """
+        Marks fields as modified, e.g., after changing the lists or dicts of the entity in-place. The locale lookups and
+        the fingerprint are rebuilt as well, as replacing or editing items in place is not detected.
+
+        Parameters
+        ----------
+        fields: str
+            Fields to mark (see `TRACKED_FIELDS`). If no field is given, all fields are marked.
+
+        Raises
+        ------
+        ValueError
+            If a field is not tracked.
+        """
+        unknown: Set[str] = set(fields) - TRACKED_FIELDS
+        if unknown:
+            raise ValueError(f"Fields {sorted(unknown)} are not tracked. Tracked fields: {sorted(TRACKED_FIELDS)}.")
+        # Items may have been replaced in place, which does not change the size of the lists
+        self.__label_index = None
+        self.__alias_index = None
+        self.__description_index = None
+        self.__data_property_index = None
+        self.__touch__(*(fields or TRACKED_FIELDS))
+
+    def reset_modified(self, *fields: str) -> None:
+        """
+        Marks fields as synchronized with the service.
+
+        Parameters
+        ----------
+        fields: str
+            Fields to reset. If no field is given, all fields are reset, i.e., the entity counts as unmodified.
+        """
+        self.__modified = self.__modified.difference(fields) if fields else NO_FIELDS
+
+    @staticmethod
+    def __is_current__(entry: Optional[Tuple[Sized, int, Any]], container: Sized) -> bool:
+        """Check if an index has been built from the container, and the container has not been resized since."""
+        return entry is not None and entry[0] is container and entry[1] == len(container)
+
+    def __label_lookup__(self) -> Dict[str, Label]:
+        if not ThingObject.__is_current__(self.__label_index, self.__label):
+            index: Dict[str, Label] = {}
+            for label in self.__label:
+                index.setdefault(label.language_code, label)
+            self.__label_index = (self.__label, len(self.__label), index)
+        return self.__label_index[2]
+
+    def __alias_lookup__(self) -> Dict[str, List[Label]]:
+        if not ThingObject.__is_current__(self.__alias_index, self.__alias):
+            index: Dict[str, List[Label]] = {}
+            for alias in self.__alias:
+                index.setdefault(alias.language_code, []).append(alias)
+            self.__alias_index = (self.__alias, len(self.__alias), index)
+        return self.__alias_index[2]
+
+    def __description_lookup__(self) -> Dict[str, Description]:
+        if not ThingObject.__is_current__(self.__description_index, self.__description):
+            index: Dict[str, Description] = {}
+            for desc in self.__description:
+                index.setdefault(desc.language_code, desc)
+            self.__description_index = (self.__description, len(self.__description), index)
+        return self.__description_index[2]
+
+    def __data_property_lookup__(self, data_property: OntologyPropertyReference) -> Dict[str, List[DataProperty]]:
+        items: Optional[List[DataProperty]] = self.__data_properties.get(data_property)
+        if items is None:
+            return {}
+        if self.__data_property_index is None:
+            self.__data_property_index = {}
+        entry = self.__data_property_index.get(data_property)
+        if not ThingObject.__is_current__(entry, items):
+            by_locale: Dict[str, List[DataProperty]] = {}
+            for dp in items:
+                by_locale.setdefault(dp.language_code, []).append(dp)
+            entry = (items, len(items), by_locale)
+            self.__data_property_index[data_property] = entry
+        return entry[2]
 
     @property
     def uri(self) -> Optional[str]:
@@ -1685,6 +1948,7 @@ class ThingObject:
     @use_for_nel.setter
     def use_for_nel(self, use_for_nel: bool) -> None:
         self.__use_for_nel = use_for_nel
+        self.__touch__(TARGETS_TAG)
 
     @property
     def use_full_text_index(self) -> bool:
@@ -1694,6 +1958,7 @@ class ThingObject:
     @use_full_text_index.setter
     def use_full_text_index(self, use_full_text_index: bool) -> None:
         self.__use_full_text_index = use_full_text_index
+        self.__touch__(TARGETS_TAG)
 
     @property
     def use_vector_index(self) -> bool:
@@ -1703,6 +1968,7 @@ class ThingObject:
     @use_vector_index.setter
     def use_vector_index(self, use_vector_index: bool) -> None:
         self.__use_vector_index = use_vector_index
+        self.__touch__(TARGETS_TAG)
 
     @property
     def use_vector_index_document(self) -> bool:
@@ -1712,6 +1978,7 @@ class ThingObject:
     @use_vector_index_document.setter
     def use_vector_index_document(self, use_vector_index_document: bool) -> None:
         self.__use_vector_index_document = use_vector_index_document
+        self.__touch__(TARGETS_TAG)
 
     @property
     def owner(self) -> bool:
@@ -1756,12 +2023,20 @@ class ThingObject:
 
     @property
     def label(self) -> List[Label]:
-        """Labels of the entity."""
+        """
+        Labels of the entity.
+
+        Items appended to or removed from the list are picked up by the locale lookups (e.g., `label_lang`) and the
+        fingerprint; after replacing or editing an item in place, e.g., `thing.label[0] = ...`, call `mark_modified`
+        to rebuild them.
+        """
         return self.__label
 
     @label.setter
     def label(self, value: List[Label]) -> None:
         self.__label = value
+        self.__label_index = None
+        self.__touch__(LABELS_TAG)
 
     def add_label(self, label: str, language_code: LocaleCode) -> None:
         """Adding a label for an entity.
@@ -1773,7 +2048,13 @@ class ThingObject:
         language_code: LocaleCode
             ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., 'en_US'.
         """
-        self.__label.append(Label(label, language_code, True))
+        new_label: Label = Label(label, language_code, True)
+        current: bool = ThingObject.__is_current__(self.__label_index, self.__label)
+        self.__label.append(new_label)
+        if current:
+            self.__label_index[2].setdefault(new_label.language_code, new_label)
+            self.__label_index = (self.__label, len(self.__label), self.__label_index[2])
+        self.__touch__(LABELS_TAG)
 
     def update_label(self, value: str, language_code: LocaleCode) -> None:
         """Update or creates a label for a specific language.
@@ -1785,10 +2066,11 @@ class ThingObject:
         language_code: LocaleCode
             ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., 'en_US'.
         """
-        for label in self.label:
-            if label.language_code == language_code:
-                label.content = value
-                return
+        label: Optional[Label] = self.label_lang(language_code)
+        if label is not None:
+            label.content = value
+            self.__touch__(LABELS_TAG)
+            return
         # Label with language does not exist, so create a new label
         self.add_label(value, language_code)
 
@@ -1804,6 +2086,8 @@ class ThingObject:
         for idx, label in enumerate(self.label):
             if label.language_code == language_code:
                 del self.label[idx]
+                self.__label_index = None
+                self.__touch__(LABELS_TAG)
                 break
 
     def remove_alias(self, label: Label) -> None:
@@ -1818,6 +2102,8 @@ class ThingObject:
         for idx, alias in enumerate(self.alias):
             if label.language_code == alias.language_code and label.content == alias.content:
                 del self.alias[idx]
+                self.__alias_index = None
+                self.__touch__(LABELS_TAG)
                 break
 
     def label_lang(self, language_code: Union[LocaleCode, LanguageCode]) -> Optional[Label]:
@@ -1833,10 +2119,7 @@ class ThingObject:
         label: Optional[Label]
             Returns the label for a specific language code
         """
-        for label in self.label:
-            if label.language_code == language_code:
-                return label
-        return None
+        return self.__label_lookup__().get(language_code)
 
     def add_source_system(self, value: DataProperty) -> None:
         """
@@ -1858,6 +2141,8 @@ class ThingObject:
             if self.__data_properties[SYSTEM_SOURCE_SYSTEM][idx].language_code == value.language_code:
                 del self.__data_properties[SYSTEM_SOURCE_SYSTEM][idx]
         self.__data_properties[SYSTEM_SOURCE_SYSTEM].append(value)
+        self.__data_property_index = None
+        self.__touch__(DATA_PROPERTIES_TAG)
 
     @property
     def source_reference_id(self) -> Optional[List[DataProperty]]:
@@ -1891,6 +2176,8 @@ class ThingObject:
                 len_props -= 1
             idx += 1
         self.__data_properties[SYSTEM_SOURCE_REFERENCE_ID].append(value)
+        self.__data_property_index = None
+        self.__touch__(DATA_PROPERTIES_TAG)
 
     @property
     def reference_id(self) -> Optional[str]:
@@ -1917,6 +2204,8 @@ class ThingObject:
         if SYSTEM_SOURCE_REFERENCE_ID not in self.__data_properties:
             self.__data_properties[SYSTEM_SOURCE_REFERENCE_ID] = []
         self.__data_properties[SYSTEM_SOURCE_REFERENCE_ID].append(DataProperty(value, SYSTEM_SOURCE_REFERENCE_ID))
+        self.__data_property_index = None
+        self.__touch__(DATA_PROPERTIES_TAG)
 
     @property
     def source_system(self) -> Optional[str]:
@@ -1943,6 +2232,8 @@ class ThingObject:
         if SYSTEM_SOURCE_SYSTEM not in self.__data_properties:
             self.__data_properties[SYSTEM_SOURCE_SYSTEM] = []
         self.__data_properties[SYSTEM_SOURCE_SYSTEM].append(DataProperty(value, SYSTEM_SOURCE_SYSTEM))
+        self.__data_property_index = None
+        self.__touch__(DATA_PROPERTIES_TAG)
 
     def default_source_reference_id(self, language_code: LocaleCode = EN_US) -> Optional[str]:
         """
@@ -1992,15 +2283,24 @@ class ThingObject:
     @image.setter
     def image(self, value: Optional[str]) -> None:
         self.__icon = value
+        self.__touch__(IMAGE_TAG)
 
     @property
     def description(self) -> List[Description]:
-        """Description of the thing (optional)."""
+        """
+        Description of the thing (optional).
+
+        Items appended to or removed from the list are picked up by the locale lookups (e.g., `description_lang`) and
+        the fingerprint; after replacing or editing an item in place, e.g., `thing.description[0] = ...`, call
+        `mark_modified` to rebuild them.
+        """
         return self.__description if self.__description else []
 
     @description.setter
     def description(self, value: List[Description]) -> None:
         self.__description = value
+        self.__description_index = None
+        self.__touch__(DESCRIPTIONS_TAG)
 
     def add_description(self, description: str, language_code: LocaleCode) -> None:
         """Adding the description for entity.
@@ -2012,7 +2312,13 @@ class ThingObject:
         language_code: LocaleCode
             ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., 'en_US'.
         """
-        self.__description.append(Description(description=description, language_code=language_code))
+        new_description: Description = Description(description=description, language_code=language_code)
+        current: bool = ThingObject.__is_current__(self.__description_index, self.__description)
+        self.__description.append(new_description)
+        if current:
+            self.__description_index[2].setdefault(new_description.language_code, new_description)
+            self.__description_index = (self.__description, len(self.__description), self.__description_index[2])
+        self.__touch__(DESCRIPTIONS_TAG)
 
     def update_description(self, value: str, language_code: LocaleCode) -> None:
         """Update or creates a description for a specific language.
@@ -2024,10 +2330,11 @@ class ThingObject:
         language_code: LocaleCode
             ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., 'en_US'.
         """
-        for desc in self.description:
-            if desc.language_code == language_code:
-                desc.content = value
-                return
+        desc: Optional[Description] = self.description_lang(language_code)
+        if desc is not None:
+            desc.content = value
+            self.__touch__(DESCRIPTIONS_TAG)
+            return
         # Description with language does not exist, so create a new description
         self.add_description(value, language_code)
 
@@ -2044,10 +2351,7 @@ class ThingObject:
         Optional[Description]
             Returns the description for a specific language_code code if it exists, otherwise None.
         """
-        for desc in self.description:
-            if desc.language_code == language_code:
-                return desc
-        return None
+        return self.__description_lookup__().get(language_code)
 
     def remove_description(self, language_code: LocaleCode) -> None:
         """
@@ -2061,6 +2365,8 @@ class ThingObject:
         for index, description in enumerate(self.description):
             if description.language_code == language_code:
                 del self.__description[index]
+                self.__description_index = None
+                self.__touch__(DESCRIPTIONS_TAG)
                 break
 
     @property
@@ -2071,6 +2377,7 @@ class ThingObject:
     @concept_type.setter
     def concept_type(self, value: OntologyClassReference) -> None:
         self.__concept_type = value
+        self.__touch__(TYPE_TAG)
 
     @property
     def ontology_types(self) -> Set[str]:
@@ -2083,13 +2390,21 @@ class ThingObject:
 
     @property
     def data_properties(self) -> Dict[OntologyPropertyReference, List[DataProperty]]:
-        """Literals of the concept."""
+        """
+        Literals of the concept.
+
+        Literals appended to or removed from the lists are picked up by the locale lookups (e.g.,
+        `data_property_lang`) and the fingerprint; after replacing or editing a literal in place, e.g.,
+        `thing.data_properties[prop][0] = ...`, call `mark_modified` to rebuild them.
+        """
         return self.__data_properties
 
     @data_properties.setter
     def data_properties(self, data_properties: Dict[OntologyPropertyReference, List[DataProperty]]) -> None:
         """Literals of the concept."""
         self.__data_properties = data_properties
+        self.__data_property_index = None
+        self.__touch__(DATA_PROPERTIES_TAG)
 
     @property
     def object_properties(self) -> Dict[OntologyPropertyReference, ObjectProperty]:
@@ -2099,6 +2414,7 @@ class ThingObject:
     @object_properties.setter
     def object_properties(self, relations: Dict[OntologyPropertyReference, ObjectProperty]) -> None:
         self.__object_properties = relations
+        self.__touch__(OBJECT_PROPERTIES_TAG)
 
     def data_property_lang(
         self, data_property: OntologyPropertyReference, language_code: LocaleCode
@@ -2117,7 +2433,7 @@ class ThingObject:
         data_properties: List[DataProperty]
             Returns a list of data properties for a specific language code
         """
-        return [d for d in self.data_properties.get(data_property, []) if d.language_code == language_code]
+        return list(self.__data_property_lookup__(data_property).get(language_code, []))
 
     def remove_data_property(self, data_property: OntologyPropertyReference) -> None:
         """Remove data property.
@@ -2128,15 +2444,25 @@ class ThingObject:
             Data property to be removed.
         """
         self.__data_properties.pop(data_property, None)
+        self.__data_property_index = None
+        self.__touch__(DATA_PROPERTIES_TAG)
 
     @property
     def alias(self) -> List[Label]:
-        """Alternative labels of the concept."""
+        """
+        Alternative labels of the concept.
+
+        Items appended to or removed from the list are picked up by the locale lookups (e.g., `alias_lang`) and the
+        fingerprint; after replacing or editing an item in place, e.g., `thing.alias[0] = ...`, call `mark_modified`
+        to rebuild them.
+        """
         return self.__alias
 
     @alias.setter
     def alias(self, alias: List[Label]) -> None:
         self.__alias = alias
+        self.__alias_index = None
+        self.__touch__(LABELS_TAG)
 
     def alias_lang(self, language_code: Union[LocaleCode, LanguageCode]) -> List[Label]:
         """
@@ -2151,11 +2477,7 @@ class ThingObject:
         aliases: List[Label]
             Returns a list of aliases for a specific language code
         """
-        aliases: List[Label] = []
-        for alias in self.alias:
-            if alias.language_code == language_code:
-                aliases.append(alias)
-        return aliases
+        return list(self.__alias_lookup__().get(language_code, []))
 
     def update_alias(self, value: str, language_code: LocaleCode) -> None:
         """Update or creates an alias for a specific language.
@@ -2167,10 +2489,11 @@ class ThingObject:
         language_code: LocaleCode
             ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., 'en_US'.
         """
-        for a in self.alias:
-            if a.language_code == language_code:
-                a.content = value
-                return
+        aliases: List[Label] = self.__alias_lookup__().get(language_code, [])
+        if len(aliases) > 0:
+            aliases[0].content = value
+            self.__touch__(LABELS_TAG)
+            return
         # Label with language does not exist, so create a new label
         self.add_alias(value, language_code=language_code)
 
@@ -2187,6 +2510,18 @@ class ThingObject:
             self.__object_properties[prop.relation].outgoing_relations.extend(prop.outgoing_relations)
         else:
             self.__object_properties[prop.relation] = prop
+        self.__touch__(OBJECT_PROPERTIES_TAG)
+
+    def remove_relation(self, relation: OntologyPropertyReference) -> None:
+        """Remove all relations of an object property.
+
+        Parameters
+        ----------
+        relation: OntologyPropertyReference
+            Object property to be removed.
+        """
+        self.__object_properties.pop(relation, None)
+        self.__touch__(OBJECT_PROPERTIES_TAG)
 
     def add_data_property(self, data_property: DataProperty) -> None:
         """Add data property to the entity.
@@ -2198,7 +2533,16 @@ class ThingObject:
         """
         if data_property.data_property_type not in self.__data_properties:
             self.__data_properties[data_property.data_property_type] = []
-        self.__data_properties[data_property.data_property_type].append(data_property)
+        items: List[DataProperty] = self.__data_properties[data_property.data_property_type]
+        entry = None
+        if self.__data_property_index is not None:
+            entry = self.__data_property_index.get(data_property.data_property_type)
+        current: bool = ThingObject.__is_current__(entry, items)
+        items.append(data_property)
+        if current:
+            entry[2].setdefault(data_property.language_code, []).append(data_property)
+            self.__data_property_index[data_property.data_property_type] = (items, len(items), entry[2])
+        self.__touch__(DATA_PROPERTIES_TAG)
 
     def add_alias(self, alias: str, language_code: LocaleCode) -> None:
         """Adding an alias for an entity.
@@ -2210,7 +2554,13 @@ class ThingObject:
         language_code: LocaleCode
             ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., 'en_US'.
         """
-        self.__alias.append(Label(alias, language_code, False))
+        new_alias: Label = Label(alias, language_code, False)
+        current: bool = ThingObject.__is_current__(self.__alias_index, self.__alias)
+        self.__alias.append(new_alias)
+        if current:
+            self.__alias_index[2].setdefault(new_alias.language_code, []).append(new_alias)
+            self.__alias_index = (self.__alias, len(self.__alias), self.__alias_index[2])
+        self.__touch__(LABELS_TAG)
 
     @property
     def tenant_access_right(self) -> TenantAccessRight:
@@ -2220,6 +2570,7 @@ class ThingObject:
     @tenant_access_right.setter
     def tenant_access_right(self, rights: TenantAccessRight) -> None:
         self.__tenants_rights = rights
+        self.__touch__(TENANT_RIGHTS_TAG)
 
     def as_dict(self) -> Dict[str, Any]:
         """
@@ -2360,142 +2711,150 @@ class ThingObject:
         ValueError:
             If the dict contains unsupported locales, or if there is a mismatch in source reference id or source system.
         """
-        labels: List[Label] = []
-        alias: List[Label] = []
-        descriptions: List[Description] = []
-        main_labels: Dict[str, bool] = {}
+        return ThingObject.__from_normalized_import_dict__(
+            ThingObject.__normalize_import_dict__(entity, raise_on_error=raise_on_error)
+        )
+
+    @staticmethod
+    def __normalize_import_dict__(entity: Dict[str, Any], raise_on_error: bool = False) -> Dict[str, Any]:
+        """
+        Normalizes an entity of the import format, without creating a ThingObject. Labels and descriptions of
+        unsupported locales are removed, the labels of a locale without main label become main labels, the data
+        properties are listed with the source reference id and source system, and the legacy index flags are merged
+        into the index targets. The given dict is not modified.
+
+        Parameters
+        ----------
+        entity: Dict[str, Any]
+            Dictionary that contains the data of the entity
+        raise_on_error: bool (default:= False)
+            Whether to raise an error if the dict contains unsupported locales or if there is a mismatch in source
+            reference id or source system. If False, the errors will be logged.
+
+        Returns
+        -------
+        normalized: Dict[str, Any]
+            Normalized entity dict, as accepted by `EntityFrame.append_dict` and `__from_normalized_import_dict__`.
+
+        Raises
+        ------
+        ValueError:
+            If the dict contains unsupported locales, or if there is a mismatch in source reference id or source system.
+        """
+
+        def error(message: str) -> None:
+            if raise_on_error:
+                raise ValueError(message)
+            logger.error(message)
+
+        normalized: Dict[str, Any] = dict(entity)
         source_reference_id: Optional[str] = entity.get(SOURCE_REFERENCE_ID_TAG)
         source_system: Optional[str] = entity.get(SOURCE_SYSTEM_TAG)
         reference_id_or_uri: str = entity.get(URI_TAG) or source_reference_id or "Unknown URI or reference id"
+        # Entities of the import format are not synchronized yet
+        normalized[URI_TAG] = None
+        normalized[IMAGE_TAG] = entity.get(IMAGE_TAG)
+        labels: List[Dict[str, Any]] = []
         for label in entity[LABELS_TAG]:
             if label[LOCALE_TAG] in SUPPORTED_LOCALES:
-                if label[IS_MAIN_TAG]:
-                    main_label: Label = Label.create_from_dict(label)
-                    main_labels[label[LOCALE_TAG]] = True
-                    labels.append(main_label)
-                else:
-                    alias_label: Label = Label.create_from_dict(label)
-                    if alias_label.language_code not in main_labels:
-                        main_labels[alias_label.language_code] = False
-                    alias.append(alias_label)
+                labels.append(dict(label))
             else:
-                if raise_on_error:
-                    raise ValueError(f"Unsupported locale {label[LOCALE_TAG]} for entity {reference_id_or_uri}")
-                logger.error(f"Unsupported locale {label[LOCALE_TAG]} for entity {reference_id_or_uri}")
-
-        for lang_code, is_main in main_labels.items():
-            if not is_main:
-                la_idx: int = 0
-                while la_idx < len(alias):
-                    # Fix things where there is no main label
-                    if alias[la_idx].language_code == lang_code:
-                        al: Label = alias[la_idx]
-                        labels.append(Label(al.content, al.language_code, main=True))
-                        del alias[la_idx]
-                        if raise_on_error:
-                            raise ValueError(
-                                f"Missing main label for locale {lang_code} for entity {reference_id_or_uri}"
-                            )
-                        logger.error(f"Missing main label for locale {lang_code} for entity {reference_id_or_uri}")
-                    else:
-                        la_idx += 1
-
+                error(f"Unsupported locale {label[LOCALE_TAG]} for entity {reference_id_or_uri}")
+        main_locales: Set[str] = {label[LOCALE_TAG] for label in labels if label[IS_MAIN_TAG]}
+        for label in labels:
+            # Fix things where there is no main label
+            if label[LOCALE_TAG] not in main_locales:
+                label[IS_MAIN_TAG] = True
+                error(f"Missing main label for locale {label[LOCALE_TAG]} for entity {reference_id_or_uri}")
+        normalized[LABELS_TAG] = labels
+        descriptions: List[Dict[str, Any]] = []
         for desc in entity[DESCRIPTIONS_TAG]:
-            if desc[LOCALE_TAG] in SUPPORTED_LOCALES:
-                if desc[DESCRIPTION_TAG] is None:
-                    if raise_on_error:
-                        raise ValueError(f"Description is None for {desc}")
-                    logger.error(f"Description is None for {desc}")
-                else:
-                    descriptions.append(Description.create_from_dict(desc))
+            if desc[LOCALE_TAG] not in SUPPORTED_LOCALES:
+                error(f"Unsupported locale {desc[LOCALE_TAG]} for entity {reference_id_or_uri}")
+            elif desc[DESCRIPTION_TAG] is None:
+                error(f"Description is None for {desc}")
             else:
-                if raise_on_error:
-                    raise ValueError(f"Unsupported locale {desc[LOCALE_TAG]} for entity {reference_id_or_uri}")
-                logger.error(f"Unsupported locale {desc[LOCALE_TAG]} for entity {reference_id_or_uri}")
-        # Backwards-compatibility
-        use_nel: bool = entity.get(USE_NEL_TAG, False)
-        use_vector_index: bool = entity.get(USE_VECTOR_INDEX_TAG, False)
-        use_vector_index_document: bool = entity.get(USE_VECTOR_DOCUMENT_INDEX_TAG, False)
-        use_full_text_index: bool = entity.get(USE_FULLTEXT_TAG, False)
-        # Vector index target
-        if INDEXING_VECTOR_SEARCH_TARGET in entity.get(TARGETS_TAG, []):
-            use_vector_index = True
-        # Vector index document target
-        if INDEXING_VECTOR_SEARCH_DOCUMENT_TARGET in entity.get(TARGETS_TAG, []):
-            use_vector_index_document = True
-        # Full text index target
-        if INDEXING_FULLTEXT_TARGET in entity.get(TARGETS_TAG, []):
-            use_full_text_index = True
-        # Named entity linking target
-        if INDEXING_NEL_TARGET in entity.get(TARGETS_TAG, []):
-            use_nel = True
+                descriptions.append(desc)
+        normalized[DESCRIPTIONS_TAG] = descriptions
+        literals: Any = entity.get(DATA_PROPERTIES_TAG, [])
+        if isinstance(literals, dict):
+            literals = [
+                {DATA_PROPERTY_TAG: iri, VALUE_TAG: item[VALUE_TAG], LOCALE_TAG: item[LOCALE_TAG]}
+                for iri, items in literals.items()
+                for item in items
+            ]
+        else:
+            literals = list(literals)
+        ref_id_found: bool = False
+        source_system_found: bool = False
+        for literal in literals:
+            if literal[DATA_PROPERTY_TAG] == SYSTEM_SOURCE_REFERENCE_ID.iri:
+                ref_id_found = True
+                if source_reference_id != literal[VALUE_TAG] and literal[LOCALE_TAG] == EN_US:
+                    error(f"Source reference id mismatch: {source_reference_id} != {literal[VALUE_TAG]}")
+            elif literal[DATA_PROPERTY_TAG] == SYSTEM_SOURCE_SYSTEM.iri:
+                source_system_found = True
+                if source_system and source_system != literal[VALUE_TAG]:
+                    error(f"Source system mismatch: {source_system} != {literal[VALUE_TAG]}")
+                if source_system is None and literal[VALUE_TAG]:
+                    logger.warning(f"Source system is None but value is {literal[VALUE_TAG]}")
+        if not ref_id_found and source_reference_id:
+            literals.append(
+                {DATA_PROPERTY_TAG: SYSTEM_SOURCE_REFERENCE_ID.iri, VALUE_TAG: source_reference_id, LOCALE_TAG: EN_US}
+            )
+        elif not ref_id_found:
+            logger.warning(f"No source reference id found for {reference_id_or_uri}")
+        if not source_system_found and source_system:
+            literals.append({DATA_PROPERTY_TAG: SYSTEM_SOURCE_SYSTEM.iri, VALUE_TAG: source_system, LOCALE_TAG: EN_US})
+        elif not source_system_found:
+            logger.warning(f"No source system found for {reference_id_or_uri}")
+        normalized[DATA_PROPERTIES_TAG] = literals
+        # Backwards-compatibility of the index targets
+        targets: List[str] = entity.get(TARGETS_TAG, [])
+        normalized[TARGETS_TAG] = [
+            target
+            for target, flag in (
+                (INDEXING_NEL_TARGET, USE_NEL_TAG),
+                (INDEXING_VECTOR_SEARCH_TARGET, USE_VECTOR_INDEX_TAG),
+                (INDEXING_VECTOR_SEARCH_DOCUMENT_TARGET, USE_VECTOR_DOCUMENT_INDEX_TAG),
+                (INDEXING_FULLTEXT_TARGET, USE_FULLTEXT_TAG),
+            )
+            if target in targets or entity.get(flag, False)
+        ]
+        normalized[OBJECT_PROPERTIES_TAG] = list(entity.get(OBJECT_PROPERTIES_TAG, []))
+        return normalized
+
+    @staticmethod
+    def __from_normalized_import_dict__(entity: Dict[str, Any]) -> "ThingObject":
+        """Creates a ThingObject from an entity dict normalized by `__normalize_import_dict__`."""
+        labels: List[Label] = []
+        alias: List[Label] = []
+        for label in entity[LABELS_TAG]:
+            (labels if label[IS_MAIN_TAG] else alias).append(Label.create_from_dict(label))
+        targets: List[str] = entity[TARGETS_TAG]
         thing: ThingObject = ThingObject(
             label=labels,
             icon=entity[IMAGE_TAG],
-            description=descriptions,
+            description=[Description.create_from_dict(desc) for desc in entity[DESCRIPTIONS_TAG]],
             concept_type=OntologyClassReference.parse(entity[TYPE_TAG]),
-            use_for_nel=use_nel,
-            use_vector_index=use_vector_index,
-            use_vector_index_document=use_vector_index_document,
-            use_full_text_index=use_full_text_index,
+            use_for_nel=INDEXING_NEL_TARGET in targets,
+            use_vector_index=INDEXING_VECTOR_SEARCH_TARGET in targets,
+            use_vector_index_document=INDEXING_VECTOR_SEARCH_DOCUMENT_TARGET in targets,
+            use_full_text_index=INDEXING_FULLTEXT_TARGET in targets,
         )
         if EXTERNAL_USER_ID_TAG in entity:
             thing.owner_external_user_id = entity[EXTERNAL_USER_ID_TAG]
-        ref_id_found: bool = False
-        source_system_found: bool = False
-        if DATA_PROPERTIES_TAG in entity:
-            if isinstance(entity[DATA_PROPERTIES_TAG], dict):
-                for data_property_type_str, data_properties in entity[DATA_PROPERTIES_TAG].items():
-                    data_property_type: OntologyPropertyReference = OntologyPropertyReference.parse(
-                        data_property_type_str
-                    )
-                    if data_property_type == SYSTEM_SOURCE_REFERENCE_ID:
-                        ref_id_found = True
-
-                    for data_property in data_properties:
-                        language_code: LocaleCode = LocaleCode(data_property[LOCALE_TAG])
-                        value: str = data_property[VALUE_TAG]
-                        if source_reference_id != value:
-                            if raise_on_error:
-                                raise ValueError(f"Source reference id mismatch: {source_reference_id} != {value}")
-                            logger.error(f"Source reference id mismatch: {source_reference_id} != {value}")
-                        thing.add_data_property(DataProperty(value, data_property_type, language_code))
-            elif isinstance(entity[DATA_PROPERTIES_TAG], list):
-                for data_property in entity[DATA_PROPERTIES_TAG]:
-                    dp_language_code: LocaleCode = LocaleCode(data_property[LOCALE_TAG])
-                    dp_value: str = data_property[VALUE_TAG]
-                    dp_property_type: OntologyPropertyReference = OntologyPropertyReference.parse(
-                        data_property[DATA_PROPERTY_TAG]
-                    )
-                    if dp_property_type == SYSTEM_SOURCE_REFERENCE_ID:
-                        ref_id_found = True
-                        if source_reference_id != dp_value and dp_language_code == EN_US:
-                            if raise_on_error:
-                                raise ValueError(f"Source reference id mismatch: {source_reference_id} != {dp_value}")
-                            logger.error(f"Source reference id mismatch: {source_reference_id} != {dp_value}")
-
-                    if dp_property_type == SYSTEM_SOURCE_SYSTEM:
-                        value: str = dp_value
-                        source_system_found = True
-                        if source_system and source_system != value:
-                            if raise_on_error:
-                                raise ValueError(f"Source system mismatch: {source_system} != {value}")
-                            logger.error(f"Source system mismatch: {source_system} != {value}")
-                        if source_system is None and value:
-                            logger.warning(f"Source system is None but value is {value}")
-                    thing.add_data_property(DataProperty(dp_value, dp_property_type, dp_language_code))
-        if not ref_id_found and source_reference_id:
-            thing.add_data_property(DataProperty(source_reference_id, SYSTEM_SOURCE_REFERENCE_ID))
-        elif not ref_id_found and not source_reference_id:
-            logger.warning(f"No source reference id found for {thing.label[0]}")
-        if not source_system_found and source_system:
-            thing.add_data_property(DataProperty(source_system, SYSTEM_SOURCE_SYSTEM))
-        elif not source_system_found and not source_system:
-            logger.warning(f"No source system found for {thing.label[0]}")
-        if OBJECT_PROPERTIES_TAG in entity:
-            for object_property in entity[OBJECT_PROPERTIES_TAG]:
-                _, obj = ObjectProperty.create_from_dict(object_property)
-                thing.add_relation(obj)
+        for literal in entity[DATA_PROPERTIES_TAG]:
+            thing.add_data_property(
+                DataProperty(
+                    literal[VALUE_TAG],
+                    OntologyPropertyReference.parse(literal[DATA_PROPERTY_TAG]),
+                    LocaleCode(literal[LOCALE_TAG]),
+                )
+            )
+        for object_property in entity[OBJECT_PROPERTIES_TAG]:
+            _, obj = ObjectProperty.create_from_dict(object_property)
+            thing.add_relation(obj)
         thing.alias = alias
         thing.group_ids = entity.get(GROUP_IDS, [])
         # Finally, retrieve rights
@@ -2504,33 +2863,23 @@ class ThingObject:
         return thing
 
     @staticmethod
-    def from_dict(entity: Dict[str, Any]) -> "ThingObject":
-        """Creates a ThingObject from a dict.
-
-        Parameters
-        ----------
-        entity: Dict[str, Any]
-            Dictionary that contains the data of the entity
-
-        Returns
-        -------
-        instance: ThingObject
-            The ThingObject that is created from the dict
-        """
+    def __labels_from_dict__(entity: Dict[str, Any]) -> Tuple[List[Label], List[Label]]:
         labels: List[Label] = []
         alias: List[Label] = []
-        descriptions: List[Description] = []
-
         for label in entity[LABELS_TAG]:
             if label[LOCALE_TAG] in SUPPORTED_LOCALES:
                 if label[IS_MAIN_TAG]:
                     labels.append(Label.create_from_dict(label))
                 else:
                     alias.append(Label.create_from_dict(label))
+        return labels, alias
 
-        for desc in entity[DESCRIPTIONS_TAG]:
-            descriptions.append(Description.create_from_dict(desc))
+    @staticmethod
+    def __descriptions_from_dict__(entity: Dict[str, Any]) -> List[Description]:
+        return [Description.create_from_dict(desc) for desc in entity[DESCRIPTIONS_TAG]]
 
+    @staticmethod
+    def __index_targets_from_dict__(entity: Dict[str, Any]) -> Tuple[bool, bool, bool, bool]:
         use_nel: bool = False
         use_vector_index: bool = False
         use_vector_index_document: bool = False
@@ -2549,53 +2898,261 @@ class ThingObject:
             elif SEND_VECTOR_INDEX_TAG in entity:
                 use_vector_index = entity[SEND_VECTOR_INDEX_TAG]
             use_fulltext_index = True
-        visibility: Optional[str] = entity.get(VISIBILITY_TAG)
-        thing: ThingObject = ThingObject(
-            label=labels,
-            icon=entity[IMAGE_TAG],
-            description=descriptions,
-            uri=entity.get(URI_TAG),
-            concept_type=OntologyClassReference.parse(entity[TYPE_TAG]),
-            owner=entity.get(OWNER_TAG, True),
-            use_for_nel=use_nel,
-            use_vector_index=use_vector_index,
-            use_vector_index_document=use_vector_index_document,
-            use_full_text_index=use_fulltext_index,
-        )
-        thing.visibility = visibility
-        thing.owner_id = entity.get(OWNER_ID_TAG)
-        thing.group_ids = entity.get(GROUP_IDS)
+        return use_nel, use_vector_index, use_vector_index_document, use_fulltext_index
+
+    @staticmethod
+    def __data_properties_from_dict__(entity: Dict[str, Any]) -> List[DataProperty]:
+        data_properties: List[DataProperty] = []
         if DATA_PROPERTIES_TAG in entity:
             if isinstance(entity[DATA_PROPERTIES_TAG], dict):
-                for data_property_type_str, data_properties in entity[DATA_PROPERTIES_TAG].items():
+                for data_property_type_str, items in entity[DATA_PROPERTIES_TAG].items():
                     data_property_type: OntologyPropertyReference = OntologyPropertyReference.parse(
                         data_property_type_str
                     )
-                    for data_property in data_properties:
+                    for data_property in items:
                         language_code: LocaleCode = LocaleCode(data_property[LOCALE_TAG])
                         value: str = data_property[VALUE_TAG]
-                        thing.add_data_property(DataProperty(value, data_property_type, language_code))
+                        data_properties.append(DataProperty(value, data_property_type, language_code))
             elif isinstance(entity[DATA_PROPERTIES_TAG], list):
                 for data_property in entity[DATA_PROPERTIES_TAG]:
                     language_code = LocaleCode(data_property[LOCALE_TAG])
                     value = data_property[VALUE_TAG]
                     data_property_type = OntologyPropertyReference.parse(data_property[DATA_PROPERTY_TAG])
-                    thing.add_data_property(DataProperty(value, data_property_type, language_code))
+                    data_properties.append(DataProperty(value, data_property_type, language_code))
+        return data_properties
+
+    @staticmethod
+    def __object_properties_from_dict__(entity: Dict[str, Any]) -> List["ObjectProperty"]:
+        object_properties: List[ObjectProperty] = []
         if OBJECT_PROPERTIES_TAG in entity:
             if isinstance(entity[OBJECT_PROPERTIES_TAG], list):
                 for relation_item in entity[OBJECT_PROPERTIES_TAG]:
                     _, obj = ObjectProperty.create_from_dict(relation_item)
-                    thing.add_relation(obj)
+                    object_properties.append(obj)
+        return object_properties
+
+    @staticmethod
+    def from_dict(entity: Dict[str, Any]) -> "ThingObject":
+        """Creates a ThingObject from a dict.
+
+        Parameters
+        ----------
+        entity: Dict[str, Any]
+            Dictionary that contains the data of the entity
+
+        Returns
+        -------
+        instance: ThingObject
+            The ThingObject that is created from the dict
+        """
+        labels, alias = ThingObject.__labels_from_dict__(entity)
+        use_nel, use_vector_index, use_vector_index_document, use_fulltext_index = (
+            ThingObject.__index_targets_from_dict__(entity)
+        )
+        visibility: Optional[str] = entity.get(VISIBILITY_TAG)
+        thing: ThingObject = ThingObject(
+            label=labels,
+            icon=entity[IMAGE_TAG],
+            description=ThingObject.__descriptions_from_dict__(entity),
+            uri=entity.get(URI_TAG),
+            concept_type=OntologyClassReference.parse(entity[TYPE_TAG]),
+            owner=entity.get(OWNER_TAG, True),
+            use_for_nel=use_nel,
+            use_vector_index=use_vector_index,
+            use_vector_index_document=use_vector_index_document,
+            use_full_text_index=use_fulltext_index,
+        )
+        thing.visibility = visibility
+        thing.owner_id = entity.get(OWNER_ID_TAG)
+        thing.group_ids = entity.get(GROUP_IDS)
+        for data_property in ThingObject.__data_properties_from_dict__(entity):
+            thing.add_data_property(data_property)
+        for obj in ThingObject.__object_properties_from_dict__(entity):
+            thing.add_relation(obj)
         thing.alias = alias
         # Finally, retrieve rights
         if TENANT_RIGHTS_TAG in entity and entity[TENANT_RIGHTS_TAG]:
             thing.tenant_access_right = TenantAccessRight.parse(entity[TENANT_RIGHTS_TAG])
+        thing.reset_modified()
         return thing
 
-    def __getstate__(self) -> Dict[str, Any]:
-        return self.as_dict()
+    @staticmethod
+    def __relation_id__(target: Union[str, "ThingObject"]) -> Optional[str]:
+        if isinstance(target, ThingObject):
+            return target.uri if target.uri is not None else target.reference_id
+        return target
 
-    def __setstate__(self, state: Dict[str, Any]) -> None:
+    @property
+    def fingerprint(self) -> str:
+        """
+        Content fingerprint of the entity.
+
+        SHA-256 hex digest over a canonical, order-independent representation of the labels, aliases, descriptions,
+        data properties, relations, index targets, image and concept type. The URI, ownership and status
+        information are not part of the content. The fingerprint is cached and invalidated by the mutators of the
+        entity. Adding or removing items of the lists and dicts returned by the properties is detected as well;
+        after replacing or editing items in place, call `mark_modified` to refresh it.
+        """
+        containers, sizes = self.__content_stamp__()
+        cached = self.__fingerprint
+        if (
+            cached is not None
+            and cached[2] == sizes
+            and all(current is container for current, container in zip(containers, cached[1]))
+        ):
+            return cached[0]
+        targets: List[str] = []
+        if self.use_for_nel:
+            targets.append(INDEXING_NEL_TARGET)
+        if self.use_vector_index:
+            targets.append(INDEXING_VECTOR_SEARCH_TARGET)
+        if self.use_vector_index_document:
+            targets.append(INDEXING_VECTOR_SEARCH_DOCUMENT_TARGET)
+        if self.use_full_text_index:
+            targets.append(INDEXING_FULLTEXT_TARGET)
+        canonical: Dict[str, Any] = {
+            TYPE_TAG: self.concept_type.iri if self.concept_type else None,
+            IMAGE_TAG: self.image,
+            LABELS_TAG: sorted([la.language_code, la.content] for la in self.label),
+            "alias": sorted([la.language_code, la.content] for la in self.alias),
+            DESCRIPTIONS_TAG: sorted([desc.language_code, desc.content] for desc in self.description),
+            DATA_PROPERTIES_TAG: sorted(
+                [prop.iri, dp.language_code, json.dumps(dp.value, default=str, sort_keys=True)]
+                for prop, items in self.data_properties.items()
+                for dp in items
+            ),
+            OBJECT_PROPERTIES_TAG: sorted(
+                [
+                    prop.iri,
+                    sorted(str(ThingObject.__relation_id__(t)) for t in rel.incoming_relations),
+                    sorted(str(ThingObject.__relation_id__(t)) for t in rel.outgoing_relations),
+                ]
+                for prop, rel in self.object_properties.items()
+            ),
+            TARGETS_TAG: sorted(targets),
+        }
+        digest: str = hashlib.sha256(
+            json.dumps(canonical, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        self.__fingerprint = (digest, containers, sizes)
+        return digest
+
+    def __content_stamp__(self) -> Tuple[Tuple[Sized, ...], Tuple[int, ...]]:
+        """Containers of the content and their sizes, to detect items added to or removed from them in place."""
+        containers: Tuple[Sized, ...] = (
+            self.__label,
+            self.__alias,
+            self.__description,
+            self.__data_properties,
+            self.__object_properties,
+        )
+        sizes: Tuple[int, ...] = tuple(len(container) for container in containers) + tuple(
+            len(items) for items in self.__data_properties.values()
+        )
+        return containers, sizes
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, ...]:
+        # Skips the generic slot inspection of `object.__reduce_ex__`, the state is created by `__getstate__`
+        return copyreg.__newobj__, (type(self),), self.__getstate__()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        rights: TenantAccessRight = self.__tenants_rights
+        return (
+            PICKLE_STATE_VERSION,
+            self.__uri,
+            self.__icon,
+            self.__concept_type.iri,
+            [(la.content, la.language_code, la.main) for la in self.__label],
+            [(la.content, la.language_code, la.main) for la in self.__alias],
+            [(desc.content, desc.language_code) for desc in self.__description],
+            [
+                (
+                    prop.iri,
+                    [
+                        (dp.value, dp.language_code, dp.data_type.value if dp.data_type is not None else None)
+                        for dp in items
+                    ],
+                )
+                for prop, items in self.__data_properties.items()
+            ],
+            [
+                (prop.iri, rel.incoming_relations, rel.outgoing_relations)
+                for prop, rel in self.__object_properties.items()
+            ],
+            (rights.read, rights.write, rights.delete),
+            self.__status_flag.value,
+            self.__ontology_types,
+            self.__owner,
+            self.__owner_id,
+            self.__owner_external_user_id,
+            self.__group_ids,
+            self.__use_for_nel,
+            self.__use_vector_index,
+            self.__use_vector_index_document,
+            self.__use_full_text_index,
+            self.__visibility,
+            self.__modified,
+        )
+
+    def __setstate__(self, state: Union[Tuple[Any, ...], Dict[str, Any]]) -> None:
+        self.__fingerprint = None
+        self.__label_index = None
+        self.__alias_index = None
+        self.__description_index = None
+        self.__data_property_index = None
+        if isinstance(state, dict):
+            self.__setstate_dict__(state)
+            return
+        if state[0] != PICKLE_STATE_VERSION:
+            raise ValueError(
+                f"Unsupported pickle state version {state[0]} for ThingObject (supported: {PICKLE_STATE_VERSION})."
+            )
+        (
+            _,
+            self.__uri,
+            self.__icon,
+            concept_type,
+            labels,
+            alias,
+            descriptions,
+            data_properties,
+            object_properties,
+            (read, write, delete),
+            status_flag,
+            self.__ontology_types,
+            self.__owner,
+            self.__owner_id,
+            self.__owner_external_user_id,
+            group_ids,
+            self.__use_for_nel,
+            self.__use_vector_index,
+            self.__use_vector_index_document,
+            self.__use_full_text_index,
+            self.__visibility,
+            modified,
+        ) = state
+        self.__concept_type = OntologyClassReference.parse(concept_type)
+        self.__label = [Label(content, language_code, main) for content, language_code, main in labels]
+        self.__alias = [Label(content, language_code, main) for content, language_code, main in alias]
+        self.__description = [Description(content, language_code) for content, language_code in descriptions]
+        self.__data_properties = {}
+        for iri, items in data_properties:
+            prop: OntologyPropertyReference = OntologyPropertyReference.parse(iri)
+            self.__data_properties[prop] = [
+                DataProperty(value, prop, language_code, __DATA_TYPE_BY_VALUE__[data_type] if data_type else None)
+                for value, language_code, data_type in items
+            ]
+        self.__object_properties = {}
+        for iri, incoming, outgoing in object_properties:
+            relation: OntologyPropertyReference = OntologyPropertyReference.parse(iri)
+            self.__object_properties[relation] = ObjectProperty(relation, list(incoming), list(outgoing))
+        self.__tenants_rights = TenantAccessRight(read, write, delete)
+        self.__status_flag = __ENTITY_STATUS_BY_VALUE__[status_flag]
+        self.__group_ids = list(group_ids)
+        self.__modified = modified if modified else NO_FIELDS
+
+    def __setstate_dict__(self, state: Dict[str, Any]) -> None:
+        """Restores the entity from the dict state of previous versions, which is based on `as_dict`."""
         self.__label = []
         self.__description = []
         self.__alias = []
@@ -2604,8 +3161,11 @@ class ThingObject:
         self.__status_flag = EntityStatus.UNKNOWN
         self.__ontology_types = None
         self.__owner_id = None
+        self.__owner_external_user_id = None
         self.__group_ids = []
         self.__visibility = None
+        # The modifications are not part of the state, thus all fields count as modified
+        self.__modified = TRACKED_FIELDS
 
         for label in state[LABELS_TAG]:
             if label[LOCALE_TAG] in SUPPORTED_LOCALES:
@@ -2659,78 +3219,222 @@ class ThingObject:
             self.tenant_access_right = TenantAccessRight()
 
     def __hash__(self) -> int:
-        return 0
+        return hash(self.fingerprint)
 
     def __eq__(self, other: Any) -> bool:
         # another object is equal to self, iff
-        # it is an instance of MyClass
+        # it is a ThingObject with the same URI and the same content
+        if self is other:
+            return True
         if not isinstance(other, ThingObject):
             return False
         if self.uri != other.uri:
             return False
-        other_thing: ThingObject = other
-        # Check if the descriptions are different
-        if len(self.description) != len(other_thing.description):
-            return False
-        for desc_file in self.description:
-            kg_desc: Optional[Description] = other_thing.description_lang(desc_file.language_code)
-            if kg_desc is None or desc_file.content != kg_desc.content:
-                return False
-        # Difference in vector index
-        if self.use_vector_index != other_thing.use_vector_index:
-            return False
-        # Difference in NEL index
-        if self.use_for_nel != other_thing.use_for_nel:
-            return False
-        if self.use_vector_index_document != other_thing.use_vector_index_document:
-            return False
+        return self.fingerprint == other.fingerprint
 
-        # Different number of labels
-        if len(self.label) != len(other_thing.label):
-            return False
-        # Check if the labels are different
-        for label_file in self.label:
-            label_kg_lang: Optional[Label] = other_thing.label_lang(label_file.language_code)
-            if label_kg_lang is None or label_file.content != label_kg_lang.content:
-                return False
-
-        # Different number of aliases
-        if len(self.alias) != len(other_thing.alias):
-            return False
+    def __repr__(self) -> str:
+        return (
+            f"<{self.concept_type.iri if self.__concept_type else 'UNSET'}: uri:={self.uri}, labels:={self.label}, "
+            f"tenant access right:={self.tenant_access_right}]>"
+        )
 
-        # Check if the aliases are different
-        for alias_file in self.alias:
-            alias_kg_lang = other_thing.alias_lang(alias_file.language_code)
-            if alias_file.content not in [alias.content for alias in alias_kg_lang]:
-                return False
 
-        # If the image is different
-        if self.image != other_thing.image:
-            return False
+# ------------------------------------------------ Lazy entity ---------------------------------------------------------
+LAZY_LABELS: str = "labels"
+"""Labels and aliases of a lazy entity."""
+LAZY_DESCRIPTIONS: str = "descriptions"
+"""Descriptions of a lazy entity."""
+LAZY_DATA_PROPERTIES: str = "data_properties"
+"""Data properties of a lazy entity."""
+LAZY_OBJECT_PROPERTIES: str = "object_properties"
+"""Object properties of a lazy entity."""
+LAZY_TENANT_RIGHTS: str = "tenant_rights"
+"""Tenant access rights of a lazy entity."""
+LAZY_FIELDS: Tuple[str, ...] = (
+    LAZY_LABELS,
+    LAZY_DESCRIPTIONS,
+    LAZY_DATA_PROPERTIES,
+    LAZY_OBJECT_PROPERTIES,
+    LAZY_TENANT_RIGHTS,
+)
 
-        # If the data properties are different
-        if len(self.data_properties) != len(other_thing.data_properties):
-            return False
 
-        for prop, data_properties in self.data_properties.items():
-            if prop not in other_thing.data_properties:
-                return False
-            if len(data_properties) != len(other_thing.data_properties.get(prop, [])):
-                return False
+def __lazy_property__(name: str, *fields: str) -> property:
+    """Wraps a ThingObject property, so that the fields are materialized before it is accessed."""
+    prop: property = getattr(ThingObject, name)
 
-            for dp in data_properties:
-                if prop not in other_thing.data_properties:
-                    return False
-                other_props = other_thing.data_properties.get(prop) or []
-                if dp.value not in [d.value for d in other_props]:
-                    return False
-        return True
+    def fget(self: "LazyThingObject") -> Any:
+        self.materialize(*fields)
+        return prop.fget(self)
 
-    def __repr__(self) -> str:
-        return (
-            f"<{self.concept_type.iri if self.__concept_type else 'UNSET'}: uri:={self.uri}, labels:={self.label}, "
-            f"tenant access right:={self.tenant_access_right}]>"
+    def fset(self: "LazyThingObject", value: Any) -> None:
+        self.materialize(*fields)
+        prop.fset(self, value)
+
+    return property(fget, fset if prop.fset is not None else None, doc=prop.__doc__)
+
+
+def __lazy_method__(name: str, *fields: str) -> Callable[..., Any]:
+    """Wraps a ThingObject method, so that the fields are materialized before it is called."""
+    method: Callable[..., Any] = getattr(ThingObject, name)
+
+    @wraps(method)
+    def wrapper(self: "LazyThingObject", *args: Any, **kwargs: Any) -> Any:
+        self.materialize(*fields)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class LazyThingObject(ThingObject):
+    """
+    LazyThingObject
+    ---------------
+    View on the raw entity dictionary returned by the knowledge graph service.
+
+    URI, concept type, image, index targets, ownership, visibility and group ids are read when the view is created.
+    Labels and aliases, descriptions, data properties, relations and tenant rights are parsed on first access.
+    A fully accessed instance behaves identically to the ThingObject created by `ThingObject.from_dict`.
+
+    Parameters
+    ----------
+    entity: Dict[str, Any]
+        Dictionary that contains the data of the entity
+    """
+
+    __slots__ = ("__raw", "__pending")
+
+    def __init__(self, entity: Dict[str, Any]) -> None:
+        use_nel, use_vector_index, use_vector_index_document, use_fulltext_index = (
+            ThingObject.__index_targets_from_dict__(entity)
+        )
+        super().__init__(
+            icon=entity[IMAGE_TAG],
+            uri=entity.get(URI_TAG),
+            concept_type=OntologyClassReference.parse(entity[TYPE_TAG]),
+            owner=entity.get(OWNER_TAG, True),
+            use_for_nel=use_nel,
+            use_vector_index=use_vector_index,
+            use_vector_index_document=use_vector_index_document,
+            use_full_text_index=use_fulltext_index,
         )
+        self.visibility = entity.get(VISIBILITY_TAG)
+        self.owner_id = entity.get(OWNER_ID_TAG)
+        self.group_ids = entity.get(GROUP_IDS)
+        self.__raw: Optional[Dict[str, Any]] = entity
+        self.__pending: Set[str] = set(LAZY_FIELDS)
+        self.reset_modified()
+
+    @staticmethod
+    def from_dict(entity: Dict[str, Any]) -> "LazyThingObject":
+        """Creates a lazy view on an entity dict.
+
+        Parameters
+        ----------
+        entity: Dict[str, Any]
+            Dictionary that contains the data of the entity
+
+        Returns
+        -------
+        instance: LazyThingObject
+            The lazy view on the dict
+        """
+        return LazyThingObject(entity)
+
+    @property
+    def materialized(self) -> bool:
+        """Flag if all fields have been parsed from the raw dict."""
+        return len(self.__pending) == 0
+
+    def materialize(self, *fields: str) -> None:
+        """
+        Parses fields from the raw dict. Fields that are already materialized are skipped.
+
+        Parameters
+        ----------
+        fields: str
+            Fields to materialize (see `LAZY_FIELDS`). If no field is given, all fields are materialized.
+        """
+        if not self.__pending:
+            return
+        # Materializing uses the setters, which must not count as modifications
+        modified: FrozenSet[str] = self.modified_fields
+        for field in fields or LAZY_FIELDS:
+            if field not in self.__pending:
+                continue
+            # Mark the field first, as the setters of ThingObject are materializing themselves
+            self.__pending.discard(field)
+            raw: Dict[str, Any] = self.__raw
+            if field == LAZY_LABELS:
+                labels, alias = ThingObject.__labels_from_dict__(raw)
+                self.label = labels
+                self.alias = alias
+            elif field == LAZY_DESCRIPTIONS:
+                self.description = ThingObject.__descriptions_from_dict__(raw)
+            elif field == LAZY_DATA_PROPERTIES:
+                for data_property in ThingObject.__data_properties_from_dict__(raw):
+                    self.add_data_property(data_property)
+            elif field == LAZY_OBJECT_PROPERTIES:
+                for obj in ThingObject.__object_properties_from_dict__(raw):
+                    self.add_relation(obj)
+            elif field == LAZY_TENANT_RIGHTS:
+                if TENANT_RIGHTS_TAG in raw and raw[TENANT_RIGHTS_TAG]:
+                    self.tenant_access_right = TenantAccessRight.parse(raw[TENANT_RIGHTS_TAG])
+        self.reset_modified()
+        if modified:
+            self.mark_modified(*modified)
+        if not self.__pending:
+            # Release the raw dict
+            self.__raw = None
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__raw = None
+        self.__pending = set()
+        super().__setstate__(state)
+
+    # Labels and aliases
+    label = __lazy_property__("label", LAZY_LABELS)
+    alias = __lazy_property__("alias", LAZY_LABELS)
+    add_label = __lazy_method__("add_label", LAZY_LABELS)
+    update_label = __lazy_method__("update_label", LAZY_LABELS)
+    remove_label = __lazy_method__("remove_label", LAZY_LABELS)
+    label_lang = __lazy_method__("label_lang", LAZY_LABELS)
+    add_alias = __lazy_method__("add_alias", LAZY_LABELS)
+    update_alias = __lazy_method__("update_alias", LAZY_LABELS)
+    remove_alias = __lazy_method__("remove_alias", LAZY_LABELS)
+    alias_lang = __lazy_method__("alias_lang", LAZY_LABELS)
+    # Descriptions
+    description = __lazy_property__("description", LAZY_DESCRIPTIONS)
+    add_description = __lazy_method__("add_description", LAZY_DESCRIPTIONS)
+    update_description = __lazy_method__("update_description", LAZY_DESCRIPTIONS)
+    remove_description = __lazy_method__("remove_description", LAZY_DESCRIPTIONS)
+    description_lang = __lazy_method__("description_lang", LAZY_DESCRIPTIONS)
+    # Data properties
+    data_properties = __lazy_property__("data_properties", LAZY_DATA_PROPERTIES)
+    source_reference_id = __lazy_property__("source_reference_id", LAZY_DATA_PROPERTIES)
+    reference_id = __lazy_property__("reference_id", LAZY_DATA_PROPERTIES)
+    source_system = __lazy_property__("source_system", LAZY_DATA_PROPERTIES)
+    add_source_system = __lazy_method__("add_source_system", LAZY_DATA_PROPERTIES)
+    add_source_reference_id = __lazy_method__("add_source_reference_id", LAZY_DATA_PROPERTIES)
+    default_source_reference_id = __lazy_method__("default_source_reference_id", LAZY_DATA_PROPERTIES)
+    default_source_system = __lazy_method__("default_source_system", LAZY_DATA_PROPERTIES)
+    add_data_property = __lazy_method__("add_data_property", LAZY_DATA_PROPERTIES)
+    remove_data_property = __lazy_method__("remove_data_property", LAZY_DATA_PROPERTIES)
+    data_property_lang = __lazy_method__("data_property_lang", LAZY_DATA_PROPERTIES)
+    # Object properties
+    object_properties = __lazy_property__("object_properties", LAZY_OBJECT_PROPERTIES)
+    add_relation = __lazy_method__("add_relation", LAZY_OBJECT_PROPERTIES)
+    remove_relation = __lazy_method__("remove_relation", LAZY_OBJECT_PROPERTIES)
+    # Tenant rights
+    tenant_access_right = __lazy_property__("tenant_access_right", LAZY_TENANT_RIGHTS)
+    # Whole entity
+    fingerprint = __lazy_property__("fingerprint", *LAZY_FIELDS)
+    as_dict = __lazy_method__("as_dict", *LAZY_FIELDS)
+    __import_format_dict__ = __lazy_method__("__import_format_dict__", *LAZY_FIELDS)
+    __getstate__ = __lazy_method__("__getstate__", *LAZY_FIELDS)
+    __hash__ = __lazy_method__("__hash__", *LAZY_FIELDS)
+    __eq__ = __lazy_method__("__eq__", *LAZY_FIELDS)
+    __repr__ = __lazy_method__("__repr__", LAZY_LABELS, LAZY_TENANT_RIGHTS)
 
 
 # --------------------------------------------- Inflection setting -----------------------------------------------------
@@ -2944,6 +3648,10 @@ __all__ = [
     "OntologyContext",
     "PropertyType",
     "ThingObject",
+    "LazyThingObject",
+    "LAZY_FIELDS",
+    "TRACKED_FIELDS",
+    "PICKLE_STATE_VERSION",
     "ThingEncoder",
     "NAME_TAG",
     "RESOURCE",
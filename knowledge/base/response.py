@@ -4,12 +4,15 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any, cast
 from typing import Literal
 
+from knowledge.base.ontology import ThingObject
+
 __all__ = [
     "JobStatus",
     "ErrorDetail",
     "ErrorLogEntry",
     "ErrorLogResponse",
     "NewEntityUrisResponse",
+    "BulkEntityResult",
 ]
 
 
@@ -372,3 +375,74 @@ class NewEntityUrisResponse:
             Instance of NewEntityUrisResponse.
         """
         return cls(new_entities_uris=param["uris"], next_page_id=param.get("nextPage"))
+
+
+class BulkEntityResult:
+    """
+    BulkEntityResult
+    ----------------
+    Represents the outcome of creating one entity within a bulk creation.
+
+    Parameters
+    ----------
+    index: int
+        Position of the entity in the input.
+    entity: ThingObject
+        The entity; its URI is set if it was created.
+    uri: Optional[str]
+        URI of the created entity, None if its batch failed.
+    error: Optional[Exception]
+        Error of the batch of the entity, if the entity was not created.
+    image_error: Optional[Exception]
+        Error of the image upload, if the entity was created but its image could not be set.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        entity: ThingObject,
+        uri: Optional[str] = None,
+        error: Optional[Exception] = None,
+        image_error: Optional[Exception] = None,
+    ):
+        self._index: int = index
+        self._entity: ThingObject = entity
+        self._uri: Optional[str] = uri
+        self._error: Optional[Exception] = error
+        self._image_error: Optional[Exception] = image_error
+
+    @property
+    def index(self) -> int:
+        """Position of the entity in the input."""
+        return self._index
+
+    @property
+    def entity(self) -> ThingObject:
+        """The entity."""
+        return self._entity
+
+    @property
+    def uri(self) -> Optional[str]:
+        """URI of the created entity."""
+        return self._uri
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """Error of the batch, if the entity was not created."""
+        return self._error
+
+    @property
+    def image_error(self) -> Optional[Exception]:
+        """Error of the image upload."""
+        return self._image_error
+
+    @property
+    def ok(self) -> bool:
+        """Flag if the entity and its image were created."""
+        return self._error is None and self._image_error is None
+
+    def __repr__(self):
+        return (
+            f"BulkEntityResult(index={self.index}, uri={self.uri}, error={self.error}, "
+            f"image_error={self.image_error})"
+        )
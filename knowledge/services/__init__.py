@@ -76,6 +76,13 @@ __all__ = [
     "tenant",
     "users",
     "search",
+    "hub",
+    "concurrency",
+    "ratelimit",
+    "circuit",
+    "coalescing",
+    "instrumentation",
+    "pagination",
     "USER_AGENT_HEADER_FLAG",
     "AUTHORIZATION_HEADER_FLAG",
     "CONTENT_TYPE_HEADER_FLAG",
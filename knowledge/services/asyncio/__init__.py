@@ -4,4 +4,4 @@
 This package contains the asyncio client for the knowledge graph functionality.
 """
 
-__all__ = ["base", "content", "graph", "group", "index_management", "ink", "queue_management", "search", "users"]
+__all__ = ["base", "content", "graph", "group", "hub", "index_management", "ink", "queue_management", "search", "users"]
@@ -2,11 +2,16 @@
 # Copyright © 2021-present Wacom. All rights reserved.
 import asyncio
 import json
+import random
 import socket
 import ssl
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Tuple, Dict, Optional, Union, Literal, List, cast
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Tuple, Dict, Optional, Union, Literal, List, Iterable, FrozenSet, Hashable, TYPE_CHECKING, cast
 
 import aiohttp
 import certifi
@@ -27,28 +32,85 @@ from knowledge.services import (
     EXTERNAL_USER_ID,
     AUTHORIZATION_HEADER_FLAG,
 )
-from knowledge.services.base import WacomServiceException, RESTAPIClient
+from knowledge.services.base import (
+    WacomServiceException,
+    CircuitOpenException,
+    RESTAPIClient,
+    STATUS_FORCE_LIST,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_BACKOFF_JITTER,
+    RETRY_AFTER_STATUS_CODES,
+    IDEMPOTENT_METHODS,
+)
+from knowledge.services.circuit import CircuitBreaker
+from knowledge.services.coalescing import AsyncRequestCoalescer, coalescing_key
+from knowledge.services.concurrency import AsyncAdaptiveLimiter, is_backpressure
+from knowledge.services.instrumentation import RequestEvent, RequestHook, dispatch, endpoint_template
+from knowledge.services.ratelimit import AsyncRateLimiter
 from knowledge.services.session import (
+    DEFAULT_REFRESH_LEAD_TIME,
+    DEFAULT_REFRESH_INTERVAL,
     TokenManager,
     PermanentSession,
     RefreshableSession,
     TimedSession,
 )
 
+if TYPE_CHECKING:
+    from knowledge.services.asyncio.hub import AsyncServiceHub
+
 __all__ = [
     "ResponseData",
     "CachedResolver",
+    "ConnectorConfig",
+    "DEFAULT_CONNECTOR_CONFIG",
+    "default_ssl_context",
+    "timing_trace_config",
     "AsyncSession",
     "AsyncServiceAPIClient",
     "handle_error",
     "cached_getaddrinfo",
     "dns_cache",
     "HTTPMethodFunction",
+    "HTTP_METHODS",
+    "parse_retry_after",
 ]
 
 # A cache for storing DNS resolutions
 dns_cache: TTLCache = TTLCache(maxsize=100, ttl=300)  # Adjust size and ttl as needed
 HTTPMethodFunction = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
+HTTP_METHODS: FrozenSet[str] = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+RETRY_AFTER_HEADER: str = "Retry-After"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses the value of a Retry-After header.
+
+    Parameters
+    ----------
+    value: Optional[str]
+        Value of the header, either seconds or an HTTP date.
+
+    Returns
+    -------
+    seconds: Optional[float]
+        Seconds to wait, None if the value is missing or invalid.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
 async def cached_getaddrinfo(host: str, *args: Any, **kwargs: Any) -> Any:
@@ -81,6 +143,79 @@ async def cached_getaddrinfo(host: str, *args: Any, **kwargs: Any) -> Any:
         raise
 
 
+@lru_cache(maxsize=1)
+def default_ssl_context() -> ssl.SSLContext:
+    """
+    SSL context with the certifi CA bundle. Loading the CA bundle is expensive, thus the context is created once per
+    process and shared by all connectors.
+
+    Returns
+    -------
+    ssl_context: ssl.SSLContext
+        Shared SSL context.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+@dataclass(frozen=True)
+class ConnectorConfig:
+    """
+    Configuration of the aiohttp connector of an asynchronous session.
+
+    Attributes
+    ----------
+    limit: int
+        Maximum number of simultaneous connections, 0 for no limit.
+    limit_per_host: int
+        Maximum number of simultaneous connections to the same host, 0 for no limit.
+    keepalive_timeout: Optional[float]
+        Seconds an idle connection is kept for reuse. Ignored if `force_close` is set.
+    force_close: bool
+        Close the connection after each request.
+    use_dns_cache: bool
+        Cache the resolved addresses in the connector.
+    ttl_dns_cache: Optional[int]
+        Seconds the resolved addresses are cached in the connector, None for no expiry.
+    cached_resolver: bool
+        Resolve the host names with the process-wide `CachedResolver` instead of the default resolver of aiohttp.
+    ssl_context: Optional[ssl.SSLContext]
+        SSL context of the connections, the shared `default_ssl_context()` if None.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: Optional[float] = 15.0
+    force_close: bool = False
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 10
+    cached_resolver: bool = True
+    ssl_context: Optional[ssl.SSLContext] = None
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """
+        Creates a connector with the configuration. The connector is bound to the running event loop.
+
+        Returns
+        -------
+        connector: aiohttp.TCPConnector
+            Connector for an aiohttp.ClientSession.
+        """
+        kwargs: Dict[str, Any] = {}
+        if not self.force_close:
+            kwargs["keepalive_timeout"] = self.keepalive_timeout
+        if self.cached_resolver:
+            kwargs["resolver"] = CachedResolver()
+        return aiohttp.TCPConnector(
+            ssl=self.ssl_context or default_ssl_context(),
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            force_close=self.force_close,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+            **kwargs,
+        )
+
+
 @dataclass
 class ResponseData:
     """
@@ -164,6 +299,60 @@ class CachedResolver(aiohttp.resolver.AbstractResolver):  # type: ignore[misc]
         ]
 
 
+DEFAULT_CONNECTOR_CONFIG: ConnectorConfig = ConnectorConfig()
+
+
+def timing_trace_config() -> aiohttp.TraceConfig:
+    """
+    Trace configuration measuring the phases of the requests, which are passed a `RequestEvent` as
+    `trace_request_ctx`. Requests without an event are ignored.
+
+    Returns
+    -------
+    trace_config: aiohttp.TraceConfig
+        Trace configuration for an `aiohttp.ClientSession`.
+    """
+
+    def stamp(name: str):
+        async def callback(_: aiohttp.ClientSession, ctx: SimpleNamespace, __: Any) -> None:
+            if isinstance(ctx.trace_request_ctx, RequestEvent):
+                setattr(ctx, name, time.perf_counter())
+
+        return callback
+
+    def measure(name: str, phase: str):
+        async def callback(_: aiohttp.ClientSession, ctx: SimpleNamespace, __: Any) -> None:
+            event: Any = ctx.trace_request_ctx
+            start: Optional[float] = getattr(ctx, name, None)
+            if isinstance(event, RequestEvent) and start is not None:
+                setattr(event.timings, phase, time.perf_counter() - start)
+
+        return callback
+
+    async def on_chunk_sent(_: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+        event: Any = ctx.trace_request_ctx
+        if isinstance(event, RequestEvent):
+            event.request_bytes = (event.request_bytes or 0) + len(params.chunk)
+
+    async def on_chunk_received(_: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+        event: Any = ctx.trace_request_ctx
+        if isinstance(event, RequestEvent):
+            event.response_bytes = (event.response_bytes or 0) + len(params.chunk)
+
+    trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+    trace_config.on_connection_queued_start.append(stamp("queued"))
+    trace_config.on_connection_queued_end.append(measure("queued", "queued"))
+    trace_config.on_dns_resolvehost_start.append(stamp("dns"))
+    trace_config.on_dns_resolvehost_end.append(measure("dns", "dns"))
+    trace_config.on_connection_create_start.append(stamp("connect"))
+    trace_config.on_connection_create_end.append(measure("connect", "connect"))
+    trace_config.on_request_headers_sent.append(stamp("sent"))
+    trace_config.on_request_end.append(measure("sent", "server"))
+    trace_config.on_request_chunk_sent.append(on_chunk_sent)
+    trace_config.on_response_chunk_received.append(on_chunk_received)
+    return trace_config
+
+
 class AsyncSession:
     """
     Represents an asynchronous session manager for making HTTP requests.
@@ -180,44 +369,249 @@ class AsyncSession:
         The client instance.
     timeout: int
         The default timeout duration in seconds for requests.
-
+    max_retries: int
+        Maximum number of retries for failed requests.
+    backoff_factor: float
+        Backoff factor for failed requests, the n-th retry waits `backoff_factor * 2 ** (n - 1)` seconds.
+    backoff_max: float
+        Maximum backoff in seconds.
+    backoff_jitter: float
+        Maximum random jitter in seconds that is added to the backoff.
+    status_forcelist: Iterable[int]
+        Status codes that are retried for the allowed methods.
+    allowed_methods: Iterable[str]
+        Methods that are retried on the status codes of `status_forcelist` and on connection errors. Other methods
+        are only retried if the service rejected the request with a Retry-After header, or if the connection could
+        not be established.
+    respect_retry_after_header: bool
+        Wait for the time given by the Retry-After header of 413, 429 and 503 responses.
+    transport: Optional[AsyncServiceHub]
+        Hub providing pooled HTTP sessions shared with other clients. The shared sessions are not closed by the
+        session.
+    connector_config: Optional[ConnectorConfig]
+        Configuration of the connector of the session, `DEFAULT_CONNECTOR_CONFIG` if None.
+    connector: Optional[aiohttp.BaseConnector]
+        Connector shared with other sessions. The shared connector is not closed by the session and has to be
+        created in the event loop of the requests.
+    limiter: Optional[AsyncAdaptiveLimiter]
+        Adaptive limiter for the in-flight requests, which can be shared with other sessions. Every attempt of a
+        request occupies a slot, the backoff between the attempts does not.
+    rate_limiter: Optional[AsyncRateLimiter]
+        Rate limiter of the endpoint classes, which can be shared with other sessions. Every attempt of a request
+        waits for a token before it occupies a slot of the adaptive limiter.
+    circuit_breaker: Optional[CircuitBreaker]
+        Circuit breaker of the endpoints, which can be shared with other sessions. Every attempt of a request is
+        recorded, an attempt to an endpoint with an open circuit raises a `CircuitOpenException`.
+    coalescer: Optional[AsyncRequestCoalescer]
+        Coalescer of identical GET requests in flight, which can be shared with other sessions. Coalesced requests
+        share the `ResponseData`, including the parsed content.
+    hooks: Iterable[RequestHook]
+        Instrumentation hooks receiving the events of every attempt of a request. The phases of the connection are
+        measured for HTTP sessions created while hooks are registered.
+
+    Notes
+    -----
+    A single request can override the method allow-list with the `idempotent` keyword argument, e.g., for POST
+    requests that only query data. Requests with a streamed body (e.g., form data) are never retried.
     """
 
     def __init__(
         self,
         client: "AsyncServiceAPIClient",
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        backoff_jitter: float = DEFAULT_BACKOFF_JITTER,
+        status_forcelist: Iterable[int] = STATUS_FORCE_LIST,
+        allowed_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        respect_retry_after_header: bool = True,
+        transport: Optional["AsyncServiceHub"] = None,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        limiter: Optional[AsyncAdaptiveLimiter] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalescer: Optional[AsyncRequestCoalescer] = None,
+        hooks: Iterable[RequestHook] = (),
     ):
         self._client = client
         self._session: Optional[aiohttp.ClientSession] = None
+        self._transport: Optional["AsyncServiceHub"] = transport
+        self._connector_config: ConnectorConfig = connector_config or DEFAULT_CONNECTOR_CONFIG
+        self._connector: Optional[aiohttp.BaseConnector] = connector
+        self._limiter: Optional[AsyncAdaptiveLimiter] = limiter
+        self._rate_limiter: Optional[AsyncRateLimiter] = rate_limiter
+        self._circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self._coalescer: Optional[AsyncRequestCoalescer] = coalescer
+        self._hooks: Tuple[RequestHook, ...] = tuple(hooks)
         self._session_lock: asyncio.Lock = asyncio.Lock()
         self._timeout: int = timeout
+        self._max_retries: int = max_retries
+        self._backoff_factor: float = backoff_factor
+        self._backoff_max: float = backoff_max
+        self._backoff_jitter: float = backoff_jitter
+        self._status_forcelist: FrozenSet[int] = frozenset(status_forcelist)
+        self._allowed_methods: FrozenSet[str] = frozenset(m.upper() for m in allowed_methods)
+        self._respect_retry_after_header: bool = respect_retry_after_header
+
+    @property
+    def max_retries(self) -> int:
+        """Maximum number of retries for failed requests."""
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, value: int) -> None:
+        self._max_retries = value
+
+    @property
+    def backoff_factor(self) -> float:
+        """Backoff factor for failed requests."""
+        return self._backoff_factor
+
+    @backoff_factor.setter
+    def backoff_factor(self, value: float) -> None:
+        self._backoff_factor = value
+
+    @property
+    def backoff_max(self) -> float:
+        """Maximum backoff in seconds."""
+        return self._backoff_max
+
+    @backoff_max.setter
+    def backoff_max(self, value: float) -> None:
+        self._backoff_max = value
+
+    @property
+    def backoff_jitter(self) -> float:
+        """Maximum random jitter in seconds that is added to the backoff."""
+        return self._backoff_jitter
+
+    @backoff_jitter.setter
+    def backoff_jitter(self, value: float) -> None:
+        self._backoff_jitter = value
+
+    @property
+    def status_forcelist(self) -> FrozenSet[int]:
+        """Status codes that are retried for the allowed methods."""
+        return self._status_forcelist
+
+    @property
+    def allowed_methods(self) -> FrozenSet[str]:
+        """Methods that are retried on the status codes of the force list and on connection errors."""
+        return self._allowed_methods
+
+    @property
+    def respect_retry_after_header(self) -> bool:
+        """Wait for the time given by the Retry-After header."""
+        return self._respect_retry_after_header
+
+    @property
+    def connector_config(self) -> ConnectorConfig:
+        """Configuration of the connector of the session."""
+        return self._connector_config
+
+    @property
+    def connector(self) -> Optional[aiohttp.BaseConnector]:
+        """Connector shared with other sessions."""
+        return self._connector
+
+    @property
+    def limiter(self) -> Optional[AsyncAdaptiveLimiter]:
+        """Adaptive limiter for the in-flight requests."""
+        return self._limiter
+
+    @limiter.setter
+    def limiter(self, value: Optional[AsyncAdaptiveLimiter]) -> None:
+        self._limiter = value
+
+    @property
+    def rate_limiter(self) -> Optional[AsyncRateLimiter]:
+        """Rate limiter of the endpoint classes."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[AsyncRateLimiter]) -> None:
+        self._rate_limiter = value
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker of the endpoints."""
+        return self._circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: Optional[CircuitBreaker]) -> None:
+        self._circuit_breaker = value
+
+    @property
+    def coalescer(self) -> Optional[AsyncRequestCoalescer]:
+        """Coalescer of identical GET requests in flight."""
+        return self._coalescer
+
+    @coalescer.setter
+    def coalescer(self, value: Optional[AsyncRequestCoalescer]) -> None:
+        self._coalescer = value
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        """Instrumentation hooks."""
+        return self._hooks
+
+    @hooks.setter
+    def hooks(self, value: Iterable[RequestHook]) -> None:
+        self._hooks = tuple(value)
 
     @staticmethod
-    def _async_session(timeout: int) -> aiohttp.ClientSession:
+    def _async_session(
+        timeout: int,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+    ) -> aiohttp.ClientSession:
         """
         Returns an asynchronous session.
 
+        Parameters
+        ----------
+        timeout : int
+            The default timeout duration in seconds for requests.
+        connector_config : Optional[ConnectorConfig]
+            Configuration of the connector of the session, `DEFAULT_CONNECTOR_CONFIG` if None.
+        connector : Optional[aiohttp.BaseConnector]
+            Shared connector, which is not closed with the session.
+        trace_configs : Optional[List[aiohttp.TraceConfig]]
+            Trace configurations of the session, e.g., `timing_trace_config()` for the instrumentation hooks.
+
         Returns
         -------
         session: aiohttp.ClientSession
             Asynchronous session
         """
         client_timeout: ClientTimeout = ClientTimeout(total=timeout)
-        ssl_context: ssl.SSLContext = ssl.create_default_context(cafile=certifi.where())
-        connector: aiohttp.TCPConnector = aiohttp.TCPConnector(ssl=ssl_context, resolver=CachedResolver())
         return aiohttp.ClientSession(
             json_serialize=lambda x: orjson.dumps(x).decode(),
             timeout=client_timeout,
-            connector=connector,
+            connector=connector or (connector_config or DEFAULT_CONNECTOR_CONFIG).create_connector(),
+            connector_owner=connector is None,
+            trace_configs=trace_configs,
         )
 
-    async def _create_session(self) -> aiohttp.ClientSession:
+    def _trace_configs(self) -> Optional[List[aiohttp.TraceConfig]]:
+        """Trace configurations of a new HTTP session, the phases of the requests are only traced with hooks."""
+        return [timing_trace_config()] if self._hooks else None
+
+    async def _create_session(self, url: Optional[str] = None) -> aiohttp.ClientSession:
         """
         Creates and manages an asynchronous HTTP session for the client instance. This
         method ensures that the session is safely created, retrieved, or recreated if
         necessary, maintaining a proper state to avoid session-related conflicts or
-        errors during asynchronous HTTP operations.
+        errors during asynchronous HTTP operations. If a shared transport is set, the
+        pooled session of the transport for the URL is returned.
+
+        Parameters
+        ----------
+        url : Optional[str]
+            URL of the request, used for selecting the connection pool of the shared transport.
 
         Returns
         -------
@@ -230,12 +624,16 @@ class AsyncSession:
             Raised if there is an attempt to close an HTTP session while the event loop
             is already closed. This error is safely handled inside the method.
         """
+        if self._transport is not None:
+            return await self._transport.session(url)
         async with self._session_lock:
             loop = asyncio.get_running_loop()
 
             # Case 1: no session yet
             if self._session is None:
-                self._session = AsyncSession._async_session(self._timeout)
+                self._session = AsyncSession._async_session(
+                    self._timeout, self._connector_config, self._connector, self._trace_configs()
+                )
                 self._session._loop = loop
                 return self._session
 
@@ -247,7 +645,9 @@ class AsyncSession:
                 except RuntimeError:
                     pass  # loop already dead, nothing to do
 
-                self._session = self._async_session(self._timeout)
+                self._session = self._async_session(
+                    self._timeout, self._connector_config, self._connector, self._trace_configs()
+                )
                 self._session._loop = loop
                 return self._session
 
@@ -318,75 +718,238 @@ class AsyncSession:
         headers : Optional[Dict[str, str]]
             Headers to include in the request. Defaults to None.
         kwargs : dict
-            Additional arguments to pass to the request method of aiohttp.ClientSession.
+            Additional arguments to pass to the request method of aiohttp.ClientSession. The flag `idempotent`
+            overrides the method allow-list of the retries.
 
         Returns
         -------
         ResponseData
-            The response object resulting from the HTTP request.
+            The response object resulting from the HTTP request. If all retries failed, the last response.
 
         Raises
         ------
         ValueError
             If the specified HTTP method is unsupported.
+        aiohttp.ClientConnectionError
+            If the connection failed and the request cannot be retried.
         """
+        if method not in HTTP_METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        coalescer: Optional[AsyncRequestCoalescer] = self._coalescer
+        if coalescer is not None and method == "GET":
+            identity: Optional[str] = kwargs.get("overwrite_auth_token")
+            if identity is None and not kwargs.get("ignore_auth", False):
+                identity = self._client.current_session_id
+            key: Hashable = coalescing_key(url, kwargs.get("params"), headers, identity)
+            return await coalescer.run(key, lambda: self._request(method, url, headers, **kwargs))
+        return await self._request(method, url, headers, **kwargs)
+
+    async def _request(
+        self,
+        method: HTTPMethodFunction,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> ResponseData:
+        """Executes an HTTP request with the retry policy, see `request`."""
         request_timeout: int = kwargs.pop("timeout", self._timeout)
-        request_headers = await self._prepare_headers(
-            headers,
-            overwrite_auth_token=kwargs.pop("overwrite_auth_token", None),
-            ignore_auth=kwargs.pop("ignore_auth", False),
-            ignore_content_type=kwargs.pop("ignore_content_type", False),
-        )
-        session: aiohttp.ClientSession = await self._create_session()
-        # Use the provided timeout or fall back to session default
-
-        if method == "GET":
-            async with session.get(url=url, headers=request_headers, timeout=request_timeout, **kwargs) as response:
-                return ResponseData(
-                    ok=response.ok,
-                    content=await AsyncSession._request_content(response),
-                    status=response.status,
-                    url=response.url.human_repr(),
-                    method=response.method,
-                )
-        elif method == "POST":
-            async with session.post(url=url, headers=request_headers, timeout=request_timeout, **kwargs) as response:
-                return ResponseData(
-                    ok=response.ok,
-                    content=await AsyncSession._request_content(response),
-                    status=response.status,
-                    url=response.url.human_repr(),
-                    method=response.method,
-                )
-        elif method == "PUT":
-            async with session.put(url=url, headers=request_headers, timeout=request_timeout, **kwargs) as response:
-                return ResponseData(
-                    ok=response.ok,
-                    content=await AsyncSession._request_content(response),
-                    status=response.status,
-                    url=response.url.human_repr(),
-                    method=response.method,
-                )
-        elif method == "DELETE":
-            async with session.delete(url=url, headers=request_headers, timeout=request_timeout, **kwargs) as response:
-                return ResponseData(
-                    ok=response.ok,
-                    content=await AsyncSession._request_content(response),
-                    status=response.status,
-                    url=response.url.human_repr(),
-                    method=response.method,
-                )
-        elif method == "PATCH":
-            async with session.patch(url=url, headers=request_headers, timeout=request_timeout, **kwargs) as response:
-                return ResponseData(
-                    ok=response.ok,
-                    content=await AsyncSession._request_content(response),
-                    status=response.status,
-                    url=response.url.human_repr(),
-                    method=response.method,
+        overwrite_auth_token: Optional[str] = kwargs.pop("overwrite_auth_token", None)
+        ignore_auth: bool = kwargs.pop("ignore_auth", False)
+        ignore_content_type: bool = kwargs.pop("ignore_content_type", False)
+        idempotent: Optional[bool] = kwargs.pop("idempotent", None)
+        retry_method: bool = method in self._allowed_methods if idempotent is None else idempotent
+        replayable: bool = AsyncSession._is_replayable(kwargs)
+        attempt: int = 0
+        while True:
+            request_headers = await self._prepare_headers(
+                headers,
+                overwrite_auth_token=overwrite_auth_token,
+                ignore_auth=ignore_auth,
+                ignore_content_type=ignore_content_type,
+            )
+            session: aiohttp.ClientSession = await self._create_session(url)
+            breaker: Optional[CircuitBreaker] = self._circuit_breaker
+            endpoint: str = ""
+            if breaker is not None:
+                endpoint = breaker.endpoint(url)
+                if not breaker.allow(endpoint):
+                    raise CircuitOpenException(endpoint, breaker.retry_after(endpoint), method=method, url=url)
+            rate_limiter: Optional[AsyncRateLimiter] = self._rate_limiter
+            limiter: Optional[AsyncAdaptiveLimiter] = self._limiter
+            try:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire(method, url)
+                if limiter is not None:
+                    await limiter.acquire()
+            except asyncio.CancelledError:
+                if breaker is not None:
+                    breaker.record(endpoint, None)
+                raise
+            hooks: Tuple[RequestHook, ...] = self._hooks
+            event: Optional[RequestEvent] = None
+            if hooks:
+                event = RequestEvent(method=method, url=url, endpoint=endpoint_template(url), attempt=attempt)
+                dispatch(hooks, "before_request", event)
+            start: float = time.perf_counter()
+            latency: Optional[float] = None
+            backpressure: bool = False
+            success: Optional[bool] = None
+            try:
+                async with session.request(
+                    method,
+                    url=url,
+                    headers=request_headers,
+                    timeout=request_timeout,
+                    trace_request_ctx=event,
+                    **kwargs,
+                ) as response:
+                    latency = time.perf_counter() - start
+                    backpressure = is_backpressure(response.status)
+                    success = breaker is None or not breaker.is_failure(response.status)
+                    retry_delay: Optional[float] = None
+                    if replayable and attempt < self._max_retries:
+                        retry_delay = self._retry_delay(response, retry_method, attempt)
+                    if retry_delay is None:
+                        content: Union[str, bytes, Dict[str, Any], List[Any]] = await AsyncSession._request_content(
+                            response
+                        )
+                        if event is not None:
+                            self._report_response(event, response, latency, time.perf_counter() - start - latency)
+                        return ResponseData(
+                            ok=response.ok,
+                            content=content,
+                            status=response.status,
+                            url=response.url.human_repr(),
+                            method=response.method,
+                        )
+                    if event is not None:
+                        self._report_response(event, response, latency, None)
+                    delay: float = retry_delay
+                    logger.warning(
+                        f"{method} {url} failed with status {response.status}. "
+                        f"Retry {attempt + 1}/{self._max_retries} in {delay:.2f}s."
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                latency = time.perf_counter() - start
+                backpressure = True
+                success = False
+                if event is not None:
+                    self._report_error(event, e, latency)
+                # Connection attempts that failed never reached the service, all methods can be repeated
+                if (
+                    not replayable
+                    or attempt >= self._max_retries
+                    or not (retry_method or isinstance(e, aiohttp.ClientConnectorError))
+                ):
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"{method} {url} failed: {e!r}. Retry {attempt + 1}/{self._max_retries} in {delay:.2f}s."
                 )
-        else:
-            raise ValueError(f"Unsupported method: {method}")
+            except Exception as e:
+                if event is not None:
+                    self._report_error(event, e, time.perf_counter() - start)
+                raise
+            finally:
+                if limiter is not None:
+                    limiter.release(latency, backpressure)
+                if breaker is not None:
+                    breaker.record(endpoint, success)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _report_response(
+        self, event: RequestEvent, response: aiohttp.ClientResponse, latency: float, decode: Optional[float]
+    ) -> None:
+        """
+        Reports a response to the hooks.
+
+        Parameters
+        ----------
+        event : RequestEvent
+            Event of the request.
+        response : aiohttp.ClientResponse
+            Response of the request.
+        latency : float
+            Time in seconds until the response headers arrived.
+        decode : Optional[float]
+            Time in seconds to read and decode the body, None if the body was not read.
+        """
+        event.status = response.status
+        event.timings.total = latency
+        event.timings.decode = decode
+        if event.response_bytes is None:
+            event.response_bytes = response.content_length
+        dispatch(self._hooks, "after_response", event)
+
+    def _report_error(self, event: RequestEvent, error: BaseException, latency: float) -> None:
+        """
+        Reports a failed request to the hooks.
+
+        Parameters
+        ----------
+        event : RequestEvent
+            Event of the request.
+        error : BaseException
+            Exception of the request.
+        latency : float
+            Time in seconds until the request failed.
+        """
+        event.error = error
+        event.timings.total = latency
+        dispatch(self._hooks, "on_error", event)
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Exponential backoff with jitter.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of previous retries.
+
+        Returns
+        -------
+        float
+            Time to wait in seconds.
+        """
+        backoff: float = min(self._backoff_max, self._backoff_factor * (2**attempt))
+        if self._backoff_jitter > 0:
+            backoff += random.uniform(0, self._backoff_jitter)
+        return backoff
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, retry_method: bool, attempt: int) -> Optional[float]:
+        """
+        Decides if a response is retried.
+
+        Parameters
+        ----------
+        response : aiohttp.ClientResponse
+            The response of the request.
+        retry_method : bool
+            The method of the request can be repeated safely.
+        attempt : int
+            Number of previous retries.
+
+        Returns
+        -------
+        Optional[float]
+            Time to wait in seconds before the retry, None if the response is not retried.
+        """
+        if self._respect_retry_after_header and response.status in RETRY_AFTER_STATUS_CODES:
+            retry_after: Optional[float] = parse_retry_after(response.headers.get(RETRY_AFTER_HEADER))
+            if retry_after is not None:
+                # The service did not process the request, so it can be repeated for all methods
+                return retry_after
+        if retry_method and response.status in self._status_forcelist:
+            return self._backoff(attempt)
+        return None
+
+    @staticmethod
+    def _is_replayable(kwargs: Dict[str, Any]) -> bool:
+        """Checks if the body of a request can be sent again."""
+        data: Any = kwargs.get("data")
+        return data is None or isinstance(data, (bytes, bytearray, str, dict, list, tuple))
 
     async def get(self, url: str, **kwargs: Any) -> ResponseData:
         """
@@ -514,7 +1077,8 @@ class AsyncSession:
         Closes the existing session asynchronously.
 
         This method ensures that the session is properly closed and reset to `None`.
-        It acquires a session lock to guarantee thread-safe operations.
+        It acquires a session lock to guarantee thread-safe operations. The sessions of a
+        shared transport are left open.
 
         Notes
         -----
@@ -637,6 +1201,15 @@ class AsyncServiceAPIClient(RESTAPIClient):
         Flag if API calls should be verified.
     timeout: int (Default:= DEFAULT_TIMEOUT)
         Timeout for the request in seconds.
+    max_retries: int (Default:= DEFAULT_MAX_RETRIES)
+        Maximum number of retries for failed requests.
+    backoff_factor: float (Default:= DEFAULT_BACKOFF_FACTOR)
+        Backoff factor for failed requests.
+    connector_config: Optional[ConnectorConfig] (Default:= None)
+        Configuration of the connection pool, e.g., `ConnectorConfig(limit=500, limit_per_host=500)` for fan-out
+        workloads. `DEFAULT_CONNECTOR_CONFIG` if None.
+    connector: Optional[aiohttp.BaseConnector] (Default:= None)
+        Connector shared with other clients. The shared connector is not closed by the client.
     """
 
     USER_ENDPOINT: str = "user"
@@ -651,6 +1224,10 @@ class AsyncServiceAPIClient(RESTAPIClient):
         service_endpoint: str = "graph/v1",
         verify_calls: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ):
         self._service_endpoint: str = service_endpoint
         self._auth_url: str = base_auth_url if base_auth_url is not None else service_url
@@ -658,9 +1235,18 @@ class AsyncServiceAPIClient(RESTAPIClient):
         self._token_manager: TokenManager = TokenManager()
         self._current_session_id: Optional[str] = None
         self._session: Optional[AsyncSession] = None
-        self._token_refresh_lock: asyncio.Lock = asyncio.Lock()
         self._session_lock: asyncio.Lock = asyncio.Lock()
+        self._transport: Optional["AsyncServiceHub"] = None
         self._timeout: int = timeout
+        self._max_retries: int = max_retries
+        self._backoff_factor: float = backoff_factor
+        self._connector_config: Optional[ConnectorConfig] = connector_config
+        self._connector: Optional[aiohttp.BaseConnector] = connector
+        self._limiter: Optional[AsyncAdaptiveLimiter] = None
+        self._rate_limiter: Optional[AsyncRateLimiter] = None
+        self._circuit_breaker: Optional[CircuitBreaker] = None
+        self._coalescer: Optional[AsyncRequestCoalescer] = None
+        self._hooks: Tuple[RequestHook, ...] = ()
         super().__init__(service_url, verify_calls)
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
@@ -711,8 +1297,9 @@ class AsyncServiceAPIClient(RESTAPIClient):
         This method ensures that the session is closed in a thread-safe manner. It acquires
         a session lock to prevent concurrent access during the session closure process.
         If the session is already closed, the method will not perform any additional
-        operations.
+        operations. A running background token refresher is stopped.
         """
+        await self._token_manager.stop_async_refresher()
         async with self._session_lock:
             if self._session:
                 await self._session.close()
@@ -722,6 +1309,91 @@ class AsyncServiceAPIClient(RESTAPIClient):
         """Application name."""
         return self._application_name
 
+    @property
+    def connector_config(self) -> ConnectorConfig:
+        """Configuration of the connection pool."""
+        return self._connector_config or DEFAULT_CONNECTOR_CONFIG
+
+    @property
+    def connector(self) -> Optional[aiohttp.BaseConnector]:
+        """Connector shared with other clients."""
+        return self._connector
+
+    @property
+    def limiter(self) -> Optional[AsyncAdaptiveLimiter]:
+        """Adaptive limiter for the in-flight requests of the client, None if the requests are not limited."""
+        return self._limiter
+
+    @limiter.setter
+    def limiter(self, value: Optional[AsyncAdaptiveLimiter]) -> None:
+        self._limiter = value
+        if self._session is not None:
+            self._session.limiter = value
+
+    @property
+    def rate_limiter(self) -> Optional[AsyncRateLimiter]:
+        """Rate limiter of the endpoint classes of the client, None if the requests are not throttled."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[AsyncRateLimiter]) -> None:
+        self._rate_limiter = value
+        if self._session is not None:
+            self._session.rate_limiter = value
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker of the endpoints of the client, None if requests never fail fast."""
+        return self._circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: Optional[CircuitBreaker]) -> None:
+        self._circuit_breaker = value
+        if self._session is not None:
+            self._session.circuit_breaker = value
+
+    @property
+    def coalescer(self) -> Optional[AsyncRequestCoalescer]:
+        """Coalescer of identical GET requests in flight of the client, None if the requests are not coalesced."""
+        return self._coalescer
+
+    @coalescer.setter
+    def coalescer(self, value: Optional[AsyncRequestCoalescer]) -> None:
+        self._coalescer = value
+        if self._session is not None:
+            self._session.coalescer = value
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        """Instrumentation hooks of the client."""
+        return self._hooks
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Register an instrumentation hook for the requests of the client.
+
+        Parameters
+        ----------
+        hook : RequestHook
+            Hook receiving the events of the requests.
+        """
+        self._hooks = self._hooks + (hook,)
+        if self._session is not None:
+            self._session.hooks = self._hooks
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """
+        Remove an instrumentation hook.
+
+        Parameters
+        ----------
+        hook : RequestHook
+            Registered hook.
+        """
+        self._hooks = tuple(h for h in self._hooks if h is not hook)
+        if self._session is not None:
+            self._session.hooks = self._hooks
+
     @property
     def user_agent(self) -> str:
         """User agent."""
@@ -730,6 +1402,11 @@ class AsyncServiceAPIClient(RESTAPIClient):
             f"(+https://github.com/Wacom-Developer/personal-knowledge-library)"
         )
 
+    @property
+    def current_session_id(self) -> Optional[str]:
+        """Id of the current session, None if no session is set."""
+        return self._current_session_id
+
     @property
     def current_session(
         self,
@@ -789,25 +1466,48 @@ class AsyncServiceAPIClient(RESTAPIClient):
         if self.current_session is None:
             raise WacomServiceException("Authentication key is not set. Please login first.")
 
-        async with self._token_refresh_lock:
-            # Re-check the session state after acquiring a lock
-            if not self.current_session.refreshable and self.current_session.expired:
-                raise WacomServiceException(
-                    "Authentication key is expired and cannot be refreshed. Please login again."
-                )
-
-            if not self.current_session.refreshable and force_refresh:
-                raise WacomServiceException("Authentication key is not refreshable. Please login again.")
+        session: Union[RefreshableSession, TimedSession, PermanentSession] = self.current_session
+        # The background refresher renews the token ahead of its expiry, the current token is used as is. If a
+        # background refresh failed, the token is refreshed on demand once it is about to expire.
+        if (
+            self._token_manager.refresher_running
+            and session.refreshable
+            and not force_refresh
+            and session.expires_in >= force_refresh_timeout
+        ):
+            return session.auth_token, session.refresh_token
+        # Token the expiry is checked for, the token is not refreshed again if another coroutine replaced it meanwhile
+        stale_token: str = session.auth_token
+        if not session.refreshable and session.expired:
+            raise WacomServiceException("Authentication key is expired and cannot be refreshed. Please login again.")
+
+        if not session.refreshable and force_refresh:
+            raise WacomServiceException("Authentication key is not refreshable. Please login again.")
+
+        # Refresh token if needed
+        if session.refreshable and (session.expires_in < force_refresh_timeout or force_refresh):
+            await self._refresh_session(cast(RefreshableSession, session), stale_token)
+        return session.auth_token, session.refresh_token
+
+    async def _refresh_session(self, session: RefreshableSession, stale_token: str) -> None:
+        """
+        Refreshes the token of a session, unless another coroutine already replaced the stale token.
 
-            # Refresh token if needed
-            if self.current_session.refreshable and (
-                self.current_session.expires_in < force_refresh_timeout or force_refresh
-            ):
+        Parameters
+        ----------
+        session : RefreshableSession
+            Session to refresh.
+        stale_token : str
+            Token that needs to be replaced.
+        """
+        # Single-flight refresh, concurrent coroutines wait for the running refresh and reuse its result
+        async with self._token_manager.async_refresh_lock(session.id):
+            if session.auth_token == stale_token:
                 try:
-                    auth_key, refresh_token, _ = await self.refresh_token(self.current_session.refresh_token or "")
+                    auth_key, refresh_token, _ = await self.refresh_token(session.refresh_token or "")
                 except WacomServiceException as e:
-                    if isinstance(self.current_session, PermanentSession):
-                        permanent_session: PermanentSession = self.current_session
+                    if isinstance(session, PermanentSession):
+                        permanent_session: PermanentSession = session
                         auth_key, refresh_token, _ = await self.request_user_token(
                             permanent_session.tenant_api_key,
                             permanent_session.external_user_id,
@@ -816,9 +1516,31 @@ class AsyncServiceAPIClient(RESTAPIClient):
                         if logger:
                             logger.error(f"Error refreshing token: {e}")
                         raise e
-                self.current_session.update_session(auth_key, refresh_token)
+                session.update_session(auth_key, refresh_token)
+
+    async def start_token_refresher(
+        self, lead_time: float = DEFAULT_REFRESH_LEAD_TIME, interval: float = DEFAULT_REFRESH_INTERVAL
+    ) -> None:
+        """
+        Starts a task of the running event loop renewing the tokens of the refreshable sessions ahead of their expiry.
+
+        While the refresher is running, `handle_token` returns the current token without expiry checks or locks.
+        The refresher is stopped when the client is closed.
+
+        Parameters
+        ----------
+        lead_time : float (Default:= DEFAULT_REFRESH_LEAD_TIME)
+            Seconds ahead of the expiry of a token the token is renewed.
+        interval : float (Default:= DEFAULT_REFRESH_INTERVAL)
+            Maximum seconds between two checks of the refresher.
+        """
+        self._token_manager.start_async_refresher(
+            lambda session: self._refresh_session(session, session.auth_token), lead_time, interval
+        )
 
-            return self.current_session.auth_token, self.current_session.refresh_token
+    async def stop_token_refresher(self) -> None:
+        """Stops the background token refresher."""
+        await self._token_manager.stop_async_refresher()
 
     async def asyncio_session(self) -> AsyncSession:
         """
@@ -831,9 +1553,41 @@ class AsyncServiceAPIClient(RESTAPIClient):
         """
         async with self._session_lock:
             if self._session is None:
-                self._session = AsyncSession(self, self._timeout)
+                self._session = AsyncSession(
+                    self,
+                    self._timeout,
+                    max_retries=self._max_retries,
+                    backoff_factor=self._backoff_factor,
+                    transport=self._transport,
+                    connector_config=self._connector_config,
+                    connector=self._connector,
+                    limiter=self._limiter,
+                    rate_limiter=self._rate_limiter,
+                    circuit_breaker=self._circuit_breaker,
+                    coalescer=self._coalescer,
+                    hooks=self._hooks,
+                )
         return self._session
 
+    async def share_transport(self, token_manager: TokenManager, transport: Optional["AsyncServiceHub"] = None) -> None:
+        """
+        Uses a token manager and pooled HTTP sessions shared with other clients, e.g., the ones of an
+        `AsyncServiceHub`.
+
+        Parameters
+        ----------
+        token_manager : TokenManager
+            Shared token manager. Sessions are looked up in the shared token manager.
+        transport : Optional[AsyncServiceHub]
+            Hub providing the pooled HTTP sessions. If None, the client keeps its own connection pool.
+        """
+        async with self._session_lock:
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+            self._token_manager = token_manager
+            self._transport = transport
+
     async def request_user_token(
         self, tenant_api_key: str, external_id: str, timeout: int = DEFAULT_TIMEOUT
     ) -> Tuple[str, str, datetime]:
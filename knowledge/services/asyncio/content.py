@@ -12,7 +12,9 @@ from knowledge.services.asyncio.base import (
     AsyncSession,
     handle_error,
     ResponseData,
+    ConnectorConfig,
 )
+from knowledge.services.base import DEFAULT_MAX_RETRIES, DEFAULT_BACKOFF_FACTOR
 
 __all__ = ["AsyncContentClient"]
 
@@ -74,6 +76,10 @@ class AsyncContentClient(AsyncServiceAPIClient):
         service_endpoint: str = "graph/v1",
         verify_calls: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ):
         super().__init__(
             service_url=service_url,
@@ -82,6 +88,10 @@ class AsyncContentClient(AsyncServiceAPIClient):
             service_endpoint=service_endpoint,
             verify_calls=verify_calls,
             timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            connector_config=connector_config,
+            connector=connector,
         )
 
     def _content_url(self, path: str = "") -> str:
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
 # Copyright © 2024-present Wacom. All rights reserved.
-import gzip
-import json
+import asyncio
 import logging
 import os
 import urllib
 from pathlib import Path
-from typing import Any, Optional, List, Dict, Tuple, cast
+from typing import Any, Optional, List, Dict, Tuple, Iterable, AsyncIterator, cast
 from urllib.parse import urlparse
 
 import aiohttp
@@ -28,15 +27,23 @@ from knowledge.base.entity import (
     TEXT_TAG,
     INCLUDE_RELATIONS_TAG,
 )
+from knowledge.base.frame import EntityFrame
 from knowledge.base.language import LocaleCode, EN_US
 from knowledge.base.ontology import (
     DataProperty,
     OntologyPropertyReference,
     ThingObject,
+    LazyThingObject,
     OntologyClassReference,
     ObjectProperty,
 )
-from knowledge.base.response import JobStatus, ErrorLogResponse, NewEntityUrisResponse
+from knowledge.base.response import (
+    JobStatus,
+    ErrorLogEntry,
+    ErrorLogResponse,
+    NewEntityUrisResponse,
+    BulkEntityResult,
+)
 from knowledge.nel.base import (
     KnowledgeGraphEntity,
     EntityType,
@@ -70,20 +77,34 @@ from knowledge.services import (
     ENTITIES_TAG,
     RESULT_TAG,
     EXACT_MATCH,
+    CONTENT_TYPE_HEADER_FLAG,
 )
 from knowledge.services.asyncio.base import (
     AsyncServiceAPIClient,
     handle_error,
     ResponseData,
     AsyncSession,
+    ConnectorConfig,
 )
 from knowledge.services.base import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_FACTOR,
     WacomServiceException,
     format_exception,
 )
 from knowledge.services import DEFAULT_TIMEOUT
 from knowledge.services.graph import Visibility, SearchPattern, MIME_TYPE
-from knowledge.services.helper import split_updates, entity_payload
+from knowledge.services.pagination import DEFAULT_PREFETCH, async_prefetch_pages
+from knowledge.services.helper import (
+    split_updates,
+    entity_payload,
+    modified_entity_payload,
+    UPDATE_PAYLOAD_FIELDS,
+    json_bytes,
+    entities_payload_bytes,
+    import_format_gzip,
+    MultipartStream,
+)
 
 
 # -------------------------------------------- Service API Client ------------------------------------------------------
@@ -158,6 +179,10 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
         service_endpoint: str = "graph/v1",
         verify_calls: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ):
         super().__init__(
             service_url=service_url,
@@ -166,6 +191,10 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
             service_endpoint=service_endpoint,
             verify_calls=verify_calls,
             timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            connector_config=connector_config,
+            connector=connector,
         )
 
     async def entity(self, uri: str, auth_key: Optional[str] = None) -> ThingObject:
@@ -216,6 +245,7 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
         locale: Optional[LocaleCode] = None,
         auth_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
+        lazy: bool = False,
     ) -> List[ThingObject]:
         """
         Retrieve entities information from personal knowledge, using the URI as identifier.
@@ -232,6 +262,8 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
             Use a different auth key than the one from the client
         timeout: int
             Timeout in seconds. Default: 10 seconds.
+        lazy: bool (default:= False)
+            Return lazy entities (LazyThingObject), which parse their content on first access.
 
         Returns
         -------
@@ -261,7 +293,7 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
             if response.ok:
                 entities: List[Dict[str, Any]] = cast(List[Dict[str, Any]], response.content)
                 for e in entities:
-                    thing: ThingObject = ThingObject.from_dict(e)
+                    thing: ThingObject = LazyThingObject(e) if lazy else ThingObject.from_dict(e)
                     things.append(thing)
             else:
                 raise await handle_error(
@@ -548,13 +580,13 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
             If the graph service returns an error code
         """
         url: str = f"{self.service_base_url}{AsyncWacomKnowledgeService.ENTITY_BULK_ENDPOINT}"
-        payload: List[Dict[str, Any]] = [await AsyncWacomKnowledgeService.__entity__(e) for e in entities]
         session: AsyncSession = await self.asyncio_session()
         for bulk_idx in range(0, len(entities), batch_size):
-            bulk = payload[bulk_idx : bulk_idx + batch_size]
+            # Encode each batch directly, instead of keeping the payloads of all entities in memory
+            bulk: bytes = entities_payload_bytes(entities[bulk_idx : bulk_idx + batch_size])
             response: ResponseData = await session.post(
                 url,
-                json=bulk,
+                data=bulk,
                 verify_ssl=self.verify_calls,
                 overwrite_auth_token=auth_key,
             )
@@ -571,6 +603,111 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
                     entities[bulk_idx + idx].uri = response_dict[URIS_TAG][idx]
         return entities
 
+    async def create_entity_bulk_concurrent(
+        self,
+        entities: List[ThingObject],
+        batch_size: int = 10,
+        max_in_flight: int = 4,
+        image_workers: int = 4,
+        ignore_images: bool = False,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> List[BulkEntityResult]:
+        """
+        Creates entities in the graph with several batches in flight.
+
+        The batches and the image uploads are bounded by separate semaphores, thus the image uploads of a batch overlap
+        with the following batches. A failed batch does not abort the others, the outcome of every entity is returned
+        in the order of the input.
+
+        Parameters
+        ----------
+        entities: List[ThingObject]
+            Entities
+        batch_size: int
+            Batch size
+        max_in_flight: int
+            Maximum number of batches in flight.
+        image_workers: int
+            Maximum number of image uploads in flight.
+        ignore_images: bool
+            Do not automatically upload images
+        auth_key: Optional[str]
+            If the auth key is not set, the client auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds).
+
+        Returns
+        -------
+        results: List[BulkEntityResult]
+            Outcome per entity, in the order of the input. The URIs of the created entities are set.
+        """
+        url: str = f"{self.service_base_url}{AsyncWacomKnowledgeService.ENTITY_BULK_ENDPOINT}"
+        session: AsyncSession = await self.asyncio_session()
+        batch_slots: asyncio.Semaphore = asyncio.Semaphore(max(1, max_in_flight))
+        image_slots: asyncio.Semaphore = asyncio.Semaphore(max(1, image_workers))
+        uris: List[Optional[str]] = [None] * len(entities)
+        errors: List[Optional[Exception]] = [None] * len(entities)
+        image_errors: List[Optional[Exception]] = [None] * len(entities)
+        uploads: List[asyncio.Task] = []
+
+        async def upload(idx: int, uri: str, image: str) -> None:
+            async with image_slots:
+                try:
+                    await self.set_entity_image_url(uri, image, auth_key=auth_key)
+                except Exception as e:  # pylint: disable=broad-except
+                    image_errors[idx] = e
+
+        async def push(start: int) -> None:
+            async with batch_slots:
+                try:
+                    # Encode the batch once it is sent, thus only the batches in flight are kept in memory
+                    bulk: bytes = entities_payload_bytes(entities[start : start + batch_size])
+                    response: ResponseData = await session.post(
+                        url,
+                        data=bulk,
+                        timeout=timeout,
+                        verify_ssl=self.verify_calls,
+                        overwrite_auth_token=auth_key,
+                    )
+                    if not response.ok:
+                        raise await handle_error("Pushing entity failed.", response)
+                    batch_uris: List[str] = cast(Dict[str, Any], response.content)[URIS_TAG]
+                    # The URIs are assigned by position, thus a batch with a different number of URIs is not assigned
+                    expected: int = min(batch_size, len(entities) - start)
+                    if len(batch_uris) != expected:
+                        raise WacomServiceException(
+                            f"Pushing entity failed. Expected {expected} URIs, but received {len(batch_uris)}.",
+                            method="POST",
+                            url=url,
+                        )
+                except Exception as e:  # pylint: disable=broad-except
+                    for idx in range(start, min(start + batch_size, len(entities))):
+                        errors[idx] = e
+                    return
+            for offset, uri in enumerate(batch_uris):
+                idx: int = start + offset
+                uris[idx] = uri
+                entities[idx].uri = uri
+                entity_image: Optional[str] = entities[idx].image
+                if entity_image is not None and entity_image != "" and not ignore_images:
+                    uploads.append(asyncio.ensure_future(upload(idx, uri, entity_image)))
+
+        pushes: List[asyncio.Task] = [
+            asyncio.ensure_future(push(start)) for start in range(0, len(entities), batch_size)
+        ]
+        try:
+            await asyncio.gather(*pushes)
+            await asyncio.gather(*uploads)
+        except BaseException:
+            for task in pushes + uploads:
+                task.cancel()
+            raise
+        return [
+            BulkEntityResult(idx, entity, uri=uris[idx], error=errors[idx], image_error=image_errors[idx])
+            for idx, entity in enumerate(entities)
+        ]
+
     async def create_entity(
         self,
         entity: ThingObject,
@@ -604,7 +741,7 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
         session: AsyncSession = await self.asyncio_session()
         response: ResponseData = await session.post(
             url,
-            json=payload,
+            data=json_bytes(payload),
             verify_ssl=self.verify_calls,
             overwrite_auth_token=auth_key,
         )
@@ -624,16 +761,19 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
 
     async def import_entities(
         self,
-        entities: List[ThingObject],
+        entities: Iterable[ThingObject],
         auth_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
     ) -> str:
         """Import entities to the graph.
 
+        The entities are encoded and compressed incrementally while the upload is streamed, thus the memory does not
+        depend on the number of entities.
+
         Parameters
         ----------
-        entities: List[ThingObject]
-            List of entities to import.
+        entities: Iterable[ThingObject]
+            Entities to import, e.g., a list or a generator.
         auth_key: Optional[str] = None
             If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
         timeout: int
@@ -649,30 +789,18 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
         WacomServiceException
             If the graph service returns an error code.
         """
-        ndjson_lines: List[str] = []
-        for obj in entities:
-            data_dict = obj.__import_format_dict__()
-            ndjson_lines.append(json.dumps(data_dict))  # Convert each dict to a JSON string
-
-        ndjson_content = "\n".join(ndjson_lines)  # Join JSON strings with a newline
-        # Compress the NDJSON string to a gzip byte array
-        compressed_data: bytes = gzip.compress(ndjson_content.encode("utf-8"))
-        url: str = f"{self.service_base_url}{self.IMPORT_ENTITIES_ENDPOINT}"
-        data: aiohttp.FormData = aiohttp.FormData()
-        data.add_field(
-            "file",
-            compressed_data,
-            filename="import.njson.gz",
-            content_type="application/x-gzip",
+        stream: MultipartStream = MultipartStream(
+            lambda: import_format_gzip(entities), replayable=iter(entities) is not entities
         )
+        url: str = f"{self.service_base_url}{self.IMPORT_ENTITIES_ENDPOINT}"
         session: AsyncSession = await self.asyncio_session()
         response: ResponseData = await session.post(
             url,
-            data=data,
+            data=stream,
+            headers={CONTENT_TYPE_HEADER_FLAG: stream.content_type},
             timeout=timeout,
             verify_ssl=self.verify_calls,
             overwrite_auth_token=auth_key,
-            ignore_content_type=True,
         )
         if response.ok:
             structure: Dict[str, Any] = cast(Dict[str, Any], response.content)
@@ -687,10 +815,12 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
     ) -> str:
         """Import entities from a file to the graph.
 
+        The file is streamed from disk in chunks.
+
         Parameters
         ----------
         file_path: Path
-            Path to the file containing entities in NDJSON format.
+            Path to the gzip-compressed file containing entities in NDJSON format.
         auth_key: Optional[str] = None
             If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
         timeout: int
@@ -711,12 +841,11 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
         if not file_path.exists():
             raise FileNotFoundError(f"The file {file_path} does not exist.")
         with file_path.open("rb") as file:
-            # Compress the NDJSON string to a gzip byte array
-            compressed_data: bytes = file.read()
+            # aiohttp reads the file in chunks while sending it
             data: aiohttp.FormData = aiohttp.FormData()
             data.add_field(
                 "file",
-                compressed_data,
+                file,
                 filename="import.njson.gz",
                 content_type="application/x-gzip",
             )
@@ -855,12 +984,87 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
             return NewEntityUrisResponse.from_dict(structure)
         raise await handle_error(f"Retrieving job status for {job_id} failed.", response)
 
+    async def import_error_log_iter(
+        self,
+        job_id: str,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[ErrorLogEntry]:
+        """
+        Iterate over the error log of the job, fetching the next pages ahead.
+
+        Parameters
+        ----------
+        job_id: str
+            ID of the job
+        auth_key: Optional[str] = None
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+        prefetch: int (default:= DEFAULT_PREFETCH)
+            Maximum number of pages fetched ahead, the pages are fetched on demand if 0.
+
+        Returns
+        -------
+        entries: AsyncIterator[ErrorLogEntry]
+            Entries of the error log of the job.
+        """
+
+        async def fetch(page_id: Optional[str]) -> Tuple[List[ErrorLogEntry], Optional[str]]:
+            page: ErrorLogResponse = await self.import_error_log(
+                job_id, auth_key=auth_key, next_page_id=page_id, timeout=timeout
+            )
+            return page.error_log, page.next_page_id
+
+        async for items in async_prefetch_pages(fetch, prefetch=prefetch):
+            for item in items:
+                yield item
+
+    async def import_new_uris_iter(
+        self,
+        job_id: str,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Iterate over the new entity uris of the job, fetching the next pages ahead.
+
+        Parameters
+        ----------
+        job_id: str
+            ID of the job
+        auth_key: Optional[str] = None
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+        prefetch: int (default:= DEFAULT_PREFETCH)
+            Maximum number of pages fetched ahead, the pages are fetched on demand if 0.
+
+        Returns
+        -------
+        uris: AsyncIterator[Tuple[str, str]]
+            Reference id and URI of the new entities.
+        """
+
+        async def fetch(page_id: Optional[str]) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+            page: NewEntityUrisResponse = await self.import_new_uris(
+                job_id, auth_key=auth_key, next_page_id=page_id, timeout=timeout
+            )
+            return list(page.new_entities_uris.items()), page.next_page_id
+
+        async for items in async_prefetch_pages(fetch, prefetch=prefetch):
+            for item in items:
+                yield item
+
     async def update_entity(
         self,
         entity: ThingObject,
         auth_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
-    ) -> None:
+        only_modified: bool = False,
+    ) -> bool:
         """
         Updates entity in the graph.
 
@@ -872,12 +1076,25 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
             Use a different auth key than the one from the client
         timeout: int
             Timeout in seconds. Default: 10 seconds.
+        only_modified: bool [default:= False]
+            Only send the fields that have been modified since the entity has been loaded (see
+            `ThingObject.modified_fields`). If no field of the update payload has been modified, no request is sent.
+
+        Returns
+        -------
+        updated: bool
+            True if the update has been sent, False if it has been skipped as nothing has been modified.
 
         Raises
         ------
         WacomServiceException
             If the graph service returns an error code
         """
+        payload: Optional[Dict[str, Any]] = (
+            modified_entity_payload(entity) if only_modified else await AsyncWacomKnowledgeService.__entity__(entity)
+        )
+        if payload is None:
+            return False
         auth_key_resolved: Optional[str] = auth_key
         if auth_key_resolved is None:
             auth_key_resolved, _ = await self.handle_token()
@@ -885,11 +1102,10 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
         url: str = f"{self.service_base_url}{AsyncWacomKnowledgeService.ENTITY_ENDPOINT}/{uri}"
         # Header info
 
-        payload: Dict[str, Any] = await AsyncWacomKnowledgeService.__entity__(entity)
         session: AsyncSession = await self.asyncio_session()
         response: ResponseData = await session.patch(
             url,
-            json=payload,
+            data=json_bytes(payload),
             timeout=timeout,
             verify_ssl=self.verify_calls,
             overwrite_auth_token=auth_key_resolved,
@@ -900,6 +1116,8 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
                 response,
                 payload=payload,
             )
+        entity.reset_modified(*UPDATE_PAYLOAD_FIELDS)
+        return True
 
     async def add_entity_indexes(
         self,
@@ -1324,7 +1542,7 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
 
         raise await handle_error(f"Activation failed. URIS:={uris}.", response, parameters=params)
 
-    async def listing(
+    async def listing_page(
         self,
         filter_type: OntologyClassReference,
         page_id: Optional[str] = None,
@@ -1336,9 +1554,9 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
         estimate_count: bool = False,
         auth_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
-    ) -> Tuple[List[ThingObject], int, str]:
+    ) -> Dict[str, Any]:
         """
-        List all entities visible to users.
+        Fetch a page of the listing of the entities visible to users, without parsing the entities.
 
         Parameters
         ----------
@@ -1365,12 +1583,9 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
 
         Returns
         -------
-        entities: List[ThingObject]
-            List of entities
-        estimated_total_number: int
-            Number of all entities
-        next_page_id: str
-            Identifier of the next page
+        page: Dict[str, Any]
+            Response of the listing, with the entity dicts (`listing`), the estimated total number of entities and the
+            identifier of the next page.
 
         Raises
         ------
@@ -1407,21 +1622,160 @@ class AsyncWacomKnowledgeService(AsyncServiceAPIClient):
         )
         # If the response is successful
         if response.ok:
-            entities_resp: Dict[str, Any] = cast(Dict[str, Any], response.content)
-            next_page_id: str = entities_resp[NEXT_PAGE_ID_TAG]
-            estimated_total_number: int = entities_resp.get(TOTAL_COUNT, 0)
-            entities: List[ThingObject] = []
-            if LISTING in entities_resp:
-                for e in entities_resp[LISTING]:
-                    thing: ThingObject = ThingObject.from_dict(e)
-                    thing.status_flag = EntityStatus.SYNCED
-                    entities.append(thing)
-            return entities, estimated_total_number, next_page_id
+            return cast(Dict[str, Any], response.content)
         raise await handle_error(
             f"Failed to list the entities (since:= {page_id}, limit:={limit}). ",
             response,
         )
 
+    async def listing(
+        self,
+        filter_type: OntologyClassReference,
+        page_id: Optional[str] = None,
+        limit: int = 30,
+        locale: Optional[LocaleCode] = None,
+        visibility: Optional[Visibility] = None,
+        is_owner: Optional[bool] = None,
+        include_relations: Optional[bool] = None,
+        estimate_count: bool = False,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        lazy: bool = False,
+    ) -> Tuple[List[ThingObject], int, str]:
+        """
+        List all entities visible to users.
+
+        Parameters
+        ----------
+        filter_type: OntologyClassReference
+            Filtering with entity
+        page_id: Optional[str] = [default:=None]
+            Page id. Start from this page id
+        limit: int
+            Limit of the returned entities.
+        locale: Optional[LocaleCode] [default:=None]
+            ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., en_US.
+        visibility: Optional[Visibility] [default:=None]
+            Filter the entities based on its visibilities
+        is_owner: Optional[bool] [default:=None]
+            Filter the entities based on its owner
+        include_relations: Optional[bool] [default:=None]
+            Include relations in the response.
+        estimate_count: bool = [default:=False]
+            Request an estimate of the entities in a tenant.
+        auth_key: Optional[str] = [default:= None]
+            Auth key from user if not set, the client auth key will be used
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+        lazy: bool = [default:=False]
+            Return lazy entities (LazyThingObject), which parse their content on first access.
+
+        Returns
+        -------
+        entities: List[ThingObject]
+            List of entities
+        estimated_total_number: int
+            Number of all entities
+        next_page_id: str
+            Identifier of the next page
+
+        Raises
+        ------
+        WacomServiceException
+            If the graph service returns an error code
+        """
+        entities_resp: Dict[str, Any] = await self.listing_page(
+            filter_type,
+            page_id=page_id,
+            limit=limit,
+            locale=locale,
+            visibility=visibility,
+            is_owner=is_owner,
+            estimate_count=estimate_count,
+            include_relations=include_relations,
+            auth_key=auth_key,
+            timeout=timeout,
+        )
+        entities: List[ThingObject] = []
+        for e in entities_resp.get(LISTING, []):
+            thing: ThingObject = LazyThingObject(e) if lazy else ThingObject.from_dict(e)
+            thing.status_flag = EntityStatus.SYNCED
+            entities.append(thing)
+        return entities, entities_resp.get(TOTAL_COUNT, 0), entities_resp[NEXT_PAGE_ID_TAG]
+
+    async def listing_frame(
+        self,
+        filter_type: OntologyClassReference,
+        page_id: Optional[str] = None,
+        limit: int = 30,
+        locale: Optional[LocaleCode] = None,
+        visibility: Optional[Visibility] = None,
+        is_owner: Optional[bool] = None,
+        include_relations: Optional[bool] = None,
+        estimate_count: bool = False,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        frame: Optional[EntityFrame] = None,
+    ) -> Tuple[EntityFrame, int, str]:
+        """
+        List the entities visible to users into a columnar frame, without creating ThingObjects.
+
+        Parameters
+        ----------
+        filter_type: OntologyClassReference
+            Filtering with entity
+        page_id: Optional[str] = [default:=None]
+            Page id. Start from this page id
+        limit: int
+            Limit of the returned entities.
+        locale: Optional[LocaleCode] [default:=None]
+            ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., en_US.
+        visibility: Optional[Visibility] [default:=None]
+            Filter the entities based on its visibilities
+        is_owner: Optional[bool] [default:=None]
+            Filter the entities based on its owner
+        include_relations: Optional[bool] [default:=None]
+            Include relations in the response.
+        estimate_count: bool = [default:=False]
+            Request an estimate of the entities in a tenant.
+        auth_key: Optional[str] = [default:= None]
+            Auth key from user if not set, the client auth key will be used
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+        frame: Optional[EntityFrame] = [default:=None]
+            Frame to append the entities to, e.g., the frame of the previous pages. If not set, a new frame is created.
+
+        Returns
+        -------
+        frame: EntityFrame
+            Frame with the entities
+        estimated_total_number: int
+            Number of all entities
+        next_page_id: str
+            Identifier of the next page
+
+        Raises
+        ------
+        WacomServiceException
+            If the graph service returns an error code
+        """
+        entities_resp: Dict[str, Any] = await self.listing_page(
+            filter_type,
+            page_id=page_id,
+            limit=limit,
+            locale=locale,
+            visibility=visibility,
+            is_owner=is_owner,
+            estimate_count=estimate_count,
+            include_relations=include_relations,
+            auth_key=auth_key,
+            timeout=timeout,
+        )
+        if frame is None:
+            frame = EntityFrame()
+        frame.extend_listing(entities_resp, EntityStatus.SYNCED)
+        return frame, entities_resp.get(TOTAL_COUNT, 0), entities_resp[NEXT_PAGE_ID_TAG]
+
     async def ontology_update(self, fix: bool = False, auth_key: Optional[str] = None) -> None:
         """
         Update the ontology.
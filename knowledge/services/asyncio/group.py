@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 # Copyright © 2024-present Wacom. All rights reserved.
 import urllib.parse
-from typing import List, Any, Optional, Dict, cast
+from typing import List, Any, AsyncIterator, Optional, Dict, Tuple, cast
+
+import aiohttp
 
 from knowledge.base.access import GroupAccessRight
 from knowledge.base.ontology import NAME_TAG
@@ -17,7 +19,10 @@ from knowledge.services.asyncio.base import (
     AsyncServiceAPIClient,
     handle_error,
     AsyncSession,
+    ConnectorConfig,
 )
+from knowledge.services.base import DEFAULT_MAX_RETRIES, DEFAULT_BACKOFF_FACTOR
+from knowledge.services.pagination import DEFAULT_PREFETCH, async_prefetch_pages, offset_cursor
 from knowledge.services.group import Group, GroupManagementService, GroupInfo
 
 __all__ = ["AsyncGroupManagementService"]
@@ -80,6 +85,10 @@ class AsyncGroupManagementService(AsyncServiceAPIClient):
         service_endpoint: str = "graph/v1",
         verify_calls: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ):
         super().__init__(
             service_url=service_url,
@@ -88,6 +97,10 @@ class AsyncGroupManagementService(AsyncServiceAPIClient):
             service_endpoint=service_endpoint,
             verify_calls=verify_calls,
             timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            connector_config=connector_config,
+            connector=connector,
         )
 
     # ------------------------------------------ Groups handling ------------------------------------------------------
@@ -281,6 +294,48 @@ class AsyncGroupManagementService(AsyncServiceAPIClient):
             raise await handle_error("Listing of group failed.", response)
         return [Group.parse(g) for g in groups]
 
+    async def listing_groups_iter(
+        self,
+        admin: bool = False,
+        limit: int = 20,
+        prefetch: int = DEFAULT_PREFETCH,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[Group]:
+        """
+        Iterate over all groups configured for this instance, fetching the next pages ahead.
+
+        Parameters
+        ----------
+        admin: bool (default:= False)
+            Uses admin privilege to show all groups of the tenants, page by page.
+            Requires a user to have the role: TenantAdmin
+        limit: int (default:= 20)
+            Size of the pages of the admin listing.
+        prefetch: int (default:= DEFAULT_PREFETCH)
+            Maximum number of pages fetched ahead, the pages are fetched on demand if 0.
+        auth_key: Optional[str]
+            If the auth key is set, the logged-in user (if any) will be ignored and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+
+        Returns
+        -------
+        groups: AsyncIterator[Group]
+            Groups of the user, or of the tenant with admin privilege.
+        """
+
+        async def fetch(offset: int) -> Tuple[List[Group], Optional[int]]:
+            groups: List[Group] = await self.listing_groups(
+                admin=admin, limit=limit, offset=offset, auth_key=auth_key, timeout=timeout
+            )
+            # Only the admin listing is paginated
+            return groups, offset_cursor(offset, limit, groups) if admin else None
+
+        async for groups in async_prefetch_pages(fetch, start=0, prefetch=prefetch):
+            for group in groups:
+                yield group
+
     async def group(
         self,
         group_id: str,
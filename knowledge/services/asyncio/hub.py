@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+This module contains the asynchronous service hub, which hands out asynchronous service clients sharing one pooled
+transport and one token manager. Clients of the same hub share the connection pools of the event loop and the
+logged-in sessions, so a worker using several services logs in once.
+
+Examples
+--------
+>>> from knowledge.services.asyncio.base import ConnectorConfig
+>>> from knowledge.services.asyncio.hub import AsyncServiceHub
+>>> from knowledge.services.asyncio.graph import AsyncWacomKnowledgeService
+>>> from knowledge.services.asyncio.search import AsyncSemanticSearchClient
+>>> config = ConnectorConfig(limit=500, limit_per_host=500)
+>>> async with AsyncServiceHub("https://private-knowledge.wacom.com", connector_config=config) as hub:
+...     await hub.login(tenant_api_key, external_user_id)
+...     graph = await hub.client(AsyncWacomKnowledgeService, application_name="Worker")
+...     search = await hub.client(AsyncSemanticSearchClient)
+"""
+
+import asyncio
+import dataclasses
+import weakref
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, TypeVar, Union, cast
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from knowledge.services import DEFAULT_BACKOFF_FACTOR, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT
+from knowledge.services.asyncio.base import (
+    AsyncServiceAPIClient,
+    AsyncSession,
+    ConnectorConfig,
+    DEFAULT_CONNECTOR_CONFIG,
+    timing_trace_config,
+)
+from knowledge.services.circuit import CircuitBreaker
+from knowledge.services.coalescing import AsyncRequestCoalescer
+from knowledge.services.concurrency import AsyncAdaptiveLimiter
+from knowledge.services.instrumentation import RequestHook
+from knowledge.services.ratelimit import AsyncRateLimiter
+from knowledge.services.session import TokenManager, PermanentSession, RefreshableSession, TimedSession
+
+__all__ = ["AsyncServiceHub", "AsyncClientType", "host_key"]
+
+AsyncClientType = TypeVar("AsyncClientType", bound=AsyncServiceAPIClient)
+
+
+def host_key(url: str) -> str:
+    """
+    Host of a URL or a host limit, e.g. `example.com` or `example.com:8443`.
+
+    Parameters
+    ----------
+    url: str
+        URL, URL prefix, or host name.
+
+    Returns
+    -------
+    host: str
+        Lower-case host, with the port if it is given explicitly.
+    """
+    if "://" not in url:
+        url = f"//{url}"
+    return urlsplit(url).netloc.rsplit("@", 1)[-1].lower()
+
+
+class AsyncServiceHub:
+    """
+    Async Service Hub
+    -----------------
+    Factory for asynchronous service clients backed by one pooled transport and one shared token manager.
+
+    All clients handed out by the hub send their requests through the same `aiohttp.ClientSession` of the running
+    event loop. Hosts with a limit get a connection pool of their own, which is bounded by the limit. Sessions added
+    by `login`, `register_token`, or by any client of the hub are stored in the shared token manager and used by all
+    clients.
+
+    Parameters
+    ----------
+    service_url: str
+        URL of the service
+    application_name: str (Default:= "Async Knowledge Client")
+        Name of the application using the service
+    verify_calls: bool (Default:= True)
+        Flag if API calls should be verified.
+    timeout: int (Default:= DEFAULT_TIMEOUT)
+        Timeout for the request in seconds.
+    max_retries: int (Default:= DEFAULT_MAX_RETRIES)
+        Maximum number of retries for failed requests.
+    backoff_factor: float (Default:= DEFAULT_BACKOFF_FACTOR)
+        Backoff factor for failed requests.
+    connector_config: Optional[ConnectorConfig] (Default:= None)
+        Configuration of the shared pool, `DEFAULT_CONNECTOR_CONFIG` if None.
+    host_limits: Optional[Dict[str, int]] (Default:= None)
+        Maximum number of simultaneous connections per host, e.g. `{"private-knowledge.wacom.com": 32}`.
+    limiter: Optional[AsyncAdaptiveLimiter] (Default:= None)
+        Adaptive limiter for the in-flight requests shared by all clients of the hub.
+    rate_limiter: Optional[AsyncRateLimiter] (Default:= None)
+        Rate limiter of the endpoint classes shared by all clients of the hub.
+    circuit_breaker: Optional[CircuitBreaker] (Default:= None)
+        Circuit breaker of the endpoints shared by all clients of the hub.
+    coalescer: Optional[AsyncRequestCoalescer] (Default:= None)
+        Coalescer of identical GET requests in flight shared by all clients of the hub.
+    hooks: Iterable[RequestHook] (Default:= ())
+        Instrumentation hooks receiving the events of the requests of all clients of the hub.
+    """
+
+    def __init__(
+        self,
+        service_url: str,
+        application_name: str = "Async Knowledge Client",
+        verify_calls: bool = True,
+        timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        host_limits: Optional[Dict[str, int]] = None,
+        limiter: Optional[AsyncAdaptiveLimiter] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalescer: Optional[AsyncRequestCoalescer] = None,
+        hooks: Iterable[RequestHook] = (),
+    ):
+        self.__service_url: str = service_url.rstrip("/")
+        self.__application_name: str = application_name
+        self.__verify_calls: bool = verify_calls
+        self.__timeout: int = timeout
+        self.__max_retries: int = max_retries
+        self.__backoff_factor: float = backoff_factor
+        self.__connector_config: ConnectorConfig = connector_config or DEFAULT_CONNECTOR_CONFIG
+        self.__host_limits: Dict[str, int] = {host_key(host): value for host, value in (host_limits or {}).items()}
+        self.__token_manager: TokenManager = TokenManager()
+        self.__sessions: Dict[Optional[str], aiohttp.ClientSession] = {}
+        self.__clients: weakref.WeakSet = weakref.WeakSet()
+        self.__current_session_id: Optional[str] = None
+        self.__lock: asyncio.Lock = asyncio.Lock()
+        self.__auth_client: Optional[AsyncServiceAPIClient] = None
+        self.__limiter: Optional[AsyncAdaptiveLimiter] = limiter
+        self.__rate_limiter: Optional[AsyncRateLimiter] = rate_limiter
+        self.__circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self.__coalescer: Optional[AsyncRequestCoalescer] = coalescer
+        self.__hooks: Tuple[RequestHook, ...] = tuple(hooks)
+
+    @property
+    def service_url(self) -> str:
+        """Service URL."""
+        return self.__service_url
+
+    @property
+    def application_name(self) -> str:
+        """Application name."""
+        return self.__application_name
+
+    @property
+    def verify_calls(self) -> bool:
+        """Flag if API calls should be verified."""
+        return self.__verify_calls
+
+    @property
+    def host_limits(self) -> Dict[str, int]:
+        """Maximum number of simultaneous connections per host."""
+        return dict(self.__host_limits)
+
+    @property
+    def connector_config(self) -> ConnectorConfig:
+        """Configuration of the shared pool."""
+        return self.__connector_config
+
+    @property
+    def limiter(self) -> Optional[AsyncAdaptiveLimiter]:
+        """Adaptive limiter shared by the clients."""
+        return self.__limiter
+
+    @property
+    def rate_limiter(self) -> Optional[AsyncRateLimiter]:
+        """Rate limiter shared by the clients."""
+        return self.__rate_limiter
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker shared by the clients."""
+        return self.__circuit_breaker
+
+    @property
+    def coalescer(self) -> Optional[AsyncRequestCoalescer]:
+        """Coalescer of identical GET requests shared by the clients."""
+        return self.__coalescer
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        """Instrumentation hooks of the clients."""
+        return self.__hooks
+
+    @property
+    def token_manager(self) -> TokenManager:
+        """Token manager shared by the clients."""
+        return self.__token_manager
+
+    @property
+    def current_session_id(self) -> Optional[str]:
+        """Session id used by the clients of the hub."""
+        return self.__current_session_id
+
+    async def session(self, url: Optional[str] = None) -> aiohttp.ClientSession:
+        """
+        Pooled HTTP session of the running event loop for a URL.
+
+        Parameters
+        ----------
+        url: Optional[str] (Default:= None)
+            URL of the request. Hosts with a limit have a pool of their own, all others share one pool.
+
+        Returns
+        -------
+        session: aiohttp.ClientSession
+            Shared HTTP session.
+        """
+        key: Optional[str] = None
+        if url is not None and self.__host_limits:
+            host: str = host_key(url)
+            if host in self.__host_limits:
+                key = host
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        session: Optional[aiohttp.ClientSession] = self.__sessions.get(key)
+        if session is not None and not session.closed and session._loop is loop:
+            return session
+        async with self.__lock:
+            session = self.__sessions.get(key)
+            if session is None or session.closed or session._loop is not loop:
+                if session is not None and not session.closed:
+                    try:
+                        await session.close()
+                    except RuntimeError:
+                        pass  # loop already dead, nothing to do
+                config: ConnectorConfig = self.__connector_config
+                if key is not None:
+                    config = dataclasses.replace(config, limit=self.__host_limits[key], limit_per_host=0)
+                session = AsyncSession._async_session(
+                    self.__timeout, config, trace_configs=[timing_trace_config()] if self.__hooks else None
+                )
+                self.__sessions[key] = session
+            return session
+
+    async def client(self, client_class: Type[AsyncClientType], **kwargs: Any) -> AsyncClientType:
+        """
+        Creates an asynchronous service client backed by the shared transport and token manager.
+
+        Parameters
+        ----------
+        client_class: Type[AsyncClientType]
+            Class of the service client, e.g. `AsyncWacomKnowledgeService`.
+        kwargs: Any
+            Additional arguments of the client. The service URL, timeout, and retry policy default to the ones of the
+            hub.
+
+        Returns
+        -------
+        client: AsyncClientType
+            Service client using the current session of the hub.
+        """
+        kwargs.setdefault("service_url", self.__service_url)
+        kwargs.setdefault("timeout", self.__timeout)
+        kwargs.setdefault("max_retries", self.__max_retries)
+        kwargs.setdefault("backoff_factor", self.__backoff_factor)
+        client: AsyncClientType = client_class(**kwargs)
+        client.verify_calls = self.__verify_calls
+        await client.share_transport(self.__token_manager, self)
+        client.limiter = self.__limiter
+        client.rate_limiter = self.__rate_limiter
+        client.circuit_breaker = self.__circuit_breaker
+        client.coalescer = self.__coalescer
+        for hook in self.__hooks:
+            client.add_hook(hook)
+        if self.__current_session_id is not None:
+            await client.use_session(self.__current_session_id)
+        self.__clients.add(client)
+        return client
+
+    async def __auth__(self) -> AsyncServiceAPIClient:
+        """Client used for the authentication of the hub."""
+        if self.__auth_client is None:
+            self.__auth_client = await self.client(AsyncServiceAPIClient, application_name=self.__application_name)
+        return self.__auth_client
+
+    async def login(self, tenant_api_key: str, external_user_id: str) -> PermanentSession:
+        """
+        Login as a user once for all clients of the hub.
+
+        Parameters
+        ----------
+        tenant_api_key: str
+            Tenant api key
+        external_user_id: str
+            External user id
+
+        Returns
+        -------
+        session: PermanentSession
+            Session used by all clients of the hub.
+        """
+        session: PermanentSession = await (await self.__auth__()).login(tenant_api_key, external_user_id)
+        await self.use_session(session.id)
+        return session
+
+    async def register_token(
+        self, auth_key: str, refresh_token: Optional[str] = None
+    ) -> Union[RefreshableSession, TimedSession]:
+        """
+        Register a token once for all clients of the hub.
+
+        Parameters
+        ----------
+        auth_key: str
+            Authentication key for identifying the user for the service calls.
+        refresh_token: Optional[str] (Default:= None)
+            Refresh token
+
+        Returns
+        -------
+        session: Union[RefreshableSession, TimedSession]
+            Session used by all clients of the hub.
+        """
+        session: Union[RefreshableSession, TimedSession] = await (await self.__auth__()).register_token(
+            auth_key, refresh_token
+        )
+        await self.use_session(session.id)
+        return session
+
+    async def use_session(self, session_id: str) -> None:
+        """
+        Use a session of the shared token manager for all clients of the hub.
+
+        Parameters
+        ----------
+        session_id: str
+            Session id
+        """
+        for client in list(self.__clients):
+            await cast(AsyncServiceAPIClient, client).use_session(session_id)
+        self.__current_session_id = session_id
+
+    async def logout(self) -> None:
+        """Logout the current session of the hub."""
+        if self.__current_session_id is not None:
+            self.__token_manager.remove_session(self.__current_session_id)
+        self.__current_session_id = None
+
+    async def close(self) -> None:
+        """Close the shared HTTP sessions and release their connections."""
+        await self.__token_manager.stop_async_refresher()
+        async with self.__lock:
+            sessions = list(self.__sessions.values())
+            self.__sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    async def __aenter__(self) -> "AsyncServiceHub":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
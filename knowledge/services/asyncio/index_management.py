@@ -3,6 +3,8 @@
 import json
 from typing import Dict, Optional, AsyncIterator, Any, List
 
+import aiohttp
+
 from knowledge.base.index import IndexMode, IndexDocument, HealthResponse
 from knowledge.base.language import LocaleCode
 from knowledge.services import (
@@ -11,9 +13,10 @@ from knowledge.services import (
 from knowledge.services.asyncio.base import (
     AsyncSession,
     ResponseData,
+    ConnectorConfig,
 )
 from knowledge.services.asyncio.search import AsyncSemanticSearchClient
-from knowledge.services.base import WacomServiceException
+from knowledge.services.base import WacomServiceException, DEFAULT_MAX_RETRIES, DEFAULT_BACKOFF_FACTOR
 
 __all__ = ["AsyncIndexManagementClient"]
 
@@ -49,6 +52,10 @@ class AsyncIndexManagementClient(AsyncSemanticSearchClient):
         service_endpoint: str = "vector/api/v1",
         verify_calls: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ):
         super().__init__(
             service_url=service_url,
@@ -57,6 +64,10 @@ class AsyncIndexManagementClient(AsyncSemanticSearchClient):
             service_endpoint=service_endpoint,
             verify_calls=verify_calls,
             timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            connector_config=connector_config,
+            connector=connector,
         )
 
     async def index_health(
@@ -3,6 +3,8 @@
 from http import HTTPStatus
 from typing import Dict, Optional, List
 
+import aiohttp
+
 __all__ = ["AsyncInkServices"]
 
 from knowledge.base.entity import LOCALE_TAG
@@ -24,7 +26,9 @@ from knowledge.services.asyncio.base import (
     AsyncSession,
     handle_error,
     ResponseData,
+    ConnectorConfig,
 )
+from knowledge.services.base import DEFAULT_MAX_RETRIES, DEFAULT_BACKOFF_FACTOR
 
 
 class AsyncInkServices(AsyncServiceAPIClient):
@@ -89,6 +93,10 @@ class AsyncInkServices(AsyncServiceAPIClient):
         service_endpoint: str = "v1/exports",
         verify_calls: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ):
         super().__init__(
             service_url=service_url,
@@ -96,6 +104,10 @@ class AsyncInkServices(AsyncServiceAPIClient):
             service_endpoint=service_endpoint,
             verify_calls=verify_calls,
             timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            connector_config=connector_config,
+            connector=connector,
         )
 
     async def perform_named_entity_linking(
@@ -2,6 +2,8 @@
 # Copyright © 2024-present Wacom. All rights reserved.
 from typing import Dict, Any, Optional, List, Literal, cast
 
+import aiohttp
+
 from knowledge.base.language import LocaleCode
 from knowledge.base.queue import QueueNames, QueueCount, QueueMonitor
 from knowledge.base.search import (
@@ -18,7 +20,9 @@ from knowledge.services.asyncio.base import (
     handle_error,
     AsyncSession,
     ResponseData,
+    ConnectorConfig,
 )
+from knowledge.services.base import DEFAULT_MAX_RETRIES, DEFAULT_BACKOFF_FACTOR
 
 __all__ = ["AsyncQueueMonitorClient"]
 
@@ -56,6 +60,10 @@ class AsyncQueueMonitorClient(AsyncServiceAPIClient):
         service_endpoint: str = "vector/api/v1",
         verify_calls: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ):
         super().__init__(
             service_url=service_url,
@@ -64,6 +72,10 @@ class AsyncQueueMonitorClient(AsyncServiceAPIClient):
             service_endpoint=service_endpoint,
             verify_calls=verify_calls,
             timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            connector_config=connector_config,
+            connector=connector,
         )
 
     async def retrieve_document_chunks(
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 # Copyright © 2024 Wacom. All rights reserved.
 from datetime import datetime
-from typing import Any, Dict, List, Tuple, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Tuple, Optional, cast
+
+import aiohttp
 
 from knowledge import logger
 from knowledge.services import APPLICATION_JSON_HEADER, EXPIRATION_DATE_TAG
@@ -10,8 +12,10 @@ from knowledge.services.asyncio.base import (
     handle_error,
     ResponseData,
     AsyncSession,
+    ConnectorConfig,
 )
-from knowledge.services.base import WacomServiceAPIClient
+from knowledge.services.base import WacomServiceAPIClient, DEFAULT_MAX_RETRIES, DEFAULT_BACKOFF_FACTOR
+from knowledge.services.pagination import DEFAULT_PREFETCH, async_prefetch_pages, offset_cursor
 from knowledge.services.users import (
     UserRole,
     USER_AGENT_TAG,
@@ -83,6 +87,10 @@ class AsyncUserManagementService(AsyncServiceAPIClient):
         service_endpoint: str = "graph/v1",
         verify_calls: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        connector_config: Optional[ConnectorConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
     ):
         super().__init__(
             service_url=service_url,
@@ -91,6 +99,10 @@ class AsyncUserManagementService(AsyncServiceAPIClient):
             service_endpoint=service_endpoint,
             verify_calls=verify_calls,
             timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            connector_config=connector_config,
+            connector=connector,
         )
 
     # ------------------------------------------ Users handling --------------------------------------------------------
@@ -360,3 +372,38 @@ class AsyncUserManagementService(AsyncServiceAPIClient):
                 results.append(User.parse(u))
             return results
         raise await handle_error("Listing of users failed.", response, headers=headers, parameters=params)
+
+    async def listing_users_iter(
+        self,
+        tenant_key: str,
+        limit: int = 20,
+        prefetch: int = DEFAULT_PREFETCH,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[User]:
+        """
+        Iterate over all users configured for this instance, fetching the next pages ahead.
+
+        Parameters
+        ----------
+        tenant_key: str
+            API key for tenant
+        limit: int - [optional]
+            Define the size of the pages. [DEFAULT:= 20]
+        prefetch: int - [optional]
+            Maximum number of pages fetched ahead, the pages are fetched on demand if 0. [DEFAULT:= 2]
+        timeout: int - [optional]
+            Default timeout for the request (in seconds) (Default:= 60 seconds).
+
+        Returns
+        -------
+        users: AsyncIterator[User]
+            Users of the tenant.
+        """
+
+        async def fetch(offset: int) -> Tuple[List[User], Optional[int]]:
+            users: List[User] = await self.listing_users(tenant_key, offset=offset, limit=limit, timeout=timeout)
+            return users, offset_cursor(offset, limit, users)
+
+        async for users in async_prefetch_pages(fetch, start=0, prefetch=prefetch):
+            for user in users:
+                yield user
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 # Copyright © 2021-present Wacom. All rights reserved.
 import threading
+import time
 from abc import ABC
 from datetime import datetime
-from typing import Any, Tuple, Dict, Optional, Union, List, cast
+from typing import Any, Tuple, Dict, Optional, Union, List, FrozenSet, Hashable, Iterable, cast
 
 import requests
 from requests import Response
@@ -22,7 +23,14 @@ from knowledge.services import (
     APPLICATION_JSON_HEADER,
     EXTERNAL_USER_ID,
 )
+from knowledge.services.circuit import CircuitBreaker
+from knowledge.services.coalescing import RequestCoalescer, coalescing_key, share_json
+from knowledge.services.concurrency import AdaptiveLimiter, is_backpressure
+from knowledge.services.instrumentation import RequestEvent, RequestHook, dispatch, endpoint_template
+from knowledge.services.ratelimit import RateLimiter
 from knowledge.services.session import (
+    DEFAULT_REFRESH_LEAD_TIME,
+    DEFAULT_REFRESH_INTERVAL,
     TokenManager,
     RefreshableSession,
     TimedSession,
@@ -31,6 +39,7 @@ from knowledge.services.session import (
 
 __all__ = [
     "WacomServiceException",
+    "CircuitOpenException",
     "RequestsSession",
     "RESTAPIClient",
     "WacomServiceAPIClient",
@@ -39,11 +48,23 @@ __all__ = [
     "STATUS_FORCE_LIST",
     "DEFAULT_BACKOFF_FACTOR",
     "DEFAULT_MAX_RETRIES",
+    "DEFAULT_BACKOFF_MAX",
+    "DEFAULT_BACKOFF_JITTER",
+    "RETRY_AFTER_STATUS_CODES",
+    "IDEMPOTENT_METHODS",
 ]
 
 STATUS_FORCE_LIST: List[int] = [502, 503, 504]
 DEFAULT_BACKOFF_FACTOR: float = 0.1
 DEFAULT_MAX_RETRIES: int = 3
+DEFAULT_BACKOFF_MAX: float = 120.0
+"""Maximum backoff between two retries in seconds."""
+DEFAULT_BACKOFF_JITTER: float = 0.1
+"""Maximum random jitter in seconds that is added to the backoff."""
+RETRY_AFTER_STATUS_CODES: FrozenSet[int] = frozenset({413, 429, 503})
+"""Status codes for which a Retry-After header is honored."""
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""HTTP methods that can be repeated safely."""
 
 
 class WacomServiceException(Exception):
@@ -129,6 +150,39 @@ class WacomServiceException(Exception):
         return self.__status_code
 
 
+class CircuitOpenException(WacomServiceException):
+    """Exception thrown if a request fails fast, because the circuit of its endpoint is open.
+
+    Parameters
+    ----------
+    endpoint: str
+        Endpoint of the request
+    retry_after: float
+        Time in seconds until the circuit sends probe requests
+    method: Optional[str] (Default:= None)
+        Method
+    url: Optional[str] (Default:= None)
+        URL
+    """
+
+    def __init__(self, endpoint: str, retry_after: float, method: Optional[str] = None, url: Optional[str] = None):
+        super().__init__(
+            f"Circuit of {endpoint} is open, retry in {retry_after:.1f}s.", method=method, url=url, status_code=503
+        )
+        self.__endpoint: str = endpoint
+        self.__retry_after: float = retry_after
+
+    @property
+    def endpoint(self) -> str:
+        """Endpoint of the request."""
+        return self.__endpoint
+
+    @property
+    def retry_after(self) -> float:
+        """Time in seconds until the circuit sends probe requests."""
+        return self.__retry_after
+
+
 class RequestsSession:
     """
     Reusable requests session with automatic token management.
@@ -146,6 +200,20 @@ class RequestsSession:
         Maximum number of connections to save in the pool
     max_retries: int (Default:= 3)
         Maximum number of retries for failed requests
+    backoff_factor: float (Default:= 0.3)
+        Backoff factor for failed requests
+    transport: Optional[requests.Session] (Default:= None)
+        Pooled transport shared with other clients. The shared transport is not closed by the session.
+    limiter: Optional[AdaptiveLimiter] (Default:= None)
+        Adaptive limiter for the in-flight requests, which can be shared with other sessions.
+    rate_limiter: Optional[RateLimiter] (Default:= None)
+        Rate limiter of the endpoint classes, which can be shared with other sessions.
+    circuit_breaker: Optional[CircuitBreaker] (Default:= None)
+        Circuit breaker of the endpoints, which can be shared with other sessions.
+    coalescer: Optional[RequestCoalescer] (Default:= None)
+        Coalescer of identical GET requests in flight, which can be shared with other sessions.
+    hooks: Iterable[RequestHook] (Default:= ())
+        Instrumentation hooks receiving the events of the requests.
     """
 
     def __init__(
@@ -155,9 +223,21 @@ class RequestsSession:
         pool_maxsize: int = 10,
         max_retries: int = 3,
         backoff_factor: float = 0.3,
+        transport: Optional[requests.Session] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        hooks: Iterable[RequestHook] = (),
     ) -> None:
         self._client = client
         self._session: Optional[requests.Session] = None
+        self._transport: Optional[requests.Session] = transport
+        self._limiter: Optional[AdaptiveLimiter] = limiter
+        self._rate_limiter: Optional[RateLimiter] = rate_limiter
+        self._circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self._coalescer: Optional[RequestCoalescer] = coalescer
+        self._hooks: Tuple[RequestHook, ...] = tuple(hooks)
         self._pool_connections = pool_connections
         self._pool_maxsize = pool_maxsize
         self._max_retries = max_retries
@@ -187,6 +267,51 @@ class RequestsSession:
             self.close()
             self._backoff_factor = value
 
+    @property
+    def limiter(self) -> Optional[AdaptiveLimiter]:
+        """Adaptive limiter for the in-flight requests."""
+        return self._limiter
+
+    @limiter.setter
+    def limiter(self, value: Optional[AdaptiveLimiter]) -> None:
+        self._limiter = value
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter of the endpoint classes."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[RateLimiter]) -> None:
+        self._rate_limiter = value
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker of the endpoints."""
+        return self._circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: Optional[CircuitBreaker]) -> None:
+        self._circuit_breaker = value
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """Coalescer of identical GET requests in flight."""
+        return self._coalescer
+
+    @coalescer.setter
+    def coalescer(self, value: Optional[RequestCoalescer]) -> None:
+        self._coalescer = value
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        """Instrumentation hooks."""
+        return self._hooks
+
+    @hooks.setter
+    def hooks(self, value: Iterable[RequestHook]) -> None:
+        self._hooks = tuple(value)
+
     @property
     def pool_connections(self) -> int:
         """Number of connection pools to cache."""
@@ -209,13 +334,54 @@ class RequestsSession:
             self.close()
             self._pool_maxsize = value
 
+    @staticmethod
+    def create_adapter(
+        pool_connections: int, pool_maxsize: int, max_retries: int, backoff_factor: float, pool_block: bool = False
+    ) -> HTTPAdapter:
+        """
+        Creates a pooling adapter with the retry policy of the clients.
+
+        Parameters
+        ----------
+        pool_connections: int
+            Number of connection pools to cache
+        pool_maxsize: int
+            Maximum number of connections to save in the pool
+        max_retries: int
+            Maximum number of retries for failed requests
+        backoff_factor: float
+            Backoff factor for failed requests
+        pool_block: bool (Default:= False)
+            Wait for a free connection instead of opening connections beyond `pool_maxsize`.
+
+        Returns
+        -------
+        adapter: HTTPAdapter
+            Adapter for mounting on a requests.Session.
+        """
+        retries: Retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=STATUS_FORCE_LIST,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(["GET", "POST", "PUT", "PATCH", "DELETE"]),
+        )
+        return HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries,
+            pool_block=pool_block,
+        )
+
     def _create_session(self) -> requests.Session:
         """
         Creates and configures an HTTP session for making requests.
 
         This method creates a thread-safe session instance with retry logic,
         connection pooling, and default headers for HTTP communication. If a
-        session already exists, it will return the existing session.
+        session already exists, it will return the existing session. If a shared
+        transport is set, the shared transport is returned.
 
         Returns
         -------
@@ -223,23 +389,14 @@ class RequestsSession:
             A configured requests.Session object to handle HTTP requests with
             retry logic and connection pooling.
         """
+        if self._transport is not None:
+            return self._transport
         with self._lock:
             if self._session is None:
                 self._session = requests.Session()
-                retries: Retry = Retry(
-                    total=self.max_retries,
-                    backoff_factor=self.backoff_factor,
-                    status_forcelist=STATUS_FORCE_LIST,
-                    raise_on_status=False,
-                    respect_retry_after_header=True,
-                    allowed_methods=frozenset(["GET", "POST", "PUT", "PATCH", "DELETE"]),
-                )
-
                 # Configure connection pooling
-                adapter = HTTPAdapter(
-                    pool_connections=self.pool_connections,
-                    pool_maxsize=self.pool_maxsize,
-                    max_retries=retries,
+                adapter: HTTPAdapter = RequestsSession.create_adapter(
+                    self.pool_connections, self.pool_maxsize, self.max_retries, self.backoff_factor
                 )
 
                 self._session.mount("https://", adapter)
@@ -296,14 +453,123 @@ class RequestsSession:
         **kwargs: Any,
     ) -> Response:
         """Execute a request with automatic token handling."""
+        overwrite_auth_token: Optional[str] = kwargs.pop("overwrite_auth_token", None)
+        ignore_auth: bool = kwargs.pop("ignore_auth", False)
         request_headers = self._prepare_headers(
             headers,
-            overwrite_auth_token=kwargs.pop("overwrite_auth_token", None),
-            ignore_auth=kwargs.pop("ignore_auth", False),
+            overwrite_auth_token=overwrite_auth_token,
+            ignore_auth=ignore_auth,
             ignore_content_type=kwargs.pop("ignore_content_type", False),
         )
         session = self._create_session()
-        return session.request(method=method, url=url, headers=request_headers, timeout=timeout, **kwargs)
+        coalescer: Optional[RequestCoalescer] = self._coalescer
+        if coalescer is not None and method.upper() == "GET" and not kwargs.get("stream"):
+            identity: Optional[str] = None
+            if overwrite_auth_token is not None:
+                identity = overwrite_auth_token
+            elif not ignore_auth:
+                identity = self._client.current_session_id
+            key: Hashable = coalescing_key(url, kwargs.get("params"), headers, identity)
+            return coalescer.run(
+                key, lambda: share_json(self._execute(session, method, url, request_headers, timeout, **kwargs))
+            )
+        return self._execute(session, method, url, request_headers, timeout, **kwargs)
+
+    def _execute(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        request_headers: Dict[str, str],
+        timeout: int,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request through the circuit breaker."""
+        breaker: Optional[CircuitBreaker] = self._circuit_breaker
+        if breaker is None:
+            return self._send(session, method, url, request_headers, timeout, **kwargs)
+        endpoint: str = breaker.endpoint(url)
+        if not breaker.allow(endpoint):
+            raise CircuitOpenException(endpoint, breaker.retry_after(endpoint), method=method, url=url)
+        success: Optional[bool] = None
+        try:
+            response: Response = self._send(session, method, url, request_headers, timeout, **kwargs)
+            success = not breaker.is_failure(response.status_code)
+            return response
+        except (requests.ConnectionError, requests.Timeout):
+            success = False
+            raise
+        finally:
+            breaker.record(endpoint, success)
+
+    def _send(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        request_headers: Dict[str, str],
+        timeout: int,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request within the rate and concurrency limits."""
+        rate_limiter: Optional[RateLimiter] = self._rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(method, url)
+        limiter: Optional[AdaptiveLimiter] = self._limiter
+        if limiter is None:
+            return self._transmit(session, method, url, request_headers, timeout, **kwargs)
+        limiter.acquire()
+        start: float = time.perf_counter()
+        latency: Optional[float] = None
+        backpressure: bool = False
+        try:
+            response: Response = self._transmit(session, method, url, request_headers, timeout, **kwargs)
+            latency = time.perf_counter() - start
+            backpressure = is_backpressure(response.status_code)
+            return response
+        except (requests.ConnectionError, requests.Timeout):
+            latency = time.perf_counter() - start
+            backpressure = True
+            raise
+        finally:
+            limiter.release(latency, backpressure)
+
+    def _transmit(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        request_headers: Dict[str, str],
+        timeout: int,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request and report it to the hooks."""
+        hooks: Tuple[RequestHook, ...] = self._hooks
+        if not hooks:
+            return session.request(method=method, url=url, headers=request_headers, timeout=timeout, **kwargs)
+        event: RequestEvent = RequestEvent(method=method, url=url, endpoint=endpoint_template(url))
+        dispatch(hooks, "before_request", event)
+        start: float = time.perf_counter()
+        try:
+            response: Response = session.request(
+                method=method, url=url, headers=request_headers, timeout=timeout, **kwargs
+            )
+        except Exception as e:
+            event.timings.total = time.perf_counter() - start
+            event.error = e
+            dispatch(hooks, "on_error", event)
+            raise
+        event.timings.total = time.perf_counter() - start
+        event.timings.server = response.elapsed.total_seconds()
+        event.status = response.status_code
+        body: Any = response.request.body if response.request is not None else None
+        if isinstance(body, (str, bytes)):
+            # Streamed bodies have no size
+            event.request_bytes = len(body.encode("utf-8") if isinstance(body, str) else body)
+        if not kwargs.get("stream"):
+            event.response_bytes = len(response.content)
+        dispatch(hooks, "after_response", event)
+        return response
 
     def get(self, url: str, **kwargs: Any) -> Response:
         """
@@ -397,7 +663,7 @@ class RequestsSession:
 
     def close(self) -> None:
         """
-        Close the session and release resources.
+        Close the session and release resources. A shared transport is left open.
         """
         with self._lock:
             if self._session is not None:
@@ -551,6 +817,12 @@ class WacomServiceAPIClient(RESTAPIClient):
         self.__token_manager: TokenManager = TokenManager()
         self.__current_session_id: Optional[str] = None
         self.__session: Optional[RequestsSession] = None
+        self.__transport: Optional[requests.Session] = None
+        self.__limiter: Optional[AdaptiveLimiter] = None
+        self.__rate_limiter: Optional[RateLimiter] = None
+        self.__circuit_breaker: Optional[CircuitBreaker] = None
+        self.__coalescer: Optional[RequestCoalescer] = None
+        self.__hooks: Tuple[RequestHook, ...] = ()
         self.__max_retries: int = max_retries
         self.__backoff_factor: float = backoff_factor
         self.__session_lock: threading.Lock = threading.Lock()
@@ -565,20 +837,130 @@ class WacomServiceAPIClient(RESTAPIClient):
                     self,
                     max_retries=self.__max_retries,
                     backoff_factor=self.__backoff_factor,
+                    transport=self.__transport,
+                    limiter=self.__limiter,
+                    rate_limiter=self.__rate_limiter,
+                    circuit_breaker=self.__circuit_breaker,
+                    coalescer=self.__coalescer,
+                    hooks=self.__hooks,
                 )
         return self.__session
 
+    @property
+    def limiter(self) -> Optional[AdaptiveLimiter]:
+        """Adaptive limiter for the in-flight requests of the client, None if the requests are not limited."""
+        return self.__limiter
+
+    @limiter.setter
+    def limiter(self, value: Optional[AdaptiveLimiter]) -> None:
+        with self.__session_lock:
+            self.__limiter = value
+            if self.__session is not None:
+                self.__session.limiter = value
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter of the endpoint classes of the client, None if the requests are not throttled."""
+        return self.__rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[RateLimiter]) -> None:
+        with self.__session_lock:
+            self.__rate_limiter = value
+            if self.__session is not None:
+                self.__session.rate_limiter = value
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker of the endpoints of the client, None if requests never fail fast."""
+        return self.__circuit_breaker
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: Optional[CircuitBreaker]) -> None:
+        with self.__session_lock:
+            self.__circuit_breaker = value
+            if self.__session is not None:
+                self.__session.circuit_breaker = value
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """Coalescer of identical GET requests in flight of the client, None if the requests are not coalesced."""
+        return self.__coalescer
+
+    @coalescer.setter
+    def coalescer(self, value: Optional[RequestCoalescer]) -> None:
+        with self.__session_lock:
+            self.__coalescer = value
+            if self.__session is not None:
+                self.__session.coalescer = value
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        """Instrumentation hooks of the client."""
+        return self.__hooks
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Register an instrumentation hook for the requests of the client.
+
+        Parameters
+        ----------
+        hook: RequestHook
+            Hook receiving the events of the requests.
+        """
+        with self.__session_lock:
+            self.__hooks = self.__hooks + (hook,)
+            if self.__session is not None:
+                self.__session.hooks = self.__hooks
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """
+        Remove an instrumentation hook.
+
+        Parameters
+        ----------
+        hook: RequestHook
+            Registered hook.
+        """
+        with self.__session_lock:
+            self.__hooks = tuple(h for h in self.__hooks if h is not hook)
+            if self.__session is not None:
+                self.__session.hooks = self.__hooks
+
     @property
     def token_manager(self) -> TokenManager:
         """Token manager."""
         return self.__token_manager
 
+    def share_transport(self, token_manager: TokenManager, transport: Optional[requests.Session] = None) -> None:
+        """
+        Uses a token manager and a pooled transport shared with other clients, e.g., the ones of a `ServiceHub`.
+
+        Parameters
+        ----------
+        token_manager: TokenManager
+            Shared token manager. Sessions are looked up in the shared token manager.
+        transport: Optional[requests.Session] (Default:= None)
+            Shared pooled transport. If None, the client keeps its own connection pool.
+        """
+        with self.__session_lock:
+            self.__token_manager = token_manager
+            self.__transport = transport
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
+
     @property
     def auth_endpoint(self) -> str:
         """Authentication endpoint."""
         # This is in the graph service REST API
         return f"{self.base_auth_url}/{self.USER_LOGIN_ENDPOINT}"
 
+    @property
+    def current_session_id(self) -> Optional[str]:
+        """Id of the current session, None if no session is set."""
+        return self.__current_session_id
+
     @property
     def current_session(
         self,
@@ -841,6 +1223,17 @@ class WacomServiceAPIClient(RESTAPIClient):
         # The session is not set
         if session is None:
             raise WacomServiceException("Authentication key is not set. Please login first.")
+        # The background refresher renews the token ahead of its expiry, the current token is used as is. If a
+        # background refresh failed, the token is refreshed on demand once it is about to expire.
+        if (
+            self.__token_manager.refresher_running
+            and session.refreshable
+            and not force_refresh
+            and session.expires_in >= force_refresh_timeout
+        ):
+            return session.auth_token, session.refresh_token or ""
+        # Token the expiry is checked for, the token is not refreshed again if another thread replaced it meanwhile
+        stale_token: str = session.auth_token
         expires_in: float = session.expires_in
 
         # The token expired and is not refreshable
@@ -853,21 +1246,68 @@ class WacomServiceAPIClient(RESTAPIClient):
 
         # Refresh token if needed
         if session.refreshable and (expires_in < force_refresh_timeout or force_refresh):
-            try:
-                if session.refresh_token is None:
-                    raise WacomServiceException("Refresh token is not set.")
-                auth_key, refresh_token, _ = self.refresh_token(session.refresh_token)
-            except WacomServiceException as e:
-                if isinstance(session, PermanentSession):
-                    permanent_session: PermanentSession = session
-                    auth_key, refresh_token, _ = self.request_user_token(
-                        permanent_session.tenant_api_key,
-                        permanent_session.external_user_id,
-                    )
-                else:
-                    if logger:
-                        logger.error(f"Error refreshing token: {e}")
-                    raise e
-            session.update_session(auth_key, refresh_token)
-            return auth_key, refresh_token
+            return self.__refresh_session__(cast(RefreshableSession, session), stale_token)
+        return session.auth_token, session.refresh_token or ""
+
+    def __refresh_session__(self, session: RefreshableSession, stale_token: str) -> Tuple[str, str]:
+        """
+        Refreshes the token of a session, unless another thread already replaced the stale token.
+
+        Parameters
+        ----------
+        session: RefreshableSession
+            Session to refresh.
+        stale_token: str
+            Token that needs to be replaced.
+
+        Returns
+        -------
+        user_token: str
+            The user token
+        refresh_token: str
+            The refresh token
+        """
+        # Single-flight refresh, concurrent threads wait for the running refresh and reuse its result
+        with self.__token_manager.refresh_lock(session.id):
+            if session.auth_token == stale_token:
+                try:
+                    if session.refresh_token is None:
+                        raise WacomServiceException("Refresh token is not set.")
+                    auth_key, refresh_token, _ = self.refresh_token(session.refresh_token)
+                except WacomServiceException as e:
+                    if isinstance(session, PermanentSession):
+                        permanent_session: PermanentSession = session
+                        auth_key, refresh_token, _ = self.request_user_token(
+                            permanent_session.tenant_api_key,
+                            permanent_session.external_user_id,
+                        )
+                    else:
+                        if logger:
+                            logger.error(f"Error refreshing token: {e}")
+                        raise e
+                session.update_session(auth_key, refresh_token)
+                return auth_key, refresh_token
         return session.auth_token, session.refresh_token or ""
+
+    def start_token_refresher(
+        self, lead_time: float = DEFAULT_REFRESH_LEAD_TIME, interval: float = DEFAULT_REFRESH_INTERVAL
+    ) -> None:
+        """
+        Starts a background thread renewing the tokens of the refreshable sessions ahead of their expiry.
+
+        While the refresher is running, `handle_token` returns the current token without expiry checks or locks.
+
+        Parameters
+        ----------
+        lead_time: float [default:= DEFAULT_REFRESH_LEAD_TIME]
+            Seconds ahead of the expiry of a token the token is renewed.
+        interval: float [default:= DEFAULT_REFRESH_INTERVAL]
+            Maximum seconds between two checks of the refresher.
+        """
+        self.__token_manager.start_refresher(
+            lambda session: self.__refresh_session__(session, session.auth_token), lead_time, interval
+        )
+
+    def stop_token_refresher(self) -> None:
+        """Stops the background token refresher."""
+        self.__token_manager.stop_refresher()
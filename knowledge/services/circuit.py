@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+This module contains the circuit breaker of the transport layer.
+
+The breaker tracks the failures of the requests per endpoint, i.e., per backend of a host such as `graph`, `vector`,
+or the ink services. An endpoint moves through three states:
+    - **Closed**: Requests are sent. After `failure_threshold` consecutive failures (connection errors, timeouts, and
+      server errors) the circuit opens.
+    - **Open**: Requests fail fast with a `CircuitOpenException` instead of waiting for the timeout of the degraded
+      backend. After `recovery_timeout` seconds the circuit becomes half-open.
+    - **Half-open**: A limited number of probe requests are sent. A successful probe closes the circuit, a failed
+      probe opens it again.
+
+Examples
+--------
+>>> from knowledge.services.circuit import CircuitBreaker
+>>> from knowledge.services.ink import WacomInkServices
+>>> client = WacomInkServices(service_url="https://private-knowledge.wacom.com")
+>>> client.circuit_breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
+>>> client.circuit_breaker.metrics
+{}
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+from knowledge import logger
+
+__all__ = [
+    "FAILURE_STATUS_CODES",
+    "CircuitState",
+    "CircuitMetrics",
+    "CircuitBreaker",
+    "endpoint_key",
+]
+
+FAILURE_STATUS_CODES: FrozenSet[int] = frozenset({500, 502, 503, 504})
+"""Status codes that count as a failure of the backend."""
+
+StateListener = Callable[[str, "CircuitState", "CircuitState"], None]
+
+
+def endpoint_key(url: str) -> str:
+    """
+    Endpoint of a URL, i.e., the host and the first segment of the path.
+
+    Parameters
+    ----------
+    url: str
+        URL of the request.
+
+    Returns
+    -------
+    endpoint: str
+        Endpoint, e.g. `private-knowledge.wacom.com/graph` for the URLs of the graph service.
+    """
+    parts = urlsplit(url)
+    segment: str = parts.path.lstrip("/").split("/", 1)[0]
+    return f"{parts.netloc.lower()}/{segment}"
+
+
+class CircuitState(Enum):
+    """
+    State of the circuit of an endpoint.
+    """
+
+    CLOSED = "closed"
+    """Requests are sent."""
+    OPEN = "open"
+    """Requests fail fast."""
+    HALF_OPEN = "half-open"
+    """Probe requests are sent."""
+
+
+@dataclass(frozen=True)
+class CircuitMetrics:
+    """
+    Snapshot of the circuit of an endpoint.
+
+    Attributes
+    ----------
+    state: CircuitState
+        State of the circuit.
+    failures: int
+        Number of consecutive failures.
+    rejected: int
+        Number of requests that failed fast.
+    opened: int
+        Number of times the circuit opened.
+    retry_after: float
+        Time in seconds until the circuit becomes half-open, 0 if it is not open.
+    """
+
+    state: CircuitState
+    failures: int
+    rejected: int
+    opened: int
+    retry_after: float
+
+
+class EndpointCircuit:
+    """Mutable state of the circuit of an endpoint, guarded by the lock of the breaker."""
+
+    __slots__ = ("state", "failures", "rejected", "opened", "opened_at", "probes")
+
+    def __init__(self) -> None:
+        self.state: CircuitState = CircuitState.CLOSED
+        self.failures: int = 0
+        self.rejected: int = 0
+        self.opened: int = 0
+        self.opened_at: float = 0.0
+        self.probes: int = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit Breaker
+    ---------------
+    Thread-safe circuit breaker keyed by endpoint for `RequestsSession` and `AsyncSession`. A breaker can be shared by
+    several clients, thus a degraded backend is detected once for all of them.
+
+    Parameters
+    ----------
+    failure_threshold: int (Default:= 5)
+        Number of consecutive failures that opens the circuit.
+    recovery_timeout: float (Default:= 30.0)
+        Time in seconds an open circuit waits before it sends probe requests.
+    half_open_max_calls: int (Default:= 1)
+        Number of simultaneous probe requests of a half-open circuit.
+    failure_status_codes: FrozenSet[int] (Default:= FAILURE_STATUS_CODES)
+        Status codes that count as a failure.
+    key: Callable[[str], str] (Default:= endpoint_key)
+        Function mapping the URL of a request to its endpoint.
+    on_state_change: Optional[Callable[[str, CircuitState, CircuitState], None]] (Default:= None)
+        Callback with the endpoint, the previous state, and the new state, called on every transition.
+    clock: Callable[[], float] (Default:= time.monotonic)
+        Clock in seconds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_status_codes: FrozenSet[int] = FAILURE_STATUS_CODES,
+        key: Callable[[str], str] = endpoint_key,
+        on_state_change: Optional[StateListener] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("The failure threshold and the number of probe requests must be at least 1.")
+        self.__failure_threshold: int = failure_threshold
+        self.__recovery_timeout: float = recovery_timeout
+        self.__half_open_max_calls: int = half_open_max_calls
+        self.__failure_status_codes: FrozenSet[int] = frozenset(failure_status_codes)
+        self.__key: Callable[[str], str] = key
+        self.__on_state_change: Optional[StateListener] = on_state_change
+        self.__clock: Callable[[], float] = clock
+        self.__circuits: Dict[str, EndpointCircuit] = {}
+        # Reentrant, the state listener may inspect the breaker
+        self.__lock: threading.RLock = threading.RLock()
+
+    @property
+    def failure_threshold(self) -> int:
+        """Number of consecutive failures that opens the circuit."""
+        return self.__failure_threshold
+
+    @property
+    def recovery_timeout(self) -> float:
+        """Time in seconds an open circuit waits before it sends probe requests."""
+        return self.__recovery_timeout
+
+    @property
+    def metrics(self) -> Dict[str, CircuitMetrics]:
+        """Snapshot of the circuits of all endpoints."""
+        with self.__lock:
+            now: float = self.__clock()
+            return {key: self.__metrics__(circuit, now) for key, circuit in self.__circuits.items()}
+
+    def endpoint(self, url: str) -> str:
+        """
+        Endpoint of a URL.
+
+        Parameters
+        ----------
+        url: str
+            URL of the request.
+
+        Returns
+        -------
+        endpoint: str
+            Key of the circuit of the request.
+        """
+        return self.__key(url)
+
+    def state(self, endpoint: str) -> CircuitState:
+        """
+        State of the circuit of an endpoint.
+
+        Parameters
+        ----------
+        endpoint: str
+            Endpoint
+
+        Returns
+        -------
+        state: CircuitState
+            State of the circuit, an open circuit is reported as half-open once the recovery timeout has passed.
+        """
+        with self.__lock:
+            circuit: Optional[EndpointCircuit] = self.__circuits.get(endpoint)
+            if circuit is None:
+                return CircuitState.CLOSED
+            return self.__metrics__(circuit, self.__clock()).state
+
+    def retry_after(self, endpoint: str) -> float:
+        """
+        Time in seconds until an open circuit sends probe requests.
+
+        Parameters
+        ----------
+        endpoint: str
+            Endpoint
+
+        Returns
+        -------
+        retry_after: float
+            Time in seconds, 0 if the circuit is not open.
+        """
+        with self.__lock:
+            circuit: Optional[EndpointCircuit] = self.__circuits.get(endpoint)
+            if circuit is None:
+                return 0.0
+            return self.__metrics__(circuit, self.__clock()).retry_after
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Check if a request to an endpoint can be sent. A request that is allowed must be completed with `record`.
+
+        Parameters
+        ----------
+        endpoint: str
+            Endpoint
+
+        Returns
+        -------
+        allowed: bool
+            True if the request can be sent, False if it fails fast.
+        """
+        with self.__lock:
+            circuit: EndpointCircuit = self.__circuits.setdefault(endpoint, EndpointCircuit())
+            if circuit.state == CircuitState.OPEN:
+                if self.__clock() - circuit.opened_at < self.__recovery_timeout:
+                    circuit.rejected += 1
+                    return False
+                self.__transition__(endpoint, circuit, CircuitState.HALF_OPEN)
+            if circuit.state == CircuitState.HALF_OPEN:
+                if circuit.probes >= self.__half_open_max_calls:
+                    circuit.rejected += 1
+                    return False
+                circuit.probes += 1
+            return True
+
+    def record(self, endpoint: str, success: Optional[bool]) -> None:
+        """
+        Record the outcome of an allowed request.
+
+        Parameters
+        ----------
+        endpoint: str
+            Endpoint
+        success: Optional[bool]
+            True if the backend answered, False if it failed, None if the request failed on the client side, which
+            does not change the circuit.
+        """
+        with self.__lock:
+            circuit: EndpointCircuit = self.__circuits.setdefault(endpoint, EndpointCircuit())
+            if circuit.probes > 0:
+                circuit.probes -= 1
+            if success is None:
+                return
+            if success:
+                circuit.failures = 0
+                if circuit.state != CircuitState.CLOSED:
+                    self.__transition__(endpoint, circuit, CircuitState.CLOSED)
+                return
+            circuit.failures += 1
+            if circuit.state == CircuitState.HALF_OPEN or (
+                circuit.state == CircuitState.CLOSED and circuit.failures >= self.__failure_threshold
+            ):
+                circuit.opened_at = self.__clock()
+                circuit.opened += 1
+                self.__transition__(endpoint, circuit, CircuitState.OPEN)
+
+    def is_failure(self, status: int) -> bool:
+        """
+        Check if a status code counts as a failure of the backend.
+
+        Parameters
+        ----------
+        status: int
+            HTTP status code of the response.
+
+        Returns
+        -------
+        failure: bool
+            True if the backend failed, otherwise False.
+        """
+        return status in self.__failure_status_codes
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """
+        Close the circuit of an endpoint, or of all endpoints.
+
+        Parameters
+        ----------
+        endpoint: Optional[str] (Default:= None)
+            Endpoint, all endpoints if None.
+        """
+        with self.__lock:
+            if endpoint is None:
+                self.__circuits.clear()
+            else:
+                self.__circuits.pop(endpoint, None)
+
+    def __metrics__(self, circuit: EndpointCircuit, now: float) -> CircuitMetrics:
+        """Snapshot of a circuit."""
+        state: CircuitState = circuit.state
+        retry_after: float = 0.0
+        if state == CircuitState.OPEN:
+            retry_after = max(0.0, circuit.opened_at + self.__recovery_timeout - now)
+            if retry_after == 0.0:
+                state = CircuitState.HALF_OPEN
+        return CircuitMetrics(
+            state=state,
+            failures=circuit.failures,
+            rejected=circuit.rejected,
+            opened=circuit.opened,
+            retry_after=retry_after,
+        )
+
+    def __transition__(self, endpoint: str, circuit: EndpointCircuit, state: CircuitState) -> None:
+        """Change the state of a circuit and notify the listener."""
+        previous: CircuitState = circuit.state
+        circuit.state = state
+        if state == CircuitState.OPEN:
+            logger.warning(
+                f"Circuit of {endpoint} opened after {circuit.failures} failures, "
+                f"requests fail fast for {self.__recovery_timeout:.1f}s."
+            )
+        else:
+            logger.info(f"Circuit of {endpoint} is {state.value}.")
+        if self.__on_state_change is not None:
+            try:
+                self.__on_state_change(endpoint, previous, state)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"State listener of the circuit breaker failed: {e}")
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+This module contains the request coalescers of the transport layer.
+
+A coalescer collapses identical GET requests that are in flight at the same time into a single round trip. The
+requests are identical if they share the URL, the query parameters, the headers given by the caller, and the auth
+identity, i.e., the session of the client. The first request is sent, the concurrent ones wait for its outcome and
+receive the same response, including the parsed JSON body, or the same exception. Requests arriving after the
+response are sent again, there is no caching.
+
+Examples
+--------
+>>> from knowledge.services.coalescing import RequestCoalescer
+>>> from knowledge.services.graph import WacomKnowledgeService
+>>> client = WacomKnowledgeService(service_url="https://private-knowledge.wacom.com")
+>>> client.coalescer = RequestCoalescer()
+
+Notes
+-----
+The callers sharing a response share the parsed content, thus they must not modify it.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Mapping, Optional, Tuple, TypeVar
+
+from requests import Response
+
+__all__ = ["RequestCoalescer", "AsyncRequestCoalescer", "coalescing_key", "share_json"]
+
+T = TypeVar("T")
+
+
+def __freeze__(value: Any) -> Hashable:
+    """Hashable representation of a parameter value."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), __freeze__(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(__freeze__(v) for v in value)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def coalescing_key(
+    url: str, params: Any = None, headers: Optional[Mapping[str, str]] = None, identity: Optional[str] = None
+) -> Hashable:
+    """
+    Key of a GET request, identical requests have the same key.
+
+    Parameters
+    ----------
+    url: str
+        URL of the request.
+    params: Any (Default:= None)
+        Query parameters of the request, e.g., a dictionary or a list of pairs.
+    headers: Optional[Mapping[str, str]] (Default:= None)
+        Headers given by the caller, e.g., the locale.
+    identity: Optional[str] (Default:= None)
+        Auth identity of the request, e.g., the session id of the client.
+
+    Returns
+    -------
+    key: Hashable
+        Key of the request.
+    """
+    header_items: Tuple[Tuple[str, str], ...] = tuple(sorted((k.lower(), str(v)) for k, v in (headers or {}).items()))
+    return url, __freeze__(params), header_items, identity or ""
+
+
+def share_json(response: Response) -> Response:
+    """
+    Parse the JSON body of a response once for all callers sharing the response.
+
+    Parameters
+    ----------
+    response: Response
+        Response shared by the callers.
+
+    Returns
+    -------
+    response: Response
+        The response, whose `json()` returns the same parsed body on every call without arguments.
+    """
+    parse: Callable[..., Any] = response.json
+    parsed: List[Any] = []
+    lock: threading.Lock = threading.Lock()
+
+    def json(**kwargs: Any) -> Any:
+        if kwargs:
+            return parse(**kwargs)
+        with lock:
+            if not parsed:
+                parsed.append(parse())
+            return parsed[0]
+
+    response.json = json  # type: ignore[method-assign]
+    return response
+
+
+class Flight:
+    """Outcome of a request in flight, which is awaited by the coalesced requests."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Request Coalescer
+    -----------------
+    Thread-safe coalescer of identical GET requests for `RequestsSession`. A coalescer can be shared by several
+    clients, the auth identity keeps the requests of different users apart.
+    """
+
+    def __init__(self) -> None:
+        self.__flights: Dict[Hashable, Flight] = {}
+        self.__lock: threading.Lock = threading.Lock()
+        self.__coalesced: int = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests in flight."""
+        return len(self.__flights)
+
+    @property
+    def coalesced(self) -> int:
+        """Number of requests that shared the round trip of another request."""
+        return self.__coalesced
+
+    def run(self, key: Hashable, call: Callable[[], T]) -> T:
+        """
+        Run a request, or wait for the identical request in flight.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key of the request, see `coalescing_key`.
+        call: Callable[[], T]
+            Function sending the request.
+
+        Returns
+        -------
+        result: T
+            Result of the request, shared with the coalesced requests.
+        """
+        with self.__lock:
+            flight: Optional[Flight] = self.__flights.get(key)
+            leader: bool = flight is None
+            if flight is None:
+                flight = Flight()
+                self.__flights[key] = flight
+            else:
+                self.__coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = call()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.__lock:
+                self.__flights.pop(key, None)
+            flight.done.set()
+
+
+class AsyncRequestCoalescer:
+    """
+    Async Request Coalescer
+    -----------------------
+    Coalescer of identical GET requests for `AsyncSession`, used from a single event loop. The request runs in a task
+    of its own, thus a cancelled caller does not cancel the request for the other callers. The request is cancelled
+    if all callers are cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.__flights: Dict[Hashable, Tuple[asyncio.Task, List[int]]] = {}
+        self.__coalesced: int = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests in flight."""
+        return len(self.__flights)
+
+    @property
+    def coalesced(self) -> int:
+        """Number of requests that shared the round trip of another request."""
+        return self.__coalesced
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a request, or wait for the identical request in flight.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key of the request, see `coalescing_key`.
+        call: Callable[[], Awaitable[T]]
+            Coroutine function sending the request.
+
+        Returns
+        -------
+        result: T
+            Result of the request, shared with the coalesced requests.
+        """
+        flight: Optional[Tuple[asyncio.Task, List[int]]] = self.__flights.get(key)
+        if flight is None:
+            task: asyncio.Task = asyncio.ensure_future(call())
+            flight = (task, [0])
+            self.__flights[key] = flight
+            task.add_done_callback(lambda done: self.__land__(key, done))
+        else:
+            self.__coalesced += 1
+        task, waiters = flight
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and waiters[0] == 1:
+                task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+
+    def __land__(self, key: Hashable, task: asyncio.Task) -> None:
+        """Remove a completed request."""
+        flight: Optional[Tuple[asyncio.Task, List[int]]] = self.__flights.get(key)
+        if flight is not None and flight[0] is task:
+            del self.__flights[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved, the callers re-raise it
+            task.exception()
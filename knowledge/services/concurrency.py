@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+This module contains the adaptive concurrency limiters of the transport layer.
+
+The limiters bound the number of in-flight requests of the sessions with an AIMD (additive increase, multiplicative
+decrease) policy:
+    - **Additive increase**: While the latency is stable and the limit is used, the limit grows by `increase` per
+      window of `limit` completed requests.
+    - **Multiplicative decrease**: On backpressure of the service (429 or 503 responses, connection errors, and
+      timeouts) or rising latency, the limit is multiplied by `backoff_ratio`, at most once per latency interval.
+
+Requests beyond the limit wait for a free slot. Bulk operations thus settle at the fastest rate the service accepts,
+without tuning thread counts or semaphores per tenant.
+
+Examples
+--------
+>>> from knowledge.services.concurrency import AdaptiveLimiter
+>>> from knowledge.services.graph import WacomKnowledgeService
+>>> client = WacomKnowledgeService(service_url="https://private-knowledge.wacom.com")
+>>> client.limiter = AdaptiveLimiter(initial_limit=8, max_limit=64)
+>>> client.limiter.metrics
+LimiterMetrics(limit=8, in_flight=0, queue_depth=0, latency=None, baseline_latency=None, decreases=0)
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, FrozenSet, Optional
+
+from knowledge import logger
+
+__all__ = [
+    "BACKPRESSURE_STATUS_CODES",
+    "LimiterMetrics",
+    "AIMDLimit",
+    "AdaptiveLimiter",
+    "AsyncAdaptiveLimiter",
+    "is_backpressure",
+]
+
+BACKPRESSURE_STATUS_CODES: FrozenSet[int] = frozenset({429, 503})
+"""Status codes the service uses to signal overload."""
+BASELINE_DRIFT: float = 0.01
+"""Weight of a latency sample above the baseline, the baseline follows slower services slowly."""
+
+
+def is_backpressure(status: Optional[int]) -> bool:
+    """
+    Check if a status code signals backpressure of the service.
+
+    Parameters
+    ----------
+    status: Optional[int]
+        HTTP status code of the response.
+
+    Returns
+    -------
+    backpressure: bool
+        True if the service is overloaded, otherwise False.
+    """
+    return status in BACKPRESSURE_STATUS_CODES
+
+
+@dataclass(frozen=True)
+class LimiterMetrics:
+    """
+    Snapshot of the state of a limiter.
+
+    Attributes
+    ----------
+    limit: int
+        Number of allowed in-flight requests.
+    in_flight: int
+        Number of in-flight requests.
+    queue_depth: int
+        Number of requests waiting for a free slot.
+    latency: Optional[float]
+        Smoothed latency in seconds.
+    baseline_latency: Optional[float]
+        Latency in seconds of the service without load.
+    decreases: int
+        Number of multiplicative decreases of the limit.
+    """
+
+    limit: int
+    in_flight: int
+    queue_depth: int
+    latency: Optional[float]
+    baseline_latency: Optional[float]
+    decreases: int
+
+
+class AIMDLimit:
+    """
+    AIMD Limit
+    ----------
+    Additive increase, multiplicative decrease policy for the number of in-flight requests. The policy is not
+    thread-safe, the limiters serialize the updates.
+
+    Parameters
+    ----------
+    initial_limit: int (Default:= 10)
+        Initial number of allowed in-flight requests.
+    min_limit: int (Default:= 1)
+        Minimum number of allowed in-flight requests.
+    max_limit: int (Default:= 256)
+        Maximum number of allowed in-flight requests.
+    increase: float (Default:= 1.0)
+        Increase of the limit per window of `limit` completed requests.
+    backoff_ratio: float (Default:= 0.5)
+        Factor applied to the limit on backpressure.
+    latency_tolerance: float (Default:= 2.0)
+        Ratio of the smoothed latency to the baseline latency that is considered as congestion.
+    smoothing: float (Default:= 0.2)
+        Weight of a latency sample in the smoothed latency.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("The limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0.0 < backoff_ratio < 1.0:
+            raise ValueError("The backoff ratio must be in (0, 1).")
+        self.__limit: float = float(initial_limit)
+        self.__min_limit: int = min_limit
+        self.__max_limit: int = max_limit
+        self.__increase: float = increase
+        self.__backoff_ratio: float = backoff_ratio
+        self.__latency_tolerance: float = latency_tolerance
+        self.__smoothing: float = smoothing
+        self.__latency: Optional[float] = None
+        self.__baseline: Optional[float] = None
+        self.__last_decrease: float = -math.inf
+        self.__decreases: int = 0
+
+    @property
+    def limit(self) -> int:
+        """Number of allowed in-flight requests."""
+        return max(self.__min_limit, int(self.__limit))
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Smoothed latency in seconds."""
+        return self.__latency
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """Latency in seconds of the service without load."""
+        return self.__baseline
+
+    @property
+    def decreases(self) -> int:
+        """Number of multiplicative decreases of the limit."""
+        return self.__decreases
+
+    def update(self, latency: float, in_flight: int, backpressure: bool, now: Optional[float] = None) -> int:
+        """
+        Update the limit with the outcome of a completed request.
+
+        Parameters
+        ----------
+        latency: float
+            Latency of the request in seconds.
+        in_flight: int
+            Number of in-flight requests when the request completed, including the request.
+        backpressure: bool
+            The service signaled overload, or the request failed with a connection error or timeout.
+        now: Optional[float] (Default:= None)
+            Monotonic time of the completion, `time.monotonic()` if None.
+
+        Returns
+        -------
+        limit: int
+            Number of allowed in-flight requests.
+        """
+        now = time.monotonic() if now is None else now
+        if not backpressure:
+            if self.__latency is None or self.__baseline is None:
+                self.__latency = latency
+                self.__baseline = latency
+            else:
+                self.__latency += (latency - self.__latency) * self.__smoothing
+                if latency < self.__baseline:
+                    self.__baseline = latency
+                else:
+                    self.__baseline += (latency - self.__baseline) * BASELINE_DRIFT
+        congested: bool = backpressure or (
+            self.__latency is not None
+            and self.__baseline is not None
+            and self.__latency > self.__latency_tolerance * self.__baseline
+        )
+        if congested:
+            # Requests in flight during a decrease see the same congestion, thus decrease once per latency interval
+            if now - self.__last_decrease >= (self.__latency or 0.0):
+                self.__limit = max(float(self.__min_limit), self.__limit * self.__backoff_ratio)
+                self.__last_decrease = now
+                self.__decreases += 1
+                logger.debug(
+                    f"Concurrency limit decreased to {self.limit} "
+                    f"({'backpressure' if backpressure else 'rising latency'})."
+                )
+        elif in_flight >= self.__limit / 2.0:
+            # Only grow if the limit is used, otherwise the limit grows without evidence that the service keeps up
+            self.__limit = min(float(self.__max_limit), self.__limit + self.__increase / self.__limit)
+        return self.limit
+
+
+class AdaptiveLimiter:
+    """
+    Adaptive Limiter
+    ----------------
+    Thread-safe limiter for the in-flight requests of `RequestsSession`, which adapts the limit with `AIMDLimit`.
+    A limiter can be shared by several clients, e.g., all clients of a tenant.
+
+    Parameters
+    ----------
+    initial_limit: int (Default:= 10)
+        Initial number of allowed in-flight requests.
+    min_limit: int (Default:= 1)
+        Minimum number of allowed in-flight requests.
+    max_limit: int (Default:= 256)
+        Maximum number of allowed in-flight requests.
+    increase: float (Default:= 1.0)
+        Increase of the limit per window of `limit` completed requests.
+    backoff_ratio: float (Default:= 0.5)
+        Factor applied to the limit on backpressure.
+    latency_tolerance: float (Default:= 2.0)
+        Ratio of the smoothed latency to the baseline latency that is considered as congestion.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self.__policy: AIMDLimit = AIMDLimit(
+            initial_limit, min_limit, max_limit, increase, backoff_ratio, latency_tolerance
+        )
+        self.__condition: threading.Condition = threading.Condition()
+        self.__in_flight: int = 0
+        self.__waiting: int = 0
+
+    @property
+    def limit(self) -> int:
+        """Number of allowed in-flight requests."""
+        return self.__policy.limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of in-flight requests."""
+        return self.__in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a free slot."""
+        return self.__waiting
+
+    @property
+    def metrics(self) -> LimiterMetrics:
+        """Snapshot of the state of the limiter."""
+        with self.__condition:
+            return LimiterMetrics(
+                limit=self.__policy.limit,
+                in_flight=self.__in_flight,
+                queue_depth=self.__waiting,
+                latency=self.__policy.latency,
+                baseline_latency=self.__policy.baseline_latency,
+                decreases=self.__policy.decreases,
+            )
+
+    def acquire(self) -> None:
+        """Wait for a free slot and occupy it."""
+        with self.__condition:
+            if self.__in_flight >= self.__policy.limit:
+                self.__waiting += 1
+                try:
+                    while self.__in_flight >= self.__policy.limit:
+                        self.__condition.wait()
+                finally:
+                    self.__waiting -= 1
+            self.__in_flight += 1
+
+    def release(self, latency: Optional[float] = None, backpressure: bool = False) -> None:
+        """
+        Free the slot of a completed request and update the limit.
+
+        Parameters
+        ----------
+        latency: Optional[float] (Default:= None)
+            Latency of the request in seconds. If None, the request does not update the limit.
+        backpressure: bool (Default:= False)
+            The service signaled overload, or the request failed with a connection error or timeout.
+        """
+        with self.__condition:
+            if latency is not None:
+                self.__policy.update(latency, self.__in_flight, backpressure)
+            self.__in_flight -= 1
+            self.__condition.notify_all()
+
+
+class AsyncAdaptiveLimiter:
+    """
+    Async Adaptive Limiter
+    ----------------------
+    Limiter for the in-flight requests of `AsyncSession`, which adapts the limit with `AIMDLimit`. The limiter is
+    used from a single event loop. A limiter can be shared by several clients, e.g., all clients of a
+    tenant.
+
+    Parameters
+    ----------
+    initial_limit: int (Default:= 10)
+        Initial number of allowed in-flight requests.
+    min_limit: int (Default:= 1)
+        Minimum number of allowed in-flight requests.
+    max_limit: int (Default:= 256)
+        Maximum number of allowed in-flight requests.
+    increase: float (Default:= 1.0)
+        Increase of the limit per window of `limit` completed requests.
+    backoff_ratio: float (Default:= 0.5)
+        Factor applied to the limit on backpressure.
+    latency_tolerance: float (Default:= 2.0)
+        Ratio of the smoothed latency to the baseline latency that is considered as congestion.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self.__policy: AIMDLimit = AIMDLimit(
+            initial_limit, min_limit, max_limit, increase, backoff_ratio, latency_tolerance
+        )
+        self.__waiters: Deque[asyncio.Future] = deque()
+        self.__in_flight: int = 0
+
+    @property
+    def limit(self) -> int:
+        """Number of allowed in-flight requests."""
+        return self.__policy.limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of in-flight requests."""
+        return self.__in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a free slot."""
+        return len(self.__waiters)
+
+    @property
+    def metrics(self) -> LimiterMetrics:
+        """Snapshot of the state of the limiter."""
+        return LimiterMetrics(
+            limit=self.__policy.limit,
+            in_flight=self.__in_flight,
+            queue_depth=len(self.__waiters),
+            latency=self.__policy.latency,
+            baseline_latency=self.__policy.baseline_latency,
+            decreases=self.__policy.decreases,
+        )
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and occupy it."""
+        if self.__in_flight < self.__policy.limit and not self.__waiters:
+            self.__in_flight += 1
+            return
+        waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+        try:
+            # The slot is occupied for the waiter when it is woken up
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.__in_flight -= 1
+                self.__wake__()
+            raise
+        finally:
+            if waiter in self.__waiters:
+                self.__waiters.remove(waiter)
+
+    def release(self, latency: Optional[float] = None, backpressure: bool = False) -> None:
+        """
+        Free the slot of a completed request and update the limit.
+
+        Parameters
+        ----------
+        latency: Optional[float] (Default:= None)
+            Latency of the request in seconds. If None, the request does not update the limit.
+        backpressure: bool (Default:= False)
+            The service signaled overload, or the request failed with a connection error or timeout.
+        """
+        if latency is not None:
+            self.__policy.update(latency, self.__in_flight, backpressure)
+        self.__in_flight -= 1
+        self.__wake__()
+
+    def __wake__(self) -> None:
+        """Hand the free slots to the waiting requests in order."""
+        while self.__waiters and self.__in_flight < self.__policy.limit:
+            waiter: asyncio.Future = self.__waiters.popleft()
+            if not waiter.done():
+                self.__in_flight += 1
+                waiter.set_result(None)
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
 # Copyright © 2021-present Wacom. All rights reserved.
 import enum
-import gzip
-import json
 import os
 import urllib
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Optional, List, Dict, Tuple, Literal, Union, cast
+from typing import Any, Optional, List, Dict, Tuple, Literal, Union, Iterable, Iterator, cast
 from urllib.parse import urlparse
 
 from requests import Response
@@ -24,16 +23,24 @@ from knowledge.base.entity import (
     URI_TAG,
     INCLUDE_RELATIONS_TAG,
 )
+from knowledge.base.frame import EntityFrame
 from knowledge.base.language import LocaleCode
 from knowledge.base.ontology import (
     DataProperty,
     OntologyPropertyReference,
     ThingObject,
+    LazyThingObject,
     OntologyClassReference,
     ObjectProperty,
     EN_US,
 )
-from knowledge.base.response import JobStatus, ErrorLogResponse, NewEntityUrisResponse
+from knowledge.base.response import (
+    JobStatus,
+    ErrorLogEntry,
+    ErrorLogResponse,
+    NewEntityUrisResponse,
+    BulkEntityResult,
+)
 from knowledge.services import (
     RELATION_TAG,
     TARGET,
@@ -66,13 +73,25 @@ from knowledge.services import (
     NEL_PARAM,
     IndexType,
     EXACT_MATCH,
+    CONTENT_TYPE_HEADER_FLAG,
 )
 from knowledge.services.base import (
     WacomServiceAPIClient,
     WacomServiceException,
     handle_error,
 )
-from knowledge.services.helper import split_updates, entity_payload
+from knowledge.services.helper import (
+    split_updates,
+    entity_payload,
+    modified_entity_payload,
+    UPDATE_PAYLOAD_FIELDS,
+    json_bytes,
+    entities_payload_bytes,
+    import_format_gzip,
+    file_chunks,
+    MultipartStream,
+)
+from knowledge.services.pagination import DEFAULT_PREFETCH, prefetch_pages
 from knowledge.services.users import UserRole
 
 __all__ = [
@@ -262,6 +281,7 @@ class WacomKnowledgeService(WacomServiceAPIClient):
         locale: Optional[LocaleCode] = None,
         auth_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
+        lazy: bool = False,
     ) -> List[ThingObject]:
         """
         Retrieve entity information from personal knowledge, using the URI as identifier.
@@ -278,6 +298,8 @@ class WacomKnowledgeService(WacomServiceAPIClient):
             If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
         timeout: int
             Timeout for the request (default: 60 seconds)
+        lazy: bool (default:= False)
+            Return lazy entities (LazyThingObject), which parse their content on first access.
 
         Returns
         -------
@@ -305,7 +327,7 @@ class WacomKnowledgeService(WacomServiceAPIClient):
             things: List[ThingObject] = []
             entities: List[Dict[str, Any]] = response.json()
             for e in entities:
-                thing: ThingObject = ThingObject.from_dict(e)
+                thing: ThingObject = LazyThingObject(e) if lazy else ThingObject.from_dict(e)
                 things.append(thing)
             return things
         raise handle_error(f"Retrieving of entity content failed. URIs:={uris}.", response)
@@ -480,12 +502,12 @@ class WacomKnowledgeService(WacomServiceAPIClient):
         """
         url: str = f"{self.service_base_url}{WacomKnowledgeService.ENTITY_BULK_ENDPOINT}"
         # Header info
-        payload: List[Dict[str, Any]] = [WacomKnowledgeService._entity_(e) for e in entities]
         for bulk_idx in range(0, len(entities), batch_size):
-            bulk = payload[bulk_idx : bulk_idx + batch_size]
+            # Encode each batch directly, instead of keeping the payloads of all entities in memory
+            bulk: bytes = entities_payload_bytes(entities[bulk_idx : bulk_idx + batch_size])
             response: Response = self.request_session.post(
                 url,
-                json=bulk,
+                data=bulk,
                 timeout=timeout,
                 verify=self.verify_calls,
                 overwrite_auth_token=auth_key,
@@ -502,6 +524,113 @@ class WacomKnowledgeService(WacomServiceAPIClient):
                 raise handle_error("Pushing entity failed.", response)
         return entities
 
+    def create_entity_bulk_concurrent(
+        self,
+        entities: List[ThingObject],
+        batch_size: int = 10,
+        max_in_flight: int = 4,
+        image_workers: int = 4,
+        ignore_images: bool = False,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> List[BulkEntityResult]:
+        """
+        Creates entities in the graph with several batches in flight.
+
+        The batches are sent by a thread pool, the images of the created entities are uploaded by a separate pool, thus
+        the image uploads of a batch overlap with the following batches. A failed batch does not abort the others, the
+        outcome of every entity is returned in the order of the input.
+
+        Parameters
+        ----------
+        entities: List[ThingObject]
+            Entities
+        batch_size: int (Default:= 10)
+            Batch size
+        max_in_flight: int (Default:= 4)
+            Maximum number of batches in flight.
+        image_workers: int (Default:= 4)
+            Maximum number of image uploads in flight.
+        ignore_images: bool (Default:= False)
+            Ignore images
+        auth_key: Optional[str]
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds).
+
+        Returns
+        -------
+        results: List[BulkEntityResult]
+            Outcome per entity, in the order of the input. The URIs of the created entities are set.
+
+        Notes
+        -----
+        The request session uses a connection pool of `pool_maxsize` connections per host, thus `max_in_flight` plus
+        `image_workers` should not exceed it.
+        """
+        url: str = f"{self.service_base_url}{WacomKnowledgeService.ENTITY_BULK_ENDPOINT}"
+        uris: List[Optional[str]] = [None] * len(entities)
+        errors: List[Optional[Exception]] = [None] * len(entities)
+        image_errors: List[Optional[Exception]] = [None] * len(entities)
+
+        def push(start: int) -> List[str]:
+            # Encode the batch in the worker, thus only the batches in flight are kept in memory
+            bulk: bytes = entities_payload_bytes(entities[start : start + batch_size])
+            response: Response = self.request_session.post(
+                url,
+                data=bulk,
+                timeout=timeout,
+                verify=self.verify_calls,
+                overwrite_auth_token=auth_key,
+            )
+            if not response.ok:
+                raise handle_error("Pushing entity failed.", response)
+            batch_uris: List[str] = response.json()[URIS_TAG]
+            # The URIs are assigned by position, thus a batch with a different number of URIs is not assigned at all
+            expected: int = min(batch_size, len(entities) - start)
+            if len(batch_uris) != expected:
+                raise WacomServiceException(
+                    f"Pushing entity failed. Expected {expected} URIs, but received {len(batch_uris)}.",
+                    method="POST",
+                    url=url,
+                )
+            return batch_uris
+
+        batches: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max(1, max_in_flight), thread_name_prefix="bulk")
+        images: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max(1, image_workers), thread_name_prefix="image")
+        with batches, images:
+            pending: Dict[Future, int] = {
+                batches.submit(push, start): start for start in range(0, len(entities), batch_size)
+            }
+            uploads: Dict[Future, int] = {}
+            for future in as_completed(pending):
+                start: int = pending[future]
+                try:
+                    batch_uris: List[str] = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    for idx in range(start, min(start + batch_size, len(entities))):
+                        errors[idx] = e
+                    continue
+                for offset, uri in enumerate(batch_uris):
+                    idx: int = start + offset
+                    uris[idx] = uri
+                    entities[idx].uri = uri
+                    entity_image: Optional[str] = entities[idx].image
+                    if entity_image is not None and entity_image != "" and not ignore_images:
+                        upload: Future = images.submit(
+                            self.set_entity_image_url, uri, entity_image, auth_key=auth_key, timeout=timeout
+                        )
+                        uploads[upload] = idx
+            for upload, idx in uploads.items():
+                try:
+                    upload.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    image_errors[idx] = e
+        return [
+            BulkEntityResult(idx, entity, uri=uris[idx], error=errors[idx], image_error=image_errors[idx])
+            for idx, entity in enumerate(entities)
+        ]
+
     def create_entity(
         self,
         entity: ThingObject,
@@ -538,7 +667,7 @@ class WacomKnowledgeService(WacomServiceAPIClient):
         payload: Dict[str, Any] = WacomKnowledgeService._entity_(entity)
         response: Response = self.request_session.post(
             url,
-            json=payload,
+            data=json_bytes(payload),
             verify=self.verify_calls,
             timeout=timeout,
             overwrite_auth_token=auth_key,
@@ -567,7 +696,8 @@ class WacomKnowledgeService(WacomServiceAPIClient):
         entity: ThingObject,
         auth_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
-    ) -> None:
+        only_modified: bool = False,
+    ) -> bool:
         """
         Updates entity in the graph.
 
@@ -579,6 +709,14 @@ class WacomKnowledgeService(WacomServiceAPIClient):
             If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
         timeout: int
             Timeout for the request (default: 60 seconds)
+        only_modified: bool [default:= False]
+            Only send the fields that have been modified since the entity has been loaded (see
+            `ThingObject.modified_fields`). If no field of the update payload has been modified, no request is sent.
+
+        Returns
+        -------
+        updated: bool
+            True if the update has been sent, False if it has been skipped as nothing has been modified.
 
         Raises
         ------
@@ -591,16 +729,22 @@ class WacomKnowledgeService(WacomServiceAPIClient):
             raise ValueError("Entity URI cannot be None for update operation")
         uri: str = entity.uri
         url: str = f"{self.service_base_url}{WacomKnowledgeService.ENTITY_ENDPOINT}/{uri}"
-        payload: Dict[str, Any] = WacomKnowledgeService._entity_(entity)
+        payload: Optional[Dict[str, Any]] = (
+            modified_entity_payload(entity) if only_modified else WacomKnowledgeService._entity_(entity)
+        )
+        if payload is None:
+            return False
         response: Response = self.request_session.patch(
             url,
-            json=payload,
+            data=json_bytes(payload),
             timeout=timeout,
             verify=self.verify_calls,
             overwrite_auth_token=auth_key,
         )
         if not response.ok:
             raise handle_error("Updating entity failed.", response)
+        entity.reset_modified(*UPDATE_PAYLOAD_FIELDS)
+        return True
 
     def add_entity_indexes(
         self,
@@ -994,7 +1138,7 @@ class WacomKnowledgeService(WacomServiceAPIClient):
             return things, relations
         raise handle_error(f"Activation failed. uris:= {uris} activation:={depth}).", response)
 
-    def listing(
+    def listing_page(
         self,
         filter_type: OntologyClassReference,
         page_id: Optional[str] = None,
@@ -1006,9 +1150,9 @@ class WacomKnowledgeService(WacomServiceAPIClient):
         include_relations: bool = False,
         auth_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
-    ) -> Tuple[List[ThingObject], int, str]:
+    ) -> Dict[str, Any]:
         """
-        List all entities visible to users.
+        Fetch a page of the listing of the entities visible to users, without parsing the entities.
 
         Parameters
         ----------
@@ -1035,12 +1179,9 @@ class WacomKnowledgeService(WacomServiceAPIClient):
 
         Returns
         -------
-        entities: List[ThingObject]
-            List of entities
-        estimated_total_number: int
-            Number of all entities
-        next_page_id: str
-            Identifier of the next page
+        page: Dict[str, Any]
+            Response of the listing, with the entity dicts (`listing`), the estimated total number of entities and the
+            identifier of the next page.
 
         Raises
         ------
@@ -1076,21 +1217,160 @@ class WacomKnowledgeService(WacomServiceAPIClient):
         )
         # If the response is successful
         if response.ok:
-            entities_resp: Dict[str, Any] = response.json()
-            next_page_id: str = entities_resp[NEXT_PAGE_ID_TAG]
-            estimated_total_number: int = entities_resp.get(TOTAL_COUNT, 0)
-            entities: List[ThingObject] = []
-            if LISTING in entities_resp:
-                for e in entities_resp[LISTING]:
-                    thing: ThingObject = ThingObject.from_dict(e)
-                    thing.status_flag = EntityStatus.SYNCED
-                    entities.append(thing)
-            return entities, estimated_total_number, next_page_id
+            return response.json()
         raise handle_error(
             f"Failed to list the entities (since:= {page_id}, limit:={limit}).",
             response,
         )
 
+    def listing(
+        self,
+        filter_type: OntologyClassReference,
+        page_id: Optional[str] = None,
+        limit: int = 30,
+        locale: Optional[LocaleCode] = None,
+        visibility: Optional[Visibility] = None,
+        is_owner: Optional[bool] = None,
+        estimate_count: bool = False,
+        include_relations: bool = False,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        lazy: bool = False,
+    ) -> Tuple[List[ThingObject], int, str]:
+        """
+        List all entities visible to users.
+
+        Parameters
+        ----------
+        filter_type: OntologyClassReference
+            Filtering with entity
+        page_id: Optional[str] = [default:=None]
+            Page id. Start from this page id
+        limit: int
+            Limit of the returned entities.
+        locale: Optional[LanguageCode] = [default:=None]
+            ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., en_US.
+        visibility: Optional[Visibility] [default:=None]
+            Filter the entities based on its visibilities
+        is_owner: Optional[bool] = [default:=None]
+            Filter the entities based on its owner
+        estimate_count: bool = [default:=False]
+            Request an estimate of the entities in a tenant.
+        include_relations: bool = [default:=False]
+            Include relations in the response.
+        auth_key: Optional[str] = [default:=None]
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+        lazy: bool = [default:=False]
+            Return lazy entities (LazyThingObject), which parse their content on first access.
+
+        Returns
+        -------
+        entities: List[ThingObject]
+            List of entities
+        estimated_total_number: int
+            Number of all entities
+        next_page_id: str
+            Identifier of the next page
+
+        Raises
+        ------
+        WacomServiceException
+            If the graph service returns an error code
+        """
+        entities_resp: Dict[str, Any] = self.listing_page(
+            filter_type,
+            page_id=page_id,
+            limit=limit,
+            locale=locale,
+            visibility=visibility,
+            is_owner=is_owner,
+            estimate_count=estimate_count,
+            include_relations=include_relations,
+            auth_key=auth_key,
+            timeout=timeout,
+        )
+        entities: List[ThingObject] = []
+        for e in entities_resp.get(LISTING, []):
+            thing: ThingObject = LazyThingObject(e) if lazy else ThingObject.from_dict(e)
+            thing.status_flag = EntityStatus.SYNCED
+            entities.append(thing)
+        return entities, entities_resp.get(TOTAL_COUNT, 0), entities_resp[NEXT_PAGE_ID_TAG]
+
+    def listing_frame(
+        self,
+        filter_type: OntologyClassReference,
+        page_id: Optional[str] = None,
+        limit: int = 30,
+        locale: Optional[LocaleCode] = None,
+        visibility: Optional[Visibility] = None,
+        is_owner: Optional[bool] = None,
+        estimate_count: bool = False,
+        include_relations: bool = False,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        frame: Optional[EntityFrame] = None,
+    ) -> Tuple[EntityFrame, int, str]:
+        """
+        List the entities visible to users into a columnar frame, without creating ThingObjects.
+
+        Parameters
+        ----------
+        filter_type: OntologyClassReference
+            Filtering with entity
+        page_id: Optional[str] = [default:=None]
+            Page id. Start from this page id
+        limit: int
+            Limit of the returned entities.
+        locale: Optional[LanguageCode] = [default:=None]
+            ISO-3166 Country Codes and ISO-639 Language Codes in the format '<language_code>_<country>', e.g., en_US.
+        visibility: Optional[Visibility] [default:=None]
+            Filter the entities based on its visibilities
+        is_owner: Optional[bool] = [default:=None]
+            Filter the entities based on its owner
+        estimate_count: bool = [default:=False]
+            Request an estimate of the entities in a tenant.
+        include_relations: bool = [default:=False]
+            Include relations in the response.
+        auth_key: Optional[str] = [default:=None]
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+        frame: Optional[EntityFrame] = [default:=None]
+            Frame to append the entities to, e.g., the frame of the previous pages. If not set, a new frame is created.
+
+        Returns
+        -------
+        frame: EntityFrame
+            Frame with the entities
+        estimated_total_number: int
+            Number of all entities
+        next_page_id: str
+            Identifier of the next page
+
+        Raises
+        ------
+        WacomServiceException
+            If the graph service returns an error code
+        """
+        entities_resp: Dict[str, Any] = self.listing_page(
+            filter_type,
+            page_id=page_id,
+            limit=limit,
+            locale=locale,
+            visibility=visibility,
+            is_owner=is_owner,
+            estimate_count=estimate_count,
+            include_relations=include_relations,
+            auth_key=auth_key,
+            timeout=timeout,
+        )
+        if frame is None:
+            frame = EntityFrame()
+        frame.extend_listing(entities_resp, EntityStatus.SYNCED)
+        return frame, entities_resp.get(TOTAL_COUNT, 0), entities_resp[NEXT_PAGE_ID_TAG]
+
     def search_all(
         self,
         search_term: str,
@@ -1583,16 +1863,19 @@ class WacomKnowledgeService(WacomServiceAPIClient):
 
     def import_entities(
         self,
-        entities: List[ThingObject],
+        entities: Iterable[ThingObject],
         auth_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
     ) -> str:
         """Import entities to the graph.
 
+        The entities are encoded and compressed incrementally while the upload is streamed, thus the memory does not
+        depend on the number of entities.
+
         Parameters
         ----------
-        entities: List[ThingObject]
-            List of entities to import.
+        entities: Iterable[ThingObject]
+            Entities to import, e.g., a list or a generator.
         auth_key: Optional[str] = None
             If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
         timeout: int
@@ -1607,26 +1890,22 @@ class WacomKnowledgeService(WacomServiceAPIClient):
         ------
         WacomServiceException
             If the graph service returns an error code.
-        """
-        ndjson_lines: List[str] = []
-        for obj in entities:
-            data_dict = obj.__import_format_dict__()
-            ndjson_lines.append(json.dumps(data_dict))  # Convert each dict to a JSON string
 
-        ndjson_content = "\n".join(ndjson_lines)  # Join JSON strings with a newline
-        # Compress the NDJSON string to a gzip byte array
-        compressed_data: bytes = gzip.compress(ndjson_content.encode("utf-8"))
-        files: List[Tuple[str, Tuple[str, bytes, str]]] = [
-            ("file", ("import.njson.gz", compressed_data, "application/x-gzip"))
-        ]
+        Notes
+        -----
+        A failed upload is only retried if the entities can be iterated again, i.e., not for generators.
+        """
+        stream: MultipartStream = MultipartStream(
+            lambda: import_format_gzip(entities), replayable=iter(entities) is not entities
+        )
         url: str = f"{self.service_base_url}{self.IMPORT_ENTITIES_ENDPOINT}"
         response: Response = self.request_session.post(
             url,
-            files=files,
+            data=stream,
+            headers={CONTENT_TYPE_HEADER_FLAG: stream.content_type},
             timeout=timeout,
             verify=self.verify_calls,
             overwrite_auth_token=auth_key,
-            ignore_content_type=True,
         )
         if response.ok:
             return str(response.json()["jobId"])
@@ -1640,10 +1919,12 @@ class WacomKnowledgeService(WacomServiceAPIClient):
     ) -> str:
         """Import entities from a file to the graph.
 
+        The file is streamed from disk in chunks.
+
         Parameters
         ----------
         file_path: Path
-            Path to the file containing entities in NDJSON format.
+            Path to the gzip-compressed file containing entities in NDJSON format.
         auth_key: Optional[str] = None
             If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
         timeout: int
@@ -1663,24 +1944,19 @@ class WacomKnowledgeService(WacomServiceAPIClient):
         """
         if not file_path.exists():
             raise FileNotFoundError(f"The file {file_path} does not exist.")
-        with file_path.open("rb") as file:
-            # Compress the NDJSON string to a gzip byte array
-            compressed_data: bytes = file.read()
-            files: List[Tuple[str, Tuple[str, bytes, str]]] = [
-                ("file", ("import.njson.gz", compressed_data, "application/x-gzip"))
-            ]
-            url: str = f"{self.service_base_url}{self.IMPORT_ENTITIES_ENDPOINT}"
-            response: Response = self.request_session.post(
-                url,
-                files=files,
-                timeout=timeout,
-                verify=self.verify_calls,
-                overwrite_auth_token=auth_key,
-                ignore_content_type=True,
-            )
-            if response.ok:
-                return str(response.json()["jobId"])
-            raise handle_error("Import endpoint returns an error.", response)
+        stream: MultipartStream = MultipartStream(lambda: file_chunks(file_path))
+        url: str = f"{self.service_base_url}{self.IMPORT_ENTITIES_ENDPOINT}"
+        response: Response = self.request_session.post(
+            url,
+            data=stream,
+            headers={CONTENT_TYPE_HEADER_FLAG: stream.content_type},
+            timeout=timeout,
+            verify=self.verify_calls,
+            overwrite_auth_token=auth_key,
+        )
+        if response.ok:
+            return str(response.json()["jobId"])
+        raise handle_error("Import endpoint returns an error.", response)
 
     def job_status(
         self,
@@ -1795,6 +2071,78 @@ class WacomKnowledgeService(WacomServiceAPIClient):
             return NewEntityUrisResponse.from_dict(response.json())
         raise handle_error(f"Retrieving job status for {job_id} failed.", response)
 
+    def import_error_log_iter(
+        self,
+        job_id: str,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Iterator[ErrorLogEntry]:
+        """
+        Iterate over the error log of the job, fetching the next pages ahead.
+
+        Parameters
+        ----------
+        job_id: str
+            ID of the job
+        auth_key: Optional[str] = None
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+        prefetch: int (default:= DEFAULT_PREFETCH)
+            Maximum number of pages fetched ahead, the pages are fetched on demand if 0.
+
+        Returns
+        -------
+        entries: Iterator[ErrorLogEntry]
+            Entries of the error log of the job.
+        """
+
+        def fetch(page_id: Optional[str]) -> Tuple[List[ErrorLogEntry], Optional[str]]:
+            page: ErrorLogResponse = self.import_error_log(
+                job_id, auth_key=auth_key, next_page_id=page_id, timeout=timeout
+            )
+            return page.error_log, page.next_page_id
+
+        for items in prefetch_pages(fetch, prefetch=prefetch):
+            yield from items
+
+    def import_new_uris_iter(
+        self,
+        job_id: str,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate over the new entity uris of the job, fetching the next pages ahead.
+
+        Parameters
+        ----------
+        job_id: str
+            ID of the job
+        auth_key: Optional[str] = None
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+        prefetch: int (default:= DEFAULT_PREFETCH)
+            Maximum number of pages fetched ahead, the pages are fetched on demand if 0.
+
+        Returns
+        -------
+        uris: Iterator[Tuple[str, str]]
+            Reference id and URI of the new entities.
+        """
+
+        def fetch(page_id: Optional[str]) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+            page: NewEntityUrisResponse = self.import_new_uris(
+                job_id, auth_key=auth_key, next_page_id=page_id, timeout=timeout
+            )
+            return list(page.new_entities_uris.items()), page.next_page_id
+
+        for items in prefetch_pages(fetch, prefetch=prefetch):
+            yield from items
+
     # ------------------------------------ Admin endpoints -------------------------------------------------------------
 
     def rebuild_vector_search_index(
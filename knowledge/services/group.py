@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright © 2021-present Wacom. All rights reserved.
 import urllib.parse
-from typing import List, Any, Optional, Dict, Union
+from typing import List, Any, Iterator, Optional, Dict, Tuple, Union
 
 from requests import Response
 
@@ -16,6 +16,7 @@ from knowledge.services import (
     FORCE_PARAM,
 )
 from knowledge.services.base import WacomServiceAPIClient, handle_error
+from knowledge.services.pagination import DEFAULT_PREFETCH, offset_cursor, prefetch_pages
 
 __all__ = [
     "Group",
@@ -446,6 +447,47 @@ class GroupManagementService(WacomServiceAPIClient):
             return [Group.parse(g) for g in groups]
         raise handle_error("Listing of groups failed.", response, parameters=params)
 
+    def listing_groups_iter(
+        self,
+        admin: bool = False,
+        limit: int = 20,
+        prefetch: int = DEFAULT_PREFETCH,
+        auth_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> Iterator[Group]:
+        """
+        Iterate over all groups configured for this instance, fetching the next pages ahead.
+
+        Parameters
+        ----------
+        admin: bool (default:= False)
+            Uses admin privilege to show all groups of the tenants, page by page.
+            Requires a user to have the role: TenantAdmin
+        limit: int (default:= 20)
+            Size of the pages of the admin listing.
+        prefetch: int (default:= DEFAULT_PREFETCH)
+            Maximum number of pages fetched ahead, the pages are fetched on demand if 0.
+        auth_key: Optional[str]
+            If the auth key is set, the logged-in user (if any) will be ignored and the auth key will be used.
+        timeout: int
+            Timeout for the request (default: 60 seconds)
+
+        Returns
+        -------
+        groups: Iterator[Group]
+            Groups of the user, or of the tenant with admin privilege.
+        """
+
+        def fetch(offset: int) -> Tuple[List[Group], Optional[int]]:
+            groups: List[Group] = self.listing_groups(
+                admin=admin, limit=limit, offset=offset, auth_key=auth_key, timeout=timeout
+            )
+            # Only the admin listing is paginated
+            return groups, offset_cursor(offset, limit, groups) if admin else None
+
+        for groups in prefetch_pages(fetch, start=0, prefetch=prefetch):
+            yield from groups
+
     def group(
         self,
         group_id: str,
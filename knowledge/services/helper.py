@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 # Copyright © 2021-present Wacom. All rights reserved.
-from typing import Any, Union
-from typing import Dict, List, Iterator
+import asyncio
+import uuid
+import zlib
+from pathlib import Path
+from typing import Any, Union, Optional, AbstractSet, AsyncIterator, Callable
+from typing import Dict, List, Iterator, Iterable, FrozenSet
 
 import loguru
+import orjson
 
 from knowledge.base.entity import (
     DATA_PROPERTIES_TAG,
@@ -23,19 +28,40 @@ from knowledge.base.entity import (
 )
 from knowledge.base.language import SUPPORTED_LOCALES
 from knowledge.base.ontology import OntologyPropertyReference
-from knowledge.base.ontology import ThingObject, EN_US
+from knowledge.base.ontology import ThingObject, EN_US, TRACKED_FIELDS
 from knowledge.services import TENANT_RIGHTS_TAG
 
 __all__ = [
     "split_updates",
     "entity_payload",
+    "modified_entity_payload",
+    "UPDATE_PAYLOAD_FIELDS",
+    "json_bytes",
+    "entity_payload_bytes",
+    "entities_payload_bytes",
+    "import_format_bytes",
+    "import_format_ndjson",
+    "import_format_gzip",
+    "file_chunks",
+    "MultipartStream",
     "RELATIONS_BULK_LIMIT",
+    "STREAM_CHUNK_SIZE",
 ]
 
 RELATIONS_BULK_LIMIT: int = 30
 """
 In one request only 30 relations can be created, otherwise the database operations are too many.
 """
+STREAM_CHUNK_SIZE: int = 64 * 1024
+"""
+Size of the chunks of streamed request bodies in bytes.
+"""
+UPDATE_PAYLOAD_FIELDS: FrozenSet[str] = frozenset(
+    {TYPE_TAG, DESCRIPTIONS_TAG, LABELS_TAG, DATA_PROPERTIES_TAG, TARGETS_TAG, TENANT_RIGHTS_TAG}
+)
+"""
+Tracked fields that are part of the entity payload.
+"""
 logger = loguru.logger
 
 
@@ -79,81 +105,334 @@ def split_updates(
         yield batch
 
 
-def entity_payload(entity: ThingObject) -> Dict[str, Any]:
+def entity_payload(entity: ThingObject, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
     """
     Create the payload for the entity.
     Parameters
     ----------
     entity: ThingObject
         The entity to create the payload for.
+    fields: Optional[Iterable[str]] (default:= None)
+        Fields of the payload to include (see `TRACKED_FIELDS`), e.g., `entity.modified_fields`. The type is always
+        included. If not set, the full payload is created.
 
     Returns
     -------
     Dict[str, Any]
         The payload for the entity.
     """
-    # Different localized content
-    labels: List[Dict[str, Any]] = []
-    descriptions: List[Dict[str, Any]] = []
-    literals: List[Dict[str, Any]] = []
+    include: AbstractSet[str] = TRACKED_FIELDS if fields is None else set(fields)
+    payload: Dict[str, Any] = {TYPE_TAG: entity.concept_type.iri}
     # Add description in different languages
-    for desc in entity.description:
-        if desc is None or desc.content is None:
-            logger.warning("Description is None")
-            continue
-
-        if len(desc.content) > 0 and not desc.content == " ":
-            descriptions.append({DESCRIPTION_TAG: desc.content, LOCALE_TAG: desc.language_code})
-
-    # Labels are tagged as the main label
-    for label in entity.label:
-        if label is not None and label.content is not None and len(label.content) > 0 and label.content != " ":
-            labels.append(
-                {
-                    VALUE_TAG: label.content,
-                    LOCALE_TAG: label.language_code,
-                    IS_MAIN_TAG: True,
-                }
-            )
-    # Aliases are no main labels
-    for label in entity.alias:
-        if label is not None and len(label.content) > 0 and label.content != " ":
-            labels.append(
-                {
-                    VALUE_TAG: label.content,
-                    LOCALE_TAG: label.language_code,
-                    IS_MAIN_TAG: False,
-                }
-            )
-    # Labels are tagged as the main label
-    for _, list_literals in entity.data_properties.items():
-        for li in list_literals:
-            if li.data_property_type:
-                literals.append(
+    if DESCRIPTIONS_TAG in include:
+        descriptions: List[Dict[str, Any]] = []
+        for desc in entity.description:
+            if desc is None or desc.content is None:
+                logger.warning("Description is None")
+                continue
+
+            if len(desc.content) > 0 and not desc.content == " ":
+                descriptions.append({DESCRIPTION_TAG: desc.content, LOCALE_TAG: desc.language_code})
+        payload[DESCRIPTIONS_TAG] = descriptions
+    if LABELS_TAG in include:
+        labels: List[Dict[str, Any]] = []
+        # Labels are tagged as the main label
+        for label in entity.label:
+            if label is not None and label.content is not None and len(label.content) > 0 and label.content != " ":
+                labels.append(
+                    {
+                        VALUE_TAG: label.content,
+                        LOCALE_TAG: label.language_code,
+                        IS_MAIN_TAG: True,
+                    }
+                )
+        # Aliases are no main labels
+        for label in entity.alias:
+            if label is not None and len(label.content) > 0 and label.content != " ":
+                labels.append(
                     {
-                        VALUE_TAG: li.value,
-                        LOCALE_TAG: (
-                            li.language_code if li.language_code and li.language_code in SUPPORTED_LOCALES else EN_US
-                        ),
-                        DATA_PROPERTY_TAG: li.data_property_type.iri,
+                        VALUE_TAG: label.content,
+                        LOCALE_TAG: label.language_code,
+                        IS_MAIN_TAG: False,
                     }
                 )
-    payload: Dict[str, Any] = {
-        TYPE_TAG: entity.concept_type.iri,
-        DESCRIPTIONS_TAG: descriptions,
-        LABELS_TAG: labels,
-        DATA_PROPERTIES_TAG: literals,
-    }
-    targets: List[str] = []
-    if entity.use_vector_index:
-        targets.append(INDEXING_VECTOR_SEARCH_TARGET)
-    if entity.use_vector_index_document:
-        targets.append(INDEXING_VECTOR_SEARCH_DOCUMENT_TARGET)
-    if entity.use_full_text_index:
-        targets.append(INDEXING_FULLTEXT_TARGET)
-    if entity.use_for_nel:
-        targets.append(INDEXING_NEL_TARGET)
-    payload[TARGETS_TAG] = targets
-    if entity.tenant_access_right:
+        payload[LABELS_TAG] = labels
+    if DATA_PROPERTIES_TAG in include:
+        literals: List[Dict[str, Any]] = []
+        for _, list_literals in entity.data_properties.items():
+            for li in list_literals:
+                if li.data_property_type:
+                    literals.append(
+                        {
+                            VALUE_TAG: li.value,
+                            LOCALE_TAG: (
+                                li.language_code
+                                if li.language_code and li.language_code in SUPPORTED_LOCALES
+                                else EN_US
+                            ),
+                            DATA_PROPERTY_TAG: li.data_property_type.iri,
+                        }
+                    )
+        payload[DATA_PROPERTIES_TAG] = literals
+    if TARGETS_TAG in include:
+        targets: List[str] = []
+        if entity.use_vector_index:
+            targets.append(INDEXING_VECTOR_SEARCH_TARGET)
+        if entity.use_vector_index_document:
+            targets.append(INDEXING_VECTOR_SEARCH_DOCUMENT_TARGET)
+        if entity.use_full_text_index:
+            targets.append(INDEXING_FULLTEXT_TARGET)
+        if entity.use_for_nel:
+            targets.append(INDEXING_NEL_TARGET)
+        payload[TARGETS_TAG] = targets
+    if TENANT_RIGHTS_TAG in include and entity.tenant_access_right:
         payload[TENANT_RIGHTS_TAG] = entity.tenant_access_right.to_list()
     return payload
+
+
+def modified_entity_payload(entity: ThingObject) -> Optional[Dict[str, Any]]:
+    """
+    Create the payload for the fields of the entity that have been modified since it has been loaded.
+
+    Parameters
+    ----------
+    entity: ThingObject
+        The entity to create the payload for.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The payload with the modified fields, or None if no field of the update payload has been modified. Images
+        and relations are not part of the payload, as they are updated with their own endpoints.
+    """
+    modified: AbstractSet[str] = entity.modified_fields & UPDATE_PAYLOAD_FIELDS
+    if not modified:
+        return None
+    return entity_payload(entity, fields=modified)
+
+
+def json_bytes(payload: Any) -> bytes:
+    """
+    Encode a JSON payload to UTF-8 bytes with orjson.
+
+    This is the single encoder used by the clients for request bodies and import files. Non-ASCII characters are
+    written as UTF-8 (equivalent to `json.dumps(..., ensure_ascii=False)`), so the bytes can be sent or written as
+    they are.
+
+    Parameters
+    ----------
+    payload: Any
+        JSON serializable payload.
+
+    Returns
+    -------
+    content: bytes
+        UTF-8 encoded JSON.
+    """
+    return orjson.dumps(payload)
+
+
+def entity_payload_bytes(entity: ThingObject) -> bytes:
+    """
+    Create the encoded payload for the entity.
+
+    Parameters
+    ----------
+    entity: ThingObject
+        The entity to create the payload for.
+
+    Returns
+    -------
+    content: bytes
+        The payload for the entity as UTF-8 encoded JSON.
+    """
+    return orjson.dumps(entity_payload(entity))
+
+
+def entities_payload_bytes(entities: Iterable[ThingObject]) -> bytes:
+    """
+    Create the encoded payload for a bulk of entities.
+
+    Parameters
+    ----------
+    entities: Iterable[ThingObject]
+        The entities to create the payload for.
+
+    Returns
+    -------
+    content: bytes
+        JSON array with the payloads of the entities as UTF-8 encoded JSON.
+    """
+    return orjson.dumps([entity_payload(e) for e in entities])
+
+
+def import_format_bytes(
+    entity: ThingObject,
+    group_ids: Optional[List[str]] = None,
+    external_user_id: Optional[str] = None,
+    reference_id: Optional[str] = None,
+) -> bytes:
+    """
+    Encode the entity as one line of the import format, including the trailing newline.
+
+    Parameters
+    ----------
+    entity: ThingObject
+        The entity to encode.
+    group_ids: Optional[List[str]] = None
+        List of group ids
+    external_user_id: Optional[str]
+        External user id
+    reference_id: Optional[str]
+        Override the reference id
+
+    Returns
+    -------
+    line: bytes
+        UTF-8 encoded NDJSON line.
+    """
+    return (
+        orjson.dumps(
+            entity.__import_format_dict__(
+                group_ids=group_ids, external_user_id=external_user_id, reference_id=reference_id
+            )
+        )
+        + b"\n"
+    )
+
+
+def import_format_ndjson(entities: Iterable[ThingObject], group_ids: Optional[List[str]] = None) -> bytes:
+    """
+    Encode the entities in the import format (NDJSON).
+
+    Parameters
+    ----------
+    entities: Iterable[ThingObject]
+        The entities to encode.
+    group_ids: Optional[List[str]] = None
+        List of group ids, if not set the group ids of the entities are used.
+
+    Returns
+    -------
+    content: bytes
+        UTF-8 encoded NDJSON, one entity per line.
+    """
+    return b"".join(import_format_bytes(e, group_ids=group_ids) for e in entities)
+
+
+def import_format_gzip(
+    entities: Iterable[ThingObject], group_ids: Optional[List[str]] = None, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Encode the entities in the import format (NDJSON) and compress it incrementally with gzip.
+
+    Parameters
+    ----------
+    entities: Iterable[ThingObject]
+        The entities to encode, consumed one by one.
+    group_ids: Optional[List[str]] = None
+        List of group ids, if not set the group ids of the entities are used.
+    chunk_size: int (Default:= STREAM_CHUNK_SIZE)
+        Minimum size of the compressed chunks, except the last one.
+
+    Returns
+    -------
+    chunks: Iterator[bytes]
+        Chunks of the gzip stream; their concatenation is a gzip file of the NDJSON.
+    """
+    # wbits=31 writes the gzip header and trailer
+    compressor = zlib.compressobj(wbits=31)
+    buffer: bytearray = bytearray()
+    for entity in entities:
+        buffer += compressor.compress(import_format_bytes(entity, group_ids=group_ids))
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += compressor.flush()
+    if buffer:
+        yield bytes(buffer)
+
+
+def file_chunks(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read a file in chunks.
+
+    Parameters
+    ----------
+    path: Path
+        Path of the file.
+    chunk_size: int (Default:= STREAM_CHUNK_SIZE)
+        Size of the chunks.
+
+    Returns
+    -------
+    chunks: Iterator[bytes]
+        Chunks of the file.
+    """
+    with path.open("rb") as fp:
+        while chunk := fp.read(chunk_size):
+            yield chunk
+
+
+class MultipartStream:
+    """
+    MultipartStream
+    ---------------
+    Streamed `multipart/form-data` body with a single file field. The body is produced chunk by chunk while it is
+    sent, thus the memory does not depend on the size of the file. It can be iterated by `requests` (sent with chunked
+    transfer encoding) and asynchronously by `aiohttp`.
+
+    Parameters
+    ----------
+    chunks: Callable[[], Iterable[bytes]]
+        Function returning the chunks of the file; it is called for every transmission of the body.
+    field: str (Default:= "file")
+        Name of the form field.
+    file_name: str (Default:= "import.njson.gz")
+        Name of the file.
+    content_type: str (Default:= "application/x-gzip")
+        Content type of the file.
+    replayable: bool (Default:= True)
+        Flag if the chunks can be produced again, e.g., for a retry. If not, a second transmission fails instead of
+        sending a truncated body.
+    """
+
+    def __init__(
+        self,
+        chunks: Callable[[], Iterable[bytes]],
+        field: str = "file",
+        file_name: str = "import.njson.gz",
+        content_type: str = "application/x-gzip",
+        replayable: bool = True,
+    ):
+        self.__chunks: Callable[[], Iterable[bytes]] = chunks
+        self.__boundary: str = uuid.uuid4().hex
+        self.__head: bytes = (
+            f"--{self.__boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{file_name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self.__tail: bytes = f"\r\n--{self.__boundary}--\r\n".encode("utf-8")
+        self.__replayable: bool = replayable
+        self.__sent: bool = False
+
+    @property
+    def content_type(self) -> str:
+        """Content type header of the body, including the boundary."""
+        return f"multipart/form-data; boundary={self.__boundary}"
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.__sent and not self.__replayable:
+            raise ValueError("The streamed body has already been sent and cannot be produced again.")
+        self.__sent = True
+        yield self.__head
+        for chunk in self.__chunks():
+            if chunk:
+                yield chunk
+        yield self.__tail
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+            # Producing a chunk is CPU-bound, let other tasks run in between
+            await asyncio.sleep(0)
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+This module contains the service hub, which hands out service clients sharing one pooled transport and one token
+manager. Clients of the same hub open a single connection pool per host and share the logged-in sessions, so a
+worker using several services logs in once.
+
+Examples
+--------
+>>> from knowledge.services.hub import ServiceHub
+>>> from knowledge.services.graph import WacomKnowledgeService
+>>> from knowledge.services.search import SemanticSearchClient
+>>> hub = ServiceHub("https://private-knowledge.wacom.com", host_limits={"private-knowledge.wacom.com": 32})
+>>> hub.login(tenant_api_key, external_user_id)
+>>> graph = hub.client(WacomKnowledgeService)
+>>> search = hub.client(SemanticSearchClient)
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union, cast
+
+import requests
+from requests.sessions import HTTPAdapter
+
+from knowledge.services import DEFAULT_BACKOFF_FACTOR, DEFAULT_MAX_RETRIES
+from knowledge.services.base import WacomServiceAPIClient, RequestsSession
+from knowledge.services.circuit import CircuitBreaker
+from knowledge.services.coalescing import RequestCoalescer
+from knowledge.services.concurrency import AdaptiveLimiter
+from knowledge.services.instrumentation import RequestHook
+from knowledge.services.ratelimit import RateLimiter
+from knowledge.services.session import TokenManager, PermanentSession, RefreshableSession, TimedSession
+
+__all__ = ["ServiceHub", "ClientType", "host_prefixes"]
+
+ClientType = TypeVar("ClientType", bound=WacomServiceAPIClient)
+
+
+def host_prefixes(host: str) -> List[str]:
+    """
+    URL prefixes of a host for mounting adapters.
+
+    Parameters
+    ----------
+    host: str
+        Host name, optionally with port (e.g. `example.com:8443`), or a URL prefix (e.g. `https://example.com`).
+
+    Returns
+    -------
+    prefixes: List[str]
+        URL prefixes matching the requests to the host only.
+    """
+    if "://" in host:
+        return [host.rstrip("/") + "/"]
+    return [f"https://{host}/", f"http://{host}/"]
+
+
+class ServiceHub:
+    """
+    Service Hub
+    -----------
+    Factory for service clients backed by one pooled transport and one shared token manager.
+
+    All clients handed out by the hub send their requests through the same `requests.Session`, thus the connections
+    to a host are pooled once for all services. Sessions added by `login`, `register_token`, or by any client of the
+    hub are stored in the shared token manager and used by all clients.
+
+    Parameters
+    ----------
+    service_url: str
+        URL of the service
+    application_name: str (Default:= "Knowledge Client")
+        Name of the application using the service
+    verify_calls: bool (Default:= True)
+        Flag if API calls should be verified.
+    max_retries: int (Default:= DEFAULT_MAX_RETRIES)
+        Maximum number of retries for failed requests.
+    backoff_factor: float (Default:= DEFAULT_BACKOFF_FACTOR)
+        Backoff factor for failed requests.
+    pool_connections: int (Default:= 10)
+        Number of connection pools to cache for hosts without limit.
+    pool_maxsize: int (Default:= 10)
+        Maximum number of connections to keep per host without limit.
+    host_limits: Optional[Dict[str, int]] (Default:= None)
+        Maximum number of pooled connections per host, e.g. `{"private-knowledge.wacom.com": 32}`.
+    pool_block: bool (Default:= False)
+        Wait for a free pooled connection instead of opening connections beyond the limit.
+    limiter: Optional[AdaptiveLimiter] (Default:= None)
+        Adaptive limiter for the in-flight requests shared by all clients of the hub.
+    rate_limiter: Optional[RateLimiter] (Default:= None)
+        Rate limiter of the endpoint classes shared by all clients of the hub.
+    circuit_breaker: Optional[CircuitBreaker] (Default:= None)
+        Circuit breaker of the endpoints shared by all clients of the hub.
+    coalescer: Optional[RequestCoalescer] (Default:= None)
+        Coalescer of identical GET requests in flight shared by all clients of the hub.
+    hooks: Iterable[RequestHook] (Default:= ())
+        Instrumentation hooks receiving the events of the requests of all clients of the hub.
+    """
+
+    def __init__(
+        self,
+        service_url: str,
+        application_name: str = "Knowledge Client",
+        verify_calls: bool = True,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        host_limits: Optional[Dict[str, int]] = None,
+        pool_block: bool = False,
+        limiter: Optional[AdaptiveLimiter] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        hooks: Iterable[RequestHook] = (),
+    ):
+        self.__service_url: str = service_url.rstrip("/")
+        self.__application_name: str = application_name
+        self.__verify_calls: bool = verify_calls
+        self.__max_retries: int = max_retries
+        self.__backoff_factor: float = backoff_factor
+        self.__pool_connections: int = pool_connections
+        self.__pool_maxsize: int = pool_maxsize
+        self.__host_limits: Dict[str, int] = dict(host_limits or {})
+        self.__pool_block: bool = pool_block
+        self.__limiter: Optional[AdaptiveLimiter] = limiter
+        self.__rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.__circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self.__coalescer: Optional[RequestCoalescer] = coalescer
+        self.__hooks: Tuple[RequestHook, ...] = tuple(hooks)
+        self.__token_manager: TokenManager = TokenManager()
+        self.__transport: Optional[requests.Session] = None
+        self.__clients: weakref.WeakSet = weakref.WeakSet()
+        self.__current_session_id: Optional[str] = None
+        self.__lock: threading.RLock = threading.RLock()
+        self.__auth_client: WacomServiceAPIClient = self.client(
+            WacomServiceAPIClient, application_name=application_name
+        )
+
+    @property
+    def service_url(self) -> str:
+        """Service URL."""
+        return self.__service_url
+
+    @property
+    def application_name(self) -> str:
+        """Application name."""
+        return self.__application_name
+
+    @property
+    def verify_calls(self) -> bool:
+        """Flag if API calls should be verified."""
+        return self.__verify_calls
+
+    @property
+    def host_limits(self) -> Dict[str, int]:
+        """Maximum number of pooled connections per host."""
+        return dict(self.__host_limits)
+
+    @property
+    def limiter(self) -> Optional[AdaptiveLimiter]:
+        """Adaptive limiter shared by the clients."""
+        return self.__limiter
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter shared by the clients."""
+        return self.__rate_limiter
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker shared by the clients."""
+        return self.__circuit_breaker
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """Coalescer of identical GET requests shared by the clients."""
+        return self.__coalescer
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        """Instrumentation hooks of the clients."""
+        return self.__hooks
+
+    @property
+    def token_manager(self) -> TokenManager:
+        """Token manager shared by the clients."""
+        return self.__token_manager
+
+    @property
+    def current_session_id(self) -> Optional[str]:
+        """Session id used by the clients of the hub."""
+        return self.__current_session_id
+
+    @property
+    def transport(self) -> requests.Session:
+        """Pooled transport shared by the clients."""
+        with self.__lock:
+            if self.__transport is None:
+                self.__transport = self.__create_transport__()
+            return self.__transport
+
+    def __create_transport__(self) -> requests.Session:
+        """Creates the pooled transport with an adapter per limited host."""
+        transport: requests.Session = requests.Session()
+        adapter: HTTPAdapter = RequestsSession.create_adapter(
+            self.__pool_connections, self.__pool_maxsize, self.__max_retries, self.__backoff_factor, self.__pool_block
+        )
+        transport.mount("https://", adapter)
+        transport.mount("http://", adapter)
+        for host, limit in self.__host_limits.items():
+            host_adapter: HTTPAdapter = RequestsSession.create_adapter(
+                1, limit, self.__max_retries, self.__backoff_factor, self.__pool_block
+            )
+            for prefix in host_prefixes(host):
+                transport.mount(prefix, host_adapter)
+        transport.verify = self.__verify_calls
+        return transport
+
+    def client(self, client_class: Type[ClientType], **kwargs: Any) -> ClientType:
+        """
+        Creates a service client backed by the shared transport and token manager.
+
+        Parameters
+        ----------
+        client_class: Type[ClientType]
+            Class of the service client, e.g. `WacomKnowledgeService`.
+        kwargs: Any
+            Additional arguments of the client. The service URL defaults to the one of the hub.
+
+        Returns
+        -------
+        client: ClientType
+            Service client using the current session of the hub.
+        """
+        kwargs.setdefault("service_url", self.__service_url)
+        client: ClientType = client_class(**kwargs)
+        client.verify_calls = self.__verify_calls
+        client.share_transport(self.__token_manager, self.transport)
+        client.limiter = self.__limiter
+        client.rate_limiter = self.__rate_limiter
+        client.circuit_breaker = self.__circuit_breaker
+        client.coalescer = self.__coalescer
+        for hook in self.__hooks:
+            client.add_hook(hook)
+        with self.__lock:
+            if self.__current_session_id is not None:
+                client.use_session(self.__current_session_id)
+            self.__clients.add(client)
+        return client
+
+    def login(self, tenant_api_key: str, external_user_id: str) -> PermanentSession:
+        """
+        Login as a user once for all clients of the hub.
+
+        Parameters
+        ----------
+        tenant_api_key: str
+            Tenant api key
+        external_user_id: str
+            External user id
+
+        Returns
+        -------
+        session: PermanentSession
+            Session used by all clients of the hub.
+        """
+        session: PermanentSession = self.__auth_client.login(tenant_api_key, external_user_id)
+        self.use_session(session.id)
+        return session
+
+    def register_token(
+        self, auth_key: str, refresh_token: Optional[str] = None
+    ) -> Union[RefreshableSession, TimedSession]:
+        """
+        Register a token once for all clients of the hub.
+
+        Parameters
+        ----------
+        auth_key: str
+            Authentication key for identifying the user for the service calls.
+        refresh_token: Optional[str] (Default:= None)
+            Refresh token
+
+        Returns
+        -------
+        session: Union[RefreshableSession, TimedSession]
+            Session used by all clients of the hub.
+        """
+        session: Union[RefreshableSession, TimedSession] = self.__auth_client.register_token(auth_key, refresh_token)
+        self.use_session(session.id)
+        return session
+
+    def use_session(self, session_id: str) -> None:
+        """
+        Use a session of the shared token manager for all clients of the hub.
+
+        Parameters
+        ----------
+        session_id: str
+            Session id
+        """
+        with self.__lock:
+            for client in list(self.__clients):
+                cast(WacomServiceAPIClient, client).use_session(session_id)
+            self.__current_session_id = session_id
+
+    def logout(self) -> None:
+        """Logout the current session of the hub."""
+        with self.__lock:
+            if self.__current_session_id is not None:
+                self.__token_manager.remove_session(self.__current_session_id)
+            self.__current_session_id = None
+
+    def close(self) -> None:
+        """Close the shared transport and release its connections."""
+        with self.__lock:
+            if self.__transport is not None:
+                self.__transport.close()
+                self.__transport = None
+
+    def __enter__(self) -> "ServiceHub":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+This module contains the instrumentation hooks of the transport layer.
+
+A hook receives an event for every request of the sessions:
+    - **before_request**: The request is about to be sent.
+    - **after_response**: The response headers arrived. The timings of the phases, the status, and the sizes are set.
+    - **on_error**: The request failed with an exception, e.g., a connection error or a timeout.
+
+The asynchronous session also reports the phases of the connection (queueing for a pooled connection, DNS, and
+connect including the TLS handshake) and the time to read and decode the body. The synchronous session reports the
+server time and the total time, as `requests` does not expose the connection phases.
+
+Sessions without hooks skip the instrumentation entirely. `HistogramCollector` is a built-in hook that collects
+latency histograms with the p50, p95, and p99 per endpoint.
+
+Examples
+--------
+>>> from knowledge.services.instrumentation import HistogramCollector
+>>> from knowledge.services.graph import WacomKnowledgeService
+>>> collector = HistogramCollector()
+>>> client = WacomKnowledgeService(service_url="https://private-knowledge.wacom.com")
+>>> client.add_hook(collector)
+>>> collector.summary()
+{}
+"""
+
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from knowledge import logger
+
+__all__ = [
+    "RequestTimings",
+    "RequestEvent",
+    "RequestHook",
+    "LatencyHistogram",
+    "LatencySummary",
+    "HistogramCollector",
+    "endpoint_template",
+    "dispatch",
+    "TIMING_PHASES",
+]
+
+TIMING_PHASES: Tuple[str, ...] = ("queued", "dns", "connect", "server", "decode", "total")
+"""Phases of a request with timings."""
+ID_PLACEHOLDER: str = "{id}"
+"""Placeholder for the identifiers in the path of an endpoint template."""
+ID_SEGMENT: re.Pattern = re.compile(
+    r"^([0-9]+|[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}|.*:.*)$"
+)
+"""Path segments that are identifiers, i.e., numbers, UUIDs, and URIs such as `wacom:entity:...`."""
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Endpoint template of a URL, the path with placeholders for the identifiers.
+
+    Parameters
+    ----------
+    url: str
+        URL of the request.
+
+    Returns
+    -------
+    template: str
+        Template, e.g. `/graph/v1/entity/{id}/relations` for the relations of an entity.
+    """
+    path: str = urlsplit(url).path
+    return "/".join(ID_PLACEHOLDER if ID_SEGMENT.match(unquote(s)) else s for s in path.split("/"))
+
+
+@dataclass
+class RequestTimings:
+    """
+    Timings of the phases of a request in seconds, None if a phase is not measured.
+
+    Attributes
+    ----------
+    queued: Optional[float]
+        Waiting for a pooled connection.
+    dns: Optional[float]
+        Resolving the host of a new connection.
+    connect: Optional[float]
+        Opening a new connection, including the TLS handshake.
+    server: Optional[float]
+        Sending the request until the response headers arrived.
+    decode: Optional[float]
+        Reading and decoding the body of the response.
+    total: Optional[float]
+        Start of the request until the response headers arrived, or the request failed.
+    """
+
+    queued: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    server: Optional[float] = None
+    decode: Optional[float] = None
+    total: Optional[float] = None
+
+
+@dataclass
+class RequestEvent:
+    """
+    Event of a request, passed to the hooks.
+
+    Attributes
+    ----------
+    method: str
+        HTTP method.
+    url: str
+        URL of the request.
+    endpoint: str
+        Endpoint template of the URL, see `endpoint_template`.
+    attempt: int
+        Number of previous attempts of the request.
+    status: Optional[int]
+        Status code of the response.
+    request_bytes: Optional[int]
+        Size of the request body.
+    response_bytes: Optional[int]
+        Size of the response body.
+    timings: RequestTimings
+        Timings of the phases.
+    error: Optional[BaseException]
+        Exception of a failed request.
+    """
+
+    method: str
+    url: str
+    endpoint: str
+    attempt: int = 0
+    status: Optional[int] = None
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    timings: RequestTimings = field(default_factory=RequestTimings)
+    error: Optional[BaseException] = None
+
+
+class RequestHook:
+    """
+    Request Hook
+    ------------
+    Base class of the instrumentation hooks, the methods do nothing. Hooks are called synchronously in the thread or
+    event loop of the request, thus they must be fast and thread-safe.
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        """
+        The request is about to be sent.
+
+        Parameters
+        ----------
+        event: RequestEvent
+            Event of the request.
+        """
+
+    def after_response(self, event: RequestEvent) -> None:
+        """
+        The response of the request arrived.
+
+        Parameters
+        ----------
+        event: RequestEvent
+            Event of the request with the status, the sizes, and the timings.
+        """
+
+    def on_error(self, event: RequestEvent) -> None:
+        """
+        The request failed.
+
+        Parameters
+        ----------
+        event: RequestEvent
+            Event of the request with the exception.
+        """
+
+
+def dispatch(hooks: Iterable[RequestHook], phase: str, event: RequestEvent) -> None:
+    """
+    Call a method of the hooks, a failing hook does not affect the request.
+
+    Parameters
+    ----------
+    hooks: Iterable[RequestHook]
+        Hooks
+    phase: str
+        Name of the method, i.e., `before_request`, `after_response`, or `on_error`.
+    event: RequestEvent
+        Event of the request.
+    """
+    for hook in hooks:
+        try:
+            getattr(hook, phase)(event)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"Request hook {type(hook).__name__}.{phase} failed: {e}")
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """
+    Summary of the latencies of an endpoint in seconds.
+
+    Attributes
+    ----------
+    count: int
+        Number of recorded requests.
+    errors: int
+        Number of failed requests.
+    mean: float
+        Mean latency.
+    p50: float
+        Median latency.
+    p95: float
+        95th percentile.
+    p99: float
+        99th percentile.
+    max: float
+        Maximum latency.
+    """
+
+    count: int
+    errors: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class LatencyHistogram:
+    """
+    Latency Histogram
+    -----------------
+    Histogram with logarithmic buckets, thus the memory is bounded and the relative error of a percentile is at most
+    `growth - 1`. The histogram is not thread-safe.
+
+    Parameters
+    ----------
+    lowest: float (Default:= 1e-4)
+        Upper bound of the first bucket in seconds.
+    growth: float (Default:= 1.02)
+        Ratio of the bounds of consecutive buckets.
+    """
+
+    def __init__(self, lowest: float = 1e-4, growth: float = 1.02):
+        self.__lowest: float = lowest
+        self.__log_growth: float = math.log(growth)
+        self.__buckets: Dict[int, int] = {}
+        self.__count: int = 0
+        self.__sum: float = 0.0
+        self.__max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self.__count
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values."""
+        return self.__sum / self.__count if self.__count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Maximum of the recorded values."""
+        return self.__max
+
+    def record(self, value: float) -> None:
+        """
+        Record a value.
+
+        Parameters
+        ----------
+        value: float
+            Value in seconds.
+        """
+        index: int = 0
+        if value > self.__lowest:
+            index = math.ceil(math.log(value / self.__lowest) / self.__log_growth)
+        self.__buckets[index] = self.__buckets.get(index, 0) + 1
+        self.__count += 1
+        self.__sum += value
+        self.__max = max(self.__max, value)
+
+    def percentile(self, q: float) -> float:
+        """
+        Percentile of the recorded values.
+
+        Parameters
+        ----------
+        q: float
+            Percentile in [0, 100].
+
+        Returns
+        -------
+        value: float
+            Upper bound of the bucket of the percentile, capped by the maximum. 0 if no value is recorded.
+        """
+        if self.__count == 0:
+            return 0.0
+        rank: float = max(1.0, math.ceil(q / 100.0 * self.__count))
+        seen: int = 0
+        for index in sorted(self.__buckets):
+            seen += self.__buckets[index]
+            if seen >= rank:
+                return min(self.__max, self.__lowest * math.exp(index * self.__log_growth))
+        return self.__max
+
+
+class HistogramCollector(RequestHook):
+    """
+    Histogram Collector
+    -------------------
+    Thread-safe hook collecting in-memory latency histograms per endpoint, i.e., per method and endpoint template,
+    and per timing phase.
+    """
+
+    def __init__(self) -> None:
+        self.__histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.__errors: Dict[str, int] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def after_response(self, event: RequestEvent) -> None:
+        key: str = f"{event.method} {event.endpoint}"
+        with self.__lock:
+            for phase in TIMING_PHASES:
+                value: Optional[float] = getattr(event.timings, phase)
+                if value is not None:
+                    self.__histogram__(key, phase).record(value)
+
+    def on_error(self, event: RequestEvent) -> None:
+        key: str = f"{event.method} {event.endpoint}"
+        with self.__lock:
+            self.__errors[key] = self.__errors.get(key, 0) + 1
+            if event.timings.total is not None:
+                self.__histogram__(key, "total").record(event.timings.total)
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Endpoints with recorded requests."""
+        with self.__lock:
+            return sorted({key for key, _ in self.__histograms} | set(self.__errors))
+
+    def percentiles(self, endpoint: str, phase: str = "total") -> Dict[str, float]:
+        """
+        Percentiles of the latency of an endpoint.
+
+        Parameters
+        ----------
+        endpoint: str
+            Endpoint, i.e., method and endpoint template, e.g. `GET /graph/v1/entity/{id}`.
+        phase: str (Default:= "total")
+            Timing phase, see `TIMING_PHASES`.
+
+        Returns
+        -------
+        percentiles: Dict[str, float]
+            The p50, p95, and p99 in seconds.
+        """
+        with self.__lock:
+            histogram: Optional[LatencyHistogram] = self.__histograms.get((endpoint, phase))
+            if histogram is None:
+                return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+            return {f"p{q}": histogram.percentile(q) for q in (50, 95, 99)}
+
+    def summary(self, phase: str = "total") -> Dict[str, LatencySummary]:
+        """
+        Summary of the latencies of all endpoints.
+
+        Parameters
+        ----------
+        phase: str (Default:= "total")
+            Timing phase, see `TIMING_PHASES`.
+
+        Returns
+        -------
+        summary: Dict[str, LatencySummary]
+            Summary per endpoint.
+        """
+        with self.__lock:
+            result: Dict[str, LatencySummary] = {}
+            for (endpoint, histogram_phase), histogram in sorted(self.__histograms.items()):
+                if histogram_phase != phase:
+                    continue
+                result[endpoint] = LatencySummary(
+                    count=histogram.count,
+                    errors=self.__errors.get(endpoint, 0),
+                    mean=histogram.mean,
+                    p50=histogram.percentile(50),
+                    p95=histogram.percentile(95),
+                    p99=histogram.percentile(99),
+                    max=histogram.max,
+                )
+            return result
+
+    def reset(self) -> None:
+        """Remove all recorded values."""
+        with self.__lock:
+            self.__histograms.clear()
+            self.__errors.clear()
+
+    def __histogram__(self, endpoint: str, phase: str) -> LatencyHistogram:
+        """Histogram of an endpoint and a phase."""
+        histogram: Optional[LatencyHistogram] = self.__histograms.get((endpoint, phase))
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.__histograms[(endpoint, phase)] = histogram
+        return histogram
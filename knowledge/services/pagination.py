@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+This module contains the prefetching page iterators of the paginated endpoints.
+
+A page is fetched with a cursor, i.e., the next page id of the listing, search, and import log endpoints, or the
+offset of the user and group listings, and returns its items and the cursor of the next page. The iteration ends with
+an empty page, or a page without a new cursor.
+
+The prefetching iterators read ahead: a background thread, or a task of the event loop, fetches the next pages while
+the consumer processes the current one, keeping at most `prefetch` pages buffered. The time of a full scan thus
+approaches the maximum of the network and the consumer time instead of their sum, with bounded memory. Errors of the
+fetches are raised by the iterators, and stopping the iteration stops the read-ahead.
+
+Examples
+--------
+>>> from knowledge.services.pagination import prefetch_pages
+>>> for page in prefetch_pages(lambda page_id: client.search_labels("Leonardo", EN_US, next_page_id=page_id)):
+...     print(len(page))
+"""
+
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+__all__ = ["prefetch_pages", "async_prefetch_pages", "offset_cursor", "DEFAULT_PREFETCH"]
+
+T = TypeVar("T")
+
+DEFAULT_PREFETCH: int = 2
+"""Default number of pages fetched ahead."""
+PUT_INTERVAL: float = 0.1
+"""Interval in seconds of the background thread to check if the iteration has stopped, while the buffer is full."""
+
+
+def offset_cursor(offset: int, limit: int, items: List[Any]) -> Optional[int]:
+    """
+    Cursor of the next page of an endpoint with offset and limit.
+
+    Parameters
+    ----------
+    offset: int
+        Offset of the current page.
+    limit: int
+        Maximum number of items of a page.
+    items: List[Any]
+        Items of the current page.
+
+    Returns
+    -------
+    cursor: Optional[int]
+        Offset of the next page, None if the current page is the last one.
+    """
+    return offset + len(items) if len(items) >= limit else None
+
+
+def __is_last__(items: List[Any], cursor: Any, next_cursor: Any) -> bool:
+    """Check if a page is the last one."""
+    return len(items) == 0 or next_cursor is None or next_cursor == "" or next_cursor == cursor
+
+
+def __pages__(fetch: Callable[[Any], Tuple[List[T], Any]], start: Any) -> Iterator[List[T]]:
+    """Fetch the pages one after the other."""
+    cursor: Any = start
+    while True:
+        items, next_cursor = fetch(cursor)
+        if items:
+            yield items
+        if __is_last__(items, cursor, next_cursor):
+            return
+        cursor = next_cursor
+
+
+def prefetch_pages(
+    fetch: Callable[[Any], Tuple[List[T], Any]], start: Any = None, prefetch: int = DEFAULT_PREFETCH
+) -> Iterator[List[T]]:
+    """
+    Iterate over the pages of a paginated endpoint, fetching the next pages in a background thread.
+
+    Parameters
+    ----------
+    fetch: Callable[[Any], Tuple[List[T], Any]]
+        Function fetching the page of a cursor, returning the items and the cursor of the next page.
+    start: Any (Default:= None)
+        Cursor of the first page.
+    prefetch: int (Default:= DEFAULT_PREFETCH)
+        Maximum number of pages fetched ahead; the pages are fetched on demand if less than 1.
+
+    Returns
+    -------
+    pages: Iterator[List[T]]
+        Non-empty pages.
+    """
+    if prefetch < 1:
+        yield from __pages__(fetch, start)
+        return
+    buffer: queue.Queue = queue.Queue(maxsize=prefetch)
+    stopped: threading.Event = threading.Event()
+
+    def put(entry: Tuple[Optional[List[T]], Optional[BaseException]]) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=PUT_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        # The terminal entry is always put, even if the thread is stopped by a BaseException, thus the consumer
+        # never waits for a page that will not come.
+        terminal: Tuple[None, Optional[BaseException]] = (None, None)
+        try:
+            for page in __pages__(fetch, start):
+                if not put((page, None)):
+                    return
+        except BaseException as e:  # pylint: disable=broad-except
+            terminal = (None, e)
+        finally:
+            put(terminal)
+
+    threading.Thread(target=produce, name="page-prefetch", daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if error is not None:
+                raise error
+            if page is None:
+                return
+            yield page
+    finally:
+        stopped.set()
+
+
+async def __async_pages__(fetch: Callable[[Any], Awaitable[Tuple[List[T], Any]]], start: Any) -> AsyncIterator[List[T]]:
+    """Fetch the pages one after the other."""
+    cursor: Any = start
+    while True:
+        items, next_cursor = await fetch(cursor)
+        if items:
+            yield items
+        if __is_last__(items, cursor, next_cursor):
+            return
+        cursor = next_cursor
+
+
+async def async_prefetch_pages(
+    fetch: Callable[[Any], Awaitable[Tuple[List[T], Any]]], start: Any = None, prefetch: int = DEFAULT_PREFETCH
+) -> AsyncIterator[List[T]]:
+    """
+    Iterate over the pages of a paginated endpoint, fetching the next pages in a task of the event loop.
+
+    Parameters
+    ----------
+    fetch: Callable[[Any], Awaitable[Tuple[List[T], Any]]]
+        Coroutine function fetching the page of a cursor, returning the items and the cursor of the next page.
+    start: Any (Default:= None)
+        Cursor of the first page.
+    prefetch: int (Default:= DEFAULT_PREFETCH)
+        Maximum number of pages fetched ahead; the pages are fetched on demand if less than 1.
+
+    Returns
+    -------
+    pages: AsyncIterator[List[T]]
+        Non-empty pages.
+    """
+    if prefetch < 1:
+        async for page in __async_pages__(fetch, start):
+            yield page
+        return
+    buffer: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+    stopped: asyncio.Event = asyncio.Event()
+
+    async def produce() -> None:
+        # The terminal entry is always put, even if a fetch raises a BaseException, e.g., CancelledError, thus the
+        # consumer never waits for a page that will not come. Once the consumer is gone, nothing is put.
+        terminal: Tuple[None, Optional[BaseException]] = (None, None)
+        try:
+            async for page in __async_pages__(fetch, start):
+                await buffer.put((page, None))
+        except BaseException as e:  # pylint: disable=broad-except
+            terminal = (None, e)
+        finally:
+            if not stopped.is_set():
+                await buffer.put(terminal)
+
+    task: asyncio.Task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if error is not None:
+                raise error
+            if page is None:
+                return
+            yield page
+    finally:
+        stopped.set()
+        task.cancel()
@@ -0,0 +1,456 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+This module contains the client-side rate limiters of the transport layer.
+
+The limiters throttle the requests of the sessions with token buckets, one per endpoint class. An endpoint class is
+configured with a `RateLimit`, which matches the URL path of the requests with a glob pattern. A request that finds
+its bucket empty reserves the next token and waits for it, thus requests queue in order instead of failing.
+
+The buckets are stored in a backend:
+    - **LocalRateLimitBackend**: Thread-safe buckets of the process.
+    - **FileRateLimitBackend**: Buckets in a file that is locked for every reservation, shared by all processes of a
+      host, e.g., the workers of a tenant.
+
+Other backends, e.g., a shared cache, implement `RateLimitBackend`.
+
+Examples
+--------
+>>> from knowledge.services.ratelimit import RateLimit, RateLimiter, FileRateLimitBackend
+>>> from knowledge.services.graph import WacomKnowledgeService
+>>> limits = [RateLimit("*/entity/bulk", rate=2.0, burst=4), RateLimit("*/nel/text", rate=10.0)]
+>>> client = WacomKnowledgeService(service_url="https://private-knowledge.wacom.com")
+>>> client.rate_limiter = RateLimiter(limits, FileRateLimitBackend("/tmp/knowledge-rates"), scope="tenant-id")
+"""
+
+import asyncio
+import fnmatch
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+from knowledge import logger
+
+__all__ = [
+    "RateLimit",
+    "RateLimitBackend",
+    "LocalRateLimitBackend",
+    "FileRateLimitBackend",
+    "RateLimiter",
+    "AsyncRateLimiter",
+]
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Rate limit of an endpoint class.
+
+    Attributes
+    ----------
+    pattern: str
+        Glob pattern matching the URL path of the requests, e.g. `*/entity/bulk` or `*/ink-to-*`.
+    rate: float
+        Number of requests per second.
+    burst: int (Default:= 1)
+        Number of requests that can be sent at once after an idle period.
+    methods: Optional[FrozenSet[str]] (Default:= None)
+        HTTP methods of the endpoint class, all methods if None.
+    name: Optional[str] (Default:= None)
+        Name of the endpoint class, which identifies the bucket. The pattern is used if None.
+    """
+
+    pattern: str
+    rate: float
+    burst: int = 1
+    methods: Optional[FrozenSet[str]] = None
+    name: Optional[str] = None
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError("The rate must be positive.")
+        if self.burst < 1:
+            raise ValueError("The burst must be at least 1.")
+        if self.methods is not None:
+            object.__setattr__(self, "methods", frozenset(m.upper() for m in self.methods))
+
+    @property
+    def key(self) -> str:
+        """Name of the bucket of the endpoint class."""
+        return self.name or self.pattern
+
+    def matches(self, method: str, path: str) -> bool:
+        """
+        Check if a request belongs to the endpoint class.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        path: str
+            URL path of the request.
+
+        Returns
+        -------
+        matches: bool
+            True if the request is limited by the rate limit, otherwise False.
+        """
+        if self.methods is not None and method.upper() not in self.methods:
+            return False
+        return fnmatch.fnmatchcase(path, self.pattern)
+
+
+def take_token(state: Optional[Tuple[float, float]], rate: float, burst: float, now: float) -> Tuple[float, float]:
+    """
+    Reserve a token of a bucket.
+
+    Parameters
+    ----------
+    state: Optional[Tuple[float, float]]
+        Tokens and time of the last update of the bucket, a full bucket if None.
+    rate: float
+        Number of tokens added per second.
+    burst: float
+        Capacity of the bucket.
+    now: float
+        Current time in seconds.
+
+    Returns
+    -------
+    state: Tuple[float, float]
+        New tokens and time of the bucket. Negative tokens are reserved by waiting requests.
+    """
+    tokens, updated = state if state is not None else (burst, now)
+    tokens = min(burst, tokens + max(0.0, now - updated) * rate) - 1.0
+    return tokens, now
+
+
+class RateLimitBackend(ABC):
+    """
+    Rate Limit Backend
+    ------------------
+    Storage of the token buckets. Implementations must serialize the reservations of a bucket.
+    """
+
+    @abstractmethod
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        """
+        Reserve the next token of a bucket.
+
+        Parameters
+        ----------
+        key: str
+            Key of the bucket.
+        rate: float
+            Number of tokens added per second.
+        burst: int
+            Capacity of the bucket.
+
+        Returns
+        -------
+        wait: float
+            Time in seconds until the reserved token is available.
+        """
+        raise NotImplementedError
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """
+    Local Rate Limit Backend
+    ------------------------
+    Thread-safe token buckets of the process.
+
+    Parameters
+    ----------
+    clock: Callable[[], float] (Default:= time.monotonic)
+        Clock of the buckets in seconds.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.__clock: Callable[[], float] = clock
+        self.__buckets: Dict[str, Tuple[float, float]] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        with self.__lock:
+            tokens, now = take_token(self.__buckets.get(key), rate, burst, self.__clock())
+            self.__buckets[key] = (tokens, now)
+        return max(0.0, -tokens / rate)
+
+
+class FileRateLimitBackend(RateLimitBackend):
+    """
+    File Rate Limit Backend
+    -----------------------
+    Token buckets stored in a file, which is shared by the processes of a host. The file is locked exclusively while
+    a token is reserved, the buckets use the wall clock as the processes do not share a monotonic clock.
+
+    Parameters
+    ----------
+    path: str
+        Path of the file of the buckets. The file is created if it does not exist.
+    clock: Callable[[], float] (Default:= time.time)
+        Clock of the buckets in seconds.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self.__path: str = path
+        self.__clock: Callable[[], float] = clock
+        # Threads of the process are serialized before they compete for the file lock with other processes
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        """Path of the file of the buckets."""
+        return self.__path
+
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        with self.__lock, open(self.__path, "a+b") as file:
+            FileRateLimitBackend.__lock_file__(file)
+            try:
+                file.seek(0)
+                buckets: Dict[str, List[float]] = FileRateLimitBackend.__read__(file.read())
+                state: Optional[List[float]] = buckets.get(key)
+                tokens, now = take_token(tuple(state) if state else None, rate, burst, self.__clock())
+                buckets[key] = [tokens, now]
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(buckets).encode("utf-8"))
+                file.flush()
+            finally:
+                FileRateLimitBackend.__unlock_file__(file)
+        return max(0.0, -tokens / rate)
+
+    @staticmethod
+    def __read__(content: bytes) -> Dict[str, List[float]]:
+        """Parse the buckets, a damaged file resets the buckets."""
+        if not content:
+            return {}
+        try:
+            return json.loads(content.decode("utf-8"))
+        except ValueError:
+            logger.warning("The file of the rate limit buckets is damaged, the buckets are reset.")
+            return {}
+
+    @staticmethod
+    def __lock_file__(file: Any) -> None:
+        """Lock the file exclusively, waiting for other processes."""
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    return
+                except OSError:
+                    continue
+
+    @staticmethod
+    def __unlock_file__(file: Any) -> None:
+        """Release the lock of the file."""
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class BaseRateLimiter:
+    """
+    Base Rate Limiter
+    -----------------
+    Matches the requests with the rate limits and reserves the tokens in the backend.
+
+    Parameters
+    ----------
+    limits: Iterable[RateLimit]
+        Rate limits of the endpoint classes. The first matching limit applies to a request, requests without a
+        matching limit are not throttled.
+    backend: Optional[RateLimitBackend] (Default:= None)
+        Storage of the token buckets, `LocalRateLimitBackend` if None.
+    scope: str (Default:= "default")
+        Scope of the buckets, e.g., the tenant id. Limiters with the same scope and backend share the buckets.
+    """
+
+    def __init__(self, limits: Iterable[RateLimit], backend: Optional[RateLimitBackend] = None, scope: str = "default"):
+        self.__limits: Tuple[RateLimit, ...] = tuple(limits)
+        self.__backend: RateLimitBackend = backend or LocalRateLimitBackend()
+        self.__scope: str = scope
+        self.__counter_lock: threading.Lock = threading.Lock()
+        self.__waiting: int = 0
+        self.__throttled: int = 0
+
+    @property
+    def limits(self) -> Tuple[RateLimit, ...]:
+        """Rate limits of the endpoint classes."""
+        return self.__limits
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        """Storage of the token buckets."""
+        return self.__backend
+
+    @property
+    def scope(self) -> str:
+        """Scope of the buckets."""
+        return self.__scope
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a token."""
+        return self.__waiting
+
+    @property
+    def throttled(self) -> int:
+        """Number of requests that waited for a token."""
+        return self.__throttled
+
+    def match(self, method: str, url: str) -> Optional[RateLimit]:
+        """
+        Rate limit of a request.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        url: str
+            URL of the request.
+
+        Returns
+        -------
+        limit: Optional[RateLimit]
+            First matching rate limit, None if the request is not throttled.
+        """
+        if not self.__limits:
+            return None
+        path: str = urlsplit(url).path
+        for limit in self.__limits:
+            if limit.matches(method, path):
+                return limit
+        return None
+
+    def reserve(self, method: str, url: str) -> float:
+        """
+        Reserve a token for a request.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        url: str
+            URL of the request.
+
+        Returns
+        -------
+        wait: float
+            Time in seconds until the request can be sent.
+        """
+        limit: Optional[RateLimit] = self.match(method, url)
+        if limit is None:
+            return 0.0
+        return self.__backend.reserve(f"{self.__scope}/{limit.key}", limit.rate, limit.burst)
+
+    def __waiting__(self, delta: int) -> None:
+        """Track the number of waiting requests."""
+        with self.__counter_lock:
+            self.__waiting += delta
+            if delta > 0:
+                self.__throttled += 1
+
+
+class RateLimiter(BaseRateLimiter):
+    """
+    Rate Limiter
+    ------------
+    Thread-safe rate limiter for `RequestsSession`.
+
+    Parameters
+    ----------
+    limits: Iterable[RateLimit]
+        Rate limits of the endpoint classes. The first matching limit applies to a request, requests without a
+        matching limit are not throttled.
+    backend: Optional[RateLimitBackend] (Default:= None)
+        Storage of the token buckets, `LocalRateLimitBackend` if None.
+    scope: str (Default:= "default")
+        Scope of the buckets, e.g., the tenant id. Limiters with the same scope and backend share the buckets.
+    """
+
+    def acquire(self, method: str, url: str) -> float:
+        """
+        Wait until a request can be sent.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        url: str
+            URL of the request.
+
+        Returns
+        -------
+        wait: float
+            Time in seconds the request waited.
+        """
+        wait: float = self.reserve(method, url)
+        if wait > 0:
+            self.__waiting__(1)
+            try:
+                time.sleep(wait)
+            finally:
+                self.__waiting__(-1)
+        return wait
+
+
+class AsyncRateLimiter(BaseRateLimiter):
+    """
+    Async Rate Limiter
+    ------------------
+    Rate limiter for `AsyncSession`. The reservations of the `FileRateLimitBackend` block the event loop while the
+    file is locked, which is short compared to a request.
+
+    Parameters
+    ----------
+    limits: Iterable[RateLimit]
+        Rate limits of the endpoint classes. The first matching limit applies to a request, requests without a
+        matching limit are not throttled.
+    backend: Optional[RateLimitBackend] (Default:= None)
+        Storage of the token buckets, `LocalRateLimitBackend` if None.
+    scope: str (Default:= "default")
+        Scope of the buckets, e.g., the tenant id. Limiters with the same scope and backend share the buckets.
+    """
+
+    async def acquire(self, method: str, url: str) -> float:
+        """
+        Wait until a request can be sent.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        url: str
+            URL of the request.
+
+        Returns
+        -------
+        wait: float
+            Time in seconds the request waited.
+        """
+        wait: float = self.reserve(method, url)
+        if wait > 0:
+            self.__waiting__(1)
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self.__waiting__(-1)
+        return wait
@@ -13,12 +13,14 @@ There are three types of sessions:
         re-login when the refresh token expires.
 """
 
+import asyncio
 import hashlib
 import logging
+import math
 import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Union, Optional, Dict, Any
+from typing import Union, Optional, Dict, Any, Tuple, List, Callable, Awaitable
 
 import jwt
 
@@ -28,10 +30,19 @@ __all__ = [
     "RefreshableSession",
     "PermanentSession",
     "TokenManager",
+    "DEFAULT_REFRESH_LEAD_TIME",
+    "DEFAULT_REFRESH_INTERVAL",
 ]
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+DEFAULT_REFRESH_LEAD_TIME: float = 300.0
+"""Seconds ahead of the expiry of a token the background refresher renews it."""
+DEFAULT_REFRESH_INTERVAL: float = 30.0
+"""Maximum seconds between two checks of the background refresher."""
+MIN_REFRESH_INTERVAL: float = 0.1
+"""Minimum seconds between two checks of the background refresher."""
+
 
 class Session(ABC):
     """
@@ -432,6 +443,13 @@ class TokenManager:
     operations for adding, retrieving, removing, and maintaining sessions. It also
     includes utilities for cleaning up expired sessions.
 
+    Token refreshes are single-flight per session id: the clients hold the refresh lock of the session while
+    refreshing, so concurrent callers wait for the running refresh and reuse its result instead of refreshing again.
+
+    Optionally, a background refresher (a daemon thread, or a task of the event loop) renews the tokens of the
+    refreshable sessions ahead of their expiry. While it is running, the clients read the current token without
+    expiry checks or locks.
+
     Attributes
     ----------
     sessions : Dict[str, Union[TimedSession, RefreshableSession, PermanentSession]]
@@ -441,6 +459,12 @@ class TokenManager:
     def __init__(self) -> None:
         self.sessions: Dict[str, Union[TimedSession, RefreshableSession, PermanentSession]] = {}
         self.__lock: threading.Lock = threading.Lock()
+        self.__refresh_locks: Dict[str, threading.Lock] = {}
+        self.__async_refresh_locks: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+        self.__refresher_running: bool = False
+        self.__refresher_thread: Optional[threading.Thread] = None
+        self.__refresher_stop: Optional[threading.Event] = None
+        self.__refresher_task: Optional[asyncio.Task] = None
 
     def add_session(
         self,
@@ -510,8 +534,8 @@ class TokenManager:
         session: Union[RefreshableSession, TimedSession, PermanentSession]
             Depending on the session type, the session is returned.
         """
-        with self.__lock:
-            return self.sessions.get(session_id)
+        # Reading a single key of the dictionary is atomic, the lock is only needed for compound updates
+        return self.sessions.get(session_id)
 
     def remove_session(self, session_id: str) -> None:
         """
@@ -525,6 +549,51 @@ class TokenManager:
         with self.__lock:
             if session_id in self.sessions:
                 del self.sessions[session_id]
+            self.__refresh_locks.pop(session_id, None)
+            self.__async_refresh_locks.pop(session_id, None)
+
+    def refresh_lock(self, session_id: str) -> threading.Lock:
+        """
+        Lock for refreshing the token of a session from threads.
+
+        Parameters
+        ----------
+        session_id: str
+            Session id.
+
+        Returns
+        -------
+        lock: threading.Lock
+            Refresh lock of the session.
+        """
+        with self.__lock:
+            lock: Optional[threading.Lock] = self.__refresh_locks.get(session_id)
+            if lock is None:
+                lock = threading.Lock()
+                self.__refresh_locks[session_id] = lock
+            return lock
+
+    def async_refresh_lock(self, session_id: str) -> asyncio.Lock:
+        """
+        Lock for refreshing the token of a session from coroutines of the running event loop.
+
+        Parameters
+        ----------
+        session_id: str
+            Session id.
+
+        Returns
+        -------
+        lock: asyncio.Lock
+            Refresh lock of the session, bound to the running event loop.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        with self.__lock:
+            entry: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = self.__async_refresh_locks.get(session_id)
+            if entry is None or entry[0] is not loop:
+                entry = (loop, asyncio.Lock())
+                self.__async_refresh_locks[session_id] = entry
+            return entry[1]
 
     def has_session(self, session_id: str) -> bool:
         """
@@ -556,6 +625,8 @@ class TokenManager:
             expired_ids = [sid for sid, session in self.sessions.items() if session.expired and not session.refreshable]
             for sid in expired_ids:
                 del self.sessions[sid]
+                self.__refresh_locks.pop(sid, None)
+                self.__async_refresh_locks.pop(sid, None)
             return len(expired_ids)
 
     @property
@@ -563,3 +634,183 @@ class TokenManager:
         """Number of active sessions."""
         with self.__lock:
             return len(self.sessions)
+
+    # ----- Background refresher -----
+
+    @property
+    def refresher_running(self) -> bool:
+        """Is the background refresher renewing the tokens?"""
+        return self.__refresher_running
+
+    def refreshable_sessions(self) -> List[RefreshableSession]:
+        """
+        Sessions with a refresh token.
+
+        Returns
+        -------
+        sessions: List[RefreshableSession]
+            Snapshot of the refreshable and permanent sessions.
+        """
+        with self.__lock:
+            return [s for s in self.sessions.values() if isinstance(s, RefreshableSession) and s.refreshable]
+
+    def __due_sessions__(self, lead_time: float) -> Tuple[List[RefreshableSession], float]:
+        """
+        Sessions with a token expiring within the lead time, and seconds until the next session is due.
+        """
+        due: List[RefreshableSession] = []
+        wait: float = math.inf
+        for session in self.refreshable_sessions():
+            remaining: float = session.expires_in - lead_time
+            if remaining <= 0.0:
+                due.append(session)
+            else:
+                wait = min(wait, remaining)
+        return due, wait
+
+    @staticmethod
+    def __next_wait__(wait: float, interval: float) -> float:
+        """Seconds until the next check of the background refresher."""
+        return max(MIN_REFRESH_INTERVAL, min(wait, interval))
+
+    def start_refresher(
+        self,
+        refresh: Callable[[RefreshableSession], Any],
+        lead_time: float = DEFAULT_REFRESH_LEAD_TIME,
+        interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> None:
+        """
+        Start the background refresher in a daemon thread.
+
+        Parameters
+        ----------
+        refresh: Callable[[RefreshableSession], Any]
+            Function refreshing the token of a session.
+        lead_time: float [default:= DEFAULT_REFRESH_LEAD_TIME]
+            Seconds ahead of the expiry of a token the token is renewed.
+        interval: float [default:= DEFAULT_REFRESH_INTERVAL]
+            Maximum seconds between two checks. Failed refreshes are retried after this interval.
+
+        Raises
+        ------
+        RuntimeError
+            If a background refresher is already running.
+        """
+        with self.__lock:
+            if self.__refresher_running:
+                raise RuntimeError("The background refresher is already running.")
+            stop: threading.Event = threading.Event()
+            self.__refresher_stop = stop
+            self.__refresher_thread = threading.Thread(
+                target=self.__refresher_loop__,
+                args=(refresh, lead_time, interval, stop),
+                name="TokenRefresher",
+                daemon=True,
+            )
+            self.__refresher_running = True
+        self.__refresher_thread.start()
+
+    def stop_refresher(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background refresher thread.
+
+        Parameters
+        ----------
+        timeout: Optional[float] [default:= None]
+            Seconds to wait for a running refresh to finish.
+        """
+        with self.__lock:
+            thread: Optional[threading.Thread] = self.__refresher_thread
+            if self.__refresher_stop is not None:
+                self.__refresher_stop.set()
+            self.__refresher_thread = None
+            self.__refresher_stop = None
+            if self.__refresher_task is None:
+                self.__refresher_running = False
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def __refresher_loop__(
+        self, refresh: Callable[[RefreshableSession], Any], lead_time: float, interval: float, stop: threading.Event
+    ) -> None:
+        """Loop of the background refresher thread."""
+        while not stop.is_set():
+            due, _ = self.__due_sessions__(lead_time)
+            for session in due:
+                try:
+                    refresh(session)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"Background refresh of session {session.id} failed: {e}")
+            # Sessions failing to refresh are still due, they are retried after the interval
+            _, wait = self.__due_sessions__(lead_time)
+            stop.wait(self.__next_wait__(wait, interval))
+
+    def start_async_refresher(
+        self,
+        refresh: Callable[[RefreshableSession], Awaitable[Any]],
+        lead_time: float = DEFAULT_REFRESH_LEAD_TIME,
+        interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> asyncio.Task:
+        """
+        Start the background refresher as a task of the running event loop.
+
+        Parameters
+        ----------
+        refresh: Callable[[RefreshableSession], Awaitable[Any]]
+            Coroutine function refreshing the token of a session.
+        lead_time: float [default:= DEFAULT_REFRESH_LEAD_TIME]
+            Seconds ahead of the expiry of a token the token is renewed.
+        interval: float [default:= DEFAULT_REFRESH_INTERVAL]
+            Maximum seconds between two checks. Failed refreshes are retried after this interval.
+
+        Returns
+        -------
+        task: asyncio.Task
+            Task of the background refresher.
+
+        Raises
+        ------
+        RuntimeError
+            If a background refresher is already running.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        with self.__lock:
+            if self.__refresher_running:
+                raise RuntimeError("The background refresher is already running.")
+            task: asyncio.Task = loop.create_task(
+                self.__async_refresher_loop__(refresh, lead_time, interval), name="TokenRefresher"
+            )
+            self.__refresher_task = task
+            self.__refresher_running = True
+        return task
+
+    async def stop_async_refresher(self) -> None:
+        """Stop the background refresher task and wait for it to finish."""
+        with self.__lock:
+            task: Optional[asyncio.Task] = self.__refresher_task
+            self.__refresher_task = None
+            if self.__refresher_thread is None:
+                self.__refresher_running = False
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def __async_refresher_loop__(
+        self, refresh: Callable[[RefreshableSession], Awaitable[Any]], lead_time: float, interval: float
+    ) -> None:
+        """Loop of the background refresher task."""
+        while True:
+            due, _ = self.__due_sessions__(lead_time)
+            for session in due:
+                try:
+                    await refresh(session)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"Background refresh of session {session.id} failed: {e}")
+            # Sessions failing to refresh are still due, they are retried after the interval
+            _, wait = self.__due_sessions__(lead_time)
+            await asyncio.sleep(self.__next_wait__(wait, interval))
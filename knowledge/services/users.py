@@ -2,7 +2,7 @@
 # Copyright © 2021-present Wacom. All rights reserved.
 import enum
 from datetime import datetime
-from typing import Any, Union, Dict, List, Tuple, Optional
+from typing import Any, Union, Dict, Iterator, List, Tuple, Optional
 
 from requests import Response
 
@@ -13,6 +13,7 @@ from knowledge.services import (
     DEFAULT_BACKOFF_FACTOR,
 )
 from knowledge.services.base import WacomServiceAPIClient, handle_error
+from knowledge.services.pagination import DEFAULT_PREFETCH, offset_cursor, prefetch_pages
 
 # -------------------------------------- Constant flags ----------------------------------------------------------------
 TENANT_ID: str = "tenantId"
@@ -460,6 +461,40 @@ class UserManagementServiceAPI(WacomServiceAPIClient):
             return results
         raise handle_error("Listing of users failed.", response)
 
+    def listing_users_iter(
+        self,
+        tenant_key: str,
+        limit: int = 20,
+        prefetch: int = DEFAULT_PREFETCH,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> Iterator[User]:
+        """
+        Iterate over all users configured for this instance, fetching the next pages ahead.
+
+        Parameters
+        ----------
+        tenant_key: str
+            An API key for tenant
+        limit: int - [optional]
+            Define the size of the pages. [DEFAULT:= 20]
+        prefetch: int - [optional]
+            Maximum number of pages fetched ahead, the pages are fetched on demand if 0. [DEFAULT:= 2]
+        timeout: int - [optional]
+            Timeout for the request. [DEFAULT:= 60]
+
+        Returns
+        -------
+        users: Iterator[User]
+            Users of the tenant.
+        """
+
+        def fetch(offset: int) -> Tuple[List[User], Optional[int]]:
+            users: List[User] = self.listing_users(tenant_key, offset=offset, limit=limit, timeout=timeout)
+            return users, offset_cursor(offset, limit, users)
+
+        for users in prefetch_pages(fetch, start=0, prefetch=prefetch):
+            yield from users
+
 
 __all__ = [
     "UserRole",
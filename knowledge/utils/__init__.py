@@ -2,9 +2,10 @@
 # Copyright © 2024-present Wacom. All rights reserved.
 """ "Utilities"""
 
-__all__ = ["import_format", "graph", "wikidata", "wikipedia"]
+__all__ = ["import_format", "graph", "importer", "wikidata", "wikipedia"]
 
 from knowledge.utils import import_format
 from knowledge.utils import graph
+from knowledge.utils import importer
 from knowledge.utils import wikidata
 from knowledge.utils import wikipedia
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright © 2024-present Wacom. All rights reserved.
 import asyncio
-from typing import Optional, Iterator, Tuple, AsyncIterator
+from typing import Any, Awaitable, Callable, List, Optional, Iterator, Tuple, AsyncIterator
 
 import loguru
 
@@ -9,6 +9,7 @@ from knowledge.base.language import LocaleCode
 from knowledge.base.ontology import OntologyClassReference, ThingObject
 from knowledge.services.asyncio.graph import AsyncWacomKnowledgeService
 from knowledge.services.graph import WacomKnowledgeService, Visibility
+from knowledge.services.pagination import DEFAULT_PREFETCH, async_prefetch_pages, prefetch_pages
 
 logger = loguru.logger
 
@@ -18,11 +19,13 @@ __all__ = [
     "count_things_session",
     "things_session_iter",
     "things_iter",
+    "search_iter",
     # Async functions
     "async_count_things",
     "async_count_things_session",
     "async_things_iter",
     "async_things_session_iter",
+    "async_search_iter",
 ]
 
 
@@ -115,9 +118,11 @@ def things_session_iter(
     include_relations: Optional[bool] = None,
     fetch_size: int = 100,
     force_refresh_timeout: int = 360,
+    prefetch: int = DEFAULT_PREFETCH,
 ) -> Iterator[ThingObject]:
     """
-    Iterates over all things using the current session configured for a client.
+    Iterates over all things using the current session configured for a client. The next pages are fetched in a
+    background thread while the current one is consumed.
 
     Parameters
     ----------
@@ -137,6 +142,8 @@ def things_session_iter(
         Fetch size.
     force_refresh_timeout: int [default:= 360]
         Force refresh timeout
+    prefetch: int [default:= DEFAULT_PREFETCH]
+        Maximum number of pages fetched ahead, no read-ahead if 0.
 
     Yields
     -------
@@ -148,22 +155,22 @@ def things_session_iter(
     ValueError
         If no session is configured for a client
     """
-    next_page_id: Optional[str] = None
     if wacom_client.current_session is None:
         raise ValueError("No session configured for client")
-    while True:
-        # Refresh token if needed
+
+    def fetch(page_id: Optional[str]) -> Tuple[List[ThingObject], str]:
         things, _, next_page_id = wacom_client.listing(
             concept_type,
             visibility=visibility,
             locale=locale,
             is_owner=only_own,
             limit=fetch_size,
-            page_id=next_page_id,
+            page_id=page_id,
             include_relations=include_relations,
         )
-        if len(things) == 0:
-            return
+        return things, next_page_id
+
+    for things in prefetch_pages(fetch, prefetch=prefetch):
         for obj in things:
             # Refresh token if needed
             wacom_client.handle_token(force_refresh_timeout=force_refresh_timeout)
@@ -183,6 +190,7 @@ def things_iter(
     force_refresh_timeout: int = 360,
     tenant_api_key: Optional[str] = None,
     external_user_id: Optional[str] = None,
+    prefetch: int = DEFAULT_PREFETCH,
 ) -> Iterator[Tuple[ThingObject, str, str]]:
     """
     Iterates over all things.
@@ -213,6 +221,8 @@ def things_iter(
         The tenant API key
     external_user_id: Optional[str] [default:= None]
         The external user ID
+    prefetch: int [default:= DEFAULT_PREFETCH]
+        Maximum number of pages fetched ahead, no read-ahead if 0.
 
     Yields
     -------
@@ -223,31 +233,70 @@ def things_iter(
     refresh_token: str
         The refresh token
     """
-    next_page_id: Optional[str] = None
     if tenant_api_key is not None and external_user_id is not None:
         # First login
         wacom_client.login(tenant_api_key=tenant_api_key, external_user_id=external_user_id)
     else:
         wacom_client.register_token(user_token, refresh_token)
-    while True:
-        # Refresh token if needed
+
+    def fetch(page_id: Optional[str]) -> Tuple[List[ThingObject], str]:
         things, _, next_page_id = wacom_client.listing(
             concept_type,
             visibility=visibility,
             locale=locale,
             is_owner=only_own,
             limit=fetch_size,
-            page_id=next_page_id,
+            page_id=page_id,
             include_relations=include_relations,
         )
-        if len(things) == 0:
-            return
+        return things, next_page_id
+
+    for things in prefetch_pages(fetch, prefetch=prefetch):
         for obj in things:
             # Refresh token if needed
             wacom_client.handle_token(force_refresh_timeout=force_refresh_timeout)
             yield obj, user_token, refresh_token
 
 
+def search_iter(
+    search: Callable[..., Tuple[List[ThingObject], str]],
+    *args: Any,
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: Any,
+) -> Iterator[ThingObject]:
+    """
+    Iterates over all results of a search, e.g., `WacomKnowledgeService.search_labels`. The next pages are fetched in a
+    background thread while the current one is consumed.
+
+    Parameters
+    ----------
+    search: Callable[..., Tuple[List[ThingObject], str]]
+        Search method of the client, with the `next_page_id` parameter
+    args: Any
+        Positional arguments of the search
+    prefetch: int [default:= DEFAULT_PREFETCH]
+        Maximum number of pages fetched ahead, no read-ahead if 0.
+    kwargs: Any
+        Keyword arguments of the search, e.g., the page size `limit`
+
+    Yields
+    -------
+    ThingObject
+        Next result
+
+    Examples
+    --------
+    >>> for thing in search_iter(client.search_labels, "Leonardo", EN_US, limit=50):
+    ...     print(thing.uri)
+    """
+
+    def fetch(page_id: Optional[str]) -> Tuple[List[ThingObject], str]:
+        return search(*args, next_page_id=page_id, **kwargs)
+
+    for results in prefetch_pages(fetch, prefetch=prefetch):
+        yield from results
+
+
 async def async_count_things(
     async_client: AsyncWacomKnowledgeService,
     user_token: str,
@@ -343,6 +392,7 @@ async def async_things_iter(
     force_refresh_timeout: int = 360,
     tenant_api_key: Optional[str] = None,
     external_user_id: Optional[str] = None,
+    prefetch: int = DEFAULT_PREFETCH,
 ) -> AsyncIterator[Tuple[ThingObject, str, str]]:
     """
     Generates an asynchronous iterator that retrieves and yields objects along with user and refresh tokens.
@@ -373,30 +423,33 @@ async def async_things_iter(
         The tenant-specific API key for the user’s organization.
     external_user_id : Optional[str], optional
         The external identifier for the user in the tenant's system.
+    prefetch : int, optional
+        The maximum number of pages fetched ahead while the current one is consumed, no read-ahead if 0.
 
     Returns
     -------
     AsyncIterator[Tuple[ThingObject, str, str]]
         An asynchronous iterator yielding retrieved objects, the updated user token, and the refresh token.
     """
-    next_page_id: Optional[str] = None
     if tenant_api_key is not None and external_user_id is not None:
         # First login
         await async_client.login(tenant_api_key=tenant_api_key, external_user_id=external_user_id)
     else:
         await async_client.register_token(user_token, refresh_token)
-    while True:
+
+    async def fetch(page_id: Optional[str]) -> Tuple[List[ThingObject], str]:
         things, _, next_page_id = await async_client.listing(
             concept_type,
             visibility=visibility,
             locale=locale,
             is_owner=only_own,
             limit=fetch_size,
-            page_id=next_page_id,
+            page_id=page_id,
             include_relations=include_relations,
         )
-        if len(things) == 0:
-            return
+        return things, next_page_id
+
+    async for things in async_prefetch_pages(fetch, prefetch=prefetch):
         for obj in things:
             user_token, refresh_token = await async_client.handle_token(force_refresh_timeout=force_refresh_timeout)
             yield obj, user_token, refresh_token
@@ -411,9 +464,11 @@ async def async_things_session_iter(
     include_relations: Optional[bool] = None,
     fetch_size: int = 100,
     force_refresh_timeout: int = 360,
+    prefetch: int = DEFAULT_PREFETCH,
 ) -> AsyncIterator[ThingObject]:
     """
-    Asynchronous iterator over all things of a given type using session.
+    Asynchronous iterator over all things of a given type using session. The next pages are fetched in a separate
+    task while the current one is consumed.
 
     Parameters
     ----------
@@ -433,33 +488,71 @@ async def async_things_session_iter(
         Fetch size.
     force_refresh_timeout: int [default:= 360]
         Force refresh timeout
+    prefetch: int [default:= DEFAULT_PREFETCH]
+        Maximum number of pages fetched ahead, no read-ahead if 0.
 
     Yields
     -------
     ThingObject
         Next thing object
     """
-    next_page_id: Optional[str] = None
     if async_client.current_session is None:
         raise ValueError("No session configured for client")
 
-    while True:
-        try:
-            things, _, next_page_id = await async_client.listing(
-                concept_type,
-                visibility=visibility,
-                is_owner=only_own,
-                locale=locale,
-                limit=fetch_size,
-                page_id=next_page_id,
-                include_relations=include_relations,
-            )
-            if len(things) == 0:
-                return
-            for obj in things:
-                await async_client.handle_token(force_refresh_timeout=force_refresh_timeout)
-                if obj.owner or not only_own:
-                    yield obj
-        except TimeoutError as e:
-            logger.error(f"Timeout error while fetching things: {e}")
-            await asyncio.sleep(2)  # Wait before retrying
+    async def fetch(page_id: Optional[str]) -> Tuple[List[ThingObject], str]:
+        while True:
+            try:
+                things, _, next_page_id = await async_client.listing(
+                    concept_type,
+                    visibility=visibility,
+                    is_owner=only_own,
+                    locale=locale,
+                    limit=fetch_size,
+                    page_id=page_id,
+                    include_relations=include_relations,
+                )
+                return things, next_page_id
+            except TimeoutError as e:
+                logger.error(f"Timeout error while fetching things: {e}")
+                await asyncio.sleep(2)  # Wait before retrying
+
+    async for things in async_prefetch_pages(fetch, prefetch=prefetch):
+        for obj in things:
+            await async_client.handle_token(force_refresh_timeout=force_refresh_timeout)
+            if obj.owner or not only_own:
+                yield obj
+
+
+async def async_search_iter(
+    search: Callable[..., Awaitable[Tuple[List[ThingObject], str]]],
+    *args: Any,
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: Any,
+) -> AsyncIterator[ThingObject]:
+    """
+    Asynchronous iterator over all results of a search, e.g., `AsyncWacomKnowledgeService.search_labels`. The next
+    pages are fetched in a separate task while the current one is consumed.
+
+    Parameters
+    ----------
+    search: Callable[..., Awaitable[Tuple[List[ThingObject], str]]]
+        Search method of the asynchronous client, with the `next_page_id` parameter
+    args: Any
+        Positional arguments of the search
+    prefetch: int [default:= DEFAULT_PREFETCH]
+        Maximum number of pages fetched ahead, no read-ahead if 0.
+    kwargs: Any
+        Keyword arguments of the search, e.g., the page size `limit`
+
+    Yields
+    -------
+    ThingObject
+        Next result
+    """
+
+    async def fetch(page_id: Optional[str]) -> Tuple[List[ThingObject], str]:
+        return await search(*args, next_page_id=page_id, **kwargs)
+
+    async for results in async_prefetch_pages(fetch, prefetch=prefetch):
+        for thing in results:
+            yield thing
@@ -6,11 +6,14 @@ import re
 import uuid
 from json import JSONDecodeError
 from pathlib import Path
-from typing import List, Dict, Any, Iterable
+from typing import List, Dict, Any, Iterable, Optional
 
 import loguru
 
-from knowledge.base.ontology import ThingObject, OntologyPropertyReference
+from knowledge.base.entity import IMAGE_TAG, INCOMING_TAG, OBJECT_PROPERTIES_TAG, OUTGOING_TAG, RELATION_TAG
+from knowledge.base.frame import EntityFrame
+from knowledge.base.ontology import ThingObject
+from knowledge.services.helper import import_format_bytes
 
 logger = loguru.logger
 
@@ -19,6 +22,7 @@ __all__ = [
     "is_local_url",
     "iterate_large_import_format",
     "load_import_format",
+    "load_import_format_frame",
     "save_import_format",
     "append_import_format",
 ]
@@ -54,6 +58,58 @@ def is_local_url(url: str) -> bool:
     return bool(re.match(r"^(file://|/|\.{1,2}/)", url, re.IGNORECASE))
 
 
+def __import_format_to_dict__(line: str, raise_on_error: bool = False) -> Dict[str, Any]:
+    """
+    Convert a line of JSON to a normalized entity dict (see `ThingObject.__normalize_import_dict__`), as accepted by
+    `EntityFrame.append_dict`, without creating a ThingObject. Local image paths are converted to file URIs, and
+    relations without incoming or outgoing targets are removed.
+
+    Parameters
+    ----------
+    line: str
+        The line of JSON to convert.
+    raise_on_error: bool (default:= False)
+        Whether to raise an error if the dict contains unsupported locales, if there is a mismatch in source
+        reference id or source system, if the image path does not exist, or if a relation has no targets.
+        If False, the errors will be logged.
+
+    Returns
+    -------
+    entity: Dict[str, Any]
+        The normalized entity dict.
+
+    Raises
+    ------
+    JSONDecodeError
+        If the line is not valid JSON.
+    ValueError
+        Raised if the line contains unsupported locales or if there is a mismatch in source reference id or
+        source system.
+    """
+    entity: Dict[str, Any] = ThingObject.__normalize_import_dict__(json.loads(line), raise_on_error=raise_on_error)
+    image: Optional[str] = entity[IMAGE_TAG]
+    if image and not is_local_url(image) and not is_http_url(image):
+        path: Path = Path(image)
+        if path.exists():
+            entity[IMAGE_TAG] = path.absolute().as_uri()
+        else:
+            if raise_on_error:
+                raise ValueError(f"Image path {path} does not exist.")
+            logger.error(f"Image path {path} does not exist. Setting to None.")
+            entity[IMAGE_TAG] = None
+    relations: List[Dict[str, Any]] = []
+    # Remove empty properties
+    for relation in entity[OBJECT_PROPERTIES_TAG]:
+        if len(relation.get(INCOMING_TAG, [])) == 0 and len(relation.get(OUTGOING_TAG, [])) == 0:
+            if raise_on_error:
+                raise ValueError(f"Property {relation[RELATION_TAG]} has no incoming or outgoing relations.")
+            logger.warning(f"Property {relation[RELATION_TAG]} has no incoming or outgoing relations. Removing.")
+        else:
+            relations.append(relation)
+    entity[OBJECT_PROPERTIES_TAG] = relations
+    return entity
+
+
 def __import_format_to_thing__(line: str, raise_on_error: bool = False) -> ThingObject:
     """
     Convert a line of JSON to a ThingObject.
@@ -80,29 +136,21 @@ def __import_format_to_thing__(line: str, raise_on_error: bool = False) -> Thing
         Raised if the line contains unsupported locales or if there is a mismatch in source reference id or
         source system.
     """
-    thing_dict: Dict[str, Any] = json.loads(line)
-    entity: ThingObject = ThingObject.from_import_dict(thing_dict, raise_on_error=raise_on_error)
-    if entity.image:
-        if not is_local_url(entity.image) and not is_http_url(entity.image):
-            path: Path = Path(entity.image)
-            if path.exists():
-                entity.image = path.absolute().as_uri()
-            else:
-                if raise_on_error:
-                    raise ValueError(f"Image path {path} does not exist.")
-                logger.error(f"Image path {path} does not exist. Setting to None.")
-                entity.image = None
-    remove_props: List[OntologyPropertyReference] = []
-    # Remove empty properties
-    for obj_prop, value in entity.object_properties.items():
-        if len(value.incoming_relations) == 0 and len(value.outgoing_relations) == 0:
-            if raise_on_error:
-                raise ValueError(f"Property {obj_prop} has no incoming or outgoing relations.")
-            logger.warning(f"Property {obj_prop} has no incoming or outgoing relations. Removing.")
-            remove_props.append(obj_prop)
-    for prop in remove_props:
-        del entity.object_properties[prop]
-    return entity
+    return ThingObject.__from_normalized_import_dict__(__import_format_to_dict__(line, raise_on_error=raise_on_error))
+
+
+def __import_format_lines__(file_path: Path) -> Iterable[str]:
+    """Iterates over the lines of a gzip-compressed or ndjson import format file."""
+    if not file_path.exists():
+        raise FileNotFoundError(f"File {file_path} does not exist.")
+    if file_path.suffix.lower() == ".gz":
+        with gzip.open(file_path, "rt", encoding="utf-8") as f_gz:
+            yield from f_gz
+    elif file_path.suffix.lower() == ".ndjson":
+        with file_path.open("r", encoding="utf-8") as f:
+            yield from f
+    else:
+        raise ValueError(f"Unsupported file format: {file_path.suffix}")
 
 
 def iterate_large_import_format(file_path: Path, raise_on_error: bool = False) -> Iterable[ThingObject]:
@@ -133,18 +181,8 @@ def iterate_large_import_format(file_path: Path, raise_on_error: bool = False) -
     ValueError
         If the file format is not supported.
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File {file_path} does not exist.")
-    if file_path.suffix.lower() == ".gz":
-        with gzip.open(file_path, "rt", encoding="utf-8") as f_gz:
-            for line in f_gz:
-                yield __import_format_to_thing__(line, raise_on_error=raise_on_error)
-    elif file_path.suffix.lower() == ".ndjson":
-        with file_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                yield __import_format_to_thing__(line, raise_on_error=raise_on_error)
-    else:
-        raise ValueError(f"Unsupported file format: {file_path.suffix}")
+    for line in __import_format_lines__(file_path):
+        yield __import_format_to_thing__(line, raise_on_error=raise_on_error)
 
 
 def load_import_format(file_path: Path, raise_on_error: bool = True) -> List[ThingObject]:
@@ -207,6 +245,36 @@ def load_import_format(file_path: Path, raise_on_error: bool = True) -> List[Thi
     return cached_entities
 
 
+def load_import_format_frame(file_path: Path, raise_on_error: bool = False) -> EntityFrame:
+    """
+    Load the import format file into a columnar frame. The entity dicts are appended one at a time, without creating
+    ThingObjects.
+
+    Parameters
+    ----------
+    file_path:  Path
+        The path to the file (gzip-compressed or ndjson).
+    raise_on_error: bool (default:= False)
+        Whether to raise an error if the dict contains unsupported locales or if there is a mismatch in source.
+
+    Returns
+    -------
+    frame: EntityFrame
+        The frame with the entities.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file format is not supported.
+    """
+    frame: EntityFrame = EntityFrame()
+    for line in __import_format_lines__(file_path):
+        frame.append_dict(__import_format_to_dict__(line, raise_on_error=raise_on_error))
+    return frame
+
+
 def save_import_format(
     file_path: Path,
     entities: List[ThingObject],
@@ -228,24 +296,19 @@ def save_import_format(
     """
     # Create the directory if it does not exist
     file_path.parent.mkdir(parents=True, exist_ok=True)
+    group_ids: Optional[List[str]] = None if save_groups else []
     if file_path.suffix.lower() == ".gz":
-        with gzip.open(file_path, "wt", encoding="utf-8") as fp_thing:
+        with gzip.open(file_path, "wb") as fp_thing:
             for entity in entities:
                 if generate_missing_ref_ids and entity.default_source_reference_id() is None:
                     entity.reference_id = str(uuid.uuid4())
-                if save_groups:
-                    fp_thing.write(f"{json.dumps(entity.__import_format_dict__(), ensure_ascii=False)}\n")
-                else:
-                    fp_thing.write(f"{json.dumps(entity.__import_format_dict__(group_ids=[]), ensure_ascii=False)}\n")
+                fp_thing.write(import_format_bytes(entity, group_ids=group_ids))
     elif file_path.suffix == ".ndjson":
-        with file_path.open("w", encoding="utf-8") as fp_thing:
+        with file_path.open("wb") as fp_thing:
             for entity in entities:
                 if generate_missing_ref_ids and entity.default_source_reference_id() is None:
                     entity.reference_id = str(uuid.uuid4())
-                if save_groups:
-                    fp_thing.write(f"{json.dumps(entity.__import_format_dict__(), ensure_ascii=False)}\n")
-                else:
-                    fp_thing.write(f"{json.dumps(entity.__import_format_dict__(group_ids=[]), ensure_ascii=False)}\n")
+                fp_thing.write(import_format_bytes(entity, group_ids=group_ids))
 
 
 def append_import_format(file_path: Path, entity: ThingObject) -> None:
@@ -258,5 +321,5 @@ def append_import_format(file_path: Path, entity: ThingObject) -> None:
     entity: ThingObject
         The entity to append.
     """
-    with file_path.open("a", encoding="utf-8") as fp_thing:
-        fp_thing.write(f"{json.dumps(entity.__import_format_dict__(), ensure_ascii=False)}\n")
+    with file_path.open("ab") as fp_thing:
+        fp_thing.write(import_format_bytes(entity))
@@ -0,0 +1,900 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Orchestration of large imports.
+
+The import endpoint processes one job per upload. For large loads, the entity stream is split into size-bounded
+shards, each shard is imported as a job of its own, and up to K jobs run at the same time. The jobs are tracked by a
+job watcher, which polls many jobs, possibly of different tenants, with adaptive intervals: the interval of a job
+follows its progress rate while it makes progress and grows while it does not. The error logs and the new URIs of the
+jobs are merged into one result.
+
+An optional checkpoint file records the job of every shard and whether it has completed. Running the import again
+with the same entities and the same shard bounds resumes it: completed shards are skipped, jobs that were still
+running are tracked again instead of being submitted twice.
+
+Examples
+--------
+>>> from knowledge.utils.import_format import iterate_large_import_format
+>>> from knowledge.utils.importer import ImportOrchestrator
+>>> orchestrator = ImportOrchestrator(knowledge_service, max_jobs=4, shard_size=5000, checkpoint="import.ckpt")
+>>> result = orchestrator.run(iterate_large_import_format(Path("entities.ndjson.gz")))
+>>> len(result.new_uris), len(result.error_log)
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import loguru
+
+from knowledge.base.ontology import ThingObject
+from knowledge.base.response import ErrorLogEntry, JobStatus
+from knowledge.services.asyncio.graph import AsyncWacomKnowledgeService
+from knowledge.services.graph import WacomKnowledgeService
+from knowledge.services.helper import import_format_bytes
+
+logger = loguru.logger
+
+__all__ = [
+    "AdaptivePolling",
+    "ImportCheckpoint",
+    "ImportResult",
+    "ImportOrchestrator",
+    "AsyncImportOrchestrator",
+    "JobWatcher",
+    "AsyncJobWatcher",
+    "shard_entities",
+]
+
+FINAL_STATES: Tuple[str, ...] = (JobStatus.COMPLETED, JobStatus.FAILED)
+"""States of a job that has finished."""
+
+
+def shard_entities(
+    entities: Iterable[ThingObject], max_entities: int = 10000, max_bytes: Optional[int] = None
+) -> Iterator[List[ThingObject]]:
+    """
+    Split an entity stream into shards.
+
+    Parameters
+    ----------
+    entities: Iterable[ThingObject]
+        Entities, consumed one by one.
+    max_entities: int (Default:= 10000)
+        Maximum number of entities of a shard.
+    max_bytes: Optional[int] (Default:= None)
+        Maximum size of a shard in the uncompressed import format. A single larger entity forms a shard of its own.
+
+    Returns
+    -------
+    shards: Iterator[List[ThingObject]]
+        Shards in the order of the entities.
+    """
+    shard: List[ThingObject] = []
+    size: int = 0
+    for entity in entities:
+        entity_size: int = len(import_format_bytes(entity)) if max_bytes is not None else 0
+        if shard and (len(shard) >= max_entities or (max_bytes is not None and size + entity_size > max_bytes)):
+            yield shard
+            shard, size = [], 0
+        shard.append(entity)
+        size += entity_size
+    if shard:
+        yield shard
+
+
+class AdaptivePolling:
+    """
+    Adaptive Polling
+    ----------------
+    Polling interval of a job. Without progress, the interval grows by a factor up to the maximum. With progress, it
+    is reset to the initial interval, or, if the expected number of entities is known, set to the estimated time until
+    completion at the observed progress rate, bounded by the initial and the maximum interval.
+
+    Parameters
+    ----------
+    initial: float (Default:= 1.0)
+        Initial interval in seconds.
+    maximum: float (Default:= 30.0)
+        Maximum interval in seconds.
+    factor: float (Default:= 2.0)
+        Growth of the interval without progress.
+    expected: Optional[int] (Default:= None)
+        Expected number of processed entities of the finished job.
+    clock: Callable[[], float] (Default:= time.monotonic)
+        Clock of the progress rate.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        factor: float = 2.0,
+        expected: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.__initial: float = initial
+        self.__maximum: float = max(initial, maximum)
+        self.__factor: float = factor
+        self.__expected: Optional[int] = expected
+        self.__clock: Callable[[], float] = clock
+        self.__interval: float = initial
+        self.__progress: Optional[Any] = None
+        self.__seen: float = clock()
+
+    @property
+    def interval(self) -> float:
+        """Current interval in seconds."""
+        return self.__interval
+
+    def next(self, progress: Any) -> float:
+        """
+        Interval until the next poll.
+
+        Parameters
+        ----------
+        progress: Any
+            Progress of the job, e.g., the number of processed entities.
+
+        Returns
+        -------
+        interval: float
+            Interval in seconds.
+        """
+        now: float = self.__clock()
+        if progress == self.__progress:
+            self.__interval = min(self.__maximum, self.__interval * self.__factor)
+            return self.__interval
+        self.__interval = self.__initial
+        if self.__expected is not None and self.__progress is not None and now > self.__seen:
+            rate: float = (progress - self.__progress) / (now - self.__seen)
+            if rate > 0:
+                remaining: float = (self.__expected - progress) / rate
+                self.__interval = min(self.__maximum, max(self.__initial, remaining))
+        self.__progress = progress
+        self.__seen = now
+        return self.__interval
+
+
+class ImportCheckpoint:
+    """
+    Import Checkpoint
+    -----------------
+    JSON file recording the job and the state of every shard of an import. The file is replaced atomically on every
+    change, thus it stays consistent if the import is interrupted.
+
+    Parameters
+    ----------
+    path: Union[str, Path]
+        Path of the checkpoint file; an existing file is loaded.
+    """
+
+    SUBMITTED: str = "submitted"
+    """The job of the shard has been submitted."""
+    COMPLETED: str = "completed"
+    """The job of the shard has completed."""
+    FAILED: str = "failed"
+    """The job of the shard has failed, the shard is submitted again on resume."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.__path: Path = Path(path)
+        self.__shards: Dict[str, Dict[str, Any]] = {}
+        if self.__path.exists():
+            with self.__path.open("r", encoding="utf-8") as fp:
+                self.__shards = json.load(fp).get("shards", {})
+
+    @property
+    def path(self) -> Path:
+        """Path of the checkpoint file."""
+        return self.__path
+
+    def shard(self, index: int) -> Optional[Dict[str, Any]]:
+        """
+        Record of a shard.
+
+        Parameters
+        ----------
+        index: int
+            Index of the shard.
+
+        Returns
+        -------
+        record: Optional[Dict[str, Any]]
+            Record with the `job_id`, the number of `entities`, and the `state`, None if the shard is unknown.
+        """
+        return self.__shards.get(str(index))
+
+    def submitted(self, index: int, job_id: str, entities: int) -> None:
+        """
+        Record the job of a shard.
+
+        Parameters
+        ----------
+        index: int
+            Index of the shard.
+        job_id: str
+            ID of the job.
+        entities: int
+            Number of entities of the shard.
+        """
+        self.__shards[str(index)] = {"job_id": job_id, "entities": entities, "state": ImportCheckpoint.SUBMITTED}
+        self.__save__()
+
+    def finished(self, index: int, state: str) -> None:
+        """
+        Record the final state of a shard.
+
+        Parameters
+        ----------
+        index: int
+            Index of the shard.
+        state: str
+            Either `ImportCheckpoint.COMPLETED` or `ImportCheckpoint.FAILED`.
+        """
+        self.__shards[str(index)]["state"] = state
+        self.__save__()
+
+    def __save__(self) -> None:
+        """Replace the checkpoint file."""
+        tmp_path: Path = self.__path.with_name(f"{self.__path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            json.dump({"shards": self.__shards}, fp)
+        os.replace(tmp_path, self.__path)
+
+
+@dataclass
+class ImportResult:
+    """
+    Result of an orchestrated import.
+
+    Attributes
+    ----------
+    jobs: Dict[int, str]
+        Job ID per shard index, including the shards skipped on resume.
+    statuses: Dict[str, JobStatus]
+        Final status per job ID.
+    completed: List[int]
+        Shards whose job completed.
+    failed: List[int]
+        Shards whose job failed.
+    skipped: List[int]
+        Shards skipped as completed in the checkpoint.
+    error_log: List[ErrorLogEntry]
+        Merged error logs of the jobs, including the jobs of the skipped shards.
+    new_uris: Dict[str, str]
+        Merged new URIs of the jobs, including the jobs of the skipped shards, i.e., reference id to URI.
+    """
+
+    jobs: Dict[int, str] = field(default_factory=dict)
+    statuses: Dict[str, JobStatus] = field(default_factory=dict)
+    completed: List[int] = field(default_factory=list)
+    failed: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)
+    error_log: List[ErrorLogEntry] = field(default_factory=list)
+    new_uris: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def processed_entities(self) -> int:
+        """Number of entities processed by the jobs."""
+        return sum(s.processed_entities for s in self.statuses.values())
+
+
+@dataclass
+class WatchedJob:
+    """Job tracked by a watcher."""
+
+    job_id: str
+    client: Any
+    auth_key: Optional[str]
+    polling: AdaptivePolling
+    due: float
+    futures: List[Any] = field(default_factory=list)
+    callbacks: List[Callable[[JobStatus], None]] = field(default_factory=list)
+    status: Optional[JobStatus] = None
+    errors: int = 0
+
+
+class BaseJobWatcher:
+    """
+    Base Job Watcher
+    ----------------
+    Schedule of the job watchers. Every job is polled on its own adaptive interval, the jobs that are due are polled
+    together.
+
+    Parameters
+    ----------
+    poll_interval: float (Default:= 1.0)
+        Initial polling interval of a job in seconds.
+    max_poll_interval: float (Default:= 30.0)
+        Maximum polling interval of a job in seconds.
+    max_poll_errors: int (Default:= 3)
+        Number of consecutive failed polls of a job, until its future fails with the error.
+    clock: Callable[[], float] (Default:= time.monotonic)
+        Clock of the polling schedule.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        max_poll_errors: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._poll_interval: float = poll_interval
+        self._max_poll_interval: float = max_poll_interval
+        self._max_poll_errors: int = max_poll_errors
+        self._clock: Callable[[], float] = clock
+        self._jobs: Dict[Tuple[int, str], WatchedJob] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs that have not finished."""
+        return len(self._jobs)
+
+    def _add(
+        self,
+        client: Any,
+        job_id: str,
+        future: Any,
+        auth_key: Optional[str],
+        expected_entities: Optional[int],
+        callback: Optional[Callable[[JobStatus], None]],
+    ) -> None:
+        """Start watching a job. A job that is already watched is polled once for all its futures."""
+        # Jobs of different tenants may share an ID, thus the client is part of the key
+        key: Tuple[int, str] = (id(client), job_id)
+        job: Optional[WatchedJob] = self._jobs.get(key)
+        if job is None:
+            polling: AdaptivePolling = AdaptivePolling(
+                self._poll_interval, self._max_poll_interval, expected=expected_entities, clock=self._clock
+            )
+            job = WatchedJob(job_id=job_id, client=client, auth_key=auth_key, polling=polling, due=self._clock())
+            self._jobs[key] = job
+        job.futures.append(future)
+        if callback is not None:
+            job.callbacks.append(callback)
+
+    def _next_due(self) -> Optional[float]:
+        """Time of the next poll, None if no job is due. Jobs whose futures are all cancelled are dropped."""
+        for key, job in list(self._jobs.items()):
+            job.futures = [f for f in job.futures if not f.cancelled()]
+            if not job.futures:
+                del self._jobs[key]
+        due: float = min((j.due for j in self._jobs.values()), default=math.inf)
+        return None if due == math.inf else due
+
+    def _take_due(self) -> List[WatchedJob]:
+        """Jobs whose poll is due; they are not due again until their status is updated."""
+        now: float = self._clock()
+        jobs: List[WatchedJob] = [j for j in self._jobs.values() if j.due <= now]
+        for job in jobs:
+            job.due = math.inf
+        return jobs
+
+    def _update(self, job: WatchedJob, status: Optional[JobStatus], error: Optional[BaseException]) -> None:
+        """Update a job with the outcome of its poll."""
+        if error is not None:
+            job.errors += 1
+            logger.warning(f"Polling job {job.job_id} failed ({job.errors}/{self._max_poll_errors}): {error}")
+            if job.errors >= self._max_poll_errors:
+                self.__done__(job, error=error)
+            else:
+                job.due = self._clock() + job.polling.next(job.status.processed_entities if job.status else None)
+            return
+        job.errors = 0
+        job.status = status
+        if status.status in FINAL_STATES:
+            self.__done__(job, status=status)
+        else:
+            job.due = self._clock() + job.polling.next(status.processed_entities)
+
+    def _cancel_all(self) -> None:
+        """Stop watching all jobs and cancel their futures."""
+        for job in self._jobs.values():
+            for future in job.futures:
+                future.cancel()
+        self._jobs.clear()
+
+    def __done__(
+        self, job: WatchedJob, status: Optional[JobStatus] = None, error: Optional[BaseException] = None
+    ) -> None:
+        """Resolve the futures of a finished job and call its callbacks."""
+        self._jobs.pop((id(job.client), job.job_id), None)
+        for future in job.futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(status)
+        if error is not None:
+            return
+        for callback in job.callbacks:
+            try:
+                callback(status)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"Callback of job {job.job_id} failed: {e}")
+
+
+class JobWatcher(BaseJobWatcher):
+    """
+    Job Watcher
+    -----------
+    Watches many import jobs with a single background thread. `watch` returns a future that resolves with the final
+    status of the job, i.e., completed or failed; a job watched several times is polled once for all its futures,
+    and is no longer watched once all of them are cancelled.
+
+    Parameters
+    ----------
+    **kwargs: Any
+        Parameters of `BaseJobWatcher`.
+
+    Examples
+    --------
+    >>> with JobWatcher() as watcher:
+    ...     futures = [watcher.watch(knowledge_service, job_id) for job_id in job_ids]
+    ...     statuses = [f.result() for f in futures]
+    """
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.__condition: threading.Condition = threading.Condition()
+        self.__thread: Optional[threading.Thread] = None
+        self.__closed: bool = False
+
+    def watch(
+        self,
+        client: WacomKnowledgeService,
+        job_id: str,
+        auth_key: Optional[str] = None,
+        expected_entities: Optional[int] = None,
+        callback: Optional[Callable[[JobStatus], None]] = None,
+    ) -> Future:
+        """
+        Watch a job.
+
+        Parameters
+        ----------
+        client: WacomKnowledgeService
+            Client of the tenant of the job.
+        job_id: str
+            ID of the job.
+        auth_key: Optional[str] (Default:= None)
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        expected_entities: Optional[int] (Default:= None)
+            Number of entities of the job, which allows estimating the completion from the progress rate.
+        callback: Optional[Callable[[JobStatus], None]] (Default:= None)
+            Called with the final status, in the thread of the watcher.
+
+        Returns
+        -------
+        future: Future
+            Future of the final status of the job.
+        """
+        future: Future = Future()
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("The watcher is closed.")
+            self._add(client, job_id, future, auth_key, expected_entities, callback)
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run__, name="job-watcher", daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+        return future
+
+    def close(self) -> None:
+        """Stop the watcher and cancel the futures of the jobs that have not finished."""
+        with self.__condition:
+            self.__closed = True
+            self._cancel_all()
+            self.__condition.notify()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+
+    def __enter__(self) -> "JobWatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __run__(self) -> None:
+        """Poll the jobs when they are due."""
+        while True:
+            with self.__condition:
+                while not self.__closed:
+                    due: Optional[float] = self._next_due()
+                    if due is not None and due <= self._clock():
+                        break
+                    self.__condition.wait(None if due is None else due - self._clock())
+                if self.__closed:
+                    return
+                jobs: List[WatchedJob] = self._take_due()
+            for job in jobs:
+                status: Optional[JobStatus] = None
+                error: Optional[BaseException] = None
+                try:
+                    status = job.client.job_status(job.job_id, auth_key=job.auth_key)
+                except Exception as e:  # pylint: disable=broad-except
+                    error = e
+                with self.__condition:
+                    if not self.__closed:
+                        self._update(job, status, error)
+
+
+class AsyncJobWatcher(BaseJobWatcher):
+    """
+    Async Job Watcher
+    -----------------
+    Watches many import jobs with a single task of the event loop; the jobs that are due are polled concurrently.
+    `watch` returns a future that resolves with the final status of the job, i.e., completed or failed; a job watched
+    several times is polled once for all its futures, and is no longer watched once all of them are cancelled.
+
+    Parameters
+    ----------
+    **kwargs: Any
+        Parameters of `BaseJobWatcher`.
+    """
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.__wakeup: Optional[asyncio.Event] = None
+        self.__task: Optional[asyncio.Task] = None
+
+    def watch(
+        self,
+        client: AsyncWacomKnowledgeService,
+        job_id: str,
+        auth_key: Optional[str] = None,
+        expected_entities: Optional[int] = None,
+        callback: Optional[Callable[[JobStatus], None]] = None,
+    ) -> asyncio.Future:
+        """
+        Watch a job. Must be called from the event loop.
+
+        Parameters
+        ----------
+        client: AsyncWacomKnowledgeService
+            Client of the tenant of the job.
+        job_id: str
+            ID of the job.
+        auth_key: Optional[str] (Default:= None)
+            If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+        expected_entities: Optional[int] (Default:= None)
+            Number of entities of the job, which allows estimating the completion from the progress rate.
+        callback: Optional[Callable[[JobStatus], None]] (Default:= None)
+            Called with the final status.
+
+        Returns
+        -------
+        future: asyncio.Future
+            Future of the final status of the job.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._add(client, job_id, future, auth_key, expected_entities, callback)
+        if self.__task is None or self.__task.done():
+            self.__wakeup = asyncio.Event()
+            self.__task = loop.create_task(self.__run__())
+        self.__wakeup.set()
+        return future
+
+    async def close(self) -> None:
+        """Stop the watcher and cancel the futures of the jobs that have not finished."""
+        self._cancel_all()
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+    async def __aenter__(self) -> "AsyncJobWatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def __run__(self) -> None:
+        """Poll the jobs when they are due."""
+        wakeup: asyncio.Event = self.__wakeup
+        while True:
+            due: Optional[float] = self._next_due()
+            if due is None or due > self._clock():
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), None if due is None else due - self._clock())
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            jobs: List[WatchedJob] = self._take_due()
+            outcomes: List[Any] = await asyncio.gather(
+                *[job.client.job_status(job.job_id, auth_key=job.auth_key) for job in jobs], return_exceptions=True
+            )
+            for job, outcome in zip(jobs, outcomes):
+                if isinstance(outcome, BaseException):
+                    self._update(job, None, outcome)
+                else:
+                    self._update(job, outcome, None)
+
+
+class BaseImportOrchestrator:
+    """
+    Base Import Orchestrator
+    ------------------------
+    Sharding, checkpoint, and bookkeeping of the import orchestrators.
+
+    Parameters
+    ----------
+    max_jobs: int (Default:= 4)
+        Maximum number of jobs in flight.
+    shard_size: int (Default:= 10000)
+        Maximum number of entities of a shard.
+    max_shard_bytes: Optional[int] (Default:= None)
+        Maximum size of a shard in the uncompressed import format.
+    checkpoint: Optional[Union[str, Path]] (Default:= None)
+        Path of the checkpoint file, no checkpoint if None.
+    poll_interval: float (Default:= 1.0)
+        Initial polling interval of a job in seconds.
+    max_poll_interval: float (Default:= 30.0)
+        Maximum polling interval of a job in seconds.
+    auth_key: Optional[str] (Default:= None)
+        If the auth key is set, the logged-in user (if any) will be ignored, and the auth key will be used.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = 4,
+        shard_size: int = 10000,
+        max_shard_bytes: Optional[int] = None,
+        checkpoint: Optional[Union[str, Path]] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        auth_key: Optional[str] = None,
+    ):
+        if max_jobs < 1:
+            raise ValueError("At least one job must be allowed in flight.")
+        self._max_jobs: int = max_jobs
+        self._shard_size: int = shard_size
+        self._max_shard_bytes: Optional[int] = max_shard_bytes
+        self._checkpoint: Optional[ImportCheckpoint] = ImportCheckpoint(checkpoint) if checkpoint else None
+        self._poll_interval: float = poll_interval
+        self._max_poll_interval: float = max_poll_interval
+        self._auth_key: Optional[str] = auth_key
+
+    @property
+    def max_jobs(self) -> int:
+        """Maximum number of jobs in flight."""
+        return self._max_jobs
+
+    @property
+    def checkpoint(self) -> Optional[ImportCheckpoint]:
+        """Checkpoint of the import."""
+        return self._checkpoint
+
+    def _shards(self, entities: Iterable[ThingObject]) -> Iterator[Tuple[int, List[ThingObject]]]:
+        """Shards with their index."""
+        return enumerate(shard_entities(entities, self._shard_size, self._max_shard_bytes))
+
+    def _resume(self, index: int, shard: List[ThingObject], result: ImportResult) -> Optional[str]:
+        """
+        State of a shard in the checkpoint.
+
+        Returns
+        -------
+        job_id: Optional[str]
+            ID of the job still in flight, "" if the shard has completed, None if it must be submitted. The job of a
+            completed shard is recorded in the result, its outputs are merged with `_merge_skipped`.
+        """
+        record: Optional[Dict[str, Any]] = self._checkpoint.shard(index) if self._checkpoint else None
+        if record is None or record["state"] == ImportCheckpoint.FAILED:
+            return None
+        if record["entities"] != len(shard):
+            raise ValueError(
+                f"Shard {index} has {len(shard)} entities, the checkpoint recorded {record['entities']}. "
+                "The entities or the shard bounds differ from the checkpointed import."
+            )
+        if record["state"] == ImportCheckpoint.COMPLETED:
+            result.skipped.append(index)
+            result.jobs[index] = str(record["job_id"])
+            return ""
+        logger.info(f"Resuming job {record['job_id']} of shard {index}.")
+        return str(record["job_id"])
+
+    def _record(self, index: int, job_id: str, entities: int, submitted: bool, result: ImportResult) -> None:
+        """Record the job of a shard."""
+        if submitted and self._checkpoint is not None:
+            self._checkpoint.submitted(index, job_id, entities)
+        result.jobs[index] = job_id
+
+    def _merge_skipped(
+        self, index: int, error_log: List[ErrorLogEntry], new_uris: Dict[str, str], result: ImportResult
+    ) -> None:
+        """Merge the outputs of the job of a shard completed before the import has been resumed."""
+        result.error_log.extend(error_log)
+        result.new_uris.update(new_uris)
+        logger.info(f"Skipped shard {index}, completed by job {result.jobs[index]}: {len(error_log)} errors.")
+
+    def _finish(
+        self,
+        index: int,
+        status: JobStatus,
+        error_log: List[ErrorLogEntry],
+        new_uris: Dict[str, str],
+        result: ImportResult,
+    ) -> None:
+        """Merge the outcome of a finished job."""
+        completed: bool = status.status == JobStatus.COMPLETED
+        result.statuses[result.jobs[index]] = status
+        (result.completed if completed else result.failed).append(index)
+        result.error_log.extend(error_log)
+        result.new_uris.update(new_uris)
+        if self._checkpoint is not None:
+            self._checkpoint.finished(index, ImportCheckpoint.COMPLETED if completed else ImportCheckpoint.FAILED)
+        logger.info(f"Job {result.jobs[index]} of shard {index}: {status.status}, {len(error_log)} errors.")
+
+
+class ImportOrchestrator(BaseImportOrchestrator):
+    """
+    Import Orchestrator
+    -------------------
+    Imports an entity stream as sharded jobs, with up to `max_jobs` jobs in flight, which are tracked by a
+    `JobWatcher`.
+
+    Parameters
+    ----------
+    client: WacomKnowledgeService
+        Knowledge graph client.
+    **kwargs: Any
+        Parameters of `BaseImportOrchestrator`.
+    """
+
+    def __init__(self, client: WacomKnowledgeService, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.__client: WacomKnowledgeService = client
+
+    def run(self, entities: Iterable[ThingObject]) -> ImportResult:
+        """
+        Import the entities.
+
+        Parameters
+        ----------
+        entities: Iterable[ThingObject]
+            Entities, consumed shard by shard.
+
+        Returns
+        -------
+        result: ImportResult
+            Merged result of the jobs.
+
+        Raises
+        ------
+        WacomServiceException
+            If a job cannot be submitted or polled. The checkpoint allows resuming the import.
+        """
+        result: ImportResult = ImportResult()
+        shards: Iterator[Tuple[int, List[ThingObject]]] = self._shards(entities)
+        active: Dict[Future, int] = {}
+        exhausted: bool = False
+        with JobWatcher(poll_interval=self._poll_interval, max_poll_interval=self._max_poll_interval) as watcher:
+            while True:
+                while not exhausted and len(active) < self.max_jobs:
+                    nxt: Optional[Tuple[int, List[ThingObject]]] = next(shards, None)
+                    if nxt is None:
+                        exhausted = True
+                        break
+                    index, shard = nxt
+                    job_id: Optional[str] = self._resume(index, shard, result)
+                    if job_id == "":
+                        self._merge_skipped(index, *self.__outputs__(result.jobs[index]), result)
+                        continue
+                    submitted: bool = job_id is None
+                    if job_id is None:
+                        job_id = self.__client.import_entities(shard, auth_key=self._auth_key)
+                    self._record(index, job_id, len(shard), submitted, result)
+                    future: Future = watcher.watch(
+                        self.__client, job_id, auth_key=self._auth_key, expected_entities=len(shard)
+                    )
+                    active[future] = index
+                if not active:
+                    return result
+                done, _ = wait(active, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = active.pop(future)
+                    self._finish(index, future.result(), *self.__outputs__(result.jobs[index]), result)
+
+    def __outputs__(self, job_id: str) -> Tuple[List[ErrorLogEntry], Dict[str, str]]:
+        """Error log and new URIs of a job."""
+        error_log: List[ErrorLogEntry] = list(self.__client.import_error_log_iter(job_id, auth_key=self._auth_key))
+        new_uris: Dict[str, str] = dict(self.__client.import_new_uris_iter(job_id, auth_key=self._auth_key))
+        return error_log, new_uris
+
+
+class AsyncImportOrchestrator(BaseImportOrchestrator):
+    """
+    Async Import Orchestrator
+    -------------------------
+    Imports an entity stream as sharded jobs with the asynchronous client, with up to `max_jobs` jobs in flight, which
+    are tracked by an `AsyncJobWatcher`.
+
+    Parameters
+    ----------
+    client: AsyncWacomKnowledgeService
+        Asynchronous knowledge graph client.
+    **kwargs: Any
+        Parameters of `BaseImportOrchestrator`.
+    """
+
+    def __init__(self, client: AsyncWacomKnowledgeService, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.__client: AsyncWacomKnowledgeService = client
+
+    async def run(self, entities: Iterable[ThingObject]) -> ImportResult:
+        """
+        Import the entities.
+
+        Parameters
+        ----------
+        entities: Iterable[ThingObject]
+            Entities, consumed shard by shard.
+
+        Returns
+        -------
+        result: ImportResult
+            Merged result of the jobs.
+
+        Raises
+        ------
+        WacomServiceException
+            If a job cannot be submitted or polled. The checkpoint allows resuming the import.
+        """
+        result: ImportResult = ImportResult()
+        shards: Iterator[Tuple[int, List[ThingObject]]] = self._shards(entities)
+        active: Dict[asyncio.Future, int] = {}
+        exhausted: bool = False
+        async with AsyncJobWatcher(
+            poll_interval=self._poll_interval, max_poll_interval=self._max_poll_interval
+        ) as watcher:
+            while True:
+                while not exhausted and len(active) < self.max_jobs:
+                    nxt: Optional[Tuple[int, List[ThingObject]]] = next(shards, None)
+                    if nxt is None:
+                        exhausted = True
+                        break
+                    index, shard = nxt
+                    job_id: Optional[str] = self._resume(index, shard, result)
+                    if job_id == "":
+                        self._merge_skipped(index, *await self.__outputs__(result.jobs[index]), result)
+                        continue
+                    submitted: bool = job_id is None
+                    if job_id is None:
+                        job_id = await self.__client.import_entities(shard, auth_key=self._auth_key)
+                    self._record(index, job_id, len(shard), submitted, result)
+                    future: asyncio.Future = watcher.watch(
+                        self.__client, job_id, auth_key=self._auth_key, expected_entities=len(shard)
+                    )
+                    active[future] = index
+                if not active:
+                    return result
+                done, _ = await asyncio.wait(active, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index = active.pop(future)
+                    self._finish(index, future.result(), *await self.__outputs__(result.jobs[index]), result)
+
+    async def __outputs__(self, job_id: str) -> Tuple[List[ErrorLogEntry], Dict[str, str]]:
+        """Error log and new URIs of a job."""
+        error_log: List[ErrorLogEntry] = [
+            e async for e in self.__client.import_error_log_iter(job_id, auth_key=self._auth_key)
+        ]
+        new_uris: Dict[str, str] = {
+            r: u async for r, u in self.__client.import_new_uris_iter(job_id, auth_key=self._auth_key)
+        }
+        return error_log, new_uris
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/asyncio/base.py
+
+These tests verify the retry policy and the connector configuration of AsyncSession against a local aiohttp server
+that injects failures.
+"""
+
+from typing import Dict, List, Tuple
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.services.asyncio.base import (
+    AsyncServiceAPIClient,
+    AsyncSession,
+    ConnectorConfig,
+    default_ssl_context,
+    parse_retry_after,
+)
+
+
+class FlakyService:
+    """Local stand-in service that answers with queued failures before succeeding."""
+
+    def __init__(self) -> None:
+        self.failures: List[Tuple[int, Dict[str, str]]] = []
+        self.calls: int = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Return the next queued failure, or a successful response."""
+        self.calls += 1
+        await request.read()
+        if self.failures:
+            status, headers = self.failures.pop(0)
+            return web.json_response({"message": "failure"}, status=status, headers=headers)
+        return web.json_response({"calls": self.calls})
+
+
+@pytest.fixture
+def service() -> FlakyService:
+    """Stand-in service."""
+    return FlakyService()
+
+
+@pytest_asyncio.fixture
+async def server(service):
+    """Local server of the stand-in service."""
+    app: web.Application = web.Application()
+    app.router.add_route("*", "/{tail:.*}", service.handle)
+    test_server: TestServer = TestServer(app)
+    await test_server.start_server()
+    yield test_server
+    await test_server.close()
+
+
+@pytest_asyncio.fixture
+async def session(server):
+    """Session with a fast retry policy."""
+    client: AsyncServiceAPIClient = AsyncServiceAPIClient(str(server.make_url("/")))
+    async_session: AsyncSession = AsyncSession(client, max_retries=3, backoff_factor=0.01, backoff_jitter=0.0)
+    yield async_session
+    await async_session.close()
+
+
+class TestAsyncSessionRetry:
+    """Tests for the retry policy of AsyncSession."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [502, 503, 504])
+    async def test_retry_idempotent(self, server, service, session, status):
+        """Test that idempotent requests are retried on gateway errors."""
+        service.failures = [(status, {}), (status, {})]
+        response = await session.get(str(server.make_url("/entity")), ignore_auth=True)
+        assert response.ok
+        assert service.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_exhausted(self, server, service, session):
+        """Test that the last response is returned when the retries are exhausted."""
+        service.failures = [(503, {})] * 5
+        response = await session.get(str(server.make_url("/entity")), ignore_auth=True)
+        assert response.status == 503
+        assert service.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_no_retry_non_idempotent(self, server, service, session):
+        """Test that POST requests are not retried on gateway errors, unless marked as idempotent."""
+        service.failures = [(502, {}), (502, {})]
+        response = await session.post(str(server.make_url("/entity")), ignore_auth=True, json={"a": 1})
+        assert response.status == 502
+        assert service.calls == 1
+        response = await session.post(str(server.make_url("/search")), ignore_auth=True, json={}, idempotent=True)
+        assert response.ok
+
+    @pytest.mark.asyncio
+    async def test_retry_after(self, server, service, session):
+        """Test that rejected requests with a Retry-After header are retried for all methods."""
+        service.failures = [(429, {"Retry-After": "0"}), (503, {"Retry-After": "0"})]
+        response = await session.post(str(server.make_url("/entity")), ignore_auth=True, data=b"{}")
+        assert response.ok
+        assert service.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_no_retry_streamed_body(self, server, service, session):
+        """Test that requests with a streamed body are not retried."""
+        service.failures = [(503, {"Retry-After": "0"})]
+        data: aiohttp.FormData = aiohttp.FormData()
+        data.add_field("file", b"content", filename="file.ndjson")
+        response = await session.post(str(server.make_url("/import")), ignore_auth=True, data=data)
+        assert response.status == 503
+        assert service.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_error(self, session):
+        """Test that failed connections are retried and raised afterwards."""
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await session.post("http://127.0.0.1:9/entity", ignore_auth=True, json={})
+
+    def test_parse_retry_after(self):
+        """Test parsing of the Retry-After header."""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestConnectorConfig:
+    """Tests for the connector configuration of AsyncSession."""
+
+    def test_ssl_context_cached(self):
+        """Test that the certifi SSL context is created once."""
+        assert default_ssl_context() is default_ssl_context()
+
+    @pytest.mark.asyncio
+    async def test_create_connector(self):
+        """Test that the connector is created with the configured limits."""
+        connector: aiohttp.TCPConnector = ConnectorConfig(limit=500, limit_per_host=250).create_connector()
+        try:
+            assert connector.limit == 500
+            assert connector.limit_per_host == 250
+        finally:
+            await connector.close()
+        connector = ConnectorConfig(force_close=True, cached_resolver=False).create_connector()
+        try:
+            assert connector.force_close
+        finally:
+            await connector.close()
+
+    @pytest.mark.asyncio
+    async def test_client_connector_config(self, server, service):
+        """Test that the client creates its sessions with its connector configuration."""
+        client: AsyncServiceAPIClient = AsyncServiceAPIClient(
+            str(server.make_url("/")), connector_config=ConnectorConfig(limit=7)
+        )
+        try:
+            session: AsyncSession = await client.asyncio_session()
+            assert (await session.get(str(server.make_url("/entity")), ignore_auth=True)).ok
+            http_session: aiohttp.ClientSession = await session._create_session()
+            assert http_session.connector.limit == 7
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_connector(self, server, service):
+        """Test that clients share an injected connector, which outlives the clients."""
+        connector: aiohttp.TCPConnector = ConnectorConfig(limit=1).create_connector()
+        clients: List[AsyncServiceAPIClient] = [
+            AsyncServiceAPIClient(str(server.make_url("/")), connector=connector) for _ in range(2)
+        ]
+        try:
+            for client in clients:
+                session: AsyncSession = await client.asyncio_session()
+                assert (await session.get(str(server.make_url("/entity")), ignore_auth=True)).ok
+                assert (await session._create_session()).connector is connector
+                await client.close()
+            assert not connector.closed
+        finally:
+            await connector.close()
+        assert service.calls == 2
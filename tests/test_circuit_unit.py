@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/circuit.py
+
+These tests verify the state machine of the circuit breaker, and that the sessions fail fast for a degraded endpoint
+of a local stand-in service while the other endpoints stay available.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.services.asyncio.base import AsyncServiceAPIClient, AsyncSession
+from knowledge.services.base import CircuitOpenException, RequestsSession, WacomServiceAPIClient, WacomServiceException
+from knowledge.services.circuit import CircuitBreaker, CircuitState, endpoint_key
+
+
+class FakeClock:
+    """Clock that only advances when told to."""
+
+    def __init__(self) -> None:
+        self.now: float = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests for the state machine of the circuit breaker."""
+
+    def test_endpoint_key(self):
+        """Test that the endpoints are the backends of a host."""
+        assert endpoint_key("https://Example.com/graph/v1/entity/bulk") == "example.com/graph"
+        assert endpoint_key("https://example.com/vector/api/v1/semantic-search") == "example.com/vector"
+        assert endpoint_key("https://example.com") == "example.com/"
+
+    def test_open_half_open_close(self):
+        """Test that consecutive failures open the circuit, and a successful probe closes it."""
+        clock: FakeClock = FakeClock()
+        transitions: List[Tuple[str, CircuitState, CircuitState]] = []
+        breaker: CircuitBreaker = CircuitBreaker(
+            failure_threshold=3,
+            recovery_timeout=10.0,
+            clock=clock,
+            on_state_change=lambda *args: transitions.append(args),
+        )
+        for success in (False, False, True, False, False):
+            assert breaker.allow("ink")
+            breaker.record("ink", success)
+        assert breaker.state("ink") == CircuitState.CLOSED
+        assert breaker.allow("ink")
+        breaker.record("ink", False)
+        assert breaker.state("ink") == CircuitState.OPEN
+        assert not breaker.allow("ink")
+        assert breaker.allow("graph")
+        clock.now += 4.0
+        assert breaker.retry_after("ink") == 6.0
+        clock.now += 6.0
+        assert breaker.allow("ink")
+        assert not breaker.allow("ink")
+        breaker.record("ink", True)
+        assert breaker.state("ink") == CircuitState.CLOSED
+        metrics = breaker.metrics["ink"]
+        assert metrics.rejected == 2
+        assert metrics.opened == 1
+        assert [t[2] for t in transitions] == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+
+    def test_failed_probe(self):
+        """Test that a failed probe opens the circuit again, and client-side errors release the probe."""
+        clock: FakeClock = FakeClock()
+        breaker: CircuitBreaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5.0, clock=clock)
+        breaker.allow("vector")
+        breaker.record("vector", False)
+        clock.now += 5.0
+        assert breaker.state("vector") == CircuitState.HALF_OPEN
+        assert breaker.allow("vector")
+        breaker.record("vector", None)
+        assert breaker.allow("vector")
+        breaker.record("vector", False)
+        assert breaker.state("vector") == CircuitState.OPEN
+        assert breaker.retry_after("vector") == 5.0
+        breaker.reset("vector")
+        assert breaker.state("vector") == CircuitState.CLOSED
+
+
+class TestSessions:
+    """Tests for the circuit breaker of the sessions."""
+
+    def test_requests_session(self):
+        """Test that RequestsSession fails fast for a degraded endpoint only."""
+        paths: List[str] = []
+
+        class ServiceHandler(BaseHTTPRequestHandler):
+            """Stand-in service with a degraded ink backend."""
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                paths.append(self.path)
+                body: bytes = b"{}"
+                self.send_response(500 if self.path.startswith("/ink") else 200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), ServiceHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url: str = f"http://127.0.0.1:{server.server_address[1]}"
+        breaker: CircuitBreaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0)
+        session: RequestsSession = RequestsSession(WacomServiceAPIClient(url), max_retries=0, circuit_breaker=breaker)
+        try:
+            for _ in range(2):
+                assert session.get(f"{url}/ink/v1/exports", ignore_auth=True).status_code == 500
+            with pytest.raises(CircuitOpenException) as info:
+                session.get(f"{url}/ink/v1/exports", ignore_auth=True)
+            assert session.get(f"{url}/graph/v1/entity", ignore_auth=True).ok
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+        assert isinstance(info.value, WacomServiceException)
+        assert info.value.status_code == 503
+        assert info.value.retry_after > 59.0
+        assert len(paths) == 3
+        assert breaker.state(f"127.0.0.1:{server.server_address[1]}/ink") == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_async_session(self):
+        """Test that AsyncSession records every attempt and stops retrying once the circuit is open."""
+        calls: List[str] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            calls.append(request.path)
+            return web.json_response({}, status=503)
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        breaker: CircuitBreaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0)
+        client: AsyncServiceAPIClient = AsyncServiceAPIClient(str(server.make_url("/")))
+        session: AsyncSession = AsyncSession(
+            client, max_retries=5, backoff_factor=0.01, backoff_jitter=0.0, circuit_breaker=breaker
+        )
+        try:
+            with pytest.raises(CircuitOpenException):
+                await session.get(str(server.make_url("/vector/api/v1/semantic-search")), ignore_auth=True)
+            with pytest.raises(CircuitOpenException):
+                await session.get(str(server.make_url("/vector/api/v1/semantic-search")), ignore_auth=True)
+        finally:
+            await session.close()
+            await server.close()
+        assert len(calls) == 2
+        metrics = list(breaker.metrics.values())[0]
+        assert metrics.state == CircuitState.OPEN
+        assert metrics.rejected == 2
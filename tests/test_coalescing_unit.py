@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/coalescing.py
+
+These tests verify that identical GET requests in flight share one round trip and one parsed result, in the
+coalescers and in the sessions against local stand-in services.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from requests import Response
+
+from knowledge.services.asyncio.base import AsyncServiceAPIClient, AsyncSession
+from knowledge.services.base import RequestsSession, WacomServiceAPIClient
+from knowledge.services.coalescing import AsyncRequestCoalescer, RequestCoalescer, coalescing_key, share_json
+
+
+class TestCoalescingKey:
+    """Tests for the keys of the requests."""
+
+    def test_key(self):
+        """Test that the key ignores the order of the parameters, but not the identity."""
+        first = coalescing_key("https://example.com/entity", {"a": 1, "b": ["x", "y"]}, {"Accept-Language": "en"}, "s")
+        second = coalescing_key("https://example.com/entity", {"b": ["x", "y"], "a": 1}, {"accept-language": "en"}, "s")
+        assert first == second
+        assert first != coalescing_key("https://example.com/entity", {"a": 1, "b": ["x", "y"]}, None, "s")
+        assert first != coalescing_key("https://example.com/entity", {"a": 1, "b": ["x", "y"]}, None, "other")
+        assert hash(coalescing_key("https://example.com/entity", [("a", {"nested": [1]})]))
+
+    def test_share_json(self):
+        """Test that the body of a shared response is parsed once."""
+        response: Response = Response()
+        response._content = b'{"uri": "entity"}'
+        share_json(response)
+        assert response.json() is response.json()
+        assert response.json(parse_float=float) == {"uri": "entity"}
+
+
+class TestRequestCoalescer:
+    """Tests for the thread-safe coalescer."""
+
+    def test_single_flight(self):
+        """Test that concurrent identical calls share one call and one result."""
+        coalescer: RequestCoalescer = RequestCoalescer()
+        calls: List[int] = []
+        started: threading.Event = threading.Event()
+
+        def call():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return {"value": len(calls)}
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            leader = pool.submit(coalescer.run, "key", call)
+            started.wait()
+            followers = [pool.submit(coalescer.run, "key", call) for _ in range(4)]
+            results = [leader.result()] + [f.result() for f in followers]
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert coalescer.coalesced == 4
+        assert coalescer.in_flight == 0
+        assert coalescer.run("key", call) == {"value": 2}
+
+    def test_shared_error(self):
+        """Test that the exception of the call is raised for all callers."""
+        coalescer: RequestCoalescer = RequestCoalescer()
+        started: threading.Event = threading.Event()
+
+        def call():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(coalescer.run, "key", call)
+            started.wait()
+            follower = pool.submit(coalescer.run, "key", call)
+            for future in (leader, follower):
+                with pytest.raises(ValueError):
+                    future.result()
+        assert coalescer.in_flight == 0
+
+    def test_requests_session(self):
+        """Test that RequestsSession sends concurrent identical GET requests once."""
+        paths: List[str] = []
+
+        class ServiceHandler(BaseHTTPRequestHandler):
+            """Slow stand-in service."""
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                paths.append(self.path)
+                time.sleep(0.2)
+                body: bytes = b'{"uri": "entity"}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), ServiceHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url: str = f"http://127.0.0.1:{server.server_address[1]}/graph/v1/entity/uri"
+        session: RequestsSession = RequestsSession(WacomServiceAPIClient(url), coalescer=RequestCoalescer())
+        try:
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                same = [pool.submit(session.get, url, ignore_auth=True, params={"locale": "en"}) for _ in range(5)]
+                other = pool.submit(session.get, url, ignore_auth=True, params={"locale": "de"})
+                responses = [f.result() for f in same]
+                assert other.result().ok
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+        assert sorted(paths) == ["/graph/v1/entity/uri?locale=de", "/graph/v1/entity/uri?locale=en"]
+        assert all(r.json() is responses[0].json() for r in responses)
+
+
+class TestAsyncRequestCoalescer:
+    """Tests for the asynchronous coalescer."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader(self):
+        """Test that a cancelled caller does not cancel the request of the others, unless all are cancelled."""
+        coalescer: AsyncRequestCoalescer = AsyncRequestCoalescer()
+        calls: List[int] = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(coalescer.run("key", call))
+        follower = asyncio.create_task(coalescer.run("key", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == "done"
+        assert len(calls) == 1
+        lonely = asyncio.create_task(coalescer.run("other", call))
+        await asyncio.sleep(0)
+        lonely.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await lonely
+        await asyncio.sleep(0)
+        assert coalescer.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_async_session(self):
+        """Test that AsyncSession shares one round trip and one ResponseData among identical GET requests."""
+        calls: List[str] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            calls.append(request.path_qs)
+            await asyncio.sleep(0.05)
+            return web.json_response({"uri": "entity"})
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        client: AsyncServiceAPIClient = AsyncServiceAPIClient(str(server.make_url("/")))
+        client.coalescer = AsyncRequestCoalescer()
+        session: AsyncSession = await client.asyncio_session()
+        url: str = str(server.make_url("/graph/v1/entity/uri"))
+        try:
+            responses = await asyncio.gather(*[session.get(url, ignore_auth=True) for _ in range(5)])
+            await asyncio.gather(*[session.post(url, ignore_auth=True, json={}) for _ in range(2)])
+        finally:
+            await client.close()
+            await server.close()
+        assert len(calls) == 3
+        assert all(r is responses[0] for r in responses)
+        assert responses[0].content == {"uri": "entity"}
+        assert client.coalescer.coalesced == 4
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/concurrency.py
+
+These tests verify the AIMD policy, the thread-safe and asynchronous limiters, and their use by the sessions against
+local stand-in services that signal backpressure.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.services.asyncio.base import AsyncServiceAPIClient, AsyncSession
+from knowledge.services.base import RequestsSession, WacomServiceAPIClient
+from knowledge.services.concurrency import AIMDLimit, AdaptiveLimiter, AsyncAdaptiveLimiter, is_backpressure
+
+
+class TestAIMDLimit:
+    """Tests for the AIMD policy."""
+
+    def test_backpressure_status(self):
+        """Test that 429 and 503 signal backpressure."""
+        assert is_backpressure(429) and is_backpressure(503)
+        assert not is_backpressure(500) and not is_backpressure(None)
+
+    def test_additive_increase(self):
+        """Test that the limit grows by one per window of completed requests while it is used."""
+        policy: AIMDLimit = AIMDLimit(initial_limit=4, max_limit=8)
+        for i in range(4):
+            policy.update(0.1, in_flight=4, backpressure=False, now=float(i))
+        assert policy.limit == 4
+        for i in range(4):
+            policy.update(0.1, in_flight=4, backpressure=False, now=float(i + 4))
+        assert policy.limit == 5
+        idle: AIMDLimit = AIMDLimit(initial_limit=4)
+        for i in range(100):
+            idle.update(0.1, in_flight=1, backpressure=False, now=float(i))
+        assert idle.limit == 4
+
+    def test_multiplicative_decrease(self):
+        """Test that backpressure halves the limit once per latency interval."""
+        policy: AIMDLimit = AIMDLimit(initial_limit=16)
+        policy.update(0.5, in_flight=16, backpressure=False, now=0.0)
+        assert policy.update(0.5, in_flight=16, backpressure=True, now=1.0) == 8
+        assert policy.update(0.5, in_flight=16, backpressure=True, now=1.1) == 8
+        assert policy.update(0.5, in_flight=16, backpressure=True, now=1.6) == 4
+        assert policy.decreases == 2
+        for now in range(10):
+            policy.update(0.5, in_flight=16, backpressure=True, now=10.0 + now)
+        assert policy.limit == 1
+
+    def test_rising_latency(self):
+        """Test that a rising latency decreases the limit without backpressure."""
+        policy: AIMDLimit = AIMDLimit(initial_limit=16)
+        policy.update(0.1, in_flight=16, backpressure=False, now=0.0)
+        now: float = 1.0
+        while policy.decreases == 0 and now < 20.0:
+            policy.update(1.0, in_flight=16, backpressure=False, now=now)
+            now += 1.0
+        assert policy.decreases == 1
+        assert policy.limit == 8
+        assert policy.baseline_latency < 0.2
+
+    def test_invalid_limits(self):
+        """Test that inconsistent limits are rejected."""
+        with pytest.raises(ValueError):
+            AIMDLimit(initial_limit=4, min_limit=8)
+        with pytest.raises(ValueError):
+            AIMDLimit(backoff_ratio=1.0)
+
+
+class TestAdaptiveLimiter:
+    """Tests for the thread-safe limiter."""
+
+    def test_limit_enforced(self):
+        """Test that concurrent threads never exceed the limit and wait in the queue."""
+        limiter: AdaptiveLimiter = AdaptiveLimiter(initial_limit=3, max_limit=3)
+        peak: List[int] = [0]
+        lock: threading.Lock = threading.Lock()
+        queued: threading.Event = threading.Event()
+
+        def work():
+            limiter.acquire()
+            try:
+                with lock:
+                    peak[0] = max(peak[0], limiter.in_flight)
+                if limiter.queue_depth > 0:
+                    queued.set()
+                time.sleep(0.02)
+            finally:
+                limiter.release(0.02)
+
+        threads: List[threading.Thread] = [threading.Thread(target=work) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert peak[0] == 3
+        assert queued.is_set()
+        assert limiter.metrics.in_flight == 0
+        assert limiter.metrics.queue_depth == 0
+
+    def test_requests_session_backpressure(self):
+        """Test that 429 responses of the service decrease the limit of RequestsSession."""
+
+        class ServiceHandler(BaseHTTPRequestHandler):
+            """Stand-in service that is overloaded."""
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                body: bytes = b"{}"
+                self.send_response(429)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), ServiceHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url: str = f"http://127.0.0.1:{server.server_address[1]}"
+        limiter: AdaptiveLimiter = AdaptiveLimiter(initial_limit=8)
+        session: RequestsSession = RequestsSession(WacomServiceAPIClient(url), max_retries=0, limiter=limiter)
+        try:
+            assert session.get(f"{url}/entity", ignore_auth=True).status_code == 429
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+        assert limiter.limit == 4
+        assert limiter.metrics.decreases == 1
+        assert limiter.in_flight == 0
+
+
+class TestAsyncAdaptiveLimiter:
+    """Tests for the asynchronous limiter."""
+
+    @pytest.mark.asyncio
+    async def test_handoff(self):
+        """Test that free slots are handed to the waiting tasks in order."""
+        limiter: AsyncAdaptiveLimiter = AsyncAdaptiveLimiter(initial_limit=1, max_limit=1)
+        order: List[int] = []
+        await limiter.acquire()
+
+        async def work(index: int):
+            await limiter.acquire()
+            order.append(index)
+            limiter.release(0.01)
+
+        tasks = [asyncio.create_task(work(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 3
+        limiter.release(0.01)
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2]
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter(self):
+        """Test that a cancelled waiter neither occupies nor loses a slot."""
+        limiter: AsyncAdaptiveLimiter = AsyncAdaptiveLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.queue_depth == 0
+        limiter.release()
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(), 1.0)
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_async_session_backpressure(self):
+        """Test that 503 responses decrease the limit of AsyncSession and successes do not."""
+        calls: List[int] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            calls.append(len(calls))
+            status: int = 503 if len(calls) <= 2 else 200
+            return web.json_response({}, status=status)
+
+        app: web.Application = web.Application()
+        app.router.add_get("/{tail:.*}", handle)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        limiter: AsyncAdaptiveLimiter = AsyncAdaptiveLimiter(initial_limit=8)
+        client: AsyncServiceAPIClient = AsyncServiceAPIClient(str(server.make_url("/")))
+        session: AsyncSession = AsyncSession(
+            client, max_retries=3, backoff_factor=0.05, backoff_jitter=0.0, limiter=limiter
+        )
+        try:
+            response = await session.get(str(server.make_url("/entity")), ignore_auth=True)
+        finally:
+            await session.close()
+            await server.close()
+        assert response.ok
+        assert len(calls) == 3
+        assert limiter.metrics.decreases == 2
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
@@ -2,6 +2,8 @@
 # Copyright © 2021-present Wacom. All rights reserved.
 """Unit tests for knowledge/base/entity.py"""
 
+import pickle
+
 import pytest
 
 from knowledge.base.entity import (
@@ -573,6 +575,17 @@ class TestLocalizedContent:
         assert label.language_code == LanguageCode("en")
         assert repr(label) == "Test@en"
 
+    def test_localized_content_uses_slots(self):
+        """Test that localized content has no per-instance dictionary and still pickles."""
+        label = Label("Test", EN_US, main=True)
+        desc = Description("Text", DE_DE)
+        assert not hasattr(label, "__dict__")
+        assert not hasattr(desc, "__dict__")
+        restored_label = pickle.loads(pickle.dumps(label))
+        restored_desc = pickle.loads(pickle.dumps(desc))
+        assert (restored_label.content, restored_label.language_code, restored_label.main) == ("Test", EN_US, True)
+        assert (restored_desc.content, restored_desc.language_code) == ("Text", DE_DE)
+
 
 # ================================================================================================
 # Edge Cases and Error Handling Tests
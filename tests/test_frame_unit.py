@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/base/frame.py
+
+These tests verify that the columnar entity frame round-trips entities and filters them like the object model.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from knowledge.base.entity import EntityStatus
+from knowledge.base.frame import EntityFrame, StringColumn, FRAME_LABELS, FRAME_OBJECT_PROPERTIES
+from knowledge.base.ontology import ThingObject
+from knowledge.utils.import_format import iterate_large_import_format, load_import_format_frame, save_import_format
+
+
+def _entity_dict(idx: int) -> Dict[str, Any]:
+    """Helper to create an entity in the listing format."""
+    return {
+        "uri": f"wacom:entity:{idx}",
+        "image": f"https://example.com/{idx}.png" if idx % 2 else None,
+        "labels": [
+            {"value": f"Entity {idx}", "locale": "en_US", "isMain": True},
+            {"value": f"Entität {idx}", "locale": "de_DE", "isMain": idx % 3 != 0},
+            {"value": "Unsupported", "locale": "xx_XX", "isMain": True},
+        ],
+        "descriptions": [{"description": f"Description {idx}", "locale": "en_US"}],
+        "type": "wacom:core#Person" if idx % 2 else "wacom:core#Topic",
+        "literals": [
+            {"value": f"ref-{idx}", "locale": "en_US", "literal": "wacom:core#sourceReferenceId"},
+        ],
+        "relations": [
+            {
+                "relation": "wacom:core#relatedTo",
+                "in": [f"wacom:entity:{idx + 1}"],
+                "out": [
+                    {
+                        "uri": f"wacom:entity:{idx + 2}",
+                        "image": None,
+                        "labels": [],
+                        "descriptions": [],
+                        "type": "wacom:core#Thing",
+                    }
+                ],
+            }
+        ],
+        "targets": ["NEL", "ElasticSearch"] if idx % 2 else ["ElasticSearch"],
+        "owner": idx % 4 != 0,
+        "ownerId": f"user-{idx % 2}",
+        "groupIds": [f"group-{idx % 3}"],
+        "visibility": "Private",
+        "tenantRights": ["Read"],
+    }
+
+
+@pytest.fixture
+def payload() -> List[Dict[str, Any]]:
+    """Listing payload with ten entities."""
+    return [_entity_dict(idx) for idx in range(10)]
+
+
+class TestStringColumn:
+    """Tests for StringColumn."""
+
+    def test_append_and_take(self):
+        """Test that values, including None and non-ASCII content, survive packing and taking ranges."""
+        column: StringColumn = StringColumn(["a", None, "Zürich", "", "b"])
+        assert list(column) == ["a", None, "Zürich", "", "b"]
+        assert list(column.take([(1, 3), (4, 5)])) == [None, "Zürich", "b"]
+
+
+class TestEntityFrame:
+    """Tests for EntityFrame."""
+
+    def test_from_listing_round_trip(self, payload):
+        """Test that materialized entities equal the entities parsed by ThingObject.from_dict."""
+        frame: EntityFrame = EntityFrame.from_listing({"listing": payload, "nextPageId": "next"})
+        assert len(frame) == len(payload)
+        for idx, entity in enumerate(payload):
+            thing: ThingObject = frame[idx]
+            expected: ThingObject = ThingObject.from_dict(entity)
+            assert thing == expected
+            assert [la.content for la in thing.alias] == [la.content for la in expected.alias]
+            assert thing.owner_id == expected.owner_id
+            assert thing.group_ids == expected.group_ids
+            assert thing.tenant_access_right.to_list() == expected.tenant_access_right.to_list()
+            assert thing.status_flag == EntityStatus.SYNCED
+            assert not thing.is_modified
+
+    def test_from_things(self, payload):
+        """Test that a frame built from entities materializes the same entities."""
+        things: List[ThingObject] = [ThingObject.from_dict(e) for e in payload]
+        assert EntityFrame.from_things(things).to_things() == things
+
+    def test_many_locales(self):
+        """Test that more locales than fit into a signed byte are encoded."""
+        thing: ThingObject = ThingObject(uri="wacom:entity:locales")
+        for idx in range(200):
+            thing.add_description(f"Description {idx}", f"l{idx}_LL")
+        frame: EntityFrame = EntityFrame.from_things([thing])
+        assert [d.language_code for d in frame[0].description] == [f"l{idx}_LL" for idx in range(200)]
+
+    def test_where(self, payload):
+        """Test that filtering matches filtering the entities."""
+        frame: EntityFrame = EntityFrame.from_listing(payload)
+        selected: EntityFrame = frame.where(concept_type="wacom:core#Person", locale="de_DE", owner=True)
+        things: List[ThingObject] = [ThingObject.from_dict(e) for e in payload]
+        expected: List[str] = [
+            t.uri
+            for t in things
+            if t.concept_type.iri == "wacom:core#Person" and t.label_lang("de_DE") is not None and t.owner
+        ]
+        assert list(selected.uris) == expected
+        assert selected.to_things() == [t for t in things if t.uri in expected]
+        assert len(frame.where(use_for_nel=False, owner_id="user-0")) == 5
+        assert len(frame.where(concept_type="wacom:core#Organization")) == 0
+
+    def test_select(self, payload):
+        """Test that a projection keeps the entity columns and the selected tables only."""
+        frame: EntityFrame = EntityFrame.from_listing(payload).select(FRAME_LABELS)
+        assert frame.tables == (FRAME_LABELS,)
+        thing: ThingObject = frame[1]
+        assert thing.uri == "wacom:entity:1"
+        assert thing.label_lang("en_US").content == "Entity 1"
+        assert thing.object_properties == {}
+        with pytest.raises(ValueError):
+            frame.select(FRAME_OBJECT_PROPERTIES)
+
+    def test_slice_and_labels(self, payload):
+        """Test slicing and label access without materializing entities."""
+        frame: EntityFrame = EntityFrame.from_listing(payload)[3:6]
+        assert list(frame.uris) == ["wacom:entity:3", "wacom:entity:4", "wacom:entity:5"]
+        assert frame.labels(0, "de_DE", main=None) == ["Entität 3"]
+        assert frame.labels(0, "de_DE") == []
+        assert frame.concept_type(1).iri == "wacom:core#Topic"
+
+    def test_load_import_format_frame(self, payload, tmp_path: Path):
+        """Test that an import format file is loaded into a frame."""
+        things: List[ThingObject] = [ThingObject.from_dict(e) for e in payload]
+        file_path: Path = tmp_path / "entities.ndjson"
+        save_import_format(file_path, things)
+        frame: EntityFrame = load_import_format_frame(file_path)
+        assert len(frame) == len(things)
+        assert [frame.labels(idx, "en_US") for idx in range(len(frame))] == [
+            [t.label_lang("en_US").content] for t in things
+        ]
+
+    def test_import_format_normalization(self, tmp_path: Path):
+        """Test that the frame and the entities of an import format file are normalized the same way."""
+        entity: Dict[str, Any] = {
+            "source_reference_id": "ref-1",
+            "source_system": "system",
+            "image": None,
+            "type": "wacom:core#Topic",
+            "use_for_nel": True,
+            "labels": [
+                {"value": "Main", "locale": "en_US", "isMain": True},
+                {"value": "Only alias", "locale": "de_DE", "isMain": False},
+                {"value": "Unsupported", "locale": "xx_XX", "isMain": True},
+            ],
+            "descriptions": [{"description": None, "locale": "en_US"}],
+            "literals": {"wacom:core#sourceSystem": [{"value": "system", "locale": "en_US"}]},
+            "relations": [{"relation": "wacom:core#relatedTo", "in": [], "out": []}],
+        }
+        file_path: Path = tmp_path / "entities.ndjson"
+        file_path.write_text(json.dumps(entity) + "\n", encoding="utf-8")
+        thing: ThingObject = next(iter(iterate_large_import_format(file_path)))
+        assert thing.label_lang("de_DE").content == "Only alias"
+        assert thing.alias == [] and thing.description == [] and thing.object_properties == {}
+        assert thing.use_for_nel and not thing.use_vector_index
+        assert [d.value for d in thing.source_reference_id] == ["ref-1"]
+        assert load_import_format_frame(file_path).to_things() == [thing]
+        with pytest.raises(ValueError):
+            ThingObject.from_import_dict(entity, raise_on_error=True)
+        assert entity["labels"][1]["isMain"] is False
+
+    def test_import_format_frame_skips_things(self, payload, tmp_path: Path, monkeypatch):
+        """Test that the import format dicts are appended without ThingObjects, like the parsed entities."""
+        file_path: Path = tmp_path / "entities.ndjson"
+        save_import_format(file_path, [ThingObject.from_dict(e) for e in payload])
+        expected: List[ThingObject] = EntityFrame.from_things(iterate_large_import_format(file_path)).to_things()
+
+        def from_import_dict(*args, **kwargs):
+            raise AssertionError("ThingObject created")
+
+        monkeypatch.setattr(ThingObject, "__from_normalized_import_dict__", from_import_dict)
+        frame: EntityFrame = load_import_format_frame(file_path)
+        assert frame.to_things() == expected
+        assert [t.use_for_nel for t in frame] == [t.use_for_nel for t in expected]
+        assert [[d.value for d in t.source_reference_id] for t in frame] == [
+            [d.value for d in t.source_reference_id] for t in expected
+        ]
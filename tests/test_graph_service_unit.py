@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/graph.py
+
+These tests verify the knowledge graph client using a mocked request session.
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from typing import Any, Dict, List
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.base.entity import EntityStatus
+from knowledge.base.ontology import ThingObject, LazyThingObject, THING_CLASS
+from knowledge.services.asyncio.graph import AsyncWacomKnowledgeService
+from knowledge.services.base import WacomServiceException
+from knowledge.services.graph import WacomKnowledgeService
+from knowledge.services.helper import entity_payload
+
+
+def _entity_dict(idx: int) -> Dict[str, Any]:
+    """Helper to create an entity in the response format."""
+    return {
+        "uri": f"wacom:entity:{idx}",
+        "image": None,
+        "labels": [{"value": f"Entity {idx}", "locale": "en_US", "isMain": True}],
+        "descriptions": [],
+        "type": "wacom:core#Thing",
+        "literals": [],
+        "relations": [],
+    }
+
+
+def _response(payload: Any, ok: bool = True) -> MagicMock:
+    """Helper to create a mocked response."""
+    response = MagicMock()
+    response.ok = ok
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def session(mocker):
+    """Mocked request session of the knowledge graph client."""
+    mocked = MagicMock()
+    mocker.patch.object(WacomKnowledgeService, "request_session", new_callable=PropertyMock, return_value=mocked)
+    return mocked
+
+
+@pytest.fixture
+def client(session):
+    """Knowledge graph client with a mocked request session."""
+    return WacomKnowledgeService(service_url="https://example.com")
+
+
+class TestListing:
+    """Tests for WacomKnowledgeService.listing."""
+
+    def test_listing_eager(self, client, session):
+        """Test that listing returns eager entities by default."""
+        session.get.return_value = _response({"nextPageId": "next", "listing": [_entity_dict(1)]})
+        things, _, next_page_id = client.listing(THING_CLASS)
+        assert next_page_id == "next"
+        assert type(things[0]) is ThingObject
+        assert things[0].status_flag == EntityStatus.SYNCED
+
+    def test_listing_lazy(self, client, session):
+        """Test that lazy listing returns views that are equal to the eager entities."""
+        payload: List[Dict[str, Any]] = [_entity_dict(1), _entity_dict(2)]
+        session.get.return_value = _response({"nextPageId": "next", "listing": payload})
+        things, _, _ = client.listing(THING_CLASS, lazy=True)
+        assert all(isinstance(t, LazyThingObject) for t in things)
+        assert things[0].status_flag == EntityStatus.SYNCED
+        assert [t.uri for t in things] == ["wacom:entity:1", "wacom:entity:2"]
+        assert things == [ThingObject.from_dict(e) for e in payload]
+
+    def test_listing_frame(self, client, session):
+        """Test that the pages of the listing are appended to a frame."""
+        session.get.side_effect = [
+            _response({"nextPageId": "next", "estimatedCount": 3, "listing": [_entity_dict(1), _entity_dict(2)]}),
+            _response({"nextPageId": None, "listing": [_entity_dict(3)]}),
+        ]
+        frame, _, next_page_id = client.listing_frame(THING_CLASS)
+        assert next_page_id == "next"
+        frame, _, next_page_id = client.listing_frame(THING_CLASS, page_id=next_page_id, frame=frame)
+        assert next_page_id is None
+        assert session.get.call_args.kwargs["params"]["nextPageId"] == "next"
+        assert frame.to_things() == [ThingObject.from_dict(_entity_dict(idx)) for idx in (1, 2, 3)]
+        assert frame[0].status_flag == EntityStatus.SYNCED
+
+
+class TestEntities:
+    """Tests for WacomKnowledgeService.entities."""
+
+    def test_entities_lazy(self, client, session):
+        """Test that entities can be retrieved as lazy views."""
+        session.get.return_value = _response([_entity_dict(1)])
+        things = client.entities(["wacom:entity:1"], lazy=True)
+        assert isinstance(things[0], LazyThingObject)
+        assert things[0].label[0].content == "Entity 1"
+
+
+class TestEncoding:
+    """Tests for the request bodies of the entity endpoints."""
+
+    def test_create_entity_bulk_sends_bytes(self, client, session):
+        """Test that bulk creation sends the encoded payload of each batch."""
+        session.post.return_value = _response({"uris": ["wacom:entity:1", "wacom:entity:2"]})
+        things = [ThingObject.from_dict(_entity_dict(1)), ThingObject.from_dict(_entity_dict(2))]
+        client.create_entity_bulk(things, ignore_images=True)
+        body: bytes = session.post.call_args.kwargs["data"]
+        assert json.loads(body) == [entity_payload(t) for t in things]
+
+    def test_import_entities_sends_gzipped_ndjson(self, client, session):
+        """Test that the import streams the compressed import format of a generator."""
+        session.post.return_value = _response({"jobId": "job"})
+        things = [ThingObject.from_dict(_entity_dict(1)), ThingObject.from_dict(_entity_dict(2))]
+        assert client.import_entities(iter(things)) == "job"
+        kwargs = session.post.call_args.kwargs
+        boundary: str = kwargs["headers"]["Content-Type"].split("boundary=")[1]
+        body: bytes = b"".join(kwargs["data"])
+        content: bytes = body.split(b"\r\n\r\n", 1)[1].rsplit(f"\r\n--{boundary}--".encode(), 1)[0]
+        lines = gzip.decompress(content).splitlines()
+        assert [json.loads(line) for line in lines] == [t.__import_format_dict__() for t in things]
+
+
+def _things_with_images(count: int) -> List[ThingObject]:
+    """Helper to create entities with images."""
+    things: List[ThingObject] = [ThingObject.from_dict(_entity_dict(idx)) for idx in range(count)]
+    for thing in things:
+        thing.uri = None
+        thing.image = f"https://example.com/{thing.label[0].content}.png"
+    return things
+
+
+class TestCreateEntityBulkConcurrent:
+    """Tests for the concurrent bulk creation of entities."""
+
+    def test_results_in_order(self, client, session):
+        """Test that the batches are in flight concurrently, and a failed batch or image does not abort the others."""
+        lock: threading.Lock = threading.Lock()
+        active: List[int] = [0, 0]
+
+        def post(url, data, **kwargs):
+            labels: List[str] = [e["labels"][0]["value"] for e in json.loads(data)]
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            if "Entity 2" in labels:
+                return _response({}, ok=False)
+            return _response({"uris": [f"uri:{label}" for label in labels]})
+
+        def set_image(uri, image, **kwargs):
+            if uri == "uri:Entity 5":
+                raise WacomServiceException("Image failed.")
+            return "image"
+
+        session.post.side_effect = post
+        client.set_entity_image_url = MagicMock(side_effect=set_image)
+        things: List[ThingObject] = _things_with_images(7)
+        results = client.create_entity_bulk_concurrent(things, batch_size=2, max_in_flight=4)
+        assert active[1] > 1
+        assert [r.index for r in results] == list(range(7))
+        assert [r.uri for r in results] == [None if i in (2, 3) else f"uri:Entity {i}" for i in range(7)]
+        assert things[6].uri == "uri:Entity 6"
+        assert [r.ok for r in results] == [True, True, False, False, True, False, True]
+        assert isinstance(results[3].error, WacomServiceException)
+        assert results[5].error is None and isinstance(results[5].image_error, WacomServiceException)
+        assert client.set_entity_image_url.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_async_results_in_order(self, mocker):
+        """Test that the asynchronous bulk creation bounds the batches in flight, isolates a malformed response and
+        uploads the images."""
+        active: List[int] = [0, 0]
+        timeouts: List[int] = []
+
+        async def post(url, data, **kwargs):
+            labels: List[str] = [e["labels"][0]["value"] for e in json.loads(data)]
+            timeouts.append(kwargs["timeout"])
+            active[0] += 1
+            active[1] = max(active)
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            response = MagicMock()
+            response.ok = "Entity 0" not in labels
+            response.content = {} if "Entity 4" in labels else {"uris": [f"uri:{label}" for label in labels]}
+            return response
+
+        session = MagicMock()
+        session.post = post
+        mocker.patch.object(AsyncWacomKnowledgeService, "asyncio_session", AsyncMock(return_value=session))
+        mocker.patch("knowledge.services.asyncio.graph.handle_error", AsyncMock(return_value=WacomServiceException("")))
+        client = AsyncWacomKnowledgeService(application_name="Test", service_url="https://example.com")
+        client.set_entity_image_url = AsyncMock(return_value="image")
+        results = await client.create_entity_bulk_concurrent(
+            _things_with_images(9), batch_size=1, max_in_flight=3, timeout=5
+        )
+        assert active[1] == 3
+        assert timeouts == [5] * 9
+        assert [r.uri for r in results] == [None if i in (0, 4) else f"uri:Entity {i}" for i in range(9)]
+        assert isinstance(results[0].error, WacomServiceException)
+        assert isinstance(results[4].error, KeyError)
+        assert client.set_entity_image_url.await_count == 7
+
+    @pytest.mark.asyncio
+    async def test_uri_count_mismatch(self, client, session, mocker):
+        """Test that a batch with more or fewer URIs than entities fails as a whole, without assigning its URIs."""
+
+        def uris(labels: List[str]) -> Dict[str, List[str]]:
+            # The middle batch has one URI too many, the last one is missing one
+            extra: List[str] = ["uri:extra"] if "Entity 2" in labels else []
+            return {"uris": [f"uri:{label}" for label in labels if label != "Entity 4"] + extra}
+
+        def labels_of(data: bytes) -> List[str]:
+            return [e["labels"][0]["value"] for e in json.loads(data)]
+
+        session.post.side_effect = lambda url, data, **kwargs: _response(uris(labels_of(data)))
+        client.set_entity_image_url = MagicMock(return_value="image")
+        expected: List[Any] = ["uri:Entity 0", "uri:Entity 1", None, None, None]
+        results = client.create_entity_bulk_concurrent(_things_with_images(5), batch_size=2)
+        assert [r.uri for r in results] == expected
+        assert all(isinstance(results[idx].error, WacomServiceException) for idx in (2, 3, 4))
+
+        async def post(url, data, **kwargs):
+            response = MagicMock()
+            response.ok = True
+            response.content = uris(labels_of(data))
+            return response
+
+        async_session = MagicMock()
+        async_session.post = post
+        mocker.patch.object(AsyncWacomKnowledgeService, "asyncio_session", AsyncMock(return_value=async_session))
+        async_client = AsyncWacomKnowledgeService(application_name="Test", service_url="https://example.com")
+        async_client.set_entity_image_url = AsyncMock(return_value="image")
+        things: List[ThingObject] = _things_with_images(5)
+        results = await async_client.create_entity_bulk_concurrent(things, batch_size=2)
+        assert [r.uri for r in results] == expected
+        assert all(isinstance(results[idx].error, WacomServiceException) for idx in (2, 3, 4))
+        assert things[4].uri is None
+        assert async_client.set_entity_image_url.await_count == 2
+
+
+class TestImportLogs:
+    """Tests for the paginated logs of the import jobs."""
+
+    def test_iterators(self, client, session):
+        """Test that the iterators fetch the pages on demand until the last one."""
+        entry: Dict[str, Any] = {"sourceReferenceId": "ref", "errors": []}
+        session.get.side_effect = [
+            _response({"nextPageId": "page-2", "errorLog": [entry, entry]}),
+            _response({"nextPageId": None, "errorLog": [entry]}),
+            _response({"nextPage": "page-2", "uris": [{"ref_id": "a", "uri": "uri:a"}]}),
+            _response({"uris": [{"ref_id": "b", "uri": "uri:b"}]}),
+        ]
+        entries = client.import_error_log_iter("job", prefetch=0)
+        assert next(entries).source_reference_id == "ref"
+        assert session.get.call_count == 1
+        assert len(list(entries)) == 2
+        assert session.get.call_args.kwargs["params"] == {"nextPageId": "page-2"}
+        assert dict(client.import_new_uris_iter("job")) == {"a": "uri:a", "b": "uri:b"}
+        assert session.get.call_count == 4
+
+
+class TestImportStreaming:
+    """Tests for the streamed uploads of the asynchronous import."""
+
+    @pytest.mark.asyncio
+    async def test_async_import(self, tmp_path: Path):
+        """Test that the generator and the file are uploaded as the file field of a multipart form."""
+        uploads: List[bytes] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            form = await request.post()
+            uploads.append(form["file"].file.read())
+            return web.json_response({"jobId": f"job-{len(uploads)}"})
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        client = AsyncWacomKnowledgeService(application_name="Test", service_url=str(server.make_url("")))
+        things = [ThingObject.from_dict(_entity_dict(idx)) for idx in range(3)]
+        file_path: Path = tmp_path / "import.njson.gz"
+        file_path.write_bytes(gzip.compress(b"{}\n"))
+        try:
+            assert await client.import_entities((t for t in things), auth_key="token") == "job-1"
+            assert await client.import_entities_from_file(file_path, auth_key="token") == "job-2"
+        finally:
+            await client.close()
+            await server.close()
+        lines = gzip.decompress(uploads[0]).splitlines()
+        assert [json.loads(line) for line in lines] == [t.__import_format_dict__() for t in things]
+        assert uploads[1] == file_path.read_bytes()
+
+
+class TestUpdateEntity:
+    """Tests for WacomKnowledgeService.update_entity."""
+
+    def test_full_update(self, client, session):
+        """Test that the full payload is sent by default."""
+        session.patch.return_value = _response({})
+        thing = ThingObject.from_dict(_entity_dict(1))
+        assert client.update_entity(thing)
+        assert json.loads(session.patch.call_args.kwargs["data"]) == entity_payload(thing)
+
+    def test_only_modified_skips_unmodified(self, client, session):
+        """Test that no request is sent if nothing has been modified."""
+        thing = ThingObject.from_dict(_entity_dict(1))
+        thing.image = "https://example.com/image.png"
+        assert not client.update_entity(thing, only_modified=True)
+        session.patch.assert_not_called()
+
+    def test_only_modified_sends_changes(self, client, session):
+        """Test that only the modified fields are sent and the entity is unmodified afterwards."""
+        session.patch.return_value = _response({})
+        thing = ThingObject.from_dict(_entity_dict(1))
+        thing.add_alias("Alias", "en_US")
+        assert client.update_entity(thing, only_modified=True)
+        body = json.loads(session.patch.call_args.kwargs["data"])
+        assert set(body) == {"type", "labels"}
+        assert len(body["labels"]) == 2
+        assert not thing.is_modified
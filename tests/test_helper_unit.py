@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/helper.py
+
+These tests verify that the orjson serializers produce the same documents as the json module, and the streamed
+import format.
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from knowledge.base.entity import Label, Description
+from knowledge.base.ontology import (
+    ThingObject,
+    DataProperty,
+    OntologyPropertyReference,
+    OntologyClassReference,
+    THING_CLASS,
+)
+from knowledge.services.helper import (
+    entity_payload,
+    entity_payload_bytes,
+    entities_payload_bytes,
+    import_format_bytes,
+    import_format_ndjson,
+    import_format_gzip,
+    MultipartStream,
+)
+from knowledge.utils.import_format import save_import_format, load_import_format, append_import_format
+
+
+@pytest.fixture
+def entity() -> ThingObject:
+    """Entity with non-ASCII content, literals and a reference id."""
+    thing: ThingObject = ThingObject(
+        label=[Label("Zürich", "de_DE", True), Label("チューリッヒ", "ja_JP", True)],
+        description=[Description("Stadt in der Schweiz", "de_DE")],
+        concept_type=OntologyClassReference.parse("wacom:core#Topic"),
+    )
+    thing.add_alias("Zuerich", "de_DE")
+    thing.add_data_property(
+        DataProperty("1234", OntologyPropertyReference.parse("wacom:core#sourceReferenceId"), "en_US")
+    )
+    return thing
+
+
+def _things(count: int):
+    """Generator of entities."""
+    for idx in range(count):
+        # Labels with high entropy, thus the compressor emits output while the entities are consumed
+        label: str = hashlib.sha256(str(idx).encode()).hexdigest()
+        yield ThingObject(label=[Label(label, "en_US", True)], concept_type=THING_CLASS)
+
+
+class TestSerialization:
+    """Tests for the orjson serializers."""
+
+    def test_entity_payload_bytes(self, entity):
+        """Test that the encoded payload decodes to the payload dictionary."""
+        content: bytes = entity_payload_bytes(entity)
+        assert json.loads(content) == entity_payload(entity)
+        assert "Zürich".encode("utf-8") in content
+
+    def test_entities_payload_bytes(self, entity):
+        """Test that the bulk payload is a JSON array of entity payloads."""
+        assert json.loads(entities_payload_bytes([entity, entity])) == [entity_payload(entity)] * 2
+
+    def test_import_format_bytes(self, entity):
+        """Test that the import format line matches the json module output."""
+        line: bytes = import_format_bytes(entity, group_ids=["g1"])
+        assert line.endswith(b"\n")
+        expected: str = json.dumps(entity.__import_format_dict__(group_ids=["g1"]), ensure_ascii=False)
+        assert json.loads(line) == json.loads(expected)
+
+    def test_import_format_ndjson(self, entity):
+        """Test that each entity is encoded on its own line."""
+        lines = import_format_ndjson([entity, entity]).splitlines()
+        assert len(lines) == 2
+        assert all(json.loads(line) == entity.__import_format_dict__() for line in lines)
+
+    def test_save_and_load_import_format(self, entity, tmp_path: Path):
+        """Test that saved import format files can be loaded again."""
+        file_path: Path = tmp_path / "entities.ndjson"
+        save_import_format(file_path, [entity])
+        append_import_format(file_path, entity)
+        loaded = load_import_format(file_path)
+        assert len(loaded) == 2
+        assert loaded[0].label_lang("de_DE").content == "Zürich"
+
+    def test_save_import_format_gzip(self, entity, tmp_path: Path):
+        """Test that the compressed import format contains the encoded lines."""
+        file_path: Path = tmp_path / "entities.ndjson.gz"
+        save_import_format(file_path, [entity, entity], save_groups=False)
+        with gzip.open(file_path, "rb") as fp:
+            assert fp.read() == import_format_ndjson([entity, entity], group_ids=[])
+
+
+class TestStreaming:
+    """Tests for the streamed import format."""
+
+    def test_import_format_gzip(self, entity):
+        """Test that the chunks form a gzip file of the import format, produced incrementally."""
+        chunks = list(import_format_gzip(_things(2000), chunk_size=1024))
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 1024 for chunk in chunks[:-1])
+        assert gzip.decompress(b"".join(chunks)) == import_format_ndjson(_things(2000))
+        assert gzip.decompress(b"".join(import_format_gzip([]))) == b""
+
+    def test_multipart_stream(self):
+        """Test the framing of the multipart body, and that a one-shot source is not sent twice."""
+        stream: MultipartStream = MultipartStream(lambda: iter([b"ab", b"", b"cd"]), replayable=False)
+        boundary: str = stream.content_type.split("boundary=")[1]
+        body: bytes = b"".join(stream)
+        assert body.startswith(f"--{boundary}\r\n".encode())
+        assert b'name="file"; filename="import.njson.gz"' in body
+        assert body.endswith(f"\r\n\r\nabcd\r\n--{boundary}--\r\n".encode())
+        with pytest.raises(ValueError):
+            list(stream)
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/utils/importer.py
+
+These tests verify the sharding of entity streams, the polling intervals, the job watchers, and that the orchestrators
+bound the jobs in flight, merge the outcome of the jobs, and resume an import from its checkpoint, using fake import
+services.
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from knowledge.base.entity import Label
+from knowledge.base.ontology import ThingObject, THING_CLASS
+from knowledge.base.response import ErrorLogEntry, ErrorLogResponse, JobStatus, NewEntityUrisResponse
+from knowledge.services.asyncio.graph import AsyncWacomKnowledgeService
+from knowledge.services.graph import WacomKnowledgeService
+from knowledge.services.helper import import_format_bytes
+from knowledge.utils.importer import (
+    AdaptivePolling,
+    AsyncImportOrchestrator,
+    AsyncJobWatcher,
+    ImportCheckpoint,
+    ImportOrchestrator,
+    JobWatcher,
+    shard_entities,
+)
+
+
+def _things(count: int):
+    """Generator of entities."""
+    for idx in range(count):
+        yield ThingObject(label=[Label(f"Entity {idx}", "en_US", True)], concept_type=THING_CLASS)
+
+
+class FakeImportService:
+    """Import service whose jobs finish after a number of polls."""
+
+    def __init__(self, polls: int = 2, failing: Optional[List[int]] = None):
+        self.polls: int = polls
+        self.failing: List[int] = failing or []
+        self.shards: List[List[ThingObject]] = []
+        self.counts: Dict[str, int] = {}
+        self.running: List[str] = []
+        self.max_running: int = 0
+
+    def import_entities(self, entities: List[ThingObject], auth_key: Optional[str] = None) -> str:
+        job_id: str = f"job-{len(self.shards)}"
+        self.shards.append(list(entities))
+        self.counts[job_id] = 0
+        self.running.append(job_id)
+        self.max_running = max(self.max_running, len(self.running))
+        return job_id
+
+    def job_status(self, job_id: str, auth_key: Optional[str] = None) -> JobStatus:
+        self.counts[job_id] += 1
+        status: str = JobStatus.IN_PROGRESS
+        if self.counts[job_id] >= self.polls:
+            status = JobStatus.FAILED if int(job_id.split("-")[1]) in self.failing else JobStatus.COMPLETED
+            self.running.remove(job_id)
+        return JobStatus("user", "tenant", job_id, job_id, status, processed_entities=self.counts[job_id])
+
+    def import_error_log(self, job_id: str, next_page_id: Optional[str] = None, **kwargs) -> ErrorLogResponse:
+        page: str = "first" if next_page_id is None else "second"
+        return ErrorLogResponse(None if next_page_id else "page-2", [ErrorLogEntry(f"{job_id}-{page}", [])])
+
+    def import_new_uris(self, job_id: str, next_page_id: Optional[str] = None, **kwargs) -> NewEntityUrisResponse:
+        return NewEntityUrisResponse([{"ref_id": job_id, "uri": f"uri:{job_id}"}], None)
+
+    import_error_log_iter = WacomKnowledgeService.import_error_log_iter
+    import_new_uris_iter = WacomKnowledgeService.import_new_uris_iter
+
+
+class AsyncFakeImportService(FakeImportService):
+    """Asynchronous variant of the fake import service."""
+
+    async def import_entities(self, entities: List[ThingObject], auth_key: Optional[str] = None) -> str:
+        return FakeImportService.import_entities(self, entities, auth_key)
+
+    async def job_status(self, job_id: str, auth_key: Optional[str] = None) -> JobStatus:
+        return FakeImportService.job_status(self, job_id, auth_key)
+
+    async def import_error_log(self, job_id: str, next_page_id: Optional[str] = None, **kwargs) -> ErrorLogResponse:
+        return FakeImportService.import_error_log(self, job_id, next_page_id)
+
+    async def import_new_uris(self, job_id: str, next_page_id: Optional[str] = None, **kwargs) -> NewEntityUrisResponse:
+        return FakeImportService.import_new_uris(self, job_id, next_page_id)
+
+    import_error_log_iter = AsyncWacomKnowledgeService.import_error_log_iter
+    import_new_uris_iter = AsyncWacomKnowledgeService.import_new_uris_iter
+
+
+class TestSharding:
+    """Tests for the shards and the polling intervals."""
+
+    def test_shard_bounds(self):
+        """Test that the shards are bounded by the number of entities and by their size."""
+        assert [len(s) for s in shard_entities(_things(7), max_entities=3)] == [3, 3, 1]
+        size: int = len(import_format_bytes(next(_things(1))))
+        assert [len(s) for s in shard_entities(_things(5), max_entities=10, max_bytes=2 * size + 1)] == [2, 2, 1]
+        assert [len(s) for s in shard_entities(_things(2), max_bytes=1)] == [1, 1]
+        assert not list(shard_entities([]))
+
+    def test_adaptive_polling(self):
+        """Test that the interval grows without progress and is reset with progress."""
+        polling: AdaptivePolling = AdaptivePolling(initial=1.0, maximum=5.0, factor=2.0)
+        assert [polling.next(p) for p in (0, 0, 0, 0, 1, 1)] == [1.0, 2.0, 4.0, 5.0, 1.0, 2.0]
+
+    def test_progress_rate(self):
+        """Test that the interval follows the estimated completion of a job with an expected size."""
+        now: List[float] = [0.0]
+        polling: AdaptivePolling = AdaptivePolling(initial=1.0, maximum=60.0, expected=1000, clock=lambda: now[0])
+        assert polling.next(0) == 1.0
+        now[0] = 10.0
+        assert polling.next(100) == 60.0
+        now[0] = 20.0
+        assert polling.next(900) == pytest.approx(1.25)
+        now[0] = 21.0
+        assert polling.next(999) == 1.0
+
+
+class TestJobWatcher:
+    """Tests for the job watchers."""
+
+    def test_watch(self):
+        """Test that the jobs of several tenants are watched at once, and the futures and callbacks are resolved."""
+        tenants = [FakeImportService(polls=2), FakeImportService(polls=4, failing=[0])]
+        job_ids = [tenant.import_entities([]) for tenant in tenants]
+        finished: List[JobStatus] = []
+        with JobWatcher(poll_interval=0.001) as watcher:
+            futures: List[Future] = [
+                watcher.watch(tenant, job_id, callback=finished.append) for tenant, job_id in zip(tenants, job_ids)
+            ]
+            assert job_ids == ["job-0", "job-0"]
+            statuses: List[JobStatus] = [f.result(timeout=5) for f in futures]
+        assert [s.status for s in statuses] == [JobStatus.COMPLETED, JobStatus.FAILED]
+        assert [tenant.counts["job-0"] for tenant in tenants] == [2, 4]
+        assert [s.status for s in finished] == [JobStatus.COMPLETED, JobStatus.FAILED]
+        assert watcher.pending == 0
+
+    def test_watch_twice(self):
+        """Test that a job watched twice is polled once, resolves both futures, and both are cancelled on close."""
+        service: FakeImportService = FakeImportService(polls=2)
+        job_id: str = service.import_entities([])
+        finished: List[JobStatus] = []
+        with JobWatcher(poll_interval=0.001) as watcher:
+            first: Future = watcher.watch(service, job_id, callback=finished.append)
+            second: Future = watcher.watch(service, job_id, callback=finished.append)
+            assert first.result(timeout=5) is second.result(timeout=5)
+        assert service.counts[job_id] == 2
+        assert len(finished) == 2
+        pending: FakeImportService = FakeImportService(polls=1000)
+        job_id = pending.import_entities([])
+        watcher = JobWatcher(poll_interval=10)
+        futures: List[Future] = [watcher.watch(pending, job_id), watcher.watch(pending, job_id)]
+        watcher.close()
+        assert all(f.cancelled() for f in futures)
+
+    def test_poll_errors(self):
+        """Test that a future fails after consecutive failed polls, and a cancelled future stops watching."""
+        calls: List[str] = []
+        polled: threading.Event = threading.Event()
+
+        class BrokenService:
+            """Service whose status endpoint fails."""
+
+            def job_status(self, job_id: str, auth_key: Optional[str] = None) -> JobStatus:
+                calls.append(job_id)
+                polled.set()
+                if job_id == "slow":
+                    return JobStatus("user", "tenant", job_id, job_id, JobStatus.PENDING)
+                raise ConnectionError("unavailable")
+
+        with JobWatcher(poll_interval=0.001, max_poll_errors=2) as watcher:
+            failing: Future = watcher.watch(BrokenService(), "broken")
+            with pytest.raises(ConnectionError):
+                failing.result(timeout=5)
+            polled.clear()
+            slow: Future = watcher.watch(BrokenService(), "slow")
+            polled.wait(5)
+            slow.cancel()
+        assert calls.count("broken") == 2
+        assert watcher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_async_watch(self):
+        """Test that the asynchronous watcher resolves the futures of the jobs."""
+        service: AsyncFakeImportService = AsyncFakeImportService(polls=3)
+        finished: List[JobStatus] = []
+        async with AsyncJobWatcher(poll_interval=0.001) as watcher:
+            job_ids: List[str] = [await service.import_entities([]) for _ in range(5)]
+            futures = [watcher.watch(service, job_id, callback=finished.append) for job_id in job_ids]
+            statuses = await asyncio.wait_for(asyncio.gather(*futures), 5)
+            late = watcher.watch(service, await service.import_entities([]))
+            assert (await asyncio.wait_for(late, 5)).status == JobStatus.COMPLETED
+        assert [s.job_id for s in statuses] == job_ids
+        assert len(finished) == 5
+        assert all(count == 3 for count in service.counts.values())
+
+
+class TestOrchestrator:
+    """Tests for the import orchestrators."""
+
+    def test_run(self, tmp_path: Path):
+        """Test that at most K jobs are in flight, the outcomes are merged, and the checkpoint is written."""
+        service: FakeImportService = FakeImportService(polls=3, failing=[2])
+        checkpoint: Path = tmp_path / "import.ckpt"
+        orchestrator: ImportOrchestrator = ImportOrchestrator(
+            service, max_jobs=2, shard_size=4, checkpoint=checkpoint, poll_interval=0.001, max_poll_interval=0.01
+        )
+        result = orchestrator.run(_things(18))
+        assert [len(s) for s in service.shards] == [4, 4, 4, 4, 2]
+        assert service.max_running == 2
+        assert sorted(result.completed) == [0, 1, 3, 4]
+        assert result.failed == [2]
+        assert result.jobs == {i: f"job-{i}" for i in range(5)}
+        assert len(result.error_log) == 10
+        assert result.new_uris["job-4"] == "uri:job-4"
+        assert result.processed_entities == 15
+        shards = json.loads(checkpoint.read_text())["shards"]
+        assert shards["2"] == {"job_id": "job-2", "entities": 4, "state": ImportCheckpoint.FAILED}
+        assert shards["4"]["state"] == ImportCheckpoint.COMPLETED
+
+    def test_resume(self, tmp_path: Path):
+        """Test that completed shards are skipped with their outputs merged, running jobs are tracked again, and failed
+        shards resubmitted."""
+        checkpoint: ImportCheckpoint = ImportCheckpoint(tmp_path / "import.ckpt")
+        checkpoint.submitted(0, "old-0", 4)
+        checkpoint.finished(0, ImportCheckpoint.COMPLETED)
+        checkpoint.submitted(1, "job-9", 4)
+        checkpoint.submitted(2, "old-2", 2)
+        checkpoint.finished(2, ImportCheckpoint.FAILED)
+        service: FakeImportService = FakeImportService(polls=1)
+        service.counts["job-9"] = 0
+        service.running.append("job-9")
+        orchestrator: ImportOrchestrator = ImportOrchestrator(
+            service, shard_size=4, checkpoint=checkpoint.path, poll_interval=0.001
+        )
+        result = orchestrator.run(_things(10))
+        assert result.skipped == [0]
+        assert result.jobs == {0: "old-0", 1: "job-9", 2: "job-0"}
+        assert result.new_uris == {"old-0": "uri:old-0", "job-9": "uri:job-9", "job-0": "uri:job-0"}
+        assert len(result.error_log) == 6
+        assert [len(s) for s in service.shards] == [2]
+        assert ImportCheckpoint(checkpoint.path).shard(2)["state"] == ImportCheckpoint.COMPLETED
+        with pytest.raises(ValueError):
+            ImportOrchestrator(service, shard_size=3, checkpoint=checkpoint.path).run(_things(10))
+
+    @pytest.mark.asyncio
+    async def test_async_run(self):
+        """Test that the asynchronous orchestrator bounds the jobs in flight and merges the outcomes."""
+        service: AsyncFakeImportService = AsyncFakeImportService(polls=2)
+        orchestrator: AsyncImportOrchestrator = AsyncImportOrchestrator(
+            service, max_jobs=3, shard_size=2, poll_interval=0.001
+        )
+        result = await orchestrator.run(_things(11))
+        assert service.max_running == 3
+        assert sorted(result.completed) == list(range(6))
+        assert len(result.new_uris) == 6
+        assert len(result.error_log) == 12
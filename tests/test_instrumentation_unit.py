@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/instrumentation.py
+
+These tests verify the endpoint templates, the latency histograms, and the events the sessions report to the hooks
+for requests to local stand-in services.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.services.asyncio.base import AsyncServiceAPIClient, AsyncSession
+from knowledge.services.base import RequestsSession, WacomServiceAPIClient
+from knowledge.services.instrumentation import (
+    HistogramCollector,
+    LatencyHistogram,
+    RequestEvent,
+    RequestHook,
+    endpoint_template,
+)
+
+
+class RecordingHook(RequestHook):
+    """Hook recording the events."""
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, RequestEvent]] = []
+
+    def before_request(self, event: RequestEvent) -> None:
+        self.events.append(("before", event))
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.events.append(("after", event))
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.events.append(("error", event))
+
+
+class FailingHook(RequestHook):
+    """Hook that fails."""
+
+    def after_response(self, event: RequestEvent) -> None:
+        raise RuntimeError("broken hook")
+
+
+class TestHistograms:
+    """Tests for the endpoint templates and the histograms."""
+
+    def test_endpoint_template(self):
+        """Test that identifiers in the path are replaced by placeholders."""
+        assert endpoint_template("https://example.com/graph/v1/entity/wacom%3Aentity%3A123/relations") == (
+            "/graph/v1/entity/{id}/relations"
+        )
+        assert endpoint_template("https://example.com/graph/v1/group/0b9a9c1e-3c4b-4d3e-9f5a-1b2c3d4e5f60") == (
+            "/graph/v1/group/{id}"
+        )
+        assert endpoint_template("https://example.com/graph/v1/entity?limit=10") == "/graph/v1/entity"
+
+    def test_percentiles(self):
+        """Test that the percentiles are within the bucket resolution."""
+        histogram: LatencyHistogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.record(i / 1000.0)
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.02)
+        assert histogram.percentile(95) == pytest.approx(0.95, rel=0.02)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.02)
+        assert histogram.percentile(100) == 1.0
+        assert histogram.mean == pytest.approx(0.5005)
+        assert LatencyHistogram().percentile(50) == 0.0
+
+    def test_collector(self):
+        """Test that the collector summarizes the latencies and errors per endpoint."""
+        collector: HistogramCollector = HistogramCollector()
+        for latency in (0.1, 0.2, 0.3):
+            event: RequestEvent = RequestEvent(method="GET", url="", endpoint="/entity/{id}", status=200)
+            event.timings.total = latency
+            collector.after_response(event)
+        failed: RequestEvent = RequestEvent(method="GET", url="", endpoint="/entity/{id}", error=TimeoutError())
+        failed.timings.total = 1.0
+        collector.on_error(failed)
+        summary = collector.summary()["GET /entity/{id}"]
+        assert summary.count == 4
+        assert summary.errors == 1
+        assert summary.max == 1.0
+        assert collector.percentiles("GET /entity/{id}")["p50"] == pytest.approx(0.2, rel=0.02)
+        assert collector.endpoints == ["GET /entity/{id}"]
+
+
+class TestSessionHooks:
+    """Tests for the events of the sessions."""
+
+    def test_requests_session(self):
+        """Test that RequestsSession reports the responses and errors, and ignores failing hooks."""
+
+        class ServiceHandler(BaseHTTPRequestHandler):
+            """Stand-in service."""
+
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):  # noqa: N802
+                self.rfile.read(int(self.headers["Content-Length"]))
+                body: bytes = b'{"uri": "wacom:entity:1"}'
+                self.send_response(201)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), ServiceHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url: str = f"http://127.0.0.1:{server.server_address[1]}"
+        client: WacomServiceAPIClient = WacomServiceAPIClient(url)
+        hook: RecordingHook = RecordingHook()
+        collector: HistogramCollector = HistogramCollector()
+        client.add_hook(FailingHook())
+        client.add_hook(hook)
+        client.add_hook(collector)
+        session: RequestsSession = client.request_session
+        try:
+            assert session.post(f"{url}/graph/v1/entity", ignore_auth=True, json={"a": 1}).status_code == 201
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+        with pytest.raises(Exception):
+            session.get(f"{url}/graph/v1/entity/wacom:entity:1", ignore_auth=True, timeout=1)
+        assert [phase for phase, _ in hook.events] == ["before", "after", "before", "error"]
+        event: RequestEvent = hook.events[1][1]
+        assert event.status == 201
+        assert event.endpoint == "/graph/v1/entity"
+        assert event.request_bytes == len(b'{"a": 1}')
+        assert event.response_bytes == len(b'{"uri": "wacom:entity:1"}')
+        assert event.timings.server is not None and event.timings.total >= event.timings.server
+        assert hook.events[3][1].endpoint == "/graph/v1/entity/{id}"
+        assert set(collector.summary()) == {"POST /graph/v1/entity", "GET /graph/v1/entity/{id}"}
+        client.remove_hook(hook)
+        assert hook not in client.hooks and collector in client.hooks
+
+    def test_no_hooks(self):
+        """Test that sessions without hooks do not trace the requests."""
+        session: AsyncSession = AsyncSession(AsyncServiceAPIClient("https://example.com"))
+        assert session.hooks == ()
+        assert session._trace_configs() is None
+
+    @pytest.mark.asyncio
+    async def test_async_session(self):
+        """Test that AsyncSession reports the phases of every attempt."""
+        calls: List[int] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            calls.append(1)
+            await request.read()
+            if len(calls) == 1:
+                return web.json_response({}, status=503)
+            return web.json_response({"uri": "wacom:entity:1"})
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        client: AsyncServiceAPIClient = AsyncServiceAPIClient(str(server.make_url("/")))
+        hook: RecordingHook = RecordingHook()
+        client.add_hook(hook)
+        session: AsyncSession = AsyncSession(
+            client, max_retries=2, backoff_factor=0.01, backoff_jitter=0.0, hooks=client.hooks
+        )
+        try:
+            response = await session.get(str(server.make_url("/graph/v1/entity/wacom:entity:1")), ignore_auth=True)
+        finally:
+            await session.close()
+            await server.close()
+        assert response.ok
+        assert [phase for phase, _ in hook.events] == ["before", "after", "before", "after"]
+        retried: RequestEvent = hook.events[1][1]
+        event: RequestEvent = hook.events[3][1]
+        assert retried.status == 503 and retried.timings.decode is None
+        assert event.status == 200 and event.attempt == 1
+        assert event.endpoint == "/graph/v1/entity/{id}"
+        assert retried.timings.connect is not None
+        assert event.timings.server is not None
+        assert event.timings.decode is not None
+        assert event.response_bytes == len(b'{"uri": "wacom:entity:1"}')
@@ -8,9 +8,13 @@ without requiring network access.
 """
 
 import json
+import pickle
+from typing import Optional
+
 import pytest
 
 from knowledge.base.entity import (
+    EntityStatus,
     Label,
     Description,
     CONTENT_TAG,
@@ -35,9 +39,17 @@ from knowledge.base.ontology import (
     ObjectProperty,
     # Entity
     ThingObject,
+    LazyThingObject,
+    LAZY_FIELDS,
+    TRACKED_FIELDS,
+    PICKLE_STATE_VERSION,
     THING_CLASS,
     # Settings
     InflectionSetting,
+    # Ontology
+    Ontology,
+    OntologyClass,
+    OntologyProperty,
     # Encoder
     ThingEncoder,
     # Labels
@@ -142,6 +154,24 @@ class TestOntologyClassReference:
         ref = OntologyClassReference("wacom", "core", "Person")
         assert repr(ref) == "wacom:core#Person"
 
+    def test_parse_interns_references(self):
+        """Test that parsing the same IRI returns a shared instance."""
+        assert OntologyClassReference.parse("wacom:core#Person") is OntologyClassReference.parse("wacom:core#Person")
+        assert OntologyClassReference.parse("wacom:core#Thing") is THING_CLASS
+
+    def test_interned_equals_constructed(self):
+        """Test that interned and directly constructed references are equal."""
+        ref = OntologyClassReference("wacom", "core", "Person")
+        interned = OntologyClassReference.parse("wacom:core#Person")
+        assert ref is not interned
+        assert ref == interned
+        assert hash(ref) == hash(interned)
+
+    def test_pickle_returns_interned(self):
+        """Test that unpickling yields the interned instance."""
+        ref = OntologyClassReference.parse("wacom:core#Person")
+        assert pickle.loads(pickle.dumps(OntologyClassReference("wacom", "core", "Person"))) is ref
+
 
 class TestOntologyPropertyReference:
     """Tests for OntologyPropertyReference class."""
@@ -178,6 +208,36 @@ class TestOntologyPropertyReference:
 
         assert hash(ref1) == hash(ref2)
 
+    def test_parse_interns_references(self):
+        """Test that parsing the same IRI returns a shared instance."""
+        assert OntologyPropertyReference.parse("wacom:core#prop") is OntologyPropertyReference.parse("wacom:core#prop")
+        assert OntologyPropertyReference.parse("wacom:core#sourceSystem") is SYSTEM_SOURCE_SYSTEM
+
+    def test_class_and_property_references_are_distinct(self):
+        """Test that class and property references with the same IRI are interned separately."""
+        cls_ref = OntologyClassReference.parse("wacom:core#same")
+        prop_ref = OntologyPropertyReference.parse("wacom:core#same")
+        assert isinstance(cls_ref, OntologyClassReference)
+        assert isinstance(prop_ref, OntologyPropertyReference)
+        assert cls_ref != prop_ref
+
+    def test_deserialization_shares_references(self):
+        """Test that entities parsed from dicts share their reference instances."""
+        entity = {
+            "uri": "wacom:entity:1",
+            "image": None,
+            "labels": [],
+            "descriptions": [],
+            "type": "wacom:core#Person",
+            "literals": [{"value": "x", "locale": "en_US", "literal": "wacom:core#prop"}],
+            "relations": [{"relation": "wacom:core#rel", "in": [], "out": ["wacom:entity:2"]}],
+        }
+        first = ThingObject.from_dict(entity)
+        second = ThingObject.from_dict(entity)
+        assert first.concept_type is second.concept_type
+        assert list(first.data_properties)[0] is list(second.data_properties)[0]
+        assert list(first.object_properties)[0] is list(second.object_properties)[0]
+
 
 class TestDataProperty:
     """Tests for DataProperty class."""
@@ -628,6 +688,513 @@ class TestThingObject:
         assert thing.image is None
 
 
+class TestThingObjectLocaleIndex:
+    """Tests for the locale-keyed lookups of ThingObject."""
+
+    def test_label_lookup_follows_mutations(self):
+        """Test that label lookups reflect add, update, remove and re-assignment."""
+        de_de = LocaleCode("de_DE")
+        thing = ThingObject(label=[Label("Test", EN_US, main=True)])
+        assert thing.label_lang(EN_US).content == "Test"
+        assert thing.label_lang(de_de) is None
+        thing.add_label("Prüfung", de_de)
+        assert thing.label_lang(de_de).content == "Prüfung"
+        thing.update_label("Updated", EN_US)
+        assert thing.label_lang(EN_US).content == "Updated"
+        thing.remove_label(EN_US)
+        assert thing.label_lang(EN_US) is None
+        thing.label = [Label("New", EN_US, main=True)]
+        assert thing.label_lang(EN_US).content == "New"
+        assert thing.label_lang(de_de) is None
+
+    def test_label_lookup_returns_first_match(self):
+        """Test that the first label for a locale wins, as in the list order."""
+        thing = ThingObject(label=[Label("First", EN_US, main=True), Label("Second", EN_US, main=True)])
+        assert thing.label_lang(EN_US).content == "First"
+        thing.remove_label(EN_US)
+        assert thing.label_lang(EN_US).content == "Second"
+
+    def test_alias_lookup_follows_mutations(self):
+        """Test that alias lookups reflect add, update, remove and re-assignment."""
+        thing = ThingObject()
+        assert thing.alias_lang(EN_US) == []
+        thing.add_alias("One", EN_US)
+        thing.add_alias("Two", EN_US)
+        assert [a.content for a in thing.alias_lang(EN_US)] == ["One", "Two"]
+        thing.update_alias("Uno", EN_US)
+        assert [a.content for a in thing.alias_lang(EN_US)] == ["Uno", "Two"]
+        thing.remove_alias(Label("Uno", EN_US))
+        assert [a.content for a in thing.alias_lang(EN_US)] == ["Two"]
+        thing.alias = []
+        assert thing.alias_lang(EN_US) == []
+
+    def test_alias_lookup_returns_copy(self):
+        """Test that modifying the returned alias list does not corrupt the index."""
+        thing = ThingObject()
+        thing.add_alias("One", EN_US)
+        thing.alias_lang(EN_US).clear()
+        assert len(thing.alias_lang(EN_US)) == 1
+
+    def test_description_lookup_follows_mutations(self):
+        """Test that description lookups reflect add, update and remove."""
+        thing = ThingObject()
+        thing.add_description("Text", EN_US)
+        assert thing.description_lang(EN_US).content == "Text"
+        thing.update_description("Changed", EN_US)
+        assert thing.description_lang(EN_US).content == "Changed"
+        thing.remove_description(EN_US)
+        assert thing.description_lang(EN_US) is None
+        thing.description = [Description("Other", EN_US)]
+        assert thing.description_lang(EN_US).content == "Other"
+
+    def test_data_property_lookup_follows_mutations(self):
+        """Test that data property lookups reflect add, remove and re-assignment."""
+        de_de = LocaleCode("de_DE")
+        prop = OntologyPropertyReference.parse("wacom:core#customProp")
+        thing = ThingObject()
+        assert thing.data_property_lang(prop, EN_US) == []
+        thing.add_data_property(DataProperty("a", prop, EN_US))
+        thing.add_data_property(DataProperty("b", prop, de_de))
+        assert [d.value for d in thing.data_property_lang(prop, EN_US)] == ["a"]
+        thing.add_data_property(DataProperty("c", prop, EN_US))
+        assert [d.value for d in thing.data_property_lang(prop, EN_US)] == ["a", "c"]
+        thing.remove_data_property(prop)
+        assert thing.data_property_lang(prop, EN_US) == []
+        thing.data_properties = {prop: [DataProperty("d", prop, de_de)]}
+        assert [d.value for d in thing.data_property_lang(prop, de_de)] == ["d"]
+
+    def test_source_reference_id_updates_lookup(self):
+        """Test that replacing the source reference id is reflected in lookups."""
+        thing = ThingObject()
+        thing.add_source_reference_id(DataProperty("old", SYSTEM_SOURCE_REFERENCE_ID))
+        assert thing.data_property_lang(SYSTEM_SOURCE_REFERENCE_ID, EN_US)[0].value == "old"
+        thing.add_source_reference_id(DataProperty("new", SYSTEM_SOURCE_REFERENCE_ID))
+        assert [d.value for d in thing.data_property_lang(SYSTEM_SOURCE_REFERENCE_ID, EN_US)] == ["new"]
+
+    def test_lookup_follows_in_place_edits(self):
+        """Test that lookups reflect in-place edits of the lists and dicts returned by the properties."""
+        de_de = LocaleCode("de_DE")
+        prop = OntologyPropertyReference.parse("wacom:core#customProp")
+        thing = ThingObject(label=[Label("Test", EN_US, main=True)])
+        thing.add_alias("Alias", EN_US)
+        thing.add_description("Text", EN_US)
+        thing.add_data_property(DataProperty("a", prop, EN_US))
+        assert thing.label_lang(de_de) is None
+        assert thing.alias_lang(de_de) == []
+        assert thing.description_lang(de_de) is None
+        assert [d.value for d in thing.data_property_lang(prop, EN_US)] == ["a"]
+        thing.label.append(Label("x", de_de))
+        thing.alias.append(Label("y", de_de))
+        thing.description.append(Description("z", de_de))
+        thing.data_properties[prop] = [DataProperty("b", prop, EN_US)]
+        assert thing.label_lang(de_de).content == "x"
+        assert [a.content for a in thing.alias_lang(de_de)] == ["y"]
+        assert thing.description_lang(de_de).content == "z"
+        assert [d.value for d in thing.data_property_lang(prop, EN_US)] == ["b"]
+        del thing.label[1]
+        del thing.data_properties[prop]
+        assert thing.label_lang(de_de) is None
+        assert thing.data_property_lang(prop, EN_US) == []
+        thing.label[0] = Label("Ersetzt", de_de)
+        thing.mark_modified()
+        assert thing.label_lang(de_de).content == "Ersetzt"
+        assert thing.label_lang(EN_US) is None
+
+
+class TestThingObjectFingerprint:
+    """Tests for the content fingerprint of ThingObject."""
+
+    @staticmethod
+    def _thing() -> ThingObject:
+        thing = ThingObject(uri="wacom:entity:test", label=[Label("Test", EN_US, main=True)])
+        thing.add_alias("Alias", EN_US)
+        thing.add_description("Description", EN_US)
+        thing.add_data_property(DataProperty("ref-1", SYSTEM_SOURCE_REFERENCE_ID))
+        thing.add_relation(ObjectProperty(OntologyPropertyReference.parse("wacom:core#rel"), outgoing=["a", "b"]))
+        return thing
+
+    def test_fingerprint_is_stable(self):
+        """Test that equal content yields the same fingerprint."""
+        assert self._thing().fingerprint == self._thing().fingerprint
+        assert len(self._thing().fingerprint) == 64
+
+    def test_fingerprint_is_order_independent(self):
+        """Test that the order of labels and relation targets does not matter."""
+        first = ThingObject(label=[Label("A", EN_US, main=True), Label("B", LocaleCode("de_DE"), main=True)])
+        second = ThingObject(label=[Label("B", LocaleCode("de_DE"), main=True), Label("A", EN_US, main=True)])
+        rel = OntologyPropertyReference.parse("wacom:core#rel")
+        first.add_relation(ObjectProperty(rel, outgoing=["x", "y"]))
+        second.add_relation(ObjectProperty(rel, outgoing=["y", "x"]))
+        assert first.fingerprint == second.fingerprint
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda t: t.add_label("Other", LocaleCode("de_DE")),
+            lambda t: t.update_label("Changed", EN_US),
+            lambda t: t.remove_label(EN_US),
+            lambda t: t.add_alias("Other alias", EN_US),
+            lambda t: t.update_description("Changed", EN_US),
+            lambda t: t.remove_description(EN_US),
+            lambda t: t.add_data_property(DataProperty("ref-2", SYSTEM_SOURCE_REFERENCE_ID, LocaleCode("de_DE"))),
+            lambda t: t.remove_data_property(SYSTEM_SOURCE_REFERENCE_ID),
+            lambda t: t.add_relation(ObjectProperty(OntologyPropertyReference.parse("wacom:core#rel"), outgoing=["c"])),
+            lambda t: t.remove_relation(OntologyPropertyReference.parse("wacom:core#rel")),
+            lambda t: setattr(t, "image", "https://example.com/image.png"),
+            lambda t: setattr(t, "use_vector_index", True),
+        ],
+    )
+    def test_mutators_change_fingerprint(self, mutate):
+        """Test that the mutators change the fingerprint."""
+        thing = self._thing()
+        before = thing.fingerprint
+        mutate(thing)
+        assert thing.fingerprint != before
+        assert thing.fingerprint == thing.fingerprint
+
+    def test_in_place_edits(self):
+        """Test that items added or removed in place are detected, and edited items after `mark_modified`."""
+        first, second = self._thing(), self._thing()
+        entities = {first}
+        second.label.append(Label("Other", LocaleCode("de_DE")))
+        assert first != second
+        assert second not in entities
+        second.label.pop()
+        assert second in entities
+        second.data_properties[SYSTEM_SOURCE_REFERENCE_ID].append(DataProperty("ref-2", SYSTEM_SOURCE_REFERENCE_ID))
+        assert first.fingerprint != second.fingerprint
+        second.data_properties[SYSTEM_SOURCE_REFERENCE_ID].pop()
+        del second.object_properties[OntologyPropertyReference.parse("wacom:core#rel")]
+        assert first.fingerprint != second.fingerprint
+        third = self._thing()
+        before: str = third.fingerprint
+        third.label[0].content = "Changed"
+        assert third.fingerprint == before
+        third.mark_modified()
+        assert third.fingerprint != before
+        assert third != first
+
+    def test_metadata_not_part_of_fingerprint(self):
+        """Test that ownership and status information do not change the fingerprint."""
+        thing = self._thing()
+        before = thing.fingerprint
+        thing.owner_id = "owner"
+        thing.group_ids = ["group"]
+        thing.visibility = "Private"
+        assert thing.fingerprint == before
+
+    def test_hash_and_equality(self):
+        """Test that hashing and equality are based on the content."""
+        first, second = self._thing(), self._thing()
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+        second.add_label("Other", LocaleCode("de_DE"))
+        assert first != second
+        assert len({first, second}) == 2
+
+    def test_equality_respects_uri(self):
+        """Test that entities with the same content but different URIs are not equal."""
+        first, second = self._thing(), self._thing()
+        second.uri = "wacom:entity:other"
+        assert first != second
+
+    def test_pickle_roundtrip_keeps_fingerprint(self):
+        """Test that the fingerprint survives pickling."""
+        thing = self._thing()
+        restored = pickle.loads(pickle.dumps(thing))
+        assert restored.fingerprint == thing.fingerprint
+        assert restored == thing
+
+
+class TestLazyThingObject:
+    """Tests for the lazy entity view."""
+
+    ENTITY = {
+        "uri": "wacom:entity:1",
+        "image": "https://example.com/image.png",
+        "labels": [
+            {"value": "Test", "locale": "en_US", "isMain": True},
+            {"value": "Alias", "locale": "en_US", "isMain": False},
+            {"value": "Prüfung", "locale": "de_DE", "isMain": True},
+        ],
+        "descriptions": [{"description": "Text", "locale": "en_US"}],
+        "type": "wacom:core#Person",
+        "literals": [{"value": "ref-1", "locale": "en_US", "literal": "wacom:core#sourceReferenceId"}],
+        "relations": [{"relation": "wacom:core#rel", "in": ["wacom:entity:0"], "out": ["wacom:entity:2"]}],
+        "targets": ["NEL", "ElasticSearch"],
+        "owner": False,
+        "ownerId": "owner-1",
+        "groupIds": ["group-1"],
+        "visibility": "Private",
+    }
+
+    def test_cheap_fields_without_materialization(self):
+        """Test that header fields are available without parsing the content."""
+        thing = LazyThingObject(self.ENTITY)
+        assert thing.uri == "wacom:entity:1"
+        assert thing.concept_type == OntologyClassReference.parse("wacom:core#Person")
+        assert thing.image == "https://example.com/image.png"
+        assert thing.owner is False
+        assert thing.owner_id == "owner-1"
+        assert thing.group_ids == ["group-1"]
+        assert thing.use_for_nel is True
+        assert not thing.materialized
+
+    def test_fields_materialize_on_access(self):
+        """Test that only the accessed fields are parsed."""
+        thing = LazyThingObject(self.ENTITY)
+        assert thing.label_lang(EN_US).content == "Test"
+        assert [a.content for a in thing.alias] == ["Alias"]
+        assert not thing.materialized
+        assert thing.reference_id == "ref-1"
+        assert thing.description_lang(EN_US).content == "Text"
+        assert len(thing.object_properties) == 1
+        assert thing.tenant_access_right is not None
+        assert thing.materialized
+
+    def test_fully_accessed_equals_eager(self):
+        """Test that a lazy entity behaves like the eager one."""
+        eager = ThingObject.from_dict(self.ENTITY)
+        lazy = LazyThingObject(self.ENTITY)
+        assert isinstance(lazy, ThingObject)
+        assert lazy == eager
+        assert eager == LazyThingObject(self.ENTITY)
+        assert hash(LazyThingObject(self.ENTITY)) == hash(eager)
+        assert LazyThingObject(self.ENTITY).as_dict() == eager.as_dict()
+        assert LazyThingObject(self.ENTITY).__import_format_dict__() == eager.__import_format_dict__()
+        assert repr(LazyThingObject(self.ENTITY)) == repr(eager)
+
+    def test_mutation_before_materialization(self):
+        """Test that mutators keep the content of the raw dict."""
+        thing = LazyThingObject(self.ENTITY)
+        thing.add_label("Test", LocaleCode("ja_JP"))
+        thing.add_data_property(DataProperty("x", OntologyPropertyReference.parse("wacom:core#prop")))
+        assert len(thing.label) == 3
+        assert len(thing.data_properties) == 2
+
+    def test_materialize_all_and_pickle(self):
+        """Test explicit materialization and pickling."""
+        thing = LazyThingObject(self.ENTITY)
+        thing.materialize(*LAZY_FIELDS)
+        assert thing.materialized
+        restored = pickle.loads(pickle.dumps(LazyThingObject(self.ENTITY)))
+        assert restored == ThingObject.from_dict(self.ENTITY)
+
+
+class TestThingObjectModification:
+    """Tests for the modification tracking of ThingObject."""
+
+    ENTITY = TestLazyThingObject.ENTITY
+
+    def test_new_entity_is_modified(self):
+        """Test that an entity that has not been loaded counts as modified."""
+        assert ThingObject().modified_fields == TRACKED_FIELDS
+
+    def test_loaded_entity_is_unmodified(self):
+        """Test that entities loaded from the service are unmodified."""
+        assert not ThingObject.from_dict(self.ENTITY).is_modified
+        lazy = LazyThingObject(self.ENTITY)
+        lazy.materialize()
+        assert not lazy.is_modified
+
+    @pytest.mark.parametrize(
+        "mutate, field",
+        [
+            (lambda t: t.add_label("Other", LocaleCode("ja_JP")), "labels"),
+            (lambda t: t.update_alias("Changed", EN_US), "labels"),
+            (lambda t: t.update_description("Changed", EN_US), "descriptions"),
+            (lambda t: setattr(t, "reference_id", "ref-2"), "literals"),
+            (lambda t: t.remove_data_property(SYSTEM_SOURCE_REFERENCE_ID), "literals"),
+            (lambda t: setattr(t, "use_vector_index", True), "targets"),
+            (lambda t: setattr(t, "concept_type", THING_CLASS), "type"),
+            (lambda t: setattr(t, "image", None), "image"),
+            (lambda t: t.add_relation(ObjectProperty(OntologyPropertyReference.parse("wacom:core#r"))), "relations"),
+        ],
+    )
+    def test_mutators_track_fields(self, mutate, field):
+        """Test that the mutators record the modified field, also on lazy entities."""
+        for thing in (ThingObject.from_dict(self.ENTITY), LazyThingObject(self.ENTITY)):
+            mutate(thing)
+            assert thing.modified_fields == {field}
+
+    def test_mark_and_reset(self):
+        """Test marking and resetting modifications."""
+        thing = ThingObject.from_dict(self.ENTITY)
+        thing.data_properties[SYSTEM_SOURCE_REFERENCE_ID].clear()
+        assert not thing.is_modified
+        thing.mark_modified("literals", "labels")
+        thing.reset_modified("labels")
+        assert thing.modified_fields == {"literals"}
+        with pytest.raises(ValueError):
+            thing.mark_modified("unknown")
+        thing.reset_modified()
+        assert not thing.is_modified
+
+
+class TestThingObjectPickling:
+    """Tests for the compact pickle state of ThingObject."""
+
+    ENTITY = TestLazyThingObject.ENTITY
+
+    def test_roundtrip_keeps_all_fields(self):
+        """Test that all fields survive pickling, including the ones that are not part of as_dict."""
+        thing = ThingObject.from_dict(self.ENTITY)
+        thing.add_data_property(
+            DataProperty("2024-01-01", OntologyPropertyReference.parse("wacom:core#date"), EN_US, DataPropertyType.DATE)
+        )
+        thing.status_flag = EntityStatus.SYNCED
+        thing.owner_external_user_id = "external"
+        restored = pickle.loads(pickle.dumps(thing))
+        assert restored == thing
+        assert restored.as_dict() == thing.as_dict()
+        assert restored.status_flag == EntityStatus.SYNCED
+        assert restored.owner_external_user_id == "external"
+        assert restored.owner_id == "owner-1"
+        assert restored.data_property_lang(OntologyPropertyReference.parse("wacom:core#date"), EN_US)[0].data_type == (
+            DataPropertyType.DATE
+        )
+        assert restored.modified_fields == thing.modified_fields == {"literals"}
+        assert restored.label_lang(EN_US).main
+
+    def test_roundtrip_keeps_main_flags(self):
+        """Test that the main flag of the labels and aliases survives pickling."""
+        thing = ThingObject(label=[Label("x", EN_US, False), Label("y", EN_US, True)])
+        thing.alias = [Label("z", EN_US, True)]
+        restored = pickle.loads(pickle.dumps(thing))
+        assert [la.main for la in restored.label] == [False, True]
+        assert [la.main for la in restored.alias] == [True]
+
+    def test_state_is_versioned(self):
+        """Test that the state carries its version and unknown versions are rejected."""
+        state = ThingObject.from_dict(self.ENTITY).__getstate__()
+        assert state[0] == PICKLE_STATE_VERSION
+        thing = ThingObject.__new__(ThingObject)
+        with pytest.raises(ValueError):
+            thing.__setstate__((PICKLE_STATE_VERSION + 1,) + state[1:])
+
+    def test_legacy_dict_state(self):
+        """Test that states pickled by previous versions can be restored."""
+        eager = ThingObject.from_dict(self.ENTITY)
+        thing = ThingObject.__new__(ThingObject)
+        thing.__setstate__(eager.as_dict())
+        assert [la.content for la in thing.label] == [la.content for la in eager.label]
+        assert thing.reference_id == "ref-1"
+
+
+class TestSlots:
+    """Tests for the slot-based layout of the entity model classes."""
+
+    def test_no_instance_dict(self):
+        """Test that entity model instances do not carry a per-instance dictionary."""
+        prop = OntologyPropertyReference.parse("wacom:core#customProp")
+        instances = [
+            OntologyClassReference.parse("wacom:core#Person"),
+            prop,
+            DataProperty("value", prop),
+            ObjectProperty(prop, outgoing=["x"]),
+            ThingObject(),
+        ]
+        for instance in instances:
+            assert not hasattr(instance, "__dict__")
+
+    def test_pickle_references_and_properties(self):
+        """Test that references and properties survive pickling."""
+        prop = OntologyPropertyReference.parse("wacom:core#customProp")
+        cls_ref = OntologyClassReference.parse("wacom:core#Person")
+        dp = DataProperty(42, prop, LocaleCode("de_DE"), DataPropertyType.INTEGER)
+        op = ObjectProperty(prop, incoming=["a"], outgoing=["b"])
+        assert pickle.loads(pickle.dumps(prop)) == prop
+        assert pickle.loads(pickle.dumps(cls_ref)) == cls_ref
+        restored_dp = pickle.loads(pickle.dumps(dp))
+        assert restored_dp.as_dict() == dp.as_dict()
+        restored_op = pickle.loads(pickle.dumps(op))
+        assert restored_op.as_dict() == op.as_dict()
+
+    def test_pickle_thing_keeps_lookups(self):
+        """Test that a restored ThingObject has working lookups and metadata."""
+        thing = ThingObject(uri="wacom:entity:test", label=[Label("Test", EN_US, main=True)])
+        thing.add_alias("Alias", EN_US)
+        restored = pickle.loads(pickle.dumps(thing))
+        assert restored.label_lang(EN_US).content == "Test"
+        assert [a.content for a in restored.alias_lang(EN_US)] == ["Alias"]
+        assert restored.owner_external_user_id is None
+
+
+class TestOntologyIndex:
+    """Tests for the ancestor sets and property indexes of Ontology."""
+
+    @staticmethod
+    def _class(name: str, parent: Optional[str] = None) -> OntologyClass:
+        """Helper to create a class of the core context."""
+        return OntologyClass(
+            "tenant",
+            "core",
+            OntologyClassReference.parse(f"wacom:core#{name}"),
+            OntologyClassReference.parse(f"wacom:core#{parent}") if parent else None,
+        )
+
+    @staticmethod
+    def _property(name: str, kind: PropertyType, *domains: str) -> OntologyProperty:
+        """Helper to create a property of the core context."""
+        return OntologyProperty(
+            kind,
+            "tenant",
+            "core",
+            OntologyPropertyReference.parse(f"wacom:core#{name}"),
+            property_domain=[OntologyClassReference.parse(f"wacom:core#{d}") for d in domains],
+        )
+
+    @pytest.fixture
+    def ontology(self) -> Ontology:
+        """Ontology with Thing > Agent > Person and Thing > Topic."""
+        ontology: Ontology = Ontology()
+        for name, parent in [("Thing", None), ("Agent", "Thing"), ("Person", "Agent"), ("Topic", "Thing")]:
+            ontology.add_class(self._class(name, parent))
+        ontology.add_properties(self._property("name", PropertyType.DATA_PROPERTY, "Thing"))
+        ontology.add_properties(self._property("birthDate", PropertyType.DATA_PROPERTY, "Person"))
+        ontology.add_properties(self._property("knows", PropertyType.OBJECT_PROPERTY, "Agent", "Topic"))
+        return ontology
+
+    def test_ancestors(self, ontology):
+        """Test that the ancestors contain the class and all its super classes."""
+        person = OntologyClassReference.parse("wacom:core#Person")
+        assert ontology.ancestors(person) == {
+            person,
+            OntologyClassReference.parse("wacom:core#Agent"),
+            OntologyClassReference.parse("wacom:core#Thing"),
+        }
+        assert ontology.ancestors(OntologyClassReference.parse("wacom:core#Unknown")) == frozenset()
+
+    def test_properties_for(self, ontology):
+        """Test that the properties of the class and its super classes are returned."""
+        person = OntologyClassReference.parse("wacom:core#Person")
+        topic = OntologyClassReference.parse("wacom:core#Topic")
+        assert [p.iri for p in ontology.data_properties_for(person)] == ["wacom:core#name", "wacom:core#birthDate"]
+        assert [p.iri for p in ontology.data_properties_for(topic)] == ["wacom:core#name"]
+        assert [p.iri for p in ontology.object_properties_for(person)] == ["wacom:core#knows"]
+        assert ontology.object_properties_for(OntologyClassReference.parse("wacom:core#Unknown")) == []
+
+    def test_invalidation(self, ontology):
+        """Test that added classes and properties are reflected in the indexes."""
+        employee = OntologyClassReference.parse("wacom:core#Employee")
+        assert ontology.data_properties_for(employee) == []
+        ontology.add_class(self._class("Employee", "Person"))
+        assert len(ontology.data_properties_for(employee)) == 2
+        ontology.add_properties(self._property("salary", PropertyType.DATA_PROPERTY, "Employee"))
+        assert [p.iri for p in ontology.data_properties_for(employee)][-1] == "wacom:core#salary"
+        ontology.get_data_properties(OntologyPropertyReference.parse("wacom:core#salary")).domains.clear()
+        ontology.invalidate()
+        assert len(ontology.data_properties_for(employee)) == 2
+
+    def test_cyclic_hierarchy(self):
+        """Test that a cyclic hierarchy terminates."""
+        ontology: Ontology = Ontology()
+        ontology.add_class(self._class("A", "B"))
+        ontology.add_class(self._class("B", "A"))
+        assert len(ontology.ancestors(OntologyClassReference.parse("wacom:core#A"))) == 2
+
+
 class TestInflectionSetting:
     """Tests for InflectionSetting class."""
 
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/pagination.py
+
+These tests verify that the prefetching iterators overlap the fetches with the consumer, bound the pages fetched
+ahead, raise the errors of the fetches, stop the read-ahead when the iteration stops, and back the paginated
+iterators of the clients.
+"""
+
+import asyncio
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import pytest
+
+from knowledge.services.asyncio.users import AsyncUserManagementService
+from knowledge.services.group import GroupManagementService
+from knowledge.services.pagination import async_prefetch_pages, offset_cursor, prefetch_pages
+from knowledge.services.users import UserManagementServiceAPI
+from knowledge.utils.graph import async_search_iter, search_iter
+
+LATENCY: float = 0.05
+"""Latency of a fetch and of the processing of a page in seconds."""
+
+
+class SlowEndpoint:
+    """Endpoint returning pages of two items after a latency, with the next page id as cursor."""
+
+    def __init__(self, pages: int, latency: float = LATENCY, failing: Optional[int] = None):
+        self.pages: int = pages
+        self.latency: float = latency
+        self.failing: Optional[int] = failing
+        self.fetched: List[Optional[str]] = []
+
+    def page(self, page_id: Optional[str]) -> Tuple[List[int], Optional[str]]:
+        index: int = int(page_id) if page_id else 0
+        self.fetched.append(page_id)
+        if index == self.failing:
+            raise ConnectionError("unavailable")
+        next_page_id: Optional[str] = str(index + 1) if index + 1 < self.pages else None
+        return [2 * index, 2 * index + 1], next_page_id
+
+    def fetch(self, page_id: Optional[str]) -> Tuple[List[int], Optional[str]]:
+        time.sleep(self.latency)
+        return self.page(page_id)
+
+    async def async_fetch(self, page_id: Optional[str]) -> Tuple[List[int], Optional[str]]:
+        await asyncio.sleep(self.latency)
+        return self.page(page_id)
+
+
+def _prefetch_threads() -> List[threading.Thread]:
+    """Alive read-ahead threads."""
+    return [t for t in threading.enumerate() if t.name == "page-prefetch"]
+
+
+class TestPrefetchPages:
+    """Tests for the prefetching iterator."""
+
+    def test_cursors(self):
+        """Test the offset cursor and that the iteration ends with an empty, or a repeated cursor."""
+        assert offset_cursor(0, 2, [1, 2]) == 2
+        assert offset_cursor(4, 2, [1]) is None
+        assert list(prefetch_pages(lambda cursor: ([cursor], "same"), start="same")) == [["same"]]
+        assert list(prefetch_pages(lambda cursor: ([], "next"), prefetch=0)) == []
+
+    def test_read_ahead(self):
+        """Test that the fetches overlap the processing of the pages."""
+        started: float = time.perf_counter()
+        for _ in prefetch_pages(SlowEndpoint(8).fetch, prefetch=0):
+            time.sleep(LATENCY)
+        sequential: float = time.perf_counter() - started
+        endpoint: SlowEndpoint = SlowEndpoint(8)
+        pages: List[List[int]] = []
+        started = time.perf_counter()
+        for page in prefetch_pages(endpoint.fetch, prefetch=2):
+            time.sleep(LATENCY)
+            pages.append(page)
+        assert time.perf_counter() - started < 0.8 * sequential
+        assert [item for page in pages for item in page] == list(range(16))
+        assert endpoint.fetched == [None] + [str(i) for i in range(1, 8)]
+
+    def test_bounded_buffer(self):
+        """Test that a slow consumer bounds the pages fetched ahead."""
+        endpoint: SlowEndpoint = SlowEndpoint(100, latency=0.0)
+        pages = prefetch_pages(endpoint.fetch, prefetch=2)
+        assert next(pages) == [0, 1]
+        time.sleep(0.2)
+        # Two buffered pages, and one page waiting for a free slot
+        assert len(endpoint.fetched) <= 4
+        pages.close()
+
+    def test_errors_and_close(self):
+        """Test that the errors, also the base exceptions, are raised, and closing the iterator stops the read-ahead."""
+        pages = prefetch_pages(SlowEndpoint(5, latency=0.0, failing=2).fetch)
+        assert next(pages) == [0, 1]
+        assert next(pages) == [2, 3]
+        with pytest.raises(ConnectionError):
+            next(pages)
+
+        def interrupted(page_id: Optional[str]) -> Tuple[List[int], Optional[str]]:
+            raise KeyboardInterrupt()
+
+        with pytest.raises(KeyboardInterrupt):
+            next(prefetch_pages(interrupted))
+        endpoint: SlowEndpoint = SlowEndpoint(1000, latency=0.0)
+        pages = prefetch_pages(endpoint.fetch, prefetch=1)
+        next(pages)
+        pages.close()
+        time.sleep(0.3)
+        assert not _prefetch_threads()
+        assert len(endpoint.fetched) <= 3
+
+    @pytest.mark.asyncio
+    async def test_async_prefetch(self):
+        """Test that the asynchronous iterator overlaps the fetches, raises the errors, also the base exceptions, and
+        cancels the task."""
+        endpoint: SlowEndpoint = SlowEndpoint(6)
+        items: List[int] = []
+        started: float = time.perf_counter()
+        async for page in async_prefetch_pages(endpoint.async_fetch):
+            await asyncio.sleep(LATENCY)
+            items.extend(page)
+        assert time.perf_counter() - started < 0.8 * 12 * LATENCY
+        assert items == list(range(12))
+        with pytest.raises(ConnectionError):
+            async for _ in async_prefetch_pages(SlowEndpoint(5, latency=0.0, failing=1).async_fetch):
+                pass
+
+        async def cancelled(page_id: Optional[str]) -> Tuple[List[int], Optional[str]]:
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(async_prefetch_pages(cancelled).__anext__(), 5)
+        endpoint = SlowEndpoint(1000, latency=0.0)
+        pages = async_prefetch_pages(endpoint.async_fetch, prefetch=1)
+        assert await pages.__anext__() == [0, 1]
+        await pages.aclose()
+        await asyncio.sleep(0.05)
+        assert len(endpoint.fetched) <= 3
+
+
+class TestPaginatedIterators:
+    """Tests for the paginated iterators of the clients."""
+
+    def test_listing_iterators(self, monkeypatch):
+        """Test that the users are fetched by offset, and only the admin listing of the groups is paginated."""
+        offsets: List[int] = []
+
+        def listing_users(self, tenant_key: str, offset: int = 0, limit: int = 20, **kwargs) -> List[int]:
+            offsets.append(offset)
+            return list(range(offset, min(offset + limit, 7)))
+
+        def listing_groups(self, admin: bool = False, limit: int = 20, offset: int = 0, **kwargs) -> List[int]:
+            return list(range(offset, offset + limit))[: 5 - offset]
+
+        monkeypatch.setattr(UserManagementServiceAPI, "listing_users", listing_users)
+        monkeypatch.setattr(GroupManagementService, "listing_groups", listing_groups)
+        users: UserManagementServiceAPI = UserManagementServiceAPI(service_url="https://example.com")
+        groups: GroupManagementService = GroupManagementService(service_url="https://example.com")
+        assert list(users.listing_users_iter("tenant", limit=3)) == list(range(7))
+        assert offsets == [0, 3, 6]
+        assert list(groups.listing_groups_iter(admin=True, limit=2)) == list(range(5))
+        assert list(groups.listing_groups_iter(limit=2)) == [0, 1]
+
+    def test_search_iter(self):
+        """Test that the search is called with the arguments and the next page id."""
+        calls: List[Tuple[str, Optional[str], int]] = []
+
+        def search_labels(term: str, next_page_id: Optional[str] = None, limit: int = 30):
+            calls.append((term, next_page_id, limit))
+            return SlowEndpoint(3, latency=0.0).page(next_page_id)
+
+        assert list(search_iter(search_labels, "Leonardo", limit=2)) == list(range(6))
+        assert calls == [("Leonardo", None, 2), ("Leonardo", "1", 2), ("Leonardo", "2", 2)]
+
+    @pytest.mark.asyncio
+    async def test_async_iterators(self, monkeypatch):
+        """Test the asynchronous iterators of the users and the search."""
+
+        async def listing_users(self, tenant_key: str, offset: int = 0, limit: int = 20, **kwargs) -> List[int]:
+            return list(range(offset, min(offset + limit, 4)))
+
+        monkeypatch.setattr(AsyncUserManagementService, "listing_users", listing_users)
+        users: AsyncUserManagementService = AsyncUserManagementService(
+            application_name="Test", service_url="https://example.com"
+        )
+        assert [user async for user in users.listing_users_iter("tenant", limit=2)] == list(range(4))
+        endpoint: SlowEndpoint = SlowEndpoint(3, latency=0.0)
+
+        async def search_all(next_page_id: Optional[str] = None):
+            return await endpoint.async_fetch(next_page_id)
+
+        assert [thing async for thing in async_search_iter(search_all)] == list(range(6))
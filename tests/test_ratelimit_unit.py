@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/ratelimit.py
+
+These tests verify the matching of the endpoint classes, the token buckets of the local and file backends, and the
+throttling of the sessions against local stand-in services.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.services.asyncio.base import AsyncServiceAPIClient, AsyncSession
+from knowledge.services.base import RequestsSession, WacomServiceAPIClient
+from knowledge.services.ratelimit import (
+    AsyncRateLimiter,
+    FileRateLimitBackend,
+    LocalRateLimitBackend,
+    RateLimit,
+    RateLimiter,
+)
+
+
+class FakeClock:
+    """Clock that only advances when told to."""
+
+    def __init__(self) -> None:
+        self.now: float = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimit:
+    """Tests for the endpoint classes."""
+
+    def test_match(self):
+        """Test that the first matching endpoint class applies to a request."""
+        bulk: RateLimit = RateLimit("*/entity/bulk", rate=2.0, methods=frozenset({"post"}))
+        ink: RateLimit = RateLimit("*/ink-to-*", rate=5.0, name="ink")
+        limiter: RateLimiter = RateLimiter([bulk, ink])
+        assert limiter.match("POST", "https://example.com/graph/v1/entity/bulk") is bulk
+        assert limiter.match("GET", "https://example.com/graph/v1/entity/bulk") is None
+        assert limiter.match("POST", "https://example.com/ink/ink-to-text/enrich-uim/?lang=en") is ink
+        assert limiter.match("GET", "https://example.com/graph/v1/entity") is None
+        assert limiter.reserve("GET", "https://example.com/graph/v1/entity") == 0.0
+        assert ink.key == "ink" and bulk.key == "*/entity/bulk"
+
+    def test_invalid(self):
+        """Test that rates and bursts are validated."""
+        with pytest.raises(ValueError):
+            RateLimit("*", rate=0.0)
+        with pytest.raises(ValueError):
+            RateLimit("*", rate=1.0, burst=0)
+
+
+class TestBackends:
+    """Tests for the token buckets."""
+
+    def test_local_bucket(self):
+        """Test that the burst is sent at once and the following requests are queued at the rate."""
+        clock: FakeClock = FakeClock()
+        backend: LocalRateLimitBackend = LocalRateLimitBackend(clock)
+        assert [backend.reserve("a", 2.0, 2) for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+        assert backend.reserve("b", 2.0, 2) == 0.0
+        clock.now += 10.0
+        assert [backend.reserve("a", 2.0, 2) for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_file_bucket_shared(self, tmp_path):
+        """Test that backends of different processes share the buckets of the file."""
+        clock: FakeClock = FakeClock()
+        path: str = str(tmp_path / "buckets.json")
+        first: FileRateLimitBackend = FileRateLimitBackend(path, clock)
+        second: FileRateLimitBackend = FileRateLimitBackend(path, clock)
+        assert first.reserve("tenant/bulk", 1.0, 1) == 0.0
+        assert second.reserve("tenant/bulk", 1.0, 1) == 1.0
+        assert first.reserve("tenant/bulk", 1.0, 1) == 2.0
+        assert second.reserve("other/bulk", 1.0, 1) == 0.0
+
+    def test_file_bucket_damaged(self, tmp_path):
+        """Test that a damaged file resets the buckets."""
+        path = tmp_path / "buckets.json"
+        path.write_bytes(b"{not json")
+        backend: FileRateLimitBackend = FileRateLimitBackend(str(path), FakeClock())
+        assert backend.reserve("bulk", 1.0, 1) == 0.0
+        assert backend.reserve("bulk", 1.0, 1) == 1.0
+
+
+class TestRateLimiter:
+    """Tests for the throttling of the sessions."""
+
+    def test_requests_session(self):
+        """Test that RequestsSession queues the requests of a throttled endpoint class."""
+        paths: List[str] = []
+
+        class ServiceHandler(BaseHTTPRequestHandler):
+            """Stand-in service."""
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                paths.append(self.path)
+                body: bytes = b"{}"
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), ServiceHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url: str = f"http://127.0.0.1:{server.server_address[1]}"
+        limiter: RateLimiter = RateLimiter([RateLimit("*/nel/text", rate=10.0)], scope="tenant")
+        session: RequestsSession = RequestsSession(WacomServiceAPIClient(url), rate_limiter=limiter)
+        try:
+            start: float = time.perf_counter()
+            for _ in range(3):
+                assert session.get(f"{url}/graph/v1/nel/text", ignore_auth=True).ok
+            duration: float = time.perf_counter() - start
+            assert session.get(f"{url}/graph/v1/entity", ignore_auth=True).ok
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+        assert len(paths) == 4
+        assert duration >= 0.19
+        assert limiter.throttled == 2
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_async_session(self):
+        """Test that concurrent requests of AsyncSession queue instead of failing."""
+        arrivals: List[float] = []
+
+        async def handle(_: web.Request) -> web.Response:
+            arrivals.append(time.perf_counter())
+            return web.json_response({})
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        limiter: AsyncRateLimiter = AsyncRateLimiter([RateLimit("*/entity/bulk", rate=20.0, burst=2)])
+        client: AsyncServiceAPIClient = AsyncServiceAPIClient(str(server.make_url("/")))
+        session: AsyncSession = AsyncSession(client, rate_limiter=limiter)
+        url: str = str(server.make_url("/graph/v1/entity/bulk"))
+        try:
+            requests = [asyncio.create_task(session.post(url, ignore_auth=True, json={})) for _ in range(6)]
+            await asyncio.sleep(0.01)
+            assert limiter.queue_depth == 4
+            responses = await asyncio.gather(*requests)
+        finally:
+            await session.close()
+            await server.close()
+        assert all(r.ok for r in responses)
+        assert arrivals[-1] - arrivals[0] >= 0.19
+        assert limiter.throttled == 4
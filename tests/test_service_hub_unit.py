@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for knowledge/services/hub.py and knowledge/services/asyncio/hub.py
+
+These tests verify that the clients of a hub share the token manager, the session, and the pooled connections to a
+local stand-in service.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Set
+
+import jwt
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.services.asyncio.graph import AsyncWacomKnowledgeService
+from knowledge.services.asyncio.hub import AsyncServiceHub, host_key
+from knowledge.services.asyncio.search import AsyncSemanticSearchClient
+from knowledge.services.graph import WacomKnowledgeService
+from knowledge.services.hub import ServiceHub, host_prefixes
+from knowledge.services.search import SemanticSearchClient
+
+
+def _token() -> str:
+    """Helper to create a JWT with the claims of the service."""
+    claims = {
+        "tenant": "tenant",
+        "roles": "User",
+        "exp": int(time.time() + 3600),
+        "iss": "https://example.com",
+        "ext-sub": "user",
+    }
+    return jwt.encode(claims, "test-secret-of-the-stand-in-auth-service", algorithm="HS256")
+
+
+class TestHostKeys:
+    """Tests for the host matching of the hubs."""
+
+    def test_host_prefixes(self):
+        """Test that adapters are mounted for the host only."""
+        assert host_prefixes("example.com") == ["https://example.com/", "http://example.com/"]
+        assert host_prefixes("https://example.com:8443") == ["https://example.com:8443/"]
+
+    def test_host_key(self):
+        """Test that URLs and limits are matched by host and explicit port."""
+        assert host_key("https://Example.com/graph/v1/entity") == "example.com"
+        assert host_key("https://example.com:8443/graph") == "example.com:8443"
+        assert host_key("example.com") == "example.com"
+
+
+class TestServiceHub:
+    """Tests for ServiceHub."""
+
+    def test_shared_transport_and_session(self):
+        """Test that clients of different services share the session and one pooled connection."""
+        peers: List[int] = []
+        auth_headers: Set[str] = set()
+        lock: threading.Lock = threading.Lock()
+
+        class ServiceHandler(BaseHTTPRequestHandler):
+            """Stand-in service with persistent connections."""
+
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                with lock:
+                    peers.append(self.client_address[1])
+                    auth_headers.add(self.headers.get("Authorization", ""))
+                body: bytes = b"{}"
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), ServiceHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url: str = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with ServiceHub(url, host_limits={f"127.0.0.1:{server.server_address[1]}": 2}) as hub:
+                graph: WacomKnowledgeService = hub.client(WacomKnowledgeService)
+                hub.register_token(_token(), "refresh")
+                search: SemanticSearchClient = hub.client(SemanticSearchClient)
+                assert graph.token_manager is search.token_manager is hub.token_manager
+                assert graph.current_session is search.current_session
+                for client in (graph, search, graph, search):
+                    assert client.request_session.get(f"{url}/entity").ok
+                assert hub.token_manager.session_count == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(peers) == 4
+        assert len(set(peers)) == 1
+        assert auth_headers == {f"Bearer {graph.current_session.auth_token}"}
+
+
+class TestAsyncServiceHub:
+    """Tests for AsyncServiceHub."""
+
+    @pytest.mark.asyncio
+    async def test_shared_transport_and_session(self):
+        """Test that asynchronous clients of different services share the session and one pooled connection."""
+        peers: List[int] = []
+        auth_headers: Set[str] = set()
+
+        async def handle(request: web.Request) -> web.Response:
+            peers.append(request.transport.get_extra_info("peername")[1])
+            auth_headers.add(request.headers.get("Authorization", ""))
+            return web.json_response({})
+
+        app: web.Application = web.Application()
+        app.router.add_get("/{tail:.*}", handle)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        url: str = str(server.make_url("")).rstrip("/")
+        try:
+            async with AsyncServiceHub(url, host_limits={url: 1}) as hub:
+                graph: AsyncWacomKnowledgeService = await hub.client(
+                    AsyncWacomKnowledgeService, application_name="Test"
+                )
+                await hub.register_token(_token(), "refresh")
+                search: AsyncSemanticSearchClient = await hub.client(AsyncSemanticSearchClient)
+                assert graph.current_session is search.current_session
+                for client in (graph, search, graph, search):
+                    session = await client.asyncio_session()
+                    assert (await session.get(f"{url}/entity")).ok
+                assert await hub.session(f"{url}/entity") is not await hub.session("https://example.com/")
+                await graph.close()
+                await search.close()
+                assert not (await hub.session(f"{url}/entity")).closed
+        finally:
+            await server.close()
+        assert len(peers) == 4
+        assert len(set(peers)) == 1
+        assert auth_headers == {f"Bearer {graph.current_session.auth_token}"}
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2026-present Wacom. All rights reserved.
+"""
+Unit tests for the token refresh of knowledge/services/base.py and knowledge/services/asyncio/base.py
+
+These tests verify that concurrent callers share a single token refresh, and that the background refresher renews
+tokens ahead of their expiry, using local stand-in auth endpoints that count the refresh calls.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+import jwt
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from knowledge.services.asyncio.base import AsyncServiceAPIClient
+from knowledge.services.base import WacomServiceAPIClient
+from knowledge.services.session import TokenManager
+
+REFRESH_DELAY: float = 0.2
+
+
+def _token(expires_in: float) -> str:
+    """Helper to create a JWT with the claims of the service."""
+    claims = {
+        "tenant": "tenant",
+        "roles": "User",
+        "exp": int(time.time() + expires_in),
+        "iss": "https://example.com",
+        "ext-sub": "user",
+        "iat": time.time_ns(),
+    }
+    return jwt.encode(claims, "test-secret-of-the-stand-in-auth-service", algorithm="HS256")
+
+
+def _refresh_response() -> bytes:
+    """Helper to create the response of the refresh endpoint."""
+    expiration: datetime = datetime.now(timezone.utc) + timedelta(hours=1)
+    return json.dumps(
+        {"accessToken": _token(3600), "refreshToken": "refresh-2", "expirationDate": expiration.isoformat()}
+    ).encode()
+
+
+class TestTokenManagerLocks:
+    """Tests for the refresh locks of TokenManager."""
+
+    def test_refresh_lock_per_session(self):
+        """Test that the refresh lock is shared per session id."""
+        manager: TokenManager = TokenManager()
+        assert manager.refresh_lock("a") is manager.refresh_lock("a")
+        assert manager.refresh_lock("a") is not manager.refresh_lock("b")
+
+    @pytest.mark.asyncio
+    async def test_async_refresh_lock_per_session(self):
+        """Test that the async refresh lock is shared per session id within the event loop."""
+        manager: TokenManager = TokenManager()
+        assert manager.async_refresh_lock("a") is manager.async_refresh_lock("a")
+        assert manager.async_refresh_lock("a") is not manager.async_refresh_lock("b")
+
+
+class TestSingleFlightRefresh:
+    """Tests for concurrent token refreshes."""
+
+    def test_threads_share_refresh(self):
+        """Test that 32 threads trigger a single refresh call."""
+        calls: List[str] = []
+        lock: threading.Lock = threading.Lock()
+
+        class AuthHandler(BaseHTTPRequestHandler):
+            """Stand-in auth endpoint."""
+
+            def do_POST(self):  # noqa: N802
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with lock:
+                    calls.append(self.path)
+                time.sleep(REFRESH_DELAY)
+                body: bytes = _refresh_response()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), AuthHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client: WacomServiceAPIClient = WacomServiceAPIClient(f"http://127.0.0.1:{server.server_address[1]}")
+            client.register_token(_token(60), "refresh-1")
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                results: List[Tuple[str, str]] = list(executor.map(lambda _: client.handle_token(), range(32)))
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(calls) == 1
+        assert calls[0].endswith("refresh/")
+        assert len({token for token, _ in results}) == 1
+        assert results[0][1] == "refresh-2"
+
+    @pytest.mark.asyncio
+    async def test_coroutines_share_refresh(self):
+        """Test that 200 coroutines trigger a single refresh call."""
+        calls: List[str] = []
+
+        async def refresh(request: web.Request) -> web.Response:
+            calls.append(request.path)
+            await asyncio.sleep(REFRESH_DELAY)
+            return web.Response(body=_refresh_response(), content_type="application/json")
+
+        app: web.Application = web.Application()
+        app.router.add_post("/{tail:.*}", refresh)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        client: AsyncServiceAPIClient = AsyncServiceAPIClient(str(server.make_url("")).rstrip("/"))
+        try:
+            await client.register_token(_token(60), "refresh-1")
+            results = await asyncio.gather(*[client.handle_token() for _ in range(200)])
+            # A forced refresh after the concurrent refresh is a new refresh
+            await client.handle_token(force_refresh=True)
+        finally:
+            await client.close()
+            await server.close()
+        assert len(calls) == 2
+        assert len({token for token, _ in results}) == 1
+        assert results[0][1] == "refresh-2"
+
+
+class TestBackgroundRefresher:
+    """Tests for the background token refresher."""
+
+    def test_thread_renews_ahead_of_expiry(self):
+        """Test that the refresher thread renews the token and the hot path does not refresh."""
+        calls: List[str] = []
+
+        class AuthHandler(BaseHTTPRequestHandler):
+            """Stand-in auth endpoint."""
+
+            def do_POST(self):  # noqa: N802
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                calls.append(self.path)
+                body: bytes = _refresh_response()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), AuthHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client: WacomServiceAPIClient = WacomServiceAPIClient(f"http://127.0.0.1:{server.server_address[1]}")
+        try:
+            stale_token: str = _token(60)
+            client.register_token(stale_token, "refresh-1")
+            client.start_token_refresher(lead_time=120, interval=0.05)
+            assert client.token_manager.refresher_running
+            deadline: float = time.time() + 5.0
+            while client.current_session.auth_token == stale_token and time.time() < deadline:
+                time.sleep(0.01)
+            tokens = {client.handle_token(force_refresh_timeout=1800)[0] for _ in range(100)}
+        finally:
+            client.stop_token_refresher()
+            server.shutdown()
+            server.server_close()
+        assert not client.token_manager.refresher_running
+        assert len(calls) == 1
+        assert tokens == {client.current_session.auth_token}
+        assert stale_token not in tokens
+
+    def test_expiring_token_refreshed_inline(self):
+        """Test that the hot path refreshes a token about to expire that the refresher has not renewed."""
+        calls: List[str] = []
+
+        class AuthHandler(BaseHTTPRequestHandler):
+            """Stand-in auth endpoint."""
+
+            def do_POST(self):  # noqa: N802
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                calls.append(self.path)
+                body: bytes = _refresh_response()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), AuthHandler)
+        thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client: WacomServiceAPIClient = WacomServiceAPIClient(f"http://127.0.0.1:{server.server_address[1]}")
+        try:
+            stale_token: str = _token(60)
+            client.register_token(stale_token, "refresh-1")
+            # The lead time is shorter than the remaining lifetime, the refresher does not renew the token
+            client.start_token_refresher(lead_time=10, interval=0.05)
+            token, refresh_token = client.handle_token(force_refresh_timeout=120)
+        finally:
+            client.stop_token_refresher()
+            server.shutdown()
+            server.server_close()
+        assert len(calls) == 1
+        assert token != stale_token
+        assert refresh_token == "refresh-2"
+
+    @pytest.mark.asyncio
+    async def test_task_renews_ahead_of_expiry(self):
+        """Test that the refresher task renews the token, and is stopped when the client is closed."""
+        calls: List[str] = []
+
+        async def refresh(request: web.Request) -> web.Response:
+            calls.append(request.path)
+            return web.Response(body=_refresh_response(), content_type="application/json")
+
+        app: web.Application = web.Application()
+        app.router.add_post("/{tail:.*}", refresh)
+        server: TestServer = TestServer(app)
+        await server.start_server()
+        client: AsyncServiceAPIClient = AsyncServiceAPIClient(str(server.make_url("")).rstrip("/"))
+        try:
+            stale_token: str = _token(60)
+            await client.register_token(stale_token, "refresh-1")
+            await client.start_token_refresher(lead_time=120, interval=0.05)
+            with pytest.raises(RuntimeError):
+                await client.start_token_refresher()
+            for _ in range(500):
+                if client.current_session.auth_token != stale_token:
+                    break
+                await asyncio.sleep(0.01)
+            results = await asyncio.gather(*[client.handle_token(force_refresh_timeout=1800) for _ in range(100)])
+        finally:
+            await client.close()
+            await server.close()
+        assert not client._token_manager.refresher_running
+        assert len(calls) == 1
+        assert {token for token, _ in results} == {client.current_session.auth_token}
+        assert results[0][1] == "refresh-2"